@@ -401,18 +401,22 @@ def closeHole(shape):
 def getCutVolume(cutplane,shapes,clip=False):
     """getCutVolume(cutplane,shapes,[clip]): returns a cut face and a cut volume
     from the given shapes and the given cutting plane. If clip is True, the cutvolume will
-    also cut off everything outside the cutplane projection"""
+    also cut off everything outside the cutplane projection. Instead of shapes, the bounding
+    box of the shapes can also be given"""
     if not shapes:
         return None,None,None
     if not cutplane.Faces:
         return None,None,None
     import Part
-    if not isinstance(shapes,list):
-        shapes = [shapes]
     # building boundbox
-    bb = shapes[0].BoundBox
-    for sh in shapes[1:]:
-        bb.add(sh.BoundBox)
+    if isinstance(shapes,FreeCAD.BoundBox):
+        bb = FreeCAD.BoundBox(shapes)
+    else:
+        if not isinstance(shapes,list):
+            shapes = [shapes]
+        bb = shapes[0].BoundBox
+        for sh in shapes[1:]:
+            bb.add(sh.BoundBox)
     bb.enlarge(1)
     # building cutplane space
     placement = None
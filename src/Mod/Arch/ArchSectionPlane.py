@@ -56,6 +56,8 @@ else:
 #  section planes, to be used in TechDraw and Drawing modules
 
 ISRENDERING = False # flag to prevent concurrent runs of the coin renderer
+BOUNDBOXES = {} # per document index of the bounding boxes of the cut objects
+CUTSHAPES = {} # per document cache of the results of cutting each object
 
 def makeSectionPlane(objectslist=None,name="Section"):
 
@@ -151,6 +153,118 @@ def looksLikeDraft(o):
     return o.Shape.Volume < 0.0000001 # add a little tolerance...
 
 
+def getDocumentCache(cache,doc):
+
+    """returns the part of the given cache that belongs to the given document,
+    and drops the parts that belong to closed documents or to deleted objects"""
+
+    docs = FreeCAD.listDocuments()
+    for name in list(cache.keys()):
+        if not name in docs:
+            del cache[name]
+    doccache = cache.setdefault(doc.Name,{})
+    for name in list(doccache.keys()):
+        if not doc.getObject(name):
+            del doccache[name]
+    return doccache
+
+
+def getIndexEntry(obj,index):
+
+    """returns the [shape, bounding box, validity] entry of the given object
+    in the given bounding box index. The entry is rebuilt when the object has
+    been recomputed or moved, as its shape is then not the same anymore"""
+
+    shape = obj.Shape
+    entry = index.get(obj.Name)
+    if (not entry) or (not entry[0].isSame(shape)):
+        entry = [shape,shape.BoundBox,None]
+        index[obj.Name] = entry
+    return entry
+
+
+def isValidShape(obj,index):
+
+    """returns the validity of the shape of the given object, using the bounding box index"""
+
+    entry = getIndexEntry(obj,index)
+    if entry[2] is None:
+        entry[2] = obj.Shape.isValid()
+    return entry[2]
+
+
+def getPlaneSide(bb,point,normal):
+
+    """returns 1 if the given bounding box lies fully on the side the normal of the
+    plane points to (the part removed by the section), -1 if it lies fully on the
+    other side, and 0 if the plane crosses it"""
+
+    r = (bb.XLength*abs(normal.x)+bb.YLength*abs(normal.y)+bb.ZLength*abs(normal.z))/2
+    d = bb.Center.sub(point).dot(normal)
+    if d-r > Draft.tolerance():
+        return 1
+    if d+r < -Draft.tolerance():
+        return -1
+    return 0
+
+
+def getPlaneKey(cutplane):
+
+    """returns a key identifying the position and orientation of the given cut plane"""
+
+    if hasattr(cutplane,"Shape"):
+        cutplane = cutplane.Shape
+    f = cutplane.Faces[0]
+    key = []
+    for v in f.Vertexes+[f.normalAt(0,0)]:
+        p = v.Point if hasattr(v,"Point") else v
+        key.extend([round(p.x,6),round(p.y,6),round(p.z,6)])
+    return tuple(key)
+
+
+def getSolids(shapeList):
+
+    """returns the correctly oriented solids of the given shapes"""
+
+    solids = []
+    for sh in shapeList:
+        for sol in sh.Solids:
+            if sol.Volume < 0:
+                sol.reverse()
+            solids.append(sol)
+    return solids
+
+
+def getObjectCut(shapeList,cutface,cutvolume,invcutvolume,showHidden):
+
+    """returns the visible solids, the section faces and the hidden shapes
+    obtained by cutting the given shapes with the given cut volumes"""
+
+    import Part,DraftGeomUtils
+    shapes = []
+    hshapes = []
+    sshapes = []
+    for sol in getSolids(shapeList):
+        c = sol.cut(cutvolume)
+        s = sol.section(cutface)
+        try:
+            wires = DraftGeomUtils.findWires(s.Edges)
+            for w in wires:
+                f = Part.Face(w)
+                sshapes.append(f)
+            #s = Part.Wire(s.Edges)
+            #s = Part.Face(s)
+        except Part.OCCError:
+            #print "ArchDrawingView: unable to get a face"
+            sshapes.append(s)
+        shapes.extend(c.Solids)
+        #sshapes.append(s)
+        if showHidden:
+            c = sol.cut(invcutvolume)
+            hshapes.append(c)
+    return shapes,sshapes,hshapes
+
+
 def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesByObject=False):
     
     """
@@ -158,12 +272,16 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
     obtained from performing a series of booleans against the given cut plane
     """
 
-    import Part,DraftGeomUtils
     shapes = []
     hshapes = []
     sshapes = []
     objectShapes = []
     objectSshapes = []
+    index = {}
+    cutcache = {}
+    if objs:
+        index = getDocumentCache(BOUNDBOXES,objs[0].Document)
+        cutcache = getDocumentCache(CUTSHAPES,objs[0].Document)
 
     if joinArch:
         shtypes = {}
@@ -179,10 +297,8 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
                 if o.Shape.isNull():
                     pass
                 elif onlySolids:
-                    shapes.extend(o.Shape.Solids)
                     objectShapes.append((o, o.Shape.Solids))
                 else:
-                    shapes.append(o.Shape.copy())
                     objectShapes.append((o,[o.Shape.copy()]))
         for k,v in shtypes.items():
             v1 = v.pop()
@@ -190,11 +306,9 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
                 v1 = v1.multiFuse(v)
                 v1 = v1.removeSplitter()
             if v1.Solids:
-                shapes.extend(v1.Solids)
                 objectShapes.append((k,v1.Solids))
             else:
                 print("ArchSectionPlane: Fusing Arch objects produced non-solid results")
-                shapes.append(v1)
                 objectShapes.append((k,[v1]))
     else:
         for o in objs:
@@ -202,40 +316,65 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
                 if o.Shape.isNull():
                     pass
                 elif onlySolids:
-                    if o.Shape.isValid():
-                        shapes.extend(o.Shape.Solids)
+                    if isValidShape(o,index):
                         objectShapes.append((o,o.Shape.Solids))
                 else:
-                    shapes.append(o.Shape)
                     objectShapes.append((o,[o.Shape]))
 
-    cutface,cutvolume,invcutvolume = ArchCommands.getCutVolume(cutplane,shapes,clip)
-    shapes = []
-    if cutvolume:
-        for o, shapeList in objectShapes:
-            tmpSshapes = []
-            for sh in shapeList:
-                for sol in sh.Solids:
-                    if sol.Volume < 0:
-                        sol.reverse()
-                    c = sol.cut(cutvolume)
-                    s = sol.section(cutface)
-                    try:
-                        wires = DraftGeomUtils.findWires(s.Edges)
-                        for w in wires:
-                            f = Part.Face(w)
-                            tmpSshapes.append(f)
-                        #s = Part.Wire(s.Edges)
-                        #s = Part.Face(s)
-                    except Part.OCCError:
-                        #print "ArchDrawingView: unable to get a face"
-                        tmpSshapes.append(s)
-                    shapes.extend(c.Solids)
-                    #sshapes.append(s)
-                    if showHidden:
-                        c = sol.cut(invcutvolume)
-                        hshapes.append(c)
+    # get the bounding boxes from the index, fused Arch objects have none
+    boxes = []
+    bb = None
+    for o, shapeList in objectShapes:
+        if isinstance(o,str):
+            obb = shapeList[0].BoundBox
+            for sh in shapeList[1:]:
+                obb.add(sh.BoundBox)
+        else:
+            obb = getIndexEntry(o,index)[1]
+        boxes.append(obb)
+        if bb:
+            bb.add(obb)
+        else:
+            bb = FreeCAD.BoundBox(obb)
 
+    cutface,cutvolume,invcutvolume = None,None,None
+    if bb:
+        cutface,cutvolume,invcutvolume = ArchCommands.getCutVolume(cutplane,bb,clip)
+    if cutvolume:
+        p = cutplane.Shape.Faces[0] if hasattr(cutplane,"Shape") else cutplane.Faces[0]
+        ce = p.CenterOfMass
+        ax = p.normalAt(0,0)
+        cutkey = (getPlaneKey(cutplane),clip,showHidden)
+        for (o, shapeList), obb in zip(objectShapes,boxes):
+            side = getPlaneSide(obb,ce,ax)
+            if side > 0:
+                # the object is entirely removed by the section
+                if showHidden:
+                    hshapes.extend(getSolids(shapeList))
+                continue
+            if (side < 0) and not clip:
+                # the object is entirely behind the section plane
+                shapes.extend(getSolids(shapeList))
+                continue
+            result = None
+            if not isinstance(o,str):
+                shape = getIndexEntry(o,index)[0]
+                entry = cutcache.get(o.Name)
+                if entry and entry[0].isSame(shape):
+                    result = entry[1].get(cutkey)
+                else:
+                    entry = [shape,{}]
+                    cutcache[o.Name] = entry
+            if result is None:
+                result = getObjectCut(shapeList,cutface,cutvolume,invcutvolume,showHidden)
+                if not isinstance(o,str):
+                    if len(entry[1]) >= 8:
+                        # keep only the latest cuts of each object
+                        del entry[1][next(iter(entry[1]))]
+                    entry[1][cutkey] = result
+            tmpShapes,tmpSshapes,tmpHshapes = result
+            shapes.extend(tmpShapes)
+            hshapes.extend(tmpHshapes)
             if len(tmpSshapes) > 0:
                 sshapes.extend(tmpSshapes)
 
@@ -119,6 +119,263 @@ class ArchTest(unittest.TestCase):
         v = Arch.makeSectionView(s)
         self.failUnless(v,"Arch Section failed")
 
+    def testSectionCut(self):
+        FreeCAD.Console.PrintLog ('Checking Arch Section cut...\n')
+        import ArchSectionPlane
+        boxes = []
+        for z in [-20,-5,10]:
+            b = FreeCAD.ActiveDocument.addObject('Part::Feature','Box')
+            b.Shape = Part.makeBox(10,10,10,FreeCAD.Vector(0,0,z))
+            boxes.append(b)
+        s = Arch.makeSectionPlane(boxes)
+        FreeCAD.ActiveDocument.recompute()
+        objs,cutplane,onlySolids,clip,direction = ArchSectionPlane.getSectionData(s)
+        for i in range(2):
+            vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = ArchSectionPlane.getCutShapes(objs,cutplane,onlySolids,clip,False,True)
+            self.failUnless(len(vshapes) == 2,"Arch Section cut failed")
+            self.failUnless(len(sshapes) == 1,"Arch Section cut failed")
+            self.failUnless(len(hshapes) == 2,"Arch Section cut failed")
+        self.failUnless(boxes[1].Name in ArchSectionPlane.CUTSHAPES[FreeCAD.ActiveDocument.Name],"Arch Section cut failed")
+        # a changed shape is cut again
+        boxes[1].Shape = Part.makeBox(20,10,10,FreeCAD.Vector(0,0,-5))
+        vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = ArchSectionPlane.getCutShapes(objs,cutplane,onlySolids,clip,False,True)
+        self.failUnless(abs(sum([f.Area for f in sshapes])-200) < 1e-6,"Arch Section cut failed")
+        # deleted objects are dropped from the caches
+        name = boxes[1].Name
+        FreeCAD.ActiveDocument.removeObject(name)
+        ArchSectionPlane.getCutShapes([boxes[0],boxes[2]],cutplane,onlySolids,clip,False,True)
+        self.failUnless(not name in ArchSectionPlane.CUTSHAPES[FreeCAD.ActiveDocument.Name],"Arch Section cut failed")
+        self.failUnless(not name in ArchSectionPlane.BOUNDBOXES[FreeCAD.ActiveDocument.Name],"Arch Section cut failed")
+
+    def testIfcShapeCacheKey(self):
+        FreeCAD.Console.PrintLog ('Checking Arch IFC shape cache...\n')
+        try:
+            import ifcopenshell
+        except ImportError:
+            self.skipTest("IfcOpenShell is not installed")
+        import re, shutil, tempfile, importIFCHelper
+        entities = ["IFCPROJECT('0YvctVUKr0kugbFTf53O9L',$,'Test',$,$,$,$,(#13),#2)",
+                    "IFCUNITASSIGNMENT((#3))",
+                    "IFCSIUNIT(*,.LENGTHUNIT.,.MILLI.,.METRE.)",
+                    "IFCCARTESIANPOINT((0.,0.,0.))",
+                    "IFCAXIS2PLACEMENT3D(#4,$,$)",
+                    "IFCLOCALPLACEMENT($,#5)",
+                    "IFCRECTANGLEPROFILEDEF(.AREA.,$,#8,1000.,200.)",
+                    "IFCAXIS2PLACEMENT2D(#9,$)",
+                    "IFCCARTESIANPOINT((0.,0.))",
+                    "IFCDIRECTION((0.,0.,1.))",
+                    "IFCEXTRUDEDAREASOLID(#7,#5,#10,3000.)",
+                    "IFCSHAPEREPRESENTATION(#13,'Body','SweptSolid',(#11))",
+                    "IFCGEOMETRICREPRESENTATIONCONTEXT($,'Model',3,1.E-05,#5,$)",
+                    "IFCPRODUCTDEFINITIONSHAPE($,$,(#12))",
+                    "IFCWALLSTANDARDCASE('2O2Fr$t4X7Zf8NOew3FLOH',$,'Wall',$,$,#6,#14,$)",
+                    "IFCMATERIAL('Concrete')",
+                    "IFCMATERIALLAYER(#16,200.,$)",
+                    "IFCMATERIALLAYERSET((#17),'Wall')",
+                    "IFCMATERIALLAYERSETUSAGE(#18,.AXIS2.,.POSITIVE.,0.)",
+                    "IFCRELASSOCIATESMATERIAL('1Fz0cPuIX7HOJ2F7mBxQJf',$,$,$,(#15),#19)"]
+        def write(path,numbers,old=None,new=None):
+            # write the entities with the given ids, in the order of the ids
+            renumber = lambda m: "#"+str(numbers[int(m.group(1))])
+            data = sorted([(numbers[i+1],re.sub(r"#(\d+)",renumber,e.replace(old,new) if old else e)) for i,e in enumerate(entities)])
+            f = open(path,"w")
+            f.write("ISO-10303-21;\nHEADER;\nFILE_DESCRIPTION((''),'2;1');\n")
+            f.write("FILE_NAME('','',(''),(''),'','','');\nFILE_SCHEMA(('IFC2X3'));\nENDSEC;\nDATA;\n")
+            for n,e in data:
+                f.write("#"+str(n)+"="+e+";\n")
+            f.write("ENDSEC;\nEND-ISO-10303-21;\n")
+            f.close()
+        def getKeys(path,layers):
+            # the keys of the wall as an architectural and as a structural product
+            ifcfile = ifcopenshell.open(path)
+            cache = importIFCHelper.ShapeCache(ifcfile,{'SEPARATE_OPENINGS':False,'SPLIT_LAYERS':layers},tempdir)
+            wall = ifcfile.by_type("IfcWallStandardCase")[0]
+            keys = (cache.getKey(wall),cache.getKey(wall,True))
+            cache.close()
+            return keys
+        tempdir = tempfile.mkdtemp()
+        try:
+            n = len(entities)
+            write(os.path.join(tempdir,"a.ifc"),dict([(i,i) for i in range(1,n+1)]))
+            write(os.path.join(tempdir,"b.ifc"),dict([(i,100+n-i) for i in range(1,n+1)]))
+            write(os.path.join(tempdir,"c.ifc"),dict([(i,i) for i in range(1,n+1)]),",3000.)",",2500.)")
+            write(os.path.join(tempdir,"d.ifc"),dict([(i,i) for i in range(1,n+1)]),"#16,200.","#16,150.")
+            a = getKeys(os.path.join(tempdir,"a.ifc"),False)
+            self.failUnless(a[0] and a[1] and (a[0] != a[1]),"Arch IFC shape cache failed")
+            self.failUnless(a == getKeys(os.path.join(tempdir,"b.ifc"),False),"Arch IFC shape cache failed")
+            self.failUnless(a[0] != getKeys(os.path.join(tempdir,"c.ifc"),False)[0],"Arch IFC shape cache failed")
+            # the material layers only count when the layers are split
+            self.failUnless(a == getKeys(os.path.join(tempdir,"d.ifc"),False),"Arch IFC shape cache failed")
+            al = getKeys(os.path.join(tempdir,"a.ifc"),True)
+            self.failUnless(al == getKeys(os.path.join(tempdir,"b.ifc"),True),"Arch IFC shape cache failed")
+            self.failUnless(al[0] != getKeys(os.path.join(tempdir,"d.ifc"),True)[0],"Arch IFC shape cache failed")
+        finally:
+            shutil.rmtree(tempdir,ignore_errors=True)
+
+    def testIfcGeometryImporter(self):
+        FreeCAD.Console.PrintLog ('Checking Arch IFC multicore geometry import...\n')
+        try:
+            import ifcopenshell
+            import ifcopenshell.geom
+        except ImportError:
+            self.skipTest("IfcOpenShell is not installed")
+        import shutil, tempfile, importIFCHelper
+        # walls 1, 2 and 4 share the same representation, 3 and 4 are rotated
+        entities = ["IFCPROJECT('0YvctVUKr0kugbFTf53O9L',$,'Test',$,$,$,$,(#13),#2)",
+                    "IFCUNITASSIGNMENT((#3))",
+                    "IFCSIUNIT(*,.LENGTHUNIT.,.MILLI.,.METRE.)",
+                    "IFCCARTESIANPOINT((0.,0.,0.))",
+                    "IFCAXIS2PLACEMENT3D(#4,$,$)",
+                    "IFCLOCALPLACEMENT($,#5)",
+                    "IFCRECTANGLEPROFILEDEF(.AREA.,$,#8,1000.,200.)",
+                    "IFCAXIS2PLACEMENT2D(#9,$)",
+                    "IFCCARTESIANPOINT((0.,0.))",
+                    "IFCDIRECTION((0.,0.,1.))",
+                    "IFCEXTRUDEDAREASOLID(#7,#5,#10,3000.)",
+                    "IFCSHAPEREPRESENTATION(#13,'Body','SweptSolid',(#11))",
+                    "IFCGEOMETRICREPRESENTATIONCONTEXT($,'Model',3,1.E-05,#5,$)",
+                    "IFCPRODUCTDEFINITIONSHAPE($,$,(#12))",
+                    "IFCWALLSTANDARDCASE('2O2Fr$t4X7Zf8NOew3FLOH',$,'Wall1',$,$,#6,#14,$)",
+                    "IFCCARTESIANPOINT((5000.,0.,0.))",
+                    "IFCAXIS2PLACEMENT3D(#16,$,$)",
+                    "IFCLOCALPLACEMENT($,#17)",
+                    "IFCWALLSTANDARDCASE('2O2Fr$t4X7Zf8NOew3FLOI',$,'Wall2',$,$,#18,#14,$)",
+                    "IFCCARTESIANPOINT((0.,3000.,0.))",
+                    "IFCAXIS2PLACEMENT3D(#20,#10,#22)",
+                    "IFCDIRECTION((0.,1.,0.))",
+                    "IFCLOCALPLACEMENT($,#21)",
+                    "IFCRECTANGLEPROFILEDEF(.AREA.,$,#8,500.,300.)",
+                    "IFCEXTRUDEDAREASOLID(#24,#5,#10,2000.)",
+                    "IFCSHAPEREPRESENTATION(#13,'Body','SweptSolid',(#25))",
+                    "IFCPRODUCTDEFINITIONSHAPE($,$,(#26))",
+                    "IFCWALLSTANDARDCASE('2O2Fr$t4X7Zf8NOew3FLOJ',$,'Wall3',$,$,#23,#27,$)",
+                    "IFCWALLSTANDARDCASE('2O2Fr$t4X7Zf8NOew3FLOK',$,'Wall4',$,$,#23,#14,$)"]
+        def getBox(shape):
+            bb = shape.BoundBox
+            return [round(v,3) for v in (bb.XMin,bb.YMin,bb.ZMin,bb.XMax,bb.YMax,bb.ZMax)]
+        tempdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tempdir,"walls.ifc")
+            f = open(path,"w")
+            f.write("ISO-10303-21;\nHEADER;\nFILE_DESCRIPTION((''),'2;1');\n")
+            f.write("FILE_NAME('','',(''),(''),'','','');\nFILE_SCHEMA(('IFC2X3'));\nENDSEC;\nDATA;\n")
+            for i,e in enumerate(entities):
+                f.write("#"+str(i+1)+"="+e+";\n")
+            f.write("ENDSEC;\nEND-ISO-10303-21;\n")
+            f.close()
+            ifcfile = ifcopenshell.open(path)
+            walls = ifcfile.by_type("IfcWallStandardCase")
+            geometries = importIFCHelper.GeometryImporter(ifcfile,walls,2,{'SEPARATE_OPENINGS':False,'SPLIT_LAYERS':False})
+            settings = ifcopenshell.geom.settings()
+            settings.set(settings.USE_BREP_DATA,True)
+            settings.set(settings.SEW_SHELLS,True)
+            settings.set(settings.USE_WORLD_COORDS,True)
+            # request the walls in reverse order, none of them may be missing
+            for wall in reversed(walls):
+                shape = geometries.getShape(wall.id())
+                self.failUnless(shape and not shape.isNull(),"Arch IFC multicore geometry import failed")
+                reference = Part.Shape()
+                reference.importBrepFromString(ifcopenshell.geom.create_shape(settings,wall).geometry.brep_data,False)
+                reference.scale(1000.0)
+                self.failUnless(abs(shape.Volume-reference.Volume) < 1e-3,"Arch IFC multicore geometry import failed")
+                self.failUnless(getBox(shape) == getBox(reference),"Arch IFC multicore geometry import failed")
+            self.failUnless(not geometries.shapes,"Arch IFC multicore geometry import failed")
+        finally:
+            shutil.rmtree(tempdir,ignore_errors=True)
+
+    def testIfcShapeKey(self):
+        FreeCAD.Console.PrintLog ('Checking Arch IFC export clone detection...\n')
+        try:
+            import exportIFCHelper
+        except ImportError:
+            self.skipTest("IfcOpenShell is not installed")
+        boxes = []
+        for size,placement in [(2,FreeCAD.Placement()),
+                               (2,FreeCAD.Placement(FreeCAD.Vector(10,5,0),FreeCAD.Rotation(FreeCAD.Vector(0,0,1),90))),
+                               (3,FreeCAD.Placement())]:
+            b = FreeCAD.ActiveDocument.addObject('Part::Feature','Box')
+            b.Shape = Part.makeBox(size,1,1)
+            b.Placement = placement
+            boxes.append(b)
+        l = FreeCAD.ActiveDocument.addObject('Part::Feature','Line')
+        l.Shape = Part.makeLine(FreeCAD.Vector(0,0,0),FreeCAD.Vector(1,0,0))
+        colors = dict([(o.Name,(0.8,0.8,0.8)) for o in boxes])
+        keys = [exportIFCHelper.getShapeKey(b,colors) for b in boxes]
+        self.failUnless(keys[0] and (keys[0] == keys[1]),"Arch IFC export clone detection failed")
+        self.failUnless(keys[0] != keys[2],"Arch IFC export clone detection failed")
+        colors[boxes[1].Name] = (1.0,0.0,0.0)
+        self.failUnless(keys[0] != exportIFCHelper.getShapeKey(boxes[1],colors),"Arch IFC export clone detection failed")
+        self.failUnless(exportIFCHelper.getShapeKey(l,colors) is None,"Arch IFC export clone detection failed")
+
+    def testIfcShapeKeyOpenings(self):
+        FreeCAD.Console.PrintLog ('Checking Arch IFC export clone detection of walls with openings...\n')
+        try:
+            import exportIFCHelper
+        except ImportError:
+            self.skipTest("IfcOpenShell is not installed")
+        walls = []
+        for y in [0,5]:
+            l = Draft.makeLine(FreeCAD.Vector(0,y,0),FreeCAD.Vector(4,y,0))
+            walls.append(Arch.makeWall(l,width=0.2,height=3))
+        FreeCAD.ActiveDocument.recompute()
+        colors = dict([(w.Name,(0.8,0.8,0.8)) for w in walls])
+        self.failUnless(exportIFCHelper.getShapeKey(walls[0],colors) == exportIFCHelper.getShapeKey(walls[1],colors),"Arch IFC export clone detection failed")
+        # identical walls with identical openings are not clones
+        for w in walls:
+            b = FreeCAD.ActiveDocument.addObject('Part::Feature','Box')
+            b.Shape = Part.makeBox(1,1,1,FreeCAD.Vector(1,w.Shape.BoundBox.YMin-0.5,1))
+            Arch.removeComponents(b,w)
+        FreeCAD.ActiveDocument.recompute()
+        for w in walls:
+            self.failUnless(exportIFCHelper.getShapeKey(w,colors) is None,"Arch IFC export clone detection failed")
+        # neither are walls hosting windows
+        w = Arch.makeWall(Draft.makeLine(FreeCAD.Vector(0,10,0),FreeCAD.Vector(4,10,0)),width=0.2,height=3)
+        win = Arch.makeWindowPreset("Fixed",width=1,height=1,h1=0.1,h2=0.1,h3=0.1,w1=0.2,w2=0.1,o1=0,o2=0.1,placement=FreeCAD.Placement(FreeCAD.Vector(1,10,1),FreeCAD.Rotation(FreeCAD.Vector(1,0,0),90)))
+        win.Hosts = [w]
+        FreeCAD.ActiveDocument.recompute()
+        self.failUnless(exportIFCHelper.getShapeKey(w,colors) is None,"Arch IFC export clone detection failed")
+
+    def testIfcBrepData(self):
+        FreeCAD.Console.PrintLog ('Checking Arch IFC export brep data...\n')
+        try:
+            import exportIFCHelper
+        except ImportError:
+            self.skipTest("IfcOpenShell is not installed")
+        import DraftVecUtils
+        def getFaces(fcsolid):
+            # the face loops as the exporter computed them before getBrepData
+            faces = []
+            for fcface in fcsolid.Faces:
+                verts = [v.Point for v in fcface.OuterWire.OrderedVertexes]
+                c = fcface.CenterOfMass
+                n = fcface.normalAt(0,0)
+                if DraftVecUtils.angle(verts[1].sub(c),verts[0].sub(c),n) >= 0:
+                    verts.reverse()
+                inner = []
+                for wire in fcface.Wires:
+                    if wire.hashCode() != fcface.OuterWire.hashCode():
+                        iverts = [v.Point for v in wire.OrderedVertexes]
+                        if DraftVecUtils.angle(iverts[1].sub(c),iverts[0].sub(c),DraftVecUtils.neg(n)) >= 0:
+                            iverts.reverse()
+                        inner.append([tuple(v) for v in iverts])
+                faces.append(([tuple(v) for v in verts],inner))
+            return faces
+        # a box with a square hole, exported as faces with inner loops
+        shape = Part.makeBox(4000,4000,1000).cut(Part.makeBox(2000,2000,1000,FreeCAD.Vector(1000,1000,0)))
+        reference = shape.copy()
+        reference.scale(0.001)
+        data = exportIFCHelper.getBrepData(shape.copy(),1,0.001)
+        self.failUnless(len(data) == 1 and data[0][0] == "brep","Arch IFC export brep data failed")
+        self.failUnless(data[0][1] == getFaces(reference.Solids[0]),"Arch IFC export brep data failed")
+        # a cylinder, exported as triangles
+        shape = Part.makeCylinder(1000,2000)
+        reference = shape.copy()
+        reference.scale(0.001)
+        tris = reference.Solids[0].tessellate(1)
+        data = exportIFCHelper.getBrepData(shape.copy(),1,0.001)
+        self.failUnless(len(data) == 1 and data[0][0] == "triangulated","Arch IFC export brep data failed")
+        self.failUnless(data[0][1] == [([tuple(tris[0][i]) for i in tri],[]) for tri in tris[1]],"Arch IFC export brep data failed")
+
     def testSpace(self):
         FreeCAD.Console.PrintLog ('Checking Arch Space...\n')
         sb = Part.makeBox(1,1,1)
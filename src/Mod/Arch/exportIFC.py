@@ -136,6 +136,8 @@ def getPreferences():
         'ADD_DEFAULT_SITE': p.GetBool("IfcAddDefaultSite",False),
         'ADD_DEFAULT_STOREY': p.GetBool("IfcAddDefaultStorey",False),
         'ADD_DEFAULT_BUILDING': p.GetBool("IfcAddDefaultBuilding",True),
+        'DETECT_CLONES': p.GetBool("ifcDetectClones",False),
+        'MULTICORE': p.GetInt("ifcExportMulticore",0),
         'IFC_UNIT': u,
         'SCALE_FACTOR': f
     }
@@ -196,7 +198,7 @@ def export(exportList,filename,colors=None,preferences=None):
     of.write(template)
     of.close()
     os.close(templatefilehandle)
-    global ifcfile, surfstyles, clones, sharedobjects, profiledefs, shapedefs
+    global ifcfile, surfstyles, clones, clonebases, sharedobjects, profiledefs, shapedefs, brepdefs
     ifcfile = ifcopenshell.open(templatefile)
     ifcfile = exportIFCHelper.writeUnits(ifcfile,preferences["IFC_UNIT"])
     history = ifcfile.by_type("IfcOwnerHistory")[0]
@@ -231,11 +233,13 @@ def export(exportList,filename,colors=None,preferences=None):
     subproducts = {} # { Name: IfcEntity, ... } for storing additions/subtractions and other types of subcomponents of a product
     surfstyles = {} # { (r,g,b): IfcEntity, ... }
     clones = {} # { Basename:[Clonename1,Clonename2,...] }
+    clonebases = {} # { Clonename:Basename, Basename:Basename }
     sharedobjects = {} # { BaseName: IfcRepresentationMap }
     count = 1
     groups = {} # { Host: [Child,Child,...] }
     profiledefs = {} # { ProfileDefString:profiledef,...}
     shapedefs = {} # { ShapeDefString:[shapes],... }
+    brepdefs = {} # { (Name,isLocal):brepdata } precomputed faces of brep objects
     spatialelements = {} # {Name:IfcEntity, ... }
 
     # reusable entity system
@@ -251,9 +255,54 @@ def export(exportList,filename,colors=None,preferences=None):
             if b:
                 clones.setdefault(b.Name,[]).append(o.Name)
 
+        # objects with identical shapes are exported as clones too
+
+        if preferences['DETECT_CLONES']:
+            identical = {} # { ShapeKey:[Name1,Name2,...] }
+            cloned = set(clones.keys())
+            for v in clones.values():
+                cloned.update(v)
+            for o in objectslist:
+                if (o.Name in cloned) or (Draft.getType(o) in ["Site","Building","Floor","BuildingPart","Space","Project"]):
+                    continue
+                key = exportIFCHelper.getShapeKey(o,colors)
+                if key:
+                    identical.setdefault(key,[]).append(o.Name)
+            for names in identical.values():
+                if len(names) > 1:
+                    clones[names[0]] = names[1:]
+
+        for k,v in clones.items():
+            clonebases[k] = k
+            for n in v:
+                clonebases[n] = k
+
     #print("clones table: ",clones)
     #print(objectslist)
 
+    # compute the faces of the objects exported as brep in parallel
+
+    if (preferences['MULTICORE'] > 1) and (not preferences['SERIALIZE']):
+        jobs = []
+        stored = set()
+        for o in objectslist:
+            if (not o.isDerivedFrom("Part::Feature")) or o.Shape.isNull() or (not o.Shape.Faces):
+                continue
+            forcebrep = preferences['FORCE_BREP']
+            if hasattr(o,"IfcData") and (o.IfcData.get("FlagForceBrep") == "True"):
+                forcebrep = True
+            if (not forcebrep) and hasattr(o,"Proxy") and (hasattr(o.Proxy,"getExtrusionData") or hasattr(o.Proxy,"getRebarData")):
+                continue # probably exported as extrusion
+            local = False
+            if (not forcebrep) and (o.Name in clonebases):
+                if clonebases[o.Name] in stored:
+                    continue # exported as a mapped item of the first one
+                stored.add(clonebases[o.Name])
+                local = True
+            jobs.append((o.Document.Name,o.Name,local,1,preferences['SCALE_FACTOR']))
+        if preferences['DEBUG']: print("Computing",len(jobs),"breps on",preferences['MULTICORE'],"processes...")
+        brepdefs = exportIFCHelper.buildBrepData(jobs,preferences['MULTICORE'])
+
     # testing if more than one site selected (forbidden in IFC)
     # TODO: Moult: This is not forbidden in IFC.
 
@@ -1745,8 +1794,6 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
 
     """returns an IfcShapeRepresentation object or None"""
 
-    import Part
-    import DraftGeomUtils
     import DraftVecUtils
     shapes = []
     placement = None
@@ -1758,24 +1805,24 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
     # check for clones
 
     if (not subtraction) and (not forcebrep):
-        for k,v in clones.items():
-            if (obj.Name == k) or (obj.Name in v):
-                if k in sharedobjects:
-                    # base shape already exists
-                    repmap = sharedobjects[k]
-                    pla = obj.getGlobalPlacement()
-                    axis1 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(1,0,0))))
-                    axis2 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,1,0))))
-                    axis3 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,0,1))))
-                    origin = ifcbin.createIfcCartesianPoint(tuple(FreeCAD.Vector(pla.Base).multiply(preferences['SCALE_FACTOR'])))
-                    transf = ifcbin.createIfcCartesianTransformationOperator3D(axis1,axis2,origin,1.0,axis3)
-                    mapitem = ifcfile.createIfcMappedItem(repmap,transf)
-                    shapes = [mapitem]
-                    solidType = "MappedRepresentation"
-                    shapetype = "clone"
-                else:
-                    # base shape not yet created
-                    tostore = k
+        k = clonebases.get(obj.Name)
+        if k:
+            if k in sharedobjects:
+                # base shape already exists
+                repmap = sharedobjects[k]
+                pla = obj.getGlobalPlacement()
+                axis1 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(1,0,0))))
+                axis2 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,1,0))))
+                axis3 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,0,1))))
+                origin = ifcbin.createIfcCartesianPoint(tuple(FreeCAD.Vector(pla.Base).multiply(preferences['SCALE_FACTOR'])))
+                transf = ifcbin.createIfcCartesianTransformationOperator3D(axis1,axis2,origin,1.0,axis3)
+                mapitem = ifcfile.createIfcMappedItem(repmap,transf)
+                shapes = [mapitem]
+                solidType = "MappedRepresentation"
+                shapetype = "clone"
+            else:
+                # base shape not yet created
+                tostore = k
 
     # unhandled case: object is duplicated because of Axis
     if obj.isDerivedFrom("Part::Feature") and (len(obj.Shape.Solids) > 1) and hasattr(obj,"Axis") and obj.Axis:
@@ -1921,90 +1968,27 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
 
                         # old method
 
-                        solids = []
-
                         # if this is a clone, place back the shape in null position
                         if tostore:
                             fcshape.Placement = FreeCAD.Placement()
 
-                        if fcshape.Solids:
-                            dataset = fcshape.Solids
-                        else:
-                            dataset = fcshape.Shells
-                            #if preferences['DEBUG']: print("Warning! object contains no solids")
+                        # the faces may have been computed beforehand, see export()
+                        brepdata = None
+                        if not subtraction:
+                            brepdata = brepdefs.get((obj.Name,bool(tostore)))
+                        if brepdata is None:
+                            brepdata = exportIFCHelper.getBrepData(fcshape,tessellation,preferences['SCALE_FACTOR'],obj.Label)
 
-                        for fcsolid in dataset:
-                            fcsolid.scale(preferences['SCALE_FACTOR']) # to meters
+                        for shapetype,facedata in brepdata:
                             faces = []
-                            curves = False
-                            shapetype = "brep"
-                            for fcface in fcsolid.Faces:
-                                for e in fcface.Edges:
-                                    if DraftGeomUtils.geomType(e) != "Line":
-                                        from FreeCAD import Base
-                                        try:
-                                            if e.curvatureAt(e.FirstParameter+(e.LastParameter-e.FirstParameter)/2) > 0.0001:
-                                                curves = True
-                                                break
-                                        except Part.OCCError:
-                                            pass
-                                        except Base.FreeCADError:
-                                            pass
-                            if curves:
-                                joinfacets = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetBool("ifcJoinCoplanarFacets",False)
-                                usedae = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetBool("ifcUseDaeOptions",False)
-                                if joinfacets:
-                                    result = Arch.removeCurves(fcsolid,dae=usedae)
-                                    if result:
-                                        fcsolid = result
-                                    else:
-                                        # fall back to standard triangulation
-                                        joinfacets = False
-                                if not joinfacets:
-                                    shapetype = "triangulated"
-                                    if usedae:
-                                        import importDAE
-                                        tris = importDAE.triangulate(fcsolid)
-                                    else:
-                                        tris = fcsolid.tessellate(tessellation)
-                                    for tri in tris[1]:
-                                        pts =   [ifcbin.createIfcCartesianPoint(tuple(tris[0][i])) for i in tri]
-                                        loop =  ifcbin.createIfcPolyLoop(pts)
-                                        bound = ifcfile.createIfcFaceOuterBound(loop,True)
-                                        face =  ifcfile.createIfcFace([bound])
-                                        faces.append(face)
-                                        fcsolid = Part.Shape() # empty shape so below code is not executed
-
-                            for fcface in fcsolid.Faces:
-                                loops = []
-                                verts = [v.Point for v in fcface.OuterWire.OrderedVertexes]
-                                c = fcface.CenterOfMass
-                                v1 = verts[0].sub(c)
-                                v2 = verts[1].sub(c)
-                                try:
-                                    n = fcface.normalAt(0,0)
-                                except Part.OCCError:
-                                    continue # this is a very wrong face, it probably shouldn't be here...
-                                if DraftVecUtils.angle(v2,v1,n) >= 0:
-                                    verts.reverse() # inverting verts order if the direction is couterclockwise
-                                pts =   [ifcbin.createIfcCartesianPoint(tuple(v)) for v in verts]
+                            for outer,inner in facedata:
+                                pts =   [ifcbin.createIfcCartesianPoint(v) for v in outer]
                                 loop =  ifcbin.createIfcPolyLoop(pts)
-                                bound = ifcfile.createIfcFaceOuterBound(loop,True)
-                                loops.append(bound)
-                                for wire in fcface.Wires:
-                                    if wire.hashCode() != fcface.OuterWire.hashCode():
-                                        verts = [v.Point for v in wire.OrderedVertexes]
-                                        if len(verts) > 1:
-                                            v1 = verts[0].sub(c)
-                                            v2 = verts[1].sub(c)
-                                            if DraftVecUtils.angle(v2,v1,DraftVecUtils.neg(n)) >= 0:
-                                                verts.reverse()
-                                            pts =   [ifcbin.createIfcCartesianPoint(tuple(v)) for v in verts]
-                                            loop =  ifcbin.createIfcPolyLoop(pts)
-                                            bound = ifcfile.createIfcFaceBound(loop,True)
-                                            loops.append(bound)
-                                        else:
-                                            print("Warning: wire with one/no vertex in ", obj.Label)
+                                loops = [ifcfile.createIfcFaceOuterBound(loop,True)]
+                                for verts in inner:
+                                    pts =   [ifcbin.createIfcCartesianPoint(v) for v in verts]
+                                    loop =  ifcbin.createIfcPolyLoop(pts)
+                                    loops.append(ifcfile.createIfcFaceBound(loop,True))
                                 face =  ifcfile.createIfcFace(loops)
                                 faces.append(face)
 
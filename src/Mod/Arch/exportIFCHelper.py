@@ -384,3 +384,167 @@ class recycler:
             if self.compress:
                 self.psas[key] = c
             return c
+
+
+# ************************************************************************************************
+# ********** brep geometry, can be computed in worker processes
+
+def getShapeKey(obj,colors=None):
+
+    """returns a string identifying the shape of an object in its own coordinates,
+    with its color and material, or None if it has no solid shape. Objects with the
+    same key can share the same representation map. Objects with additions,
+    subtractions or hosted windows have none, as the exporter writes their
+    openings and additions only if their own shape is exported"""
+
+    import DraftGeomUtils
+    if not obj.isDerivedFrom("Part::Feature"):
+        return None
+    if getattr(obj,"Additions",None) or getattr(obj,"Subtractions",None):
+        return None
+    for parent in obj.InList:
+        if obj in getattr(parent,"Hosts",[]):
+            return None
+    if obj.Shape.isNull() or (not obj.Shape.Solids):
+        return None
+    shape = obj.Shape.copy()
+    shape.Placement = FreeCAD.Placement()
+    key = [len(shape.Faces),round(shape.Area,6)]
+    key.extend([tuple([round(c,6) for c in v.Point]) for v in shape.Vertexes])
+    key.extend([(DraftGeomUtils.geomType(e),round(e.Length,6)) for e in shape.Edges])
+    if colors:
+        key.append(colors.get(obj.Name))
+    elif FreeCAD.GuiUp and hasattr(obj.ViewObject,"ShapeColor"):
+        key.append(obj.ViewObject.ShapeColor[:3])
+        key.append(obj.ViewObject.Transparency)
+        if hasattr(obj.ViewObject,"DiffuseColor"):
+            key.append(tuple(obj.ViewObject.DiffuseColor))
+    if hasattr(obj,"Material") and obj.Material:
+        key.append(obj.Material.Name)
+    return str(key)
+
+
+def getBrepData(fcshape,tessellation=1,scale=0.001,label=""):
+
+    """returns the faces of the solids of a shape, as they are exported as IfcFacetedBreps:
+    a list of (shapetype,faces) tuples, one per solid or shell, where faces is a list of
+    (outerloop,[innerloop,...]) and each loop a list of (x,y,z) points, in meters"""
+
+    import Part
+    import Arch
+    import DraftGeomUtils
+    import DraftVecUtils
+    from FreeCAD import Base
+
+    data = []
+    if fcshape.Solids:
+        dataset = fcshape.Solids
+    else:
+        dataset = fcshape.Shells
+    for fcsolid in dataset:
+        fcsolid.scale(scale) # to meters
+        faces = []
+        curves = False
+        shapetype = "brep"
+        for fcface in fcsolid.Faces:
+            for e in fcface.Edges:
+                if DraftGeomUtils.geomType(e) != "Line":
+                    try:
+                        if e.curvatureAt(e.FirstParameter+(e.LastParameter-e.FirstParameter)/2) > 0.0001:
+                            curves = True
+                            break
+                    except Part.OCCError:
+                        pass
+                    except Base.FreeCADError:
+                        pass
+        if curves:
+            joinfacets = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetBool("ifcJoinCoplanarFacets",False)
+            usedae = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetBool("ifcUseDaeOptions",False)
+            if joinfacets:
+                result = Arch.removeCurves(fcsolid,dae=usedae)
+                if result:
+                    fcsolid = result
+                else:
+                    # fall back to standard triangulation
+                    joinfacets = False
+            if not joinfacets:
+                shapetype = "triangulated"
+                if usedae:
+                    import importDAE
+                    tris = importDAE.triangulate(fcsolid)
+                else:
+                    tris = fcsolid.tessellate(tessellation)
+                for tri in tris[1]:
+                    faces.append(([tuple(tris[0][i]) for i in tri],[]))
+                    fcsolid = Part.Shape() # empty shape so below code is not executed
+
+        for fcface in fcsolid.Faces:
+            verts = [v.Point for v in fcface.OuterWire.OrderedVertexes]
+            c = fcface.CenterOfMass
+            v1 = verts[0].sub(c)
+            v2 = verts[1].sub(c)
+            try:
+                n = fcface.normalAt(0,0)
+            except Part.OCCError:
+                continue # this is a very wrong face, it probably shouldn't be here...
+            if DraftVecUtils.angle(v2,v1,n) >= 0:
+                verts.reverse() # inverting verts order if the direction is couterclockwise
+            outer = [tuple(v) for v in verts]
+            inner = []
+            for wire in fcface.Wires:
+                if wire.hashCode() != fcface.OuterWire.hashCode():
+                    verts = [v.Point for v in wire.OrderedVertexes]
+                    if len(verts) > 1:
+                        v1 = verts[0].sub(c)
+                        v2 = verts[1].sub(c)
+                        if DraftVecUtils.angle(v2,v1,DraftVecUtils.neg(n)) >= 0:
+                            verts.reverse()
+                        inner.append([tuple(v) for v in verts])
+                    else:
+                        print("Warning: wire with one/no vertex in ", label)
+            faces.append((outer,inner))
+        data.append((shapetype,faces))
+    return data
+
+
+def getObjectBrepData(job):
+
+    """runs in a worker process: job is (documentname,objectname,local,tessellation,scale).
+    Returns (objectname,local,brepdata) for the shape of the object, placed at
+    its global placement or, if local is True, at the origin"""
+
+    docname,name,local,tessellation,scale = job
+    try:
+        obj = FreeCAD.getDocument(docname).getObject(name)
+        fcshape = obj.Shape.copy()
+        if local:
+            fcshape.Placement = FreeCAD.Placement()
+        else:
+            fcshape.Placement = obj.getGlobalPlacement()
+        return name,local,getBrepData(fcshape,tessellation,scale,obj.Label)
+    except Exception:
+        # the exporter will compute it again and report the problem
+        return name,local,None
+
+
+def buildBrepData(jobs,processes):
+
+    """computes the brep data of the given jobs (see getObjectBrepData) in
+    worker processes forked from this one, and returns a {(objectname,local):brepdata}
+    dictionary. It is empty if processes can't be forked on this platform, or if
+    the GUI is up, as a forked GUI process is not safe: the exporter then computes
+    the data serially"""
+
+    from draftutils.utils import get_fork_pool
+    brepdata = {}
+    pool = get_fork_pool(processes)
+    if pool is None:
+        return brepdata
+    try:
+        for name,local,data in pool.imap_unordered(getObjectBrepData,jobs,chunksize=4):
+            if data is not None:
+                brepdata[(name,local)] = data
+    finally:
+        pool.close()
+        pool.join()
+    return brepdata
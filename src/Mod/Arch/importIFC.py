@@ -161,7 +161,9 @@ def getPreferences():
         'IMPORT_PROPERTIES': p.GetBool("ifcImportProperties",False),
         'SPLIT_LAYERS': p.GetBool("ifcSplitLayers",False),
         'FITVIEW_ONIMPORT': p.GetBool("ifcFitViewOnImport",False),
-        'ALLOW_INVALID': p.GetBool("ifcAllowInvalid",False)
+        'ALLOW_INVALID': p.GetBool("ifcAllowInvalid",False),
+        'MULTICORE': p.GetInt("ifcMulticore",0),
+        'CACHE_SHAPES': p.GetBool("ifcCacheShapes",False)
     }
 
     if preferences['MERGE_MODE_ARCH'] > 0:
@@ -273,6 +275,8 @@ def insert(filename,docname,skip=[],only=[],root=None,preferences=None):
     subtractions = importIFCHelper.buildRelSubtractions(ifcfile)
     mattable = importIFCHelper.buildRelMattable(ifcfile)
     colors = importIFCHelper.buildRelProductColors(ifcfile, prodrepr)
+    properties = importIFCHelper.buildRelProperties(ifcfile)
+    prodlayers = importIFCHelper.buildRelLayers(ifcfile)
     if preferences['DEBUG']: print("done.")
 
     # only import a list of IDs and their children, if defined
@@ -307,6 +311,24 @@ def insert(filename,docname,skip=[],only=[],root=None,preferences=None):
         print("No IfcProject found in the ifc file. Nothing imported")
         return doc
 
+    # shapes stored by previous imports, only changed products are recomputed
+    cache = None
+    if preferences['CACHE_SHAPES']:
+        cache = importIFCHelper.ShapeCache(ifcfile, preferences)
+
+    # compute the shapes on several cores, they are picked up in the loop below
+    geometries = None
+    if preferences['MULTICORE'] > 0:
+        if preferences['DEBUG']: print("Computing shapes on",preferences['MULTICORE'],"cores...")
+        geoproducts = [p for p in products if not (p.id() in skip) and not (p.is_a() in preferences['SKIP'])]
+        if preferences['MERGE_MODE_ARCH'] == 4:
+            geoproducts = [p for p in geoproducts if p.is_a() in structuralifcobjects]
+        if preferences['MERGE_MODE_STRUCT'] == 3:
+            geoproducts = [p for p in geoproducts if not (p.is_a() in structuralifcobjects)]
+        if cache:
+            geoproducts = [p for p in geoproducts if not cache.hasShape(p,p.is_a() in structuralifcobjects)]
+        geometries = importIFCHelper.GeometryImporter(ifcfile, geoproducts, preferences['MULTICORE'], preferences, structuralifcobjects)
+
     # handle IFC products
 
     for product in products:
@@ -319,21 +341,15 @@ def insert(filename,docname,skip=[],only=[],root=None,preferences=None):
         if preferences['DEBUG']: print(count,"/",len(products),"object #"+str(pid),":",ptype,end="")
 
         # build list of related property sets
-        psets = importIFCHelper.getIfcPropertySets(ifcfile, pid)
+        psets = properties.get(pid,{})
 
         # add layer names to layers
-        if hasattr(product, "Representation") and hasattr(product.Representation, "Representations"):
-            if len(product.Representation.Representations) > 0:
-                lays = product.Representation.Representations[0].LayerAssignments
-                if len(lays) > 0:
-                    layer_name = lays[0].Name
-                    if layer_name not in list(layers.keys()):
-                        layers[layer_name] = [pid]
-                    else:
-                        layers[layer_name].append(pid)
-                    if preferences['DEBUG']: print(" layer ", layer_name, " found", ptype,end="")
-                else:
-                    if preferences['DEBUG']: print(" no layer found", ptype,end="")
+        if pid in prodlayers:
+            layer_name = prodlayers[pid]
+            layers.setdefault(layer_name,[]).append(pid)
+            if preferences['DEBUG']: print(" layer ", layer_name, " found", ptype,end="")
+        else:
+            if preferences['DEBUG']: print(" no layer found", ptype,end="")
    
 
         # checking for full FreeCAD parametric definition, overriding everything else
@@ -402,27 +418,44 @@ def insert(filename,docname,skip=[],only=[],root=None,preferences=None):
                             sharedobjects[originalid] = None
                             store = originalid  # flag this object to be stored later
 
-        # set additional setting for structural entities
-        if hasattr(settings,"INCLUDE_CURVES"):
-            if structobj:
-                settings.set(settings.INCLUDE_CURVES,True)
-            else:
-                settings.set(settings.INCLUDE_CURVES,False)
-        try:
-            cr = ifcopenshell.geom.create_shape(settings,product)
-            brep = cr.geometry.brep_data
-        except:
-            pass  # IfcOpenShell will yield an error if a given product has no shape, but we don't care, we're brave enough
+        # get the shape stored by a previous import, if any
+        cached = False
+        if cache:
+            shape = cache.getShape(product,structobj)
+            cached = shape is not None
+            if preferences['DEBUG'] and cached: print(" cached ",end="")
+
+        # get the shape computed beforehand, if any
+        if geometries and (shape is None):
+            shape = geometries.getShape(pid)
+            if preferences['DEBUG'] and (shape is not None): print(" precomputed ",end="")
+
+        if shape is None:
+            # set additional setting for structural entities
+            if hasattr(settings,"INCLUDE_CURVES"):
+                if structobj:
+                    settings.set(settings.INCLUDE_CURVES,True)
+                else:
+                    settings.set(settings.INCLUDE_CURVES,False)
+            try:
+                cr = ifcopenshell.geom.create_shape(settings,product)
+                brep = cr.geometry.brep_data
+            except:
+                pass  # IfcOpenShell will yield an error if a given product has no shape, but we don't care, we're brave enough
+
+            # from now on we have a brep string
+            if brep:
+                if preferences['DEBUG']: print(" "+str(int(len(brep)/1000))+"k ",end="")
 
-        # from now on we have a brep string
-        if brep:
-            if preferences['DEBUG']: print(" "+str(int(len(brep)/1000))+"k ",end="")
+                # create a Part shape
+                shape = Part.Shape()
+                shape.importBrepFromString(brep,False)
+                shape.scale(1000.0)  # IfcOpenShell always outputs in meters, we convert to mm, the freecad internal unit
 
-            # create a Part shape
-            shape = Part.Shape()
-            shape.importBrepFromString(brep,False)
-            shape.scale(1000.0)  # IfcOpenShell always outputs in meters, we convert to mm, the freecad internal unit
+        if cache and (shape is not None) and (not cached) and (not shape.isNull()):
+            cache.setShape(product,shape,structobj)
 
+        if shape is not None:
             if shape.isNull() and (not preferences['ALLOW_INVALID']):
                 if preferences['DEBUG']: print("null shape ",end="")
             elif not shape.isValid()  and (not preferences['ALLOW_INVALID']):
@@ -855,10 +888,14 @@ def insert(filename,docname,skip=[],only=[],root=None,preferences=None):
         except(RuntimeError):
             print("Aborted.")
             progressbar.stop()
+            if cache:
+                cache.close()
             FreeCAD.ActiveDocument.recompute()
             return
 
     progressbar.stop()
+    if cache:
+        cache.close()
     FreeCAD.ActiveDocument.recompute()
 
     if preferences['MERGE_MODE_STRUCT'] == 2:
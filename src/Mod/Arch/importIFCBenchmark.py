@@ -0,0 +1,169 @@
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from __future__ import print_function
+
+__title__ = "FreeCAD IFC importer - relationship tables benchmark"
+__author__ = "FreeCAD Developers"
+__url__ = "http://www.freecadweb.org"
+
+## @package importIFCBenchmark
+#  \ingroup ARCH
+#  \brief Benchmark of the relationship tables of the IFC importer
+#
+#  This module builds a synthetic IFC file with many products, each one
+#  with a property set, a color, a layer and a material, and compares the
+#  time needed to get them product by product, by walking the inverse
+#  relationships, and with the relation tables of importIFCHelper.
+#  It is not installed, run it from the Python console with the Arch
+#  source directory in the path:
+#
+#      import sys; sys.path.append("/path/to/src/Mod/Arch")
+#      import importIFCBenchmark
+#      importIFCBenchmark.run(100000)
+
+import time
+
+import importIFCHelper
+
+
+def makeFile(count,layers=10,materials=10,filename=None):
+
+    """makeFile(count,[layers,materials,filename]): builds an IFC4 file with count
+    products, sharing one extrusion, each one with its own property set and
+    styled item. The products are spread over the given number of layers and
+    materials. If a filename is given, the file is also written to disk."""
+
+    import uuid
+    import ifcopenshell
+    import ifcopenshell.guid
+
+    f = ifcopenshell.file(schema="IFC4")
+
+    def guid():
+        return ifcopenshell.guid.compress(uuid.uuid4().hex)
+
+    origin = f.createIfcAxis2Placement3D(f.createIfcCartesianPoint((0.0,0.0,0.0)),None,None)
+    context = f.createIfcGeometricRepresentationContext(None,"Model",3,1.0E-05,origin,None)
+    f.createIfcProject(guid(),None,"Benchmark",None,None,None,None,[context],None)
+    profile = f.createIfcRectangleProfileDef("AREA",None,None,1.0,1.0)
+    solid = f.createIfcExtrudedAreaSolid(profile,origin,f.createIfcDirection((0.0,0.0,1.0)),1.0)
+    mapsource = f.createIfcRepresentationMap(origin,f.createIfcShapeRepresentation(context,"Body","SweptSolid",[solid]))
+    operator = f.createIfcCartesianTransformationOperator3D(None,None,f.createIfcCartesianPoint((0.0,0.0,0.0)),None,None)
+    mats = [f.createIfcMaterial("Material "+str(i)) for i in range(materials)]
+    colour = f.createIfcColourRgb(None,0.5,0.5,0.5)
+    rendering = f.create_entity("IfcSurfaceStyleRendering",SurfaceColour=colour,ReflectanceMethod="NOTDEFINED")
+    style = f.createIfcSurfaceStyle(None,"BOTH",[rendering])
+
+    layeritems = [[] for i in range(layers)]
+    matobjects = [[] for i in range(materials)]
+    for i in range(count):
+        item = f.createIfcMappedItem(mapsource,operator)
+        f.createIfcStyledItem(item,[style],None)
+        representation = f.createIfcShapeRepresentation(context,"Body","MappedRepresentation",[item])
+        placement = f.createIfcLocalPlacement(None,f.createIfcAxis2Placement3D(f.createIfcCartesianPoint((float(i),0.0,0.0)),None,None))
+        product = f.createIfcBuildingElementProxy(guid(),None,"Proxy "+str(i),None,None,placement,
+                                                  f.createIfcProductDefinitionShape(None,None,[representation]),None,None)
+        props = [f.createIfcPropertySingleValue("Property "+str(j),None,f.create_entity("IfcLabel",str(i)),None) for j in range(3)]
+        pset = f.createIfcPropertySet(guid(),None,"Pset_Benchmark",None,props)
+        f.createIfcRelDefinesByProperties(guid(),None,None,None,[product],pset)
+        layeritems[i % layers].append(representation)
+        matobjects[i % materials].append(product)
+    for i,items in enumerate(layeritems):
+        if items:
+            f.createIfcPresentationLayerAssignment("Layer "+str(i),None,items,None)
+    for mat,objs in zip(mats,matobjects):
+        if objs:
+            f.createIfcRelAssociatesMaterial(guid(),None,None,None,objs,mat)
+    if filename:
+        f.write(filename)
+    return f
+
+
+def getByProduct(ifcfile,products):
+
+    """gets the property sets, colors, layers and materials of the products
+    one by one, from the inverse relationships, as the importer used to do"""
+
+    psets = {}
+    colors = {}
+    layers = {}
+    materials = {}
+    for product in products:
+        pid = product.id()
+        psets[pid] = importIFCHelper.getIfcPropertySets(ifcfile, pid)
+        representation = product.Representation.Representations[0]
+        if representation.LayerAssignments:
+            layers[pid] = representation.LayerAssignments[0].Name
+        item = representation.Items[0]
+        if item.StyledByItem:
+            colors[pid] = importIFCHelper.getColorFromStyledItem(item.StyledByItem[0])
+        for rel in product.HasAssociations:
+            if rel.is_a("IfcRelAssociatesMaterial"):
+                materials[pid] = rel.RelatingMaterial.id()
+    return psets, colors, layers, materials
+
+
+def getByTables(ifcfile,products):
+
+    """gets the property sets, colors, layers and materials of the products
+    from the relation tables, as the importer does"""
+
+    prodrepr = importIFCHelper.buildRelProductRepresentation(ifcfile)
+    properties = importIFCHelper.buildRelProperties(ifcfile)
+    colors = importIFCHelper.buildRelProductColors(ifcfile, prodrepr)
+    prodlayers = importIFCHelper.buildRelLayers(ifcfile)
+    mattable = importIFCHelper.buildRelMattable(ifcfile)
+    psets = {}
+    layers = {}
+    materials = {}
+    for product in products:
+        pid = product.id()
+        psets[pid] = properties.get(pid,{})
+        if pid in prodlayers:
+            layers[pid] = prodlayers[pid]
+        if pid in mattable:
+            materials[pid] = mattable[pid]
+    return psets, colors, layers, materials
+
+
+def run(count=100000,filename=None):
+
+    """run([count,filename]): builds a synthetic IFC file with count products,
+    times the two ways to get their relationships, checks that they give the
+    same results and returns the times in seconds as a dictionary"""
+
+    t = time.time()
+    ifcfile = makeFile(count,filename=filename)
+    products = ifcfile.by_type("IfcBuildingElementProxy")
+    result = {"Count": count, "Build": time.time()-t}
+    t = time.time()
+    byproduct = getByProduct(ifcfile,products)
+    result["ByProduct"] = time.time()-t
+    t = time.time()
+    bytables = getByTables(ifcfile,products)
+    result["ByTables"] = time.time()-t
+    if byproduct != bytables:
+        print("Warning: the relation tables give different results")
+    print("Products:",count)
+    print("Walking the inverse relationships: {:.3f} s".format(result["ByProduct"]))
+    print("Using the relation tables: {:.3f} s".format(result["ByTables"]))
+    return result
@@ -20,10 +20,13 @@
 # ***************************************************************************
 
 import six
+import os
 import sys
 import math
+import hashlib
 
 import FreeCAD
+import Part
 import Arch
 import ArchIFC
 
@@ -138,6 +141,203 @@ class ProjectImporter:
         return round(math.degrees(math.atan2(y, x)) - 90, 6)
 
 
+class GeometryImporter:
+    """A helper class to compute the shapes of IFC products beforehand
+
+    The shapes are computed by the IfcOpenShell geometry iterator, which
+    runs on several cores, and are handed to the import loop as they
+    arrive. The iterator doesn't follow the order of the products, so the
+    shapes it yields before the requested one are kept until they are
+    requested. The iterator gives the geometry of each product in its local
+    coordinates, so products sharing the same geometry (mapped items)
+    share the same FreeCAD shape, placed at the product transformation."""
+
+    def __init__(self, ifcfile, products, cores, preferences, structural=()):
+        self.shapes = {}  # { productid:shape } computed but not requested yet
+        self.sources = {}  # { geometryid:shape } shapes shared by products
+        self.iterator = None
+        # structural objects need curves, they are computed one by one
+        include = [p for p in products if getattr(p,"Representation",None) and not (p.is_a() in structural)]
+        self.ids = set([p.id() for p in include])
+        if not include:
+            return
+        import ifcopenshell.geom
+        settings = ifcopenshell.geom.settings()
+        settings.set(settings.USE_BREP_DATA,True)
+        settings.set(settings.SEW_SHELLS,True)
+        if preferences['SEPARATE_OPENINGS']:
+            settings.set(settings.DISABLE_OPENING_SUBTRACTIONS,True)
+        if preferences['SPLIT_LAYERS'] and hasattr(settings,"APPLY_LAYERSETS"):
+            settings.set(settings.APPLY_LAYERSETS,True)
+        iterator = ifcopenshell.geom.iterator(settings, ifcfile, max(1,cores), include=include)
+        if iterator.initialize():
+            self.iterator = iterator
+
+    def getShape(self, pid):
+        """returns the shape of the given product id, or None if the iterator
+        could not compute it. The shapes yielded before it are kept"""
+
+        if not pid in self.ids:
+            return None
+        while (not pid in self.shapes) and self.iterator:
+            self.addShape(self.iterator.get())
+            if not self.iterator.next():
+                self.iterator = None
+        self.ids.remove(pid)
+        return self.shapes.pop(pid,None)
+
+    def addShape(self, item):
+        if not item.id in self.ids:
+            return  # not requested
+        geometry = item.geometry
+        source = self.sources.get(geometry.id)
+        if source is None:
+            if not geometry.brep_data:
+                return
+            source = Part.Shape()
+            source.importBrepFromString(geometry.brep_data,False)
+            source.scale(1000.0)  # IfcOpenShell always outputs in meters
+            self.sources[geometry.id] = source
+        m = item.transformation.matrix.data
+        matrix = FreeCAD.Matrix(m[0],m[3],m[6],m[9]*1000,
+                                m[1],m[4],m[7],m[10]*1000,
+                                m[2],m[5],m[8],m[11]*1000,
+                                0,0,0,1)
+        if abs(matrix.determinant()-1) > 1e-7:
+            # scaled mapped items can't share the geometry
+            self.shapes[item.id] = source.transformGeometry(matrix)
+        else:
+            self.shapes[item.id] = source.transformed(matrix)
+
+
+class ShapeCache:
+    """A helper class to store the imported shapes of IFC products on disk
+
+    The shapes are stored by GlobalId, together with a hash of everything
+    their geometry depends on: the placement and representation subgraphs
+    of the product and of its openings, and the import settings. The hash
+    doesn't depend on the entity ids, so a product which didn't change in
+    a new revision of a file is found in the cache even if the file was
+    renumbered. One database is kept per IfcProject. The shapes are written
+    to disk as they are stored, so an interrupted import keeps them."""
+
+    VERSION = 1  # bump to invalidate all stored shapes
+    BATCH = 100  # number of stored shapes written to disk at once
+
+    def __init__(self, ifcfile, preferences, path=None):
+        import sqlite3
+        import ifcopenshell
+        if not path:
+            path = os.path.join(FreeCAD.getUserAppDataDir(),"IfcCache")
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        projects = ifcfile.by_type("IfcProject")
+        name = projects[0].GlobalId if projects else "default"
+        # the shapes also depend on the length unit of the file and on the
+        # IfcOpenShell version which computed them
+        self.settings = "{}:{}:{}:{}:{}".format(self.VERSION,
+                                                int(preferences['SEPARATE_OPENINGS']),
+                                                int(preferences['SPLIT_LAYERS']),
+                                                repr(getScaling(ifcfile)),
+                                                getattr(ifcopenshell,"version",""))
+        self.openings = not preferences['SEPARATE_OPENINGS']
+        self.layers = preferences['SPLIT_LAYERS']
+        self.hashes = {}  # { entityid:hash } hashes of shared entities
+        self.keys = {}  # { (productid,structural):hash } hashes of products
+        self.pending = 0  # number of stored shapes not written to disk yet
+        self.connection = sqlite3.connect(os.path.join(path,name+".sqlite"))
+        self.connection.execute("CREATE TABLE IF NOT EXISTS shapes (guid TEXT PRIMARY KEY, hash TEXT, brep TEXT)")
+
+    def getKey(self, product, structural=False):
+        """returns the hash of the geometry of a product, or None if it
+        has no representation"""
+
+        memo = (product.id(),structural)
+        if not memo in self.keys:
+            key = None
+            if getattr(product,"Representation",None):
+                h = hashlib.sha1((self.settings+":"+str(int(structural))).encode("utf8"))
+                try:
+                    h.update(self.getHash(product.ObjectPlacement))
+                    h.update(self.getHash(product.Representation))
+                    if self.openings:
+                        for rel in getattr(product,"HasOpenings",[]):
+                            h.update(self.getHash(rel.RelatedOpeningElement.ObjectPlacement))
+                            h.update(self.getHash(rel.RelatedOpeningElement.Representation))
+                    if self.layers:
+                        # the layers of the material layer sets split the shape
+                        for rel in getattr(product,"HasAssociations",[]):
+                            if rel.is_a("IfcRelAssociatesMaterial"):
+                                h.update(self.getHash(rel.RelatingMaterial))
+                    key = h.hexdigest()
+                except RuntimeError:
+                    # too deeply nested, this product is not cached
+                    pass
+            self.keys[memo] = key
+        return self.keys[memo]
+
+    def getHash(self, value):
+        """returns a hash of an attribute value, independent of entity ids"""
+
+        if value is None:
+            return b"$"
+        if isinstance(value,(list,tuple)):
+            return b"(" + b",".join([self.getHash(v) for v in value]) + b")"
+        if not hasattr(value,"is_a"):
+            return repr(value).encode("utf8")
+        eid = value.id()
+        if eid and (eid in self.hashes):
+            return self.hashes[eid]
+        h = hashlib.sha1(value.is_a().encode("utf8"))
+        for i in range(len(value)):
+            h.update(self.getHash(value[i]))
+        result = h.digest()
+        if eid:
+            self.hashes[eid] = result
+        return result
+
+    def hasShape(self, product, structural=False):
+        """returns True if an up-to-date shape of this product is stored"""
+
+        key = self.getKey(product,structural)
+        if not key:
+            return False
+        row = self.connection.execute("SELECT hash FROM shapes WHERE guid=?",(product.GlobalId,)).fetchone()
+        return bool(row) and (row[0] == key)
+
+    def getShape(self, product, structural=False):
+        """returns the stored shape of this product, or None if there is
+        no up-to-date one"""
+
+        key = self.getKey(product,structural)
+        if not key:
+            return None
+        row = self.connection.execute("SELECT hash,brep FROM shapes WHERE guid=?",(product.GlobalId,)).fetchone()
+        if (not row) or (row[0] != key):
+            return None
+        shape = Part.Shape()
+        shape.importBrepFromString(row[1],False)
+        return shape
+
+    def setShape(self, product, shape, structural=False):
+        """stores the shape of this product"""
+
+        key = self.getKey(product,structural)
+        if key and product.GlobalId:
+            self.connection.execute("INSERT OR REPLACE INTO shapes VALUES (?,?,?)",
+                                    (product.GlobalId,key,shape.exportBrepToString()))
+            self.pending += 1
+            if self.pending >= self.BATCH:
+                self.connection.commit()
+                self.pending = 0
+
+    def close(self):
+        """writes the remaining stored shapes to disk"""
+
+        self.connection.commit()
+        self.connection.close()
+
+
 # type tables
 def buildRelProductsAnnotations(ifcfile, root_element):
     """build the products and annotations relation table and"""
@@ -237,10 +437,42 @@ def buildRelMattable(ifcfile):
     return mattable
 
 
+def buildRelLayers(ifcfile):
+    """build the product/layer relation table"""
+
+    replayers = {}  # { representationid:layername }
+    for l in ifcfile.by_type("IfcPresentationLayerAssignment"):
+        for it in l.AssignedItems:
+            replayers.setdefault(it.id(),l.Name)
+
+    layers = {}  # { productid:layername }
+    if replayers:
+        for p in ifcfile.by_type("IfcProduct"):
+            if getattr(p,"Representation",None) and p.Representation.Representations:
+                rid = p.Representation.Representations[0].id()
+                if rid in replayers:
+                    layers[p.id()] = replayers[rid]
+
+    return layers
+
+
 # ************************************************************************************************
 # color relation tables
 # products can have a color and materials can have a color and products can have a material
 # colors for material assigned to a product and product color can be different
+def buildRelStyles(ifcfile):
+    """build the representation item/styled item relation table"""
+
+    # the same as the StyledByItem inverse attribute of the items,
+    # but built in one pass instead of one lookup per item
+    styles = {}  # { itemid:styleditem }
+    for r in ifcfile.by_type("IfcStyledItem"):
+        if r.Item:
+            styles.setdefault(r.Item.id(),r)
+
+    return styles
+
+
 def buildRelColors(ifcfile, prodrepr):
     """build the colors relation table and"""
 
@@ -277,6 +509,7 @@ def buildRelColors(ifcfile, prodrepr):
         '''
     # a much faster version for Nova style_material_id with product_ids
     # no material colors, Nova ifc files often do not have materials at all
+    styles = buildRelStyles(ifcfile)
     for p in prodrepr.keys():
         # print("\n")
         # print(ifcfile[p])  # IfcProduct
@@ -287,8 +520,8 @@ def buildRelColors(ifcfile, prodrepr):
         # print(ifcfile[p].Representation.Representations[0].Items[0].StyledByItem[0].id())
         # print(p)
         representation_item = ifcfile[p].Representation.Representations[0].Items[0]
-        if hasattr(representation_item, "StyledByItem") and representation_item.StyledByItem:
-            style_material_id[representation_item.StyledByItem[0].id()] = p
+        if representation_item.id() in styles:
+            style_material_id[styles[representation_item.id()].id()] = p
 
     # Allplan, ArchiCAD
     for m in ifcfile.by_type("IfcMaterialDefinitionRepresentation"):
@@ -308,6 +541,7 @@ def buildRelProductColors(ifcfile, prodrepr):
 
     # gets the colors for the products
     colors = {}  # { id:(r,g,b) }
+    styles = buildRelStyles(ifcfile)
 
     for p in prodrepr.keys():
 
@@ -320,13 +554,14 @@ def buildRelProductColors(ifcfile, prodrepr):
         # print(representation_item)
 
         # get the geometric representations which have a presentation style
-        # all representation items have the inverse attribute StyledByItem for this
+        # all representation items have the inverse attribute StyledByItem for this,
+        # the styles table holds the first one of each item
         # there will be gemetric representations which do not have a presentation style
-        # the StyledByItem will be empty than
-        if representation_item.StyledByItem:
+        # they are not in the styles table than
+        if representation_item.id() in styles:
 
             # it has to be a IfcStyledItem, no check needed
-            styled_item = representation_item.StyledByItem[0]
+            styled_item = styles[representation_item.id()]
 
             # write into colors table if a IfcStyledItem exists for this product
             # write None if something goes wrong or if the ifc file has errors and thus no valid color is returned
@@ -425,8 +660,8 @@ def buildRelProperties(ifcfile):
     Builds and returns a dictionary of {object:[properties]} from an IFC file
     """
 
-    # this method no longer used by the importer module
-    # but this relation table might be useful anyway for other purposes
+    # used by the importer module instead of getIfcPropertySets, which walks
+    # the inverse relationships of one object and is slow on large files
 
     properties = {}  # { objid : { psetid : [propertyid, ... ], ... }, ... }
     for r in ifcfile.by_type("IfcRelDefinesByProperties"):
@@ -3067,65 +3067,8 @@ def calculatePlacement(globalRotation, edge, offset, RefPt, xlate, align, normal
 
 def calculatePlacementsOnPath(shapeRotation, pathwire, count, xlate, align):
     """Calculates the placements of a shape along a given path so that each copy will be distributed evenly"""
-    import Part
-    import DraftGeomUtils
-
-    closedpath = DraftGeomUtils.isReallyClosed(pathwire)
-    normal = DraftGeomUtils.getNormal(pathwire)
-    path = Part.__sortEdges__(pathwire.Edges)
-    ends = []
-    cdist = 0
-
-    for e in path:                                                 # find cumulative edge end distance
-        cdist += e.Length
-        ends.append(cdist)
-
-    placements = []
-
-    # place the start shape
-    pt = path[0].Vertexes[0].Point
-    placements.append(calculatePlacement(
-        shapeRotation, path[0], 0, pt, xlate, align, normal))
-
-    # closed path doesn't need shape on last vertex
-    if not(closedpath):
-        # place the end shape
-        pt = path[-1].Vertexes[-1].Point
-        placements.append(calculatePlacement(
-            shapeRotation, path[-1], path[-1].Length, pt, xlate, align, normal))
-
-    if count < 3:
-        return placements
-
-    # place the middle shapes
-    if closedpath:
-        stop = count
-    else:
-        stop = count - 1
-    step = float(cdist) / stop
-    remains = 0
-    travel = step
-    for i in range(1, stop):
-        # which edge in path should contain this shape?
-        # avoids problems with float math travel > ends[-1]
-        iend = len(ends) - 1
-
-        for j in range(0, len(ends)):
-            if travel <= ends[j]:
-                iend = j
-                break
-
-        # place shape at proper spot on proper edge
-        remains = ends[iend] - travel
-        offset = path[iend].Length - remains
-        pt = path[iend].valueAt(getParameterFromV0(path[iend], offset))
-
-        placements.append(calculatePlacement(
-            shapeRotation, path[iend], offset, pt, xlate, align, normal))
-
-        travel += step
-
-    return placements
+    from draftutils import array_placements
+    return array_placements.path_array(shapeRotation, pathwire, count, xlate, align)
 
 #---------------------------------------------------------------------------
 # Python Features definitions
@@ -5211,8 +5154,8 @@ class _DraftLink(_DraftObject):
                 shape = shape.copy()
                 shape.Placement = FreeCAD.Placement()
                 base = []
+                vis = getattr(obj,'VisibilityList',[])
                 for i,pla in enumerate(pls):
-                    vis = getattr(obj,'VisibilityList',[])
                     if len(vis)>i and not vis[i]:
                         continue;
                     # 'I' is a prefix for disambiguation when mapping element names
@@ -5312,77 +5255,16 @@ class _Array(_DraftLink):
             return _DraftLink.buildShape(self,obj,pl,pls)
 
     def rectArray(self,pl,xvector,yvector,zvector,xnum,ynum,znum):
-        import Part
-        base = [pl.copy()]
-        for xcount in range(xnum):
-            currentxvector=Vector(xvector).multiply(xcount)
-            if not xcount==0:
-                npl = pl.copy()
-                npl.translate(currentxvector)
-                base.append(npl)
-            for ycount in range(ynum):
-                currentyvector=FreeCAD.Vector(currentxvector)
-                currentyvector=currentyvector.add(Vector(yvector).multiply(ycount))
-                if not ycount==0:
-                    npl = pl.copy()
-                    npl.translate(currentyvector)
-                    base.append(npl)
-                for zcount in range(znum):
-                    currentzvector=FreeCAD.Vector(currentyvector)
-                    currentzvector=currentzvector.add(Vector(zvector).multiply(zcount))
-                    if not zcount==0:
-                        npl = pl.copy()
-                        npl.translate(currentzvector)
-                        base.append(npl)
-        return base
+        from draftutils import array_placements
+        return array_placements.rect_array(pl,xvector,yvector,zvector,xnum,ynum,znum)
 
     def circArray(self,pl,rdist,tdist,axis,center,cnum,sym):
-        import Part
-        sym = max(1, sym)
-        lead = (0,1,0)
-        if axis.x == 0 and axis.z == 0: lead = (1,0,0)
-        direction = axis.cross(Vector(lead)).normalize()
-        base = [pl.copy()]
-        for xcount in range(1, cnum):
-            rc = xcount*rdist
-            c = 2*rc*math.pi
-            n = math.floor(c/tdist)
-            n = int(math.floor(n/sym)*sym)
-            if n == 0: continue
-            angle = 360.0/n
-            for ycount in range(0, n):
-                npl = pl.copy()
-                trans = FreeCAD.Vector(direction).multiply(rc)
-                npl.translate(trans)
-                npl.rotate(npl.Rotation.inverted().multVec(center-trans), axis, ycount*angle)
-                base.append(npl)
-        return base
+        from draftutils import array_placements
+        return array_placements.circ_array(pl,rdist,tdist,axis,center,cnum,sym)
 
     def polarArray(self,spl,center,angle,num,axis,axisvector):
-        #print("angle ",angle," num ",num)
-        import Part
-        spin = FreeCAD.Placement(Vector(), spl.Rotation)
-        pl = FreeCAD.Placement(spl.Base, FreeCAD.Rotation())
-        center = center.sub(spl.Base)
-        base = [spl.copy()]
-        if angle == 360:
-            fraction = float(angle)/num
-        else:
-            if num == 0:
-                return base
-            fraction = float(angle)/(num-1)
-        ctr = DraftVecUtils.tup(center)
-        axs = DraftVecUtils.tup(axis)
-        for i in range(num-1):
-            currangle = fraction + (i*fraction)
-            npl = pl.copy()
-            npl.rotate(ctr, axs, currangle)
-            npl = npl.multiply(spin)
-            if axisvector:
-                if not DraftVecUtils.isNull(axisvector):
-                    npl.translate(FreeCAD.Vector(axisvector).multiply(i+1))
-            base.append(npl)
-        return base
+        from draftutils import array_placements
+        return array_placements.polar_array(spl,center,angle,num,axis,axisvector)
 
 class _PathArray(_DraftLink):
     """The Draft Path Array object"""
@@ -36,6 +36,7 @@ from collections import OrderedDict
 from FreeCAD import Vector
 from pivy import coin
 from PySide import QtCore,QtGui
+from draftutils import snap_index
 
 class Snapper:
     """The Snapper objects contains all the functionality used by draft
@@ -521,7 +522,8 @@ class Snapper:
                 ob = FreeCAD.ActiveDocument.getObject(o)
                 if ob:
                     if ob.isDerivedFrom("Part::Feature"):
-                        edges = ob.Shape.Edges
+                        # the edges list of the cached index is not rebuilt on every move
+                        edges = list(snap_index.get_edge_index((ob.Document.Name,ob.Name),ob.Shape).edges)
                         if Draft.getType(ob) == "Wall":
                             for so in [ob]+ob.Additions:
                                 if Draft.getType(so) == "Wall":
@@ -870,9 +872,17 @@ class Snapper:
                 obj = FreeCAD.ActiveDocument.getObject(self.lastObj[0])
                 if obj:
                     if obj.isDerivedFrom("Part::Feature") or (Draft.getType(obj) == "Axis"):
-                        if (not self.maxEdges) or (len(obj.Shape.Edges) <= self.maxEdges):
+                        # only the edges near the given shape are tested
+                        index = snap_index.get_edge_index((obj.Document.Name,obj.Name),obj.Shape)
+                        box = shape.BoundBox
+                        box.enlarge(Draft.tolerance())
+                        if self.isEnabled("WorkingPlane") and hasattr(FreeCAD,"DraftWorkingPlane"):
+                            # apparent intersections of lines projected on the working plane
+                            box = snap_index.extend_box(box,FreeCAD.DraftWorkingPlane.axis)
+                        edges = index.query_edges(box)
+                        if (not self.maxEdges) or (len(edges) <= self.maxEdges):
                             import Part
-                            for e in obj.Shape.Edges:
+                            for e in edges:
                                 # get the intersection points
                                 try:
                                     if self.isEnabled("WorkingPlane") and hasattr(e,"Curve") and isinstance(e.Curve,(Part.Line,Part.LineSegment)) and hasattr(shape,"Curve") and isinstance(shape.Curve,(Part.Line,Part.LineSegment)):
@@ -108,6 +108,14 @@ from drafttests.test_dxf import DraftDXF as DraftTest08
 from drafttests.test_dwg import DraftDWG as DraftTest09
 from drafttests.test_oca import DraftOCA as DraftTest10
 from drafttests.test_airfoildat import DraftAirfoilDAT as DraftTest11
+from drafttests.test_dxf_writer import DraftDXFWriter as DraftTest13
+from drafttests.test_dxf_stream import DraftDXFStream as DraftTest15
+
+# Snapping tests
+from drafttests.test_snap_index import DraftSnapIndex as DraftTest12
+
+# Array tests
+from drafttests.test_array_placements import DraftArrayPlacements as DraftTest14
 
 # Use the modules so that code checkers don't complain (flake8)
 True if DraftTest01 else False
@@ -121,3 +129,7 @@ True if DraftTest08 else False
 True if DraftTest09 else False
 True if DraftTest10 else False
 True if DraftTest11 else False
+True if DraftTest12 else False
+True if DraftTest13 else False
+True if DraftTest14 else False
+True if DraftTest15 else False
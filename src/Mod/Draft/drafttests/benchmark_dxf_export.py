@@ -0,0 +1,213 @@
+"""Benchmark of the DXF exporters of the Draft module on Arch sections.
+
+A grid of identical Arch structures, half of them rotated, is cut
+by a section plane. Two exports are timed, each one with the legacy
+writer, based on `dxfLibrary`, and with the fast writer
+of `draftutils.dxf_writer`:
+
+- `'section'`: the cut shapes of the section plane, written
+  as one shape, as in a plan exported from a section view.
+- `'objects'`: the structures themselves, written by `importDXF.export`
+  and `importDXF.exportFast`; the fast writer shares one block
+  between all structures.
+
+The legacy writer is skipped if the DXF libraries are not installed.
+
+Run it from the Python console
+::
+    from drafttests import benchmark_dxf_export
+    benchmark_dxf_export.run_benchmark(counts=(100, 1000))
+"""
+## @package benchmark_dxf_export
+# \ingroup DRAFT
+# \brief Benchmark of the DXF exporters of the Draft module
+
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import FreeCAD as App
+from FreeCAD import Vector
+
+# Number of structures of the benchmark cases
+COUNTS = (100, 1000, 5000)
+
+# Distance between the structures of the grid
+SPACING = 2000
+
+
+def run_benchmark(counts=COUNTS, result_file=None):
+    """Run the benchmark for the given numbers of structures.
+
+    Parameters
+    ----------
+    counts : iterable of int, optional
+        It defaults to `COUNTS`. The numbers of structures of the cases.
+
+    result_file : str, optional
+        It defaults to `None`. If it is given, the results
+        are written to it in JSON format.
+
+    Returns
+    -------
+    list of dict
+        One dictionary per case and export, with the keys
+        `'Count'`, `'Export'`, `'Legacy'` and `'Fast'`.
+        The last two are dictionaries with the time in seconds
+        and the size in bytes of the file, or `None` if the writer
+        is not available.
+    """
+    import importDXF
+    importDXF.readPreferences()
+    importDXF.getDXFlibs()
+    if not importDXF.dxfLibrary:
+        App.Console.PrintWarning("DXF libraries not found, "
+                                 "only the fast writer is timed\n")
+    results = []
+    working_dir = tempfile.mkdtemp(prefix="draft_dxf_benchmark_")
+    try:
+        for count in counts:
+            results.extend(run_case(count, working_dir))
+    finally:
+        shutil.rmtree(working_dir, ignore_errors=True)
+    App.Console.PrintMessage("{:>8} {:>8} {:>12} {:>12}\n"
+                             .format("Count", "Export", "Legacy", "Fast"))
+    for r in results:
+        App.Console.PrintMessage("{:>8} {:>8} {:>12} {:>12}\n"
+                                 .format(r["Count"], r["Export"],
+                                         _format_time(r["Legacy"]),
+                                         _format_time(r["Fast"])))
+    if result_file:
+        with open(result_file, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return results
+
+
+def run_case(count, working_dir):
+    """Time the exports of a grid of `count` structures.
+
+    Returns
+    -------
+    list of dict
+        The results of the `'section'` and `'objects'` exports,
+        see `run_benchmark`.
+    """
+    import Part
+    import ArchSectionPlane
+    import importDXF
+    from draftutils import dxf_writer
+
+    doc = App.newDocument("DraftDXFBenchmark")
+    try:
+        structures = make_structures(count)
+        section = ArchSectionPlane.makeSectionPlane(structures)
+        doc.recompute()
+        objs, cutplane, onlySolids, clip, direction = \
+            ArchSectionPlane.getSectionData(section)
+        shapes = ArchSectionPlane.getCutShapes(objs, cutplane, onlySolids,
+                                               clip, False, False)
+        cut = Part.makeCompound(shapes[0] + shapes[2])
+        path = os.path.join(working_dir, "{}.dxf".format(count))
+
+        def write_legacy_section():
+            dxf = importDXF.dxfLibrary.Drawing()
+            importDXF.writeShape(cut, section, dxf)
+            dxf.saveas(path)
+
+        def write_fast_section():
+            writer = dxf_writer.DXFWriter()
+            writer.add_shape(cut, "SECTION")
+            writer.save(path)
+
+        def write_legacy_objects():
+            _export_legacy(structures, path)
+
+        def write_fast_objects():
+            importDXF.exportFast(structures, [], path)
+
+        results = []
+        for name, legacy, fast in (("section", write_legacy_section,
+                                    write_fast_section),
+                                   ("objects", write_legacy_objects,
+                                    write_fast_objects)):
+            result = {"Count": count, "Export": name,
+                      "Legacy": None, "Fast": _time(fast, path)}
+            if importDXF.dxfLibrary:
+                result["Legacy"] = _time(legacy, path)
+            results.append(result)
+        return results
+    finally:
+        App.closeDocument(doc.Name)
+
+
+def make_structures(count):
+    """Return a square grid of `count` identical Arch structures.
+
+    Every second structure is rotated by 90 degrees around the Z axis.
+    The structures cross the XY plane, where the default section plane
+    cuts them.
+    """
+    import Arch
+    side = max(1, int(round(count ** 0.5)))
+    structures = []
+    for i in range(count):
+        obj = Arch.makeStructure(length=1000, width=200, height=3000)
+        angle = 90 if i % 2 else 0
+        obj.Placement = App.Placement(Vector((i % side) * SPACING,
+                                             (i // side) * SPACING,
+                                             -1500),
+                                      App.Rotation(Vector(0, 0, 1), angle))
+        structures.append(obj)
+    return structures
+
+
+def _export_legacy(objects, path):
+    # importDXF.export with the legacy exporter and without the fast writer
+    import importDXF
+    p = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+    old = (p.GetBool("dxfUseLegacyExporter", False),
+           p.GetBool("dxfFastExport", False))
+    p.SetBool("dxfUseLegacyExporter", True)
+    p.SetBool("dxfFastExport", False)
+    try:
+        importDXF.export(objects, path)
+    finally:
+        p.SetBool("dxfUseLegacyExporter", old[0])
+        p.SetBool("dxfFastExport", old[1])
+
+
+def _time(function, path):
+    start = time.time()
+    function()
+    return {"Time": time.time() - start, "Size": os.path.getsize(path)}
+
+
+def _format_time(result):
+    if result is None:
+        return "-"
+    return "{:.3f} s".format(result["Time"])
@@ -0,0 +1,167 @@
+"""Unit test for the Draft module, placements of arrays.
+"""
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import math
+import unittest
+import FreeCAD as App
+from FreeCAD import Vector
+from draftutils import array_placements
+from .auxiliary import _msg
+from .auxiliary import _draw_header
+
+
+class DraftArrayPlacements(unittest.TestCase):
+    """Test the placements of the copies of arrays."""
+
+    def setUp(self):
+        """Draw the header of the test."""
+        _draw_header()
+        self.pl = App.Placement(Vector(1, 2, 3),
+                                App.Rotation(Vector(1, 1, 0), 30))
+
+    def _assert_placements(self, placements, expected, operation):
+        """Compare two lists of placements."""
+        self.assertEqual(len(placements), len(expected),
+                         "'{}' failed".format(operation))
+        for pl, epl in zip(placements, expected):
+            self.assertTrue(pl.isSame(epl, 1e-9),
+                            "'{}' failed".format(operation))
+
+    def test_rect_array(self):
+        """Translate the copies in three directions."""
+        operation = "array_placements.rect_array"
+        _msg("  Test '{}'".format(operation))
+        xv, yv, zv = Vector(10, 0, 0), Vector(0, 5, 1), Vector(0, 0, 7)
+        expected = []
+        for i in range(3):
+            for j in range(2):
+                for k in range(4):
+                    pl = self.pl.copy()
+                    pl.move(xv * i + yv * j + zv * k)
+                    expected.append(pl)
+        placements = array_placements.rect_array(self.pl, xv, yv, zv,
+                                                 3, 2, 4)
+        self._assert_placements(placements, expected, operation)
+
+    def test_rect_array_zero(self):
+        """Ignore the following directions after a count of zero."""
+        operation = "array_placements.rect_array"
+        _msg("  Test '{}' with zero counts".format(operation))
+        xv, yv, zv = Vector(10, 0, 0), Vector(0, 5, 1), Vector(0, 0, 7)
+        placements = array_placements.rect_array(self.pl, xv, yv, zv,
+                                                 0, 2, 4)
+        self._assert_placements(placements, [self.pl], operation)
+        expected = []
+        for i in range(3):
+            pl = self.pl.copy()
+            pl.move(xv * i)
+            expected.append(pl)
+        placements = array_placements.rect_array(self.pl, xv, yv, zv,
+                                                 3, 0, 4)
+        self._assert_placements(placements, expected, operation)
+        expected = []
+        for i in range(3):
+            for j in range(2):
+                pl = self.pl.copy()
+                pl.move(xv * i + yv * j)
+                expected.append(pl)
+        placements = array_placements.rect_array(self.pl, xv, yv, zv,
+                                                 3, 2, 0)
+        self._assert_placements(placements, expected, operation)
+
+    def test_circ_array(self):
+        """Rotate the copies on concentric circles."""
+        operation = "array_placements.circ_array"
+        _msg("  Test '{}'".format(operation))
+        axis, center = Vector(0, 0, 1), Vector(3, 4, 0)
+        direction = axis.cross(Vector(0, 1, 0)).normalize()
+        expected = [self.pl.copy()]
+        for ring in range(1, 3):
+            n = int(math.floor(2 * ring * 10 * math.pi / 8 / 3) * 3)
+            for i in range(n):
+                pl = self.pl.copy()
+                trans = Vector(direction).multiply(ring * 10)
+                pl.translate(trans)
+                pl.rotate(pl.Rotation.inverted().multVec(center - trans),
+                          axis, i * 360.0 / n)
+                expected.append(pl)
+        placements = array_placements.circ_array(self.pl, 10, 8, axis,
+                                                 center, 3, 3)
+        self._assert_placements(placements, expected, operation)
+
+    def test_polar_array(self):
+        """Rotate the copies around an axis."""
+        operation = "array_placements.polar_array"
+        _msg("  Test '{}'".format(operation))
+        axis, center = Vector(0, 1, 1), Vector(-5, 0, 2)
+        axisvector = Vector(0, 0, 2)
+        for angle, num in ((360, 6), (90, 4)):
+            fraction = angle / num if angle == 360 else angle / (num - 1)
+            expected = [self.pl.copy()]
+            for i in range(1, num):
+                pl = App.Placement(self.pl.Base, App.Rotation())
+                pl.rotate(center - self.pl.Base, axis, i * fraction)
+                pl = pl.multiply(App.Placement(Vector(), self.pl.Rotation))
+                pl.translate(axisvector * i)
+                expected.append(pl)
+            placements = array_placements.polar_array(self.pl, center,
+                                                      angle, num, axis,
+                                                      axisvector)
+            self._assert_placements(placements, expected, operation)
+
+    def test_path_array(self):
+        """Align the copies with a planar path."""
+        operation = "array_placements.path_array"
+        _msg("  Test '{}'".format(operation))
+        import Part
+        import Draft
+        wire = Part.Wire([Part.LineSegment(Vector(0, 0, 0),
+                                           Vector(10, 0, 0)).toShape(),
+                          Part.Arc(Vector(10, 0, 0), Vector(15, 5, 0),
+                                   Vector(10, 10, 0)).toShape()])
+        xlate = Vector(0, 0, 1)
+        edges = Part.__sortEdges__(wire.Edges)
+        ends = [edges[0].Length, edges[0].Length + edges[1].Length]
+        step = ends[-1] / 5
+        expected = [Draft.calculatePlacement(self.pl.Rotation, edges[0], 0,
+                                             Vector(0, 0, 0), xlate, True,
+                                             Vector(0, 0, 1)),
+                    Draft.calculatePlacement(self.pl.Rotation, edges[1],
+                                             edges[1].Length,
+                                             edges[1].Vertexes[-1].Point,
+                                             xlate, True, Vector(0, 0, 1))]
+        for i in range(1, 5):
+            travel = step * i
+            j = 0 if travel <= ends[0] else 1
+            offset = edges[j].Length - (ends[j] - travel)
+            pt = edges[j].valueAt(Draft.getParameterFromV0(edges[j], offset))
+            expected.append(Draft.calculatePlacement(self.pl.Rotation,
+                                                     edges[j], offset, pt,
+                                                     xlate, True,
+                                                     Vector(0, 0, 1)))
+        placements = array_placements.path_array(self.pl.Rotation, wire,
+                                                 6, xlate, True)
+        self._assert_placements(placements, expected, operation)
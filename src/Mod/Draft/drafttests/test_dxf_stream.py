@@ -0,0 +1,199 @@
+"""Unit test for the Draft module, streaming DXF import.
+"""
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import FreeCAD as App
+import importDXF
+from .auxiliary import _msg
+from .auxiliary import _draw_header
+
+TABLES = ["0", "SECTION", "2", "TABLES",
+          "0", "TABLE", "2", "LAYER", "70", "2",
+          "0", "LAYER", "2", "Walls", "70", "0", "62", "1", "6", "CONTINUOUS",
+          "0", "LAYER", "2", "Doors", "70", "0", "62", "3", "6", "CONTINUOUS",
+          "0", "ENDTAB",
+          "0", "ENDSEC"]
+
+
+def _line(layer, x1, y1, x2, y2):
+    """Return the group codes of a line."""
+    return ["0", "LINE", "8", layer,
+            "10", str(x1), "20", str(y1), "30", "0.0",
+            "11", str(x2), "21", str(y2), "31", "0.0"]
+
+
+def _count_entities(data):
+    """Return the number of entities in the group codes of a batch."""
+    lines = data.splitlines()
+    return len([i for i in range(0, len(lines), 2)
+                if lines[i].strip() == b"0"])
+
+
+def _dxf_data(entities):
+    """Return the content of a DXF file with the given entities."""
+    data = TABLES + ["0", "SECTION", "2", "ENTITIES"]
+    for entity in entities:
+        data.extend(entity)
+    data.extend(["0", "ENDSEC", "0", "EOF"])
+    return "\n".join(data) + "\n"
+
+
+class DraftDXFStream(unittest.TestCase):
+    """Test the streaming DXF importer."""
+
+    def setUp(self):
+        """Draw the header of the test and make a working directory."""
+        _draw_header()
+        self.working_dir = tempfile.mkdtemp(prefix="draft_dxf_stream_")
+        self.doc_names = []
+
+    def _get_dxf_libs(self):
+        """Load the DXF libraries, skip the test if they are missing."""
+        if App.ConfigGet("UserAppData") not in sys.path:
+            sys.path.append(App.ConfigGet("UserAppData"))
+        try:
+            import dxfReader  # noqa: F401
+        except ImportError:
+            self.skipTest("the DXF libraries are not installed")
+        importDXF.readPreferences()
+        importDXF.getDXFlibs()
+        if not importDXF.dxfReader:
+            self.skipTest("the DXF libraries are not available")
+
+    def _write_file(self, entities):
+        """Write a DXF file with the given entities, return its path."""
+        path = os.path.join(self.working_dir, "stream.dxf")
+        with open(path, "w") as f:
+            f.write(_dxf_data(entities))
+        return path
+
+    def _new_document(self, name):
+        """Make a new document, closed in tearDown."""
+        doc = App.newDocument(name)
+        self.doc_names.append(doc.Name)
+        return doc
+
+    def _get_geometry(self, doc):
+        """Return the length and the bounding box of the edges of a doc."""
+        doc.recompute()
+        length = 0
+        bb = App.BoundBox()
+        for obj in doc.Objects:
+            if hasattr(obj, "Shape") and not obj.Shape.isNull():
+                for edge in obj.Shape.Edges:
+                    length += edge.Length
+                    bb.add(edge.BoundBox)
+        return [length, bb.XMin, bb.YMin, bb.XMax, bb.YMax]
+
+    def _assert_geometry(self, geometry, expected, operation):
+        """Compare the lengths and bounding boxes of two documents."""
+        for value, evalue in zip(geometry, expected):
+            self.assertAlmostEqual(value, evalue, 6,
+                                   "'{}' failed".format(operation))
+
+    def test_sections(self):
+        """Split the entities of a file in batches."""
+        operation = "importDXF.readDXFSections"
+        _msg("  Test '{}'".format(operation))
+        polyline = ["0", "POLYLINE", "8", "Walls", "66", "1", "70", "0"]
+        for x in range(3):
+            polyline.extend(["0", "VERTEX", "8", "Walls",
+                             "10", str(x), "20", "0.0", "30", "0.0"])
+        polyline.extend(["0", "SEQEND"])
+        entities = [_line("Walls", 0, 0, 1, 0), polyline,
+                    _line("Walls", 1, 0, 1, 1), _line("Doors", 1, 1, 0, 1),
+                    _line("Doors", 0, 1, 0, 0)]
+        data = _dxf_data(entities).encode("latin1")
+        sections = list(importDXF.readDXFSections(io.BytesIO(data), 2))
+        self.assertEqual([name for name, batch in sections],
+                         ["TABLES", "ENTITIES", "ENTITIES", "ENTITIES"],
+                         "'{}' failed".format(operation))
+        # the polyline and its vertices are in the first batch
+        batches = [batch for name, batch in sections[1:]]
+        self.assertEqual([_count_entities(batch) for batch in batches],
+                         [6, 2, 1], "'{}' failed".format(operation))
+        self.assertIn(b"SEQEND", batches[0], "'{}' failed".format(operation))
+        # nothing is lost or repeated
+        body = "\n".join(sum(entities, [])) + "\n"
+        self.assertEqual(b"".join(batches), body.encode("latin1"),
+                         "'{}' failed".format(operation))
+
+    def test_stream_import(self):
+        """Import a small file in batches and with the legacy importer."""
+        operation = "importDXF.processdxfStream"
+        _msg("  Test '{}'".format(operation))
+        self._get_dxf_libs()
+        entities = [_line("Walls", 0, 0, 10, 0), _line("Walls", 10, 0, 10, 5),
+                    _line("Doors", 10, 5, 0, 5),
+                    ["0", "CIRCLE", "8", "Doors", "10", "3.0", "20", "2.0",
+                     "30", "0.0", "40", "1.5"],
+                    ["0", "ARC", "8", "Walls", "10", "0.0", "20", "5.0",
+                     "30", "0.0", "40", "2.0", "50", "90.0", "51", "270.0"]]
+        path = self._write_file(entities)
+        legacy = self._new_document("DraftDXFLegacy")
+        importDXF.processdxf(legacy, path)
+        stream = self._new_document("DraftDXFStream")
+        importDXF.processdxfStream(stream, path, batchSize=2, processes=1)
+        self._assert_geometry(self._get_geometry(stream),
+                              self._get_geometry(legacy), operation)
+        # one object per layer
+        self.assertEqual(len([o for o in stream.Objects
+                              if o.TypeId == "Part::Feature"]), 2,
+                         "'{}' failed".format(operation))
+
+    def test_stream_import_processes(self):
+        """Draw the batches in worker processes and in a single process."""
+        operation = "importDXF.buildDXFShapes"
+        _msg("  Test '{}'".format(operation))
+        self._get_dxf_libs()
+        entities = []
+        for i in range(20):
+            layer = "Walls" if i % 2 else "Doors"
+            entities.append(_line(layer, i, 0, i, 10 + i))
+            entities.append(["0", "CIRCLE", "8", layer,
+                             "10", str(i), "20", "20.0", "30", "0.0",
+                             "40", str(0.5 + i / 10.0)])
+        path = self._write_file(entities)
+        serial = self._new_document("DraftDXFSerial")
+        importDXF.processdxfStream(serial, path, batchSize=3, processes=1)
+        parallel = self._new_document("DraftDXFParallel")
+        importDXF.processdxfStream(parallel, path, batchSize=3, processes=2)
+        self._assert_geometry(self._get_geometry(parallel),
+                              self._get_geometry(serial), operation)
+        for doc in (serial, parallel):
+            self.assertEqual(len([o for o in doc.Objects
+                                  if o.TypeId == "Part::Feature"]), 2,
+                             "'{}' failed".format(operation))
+
+    def tearDown(self):
+        """Close the documents and remove the working directory."""
+        for name in self.doc_names:
+            App.closeDocument(name)
+        shutil.rmtree(self.working_dir, ignore_errors=True)
@@ -0,0 +1,92 @@
+"""Unit test for the Draft module, fast DXF writer.
+"""
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import unittest
+import FreeCAD as App
+from FreeCAD import Vector
+from draftutils import dxf_writer
+from .auxiliary import _msg
+from .auxiliary import _draw_header
+
+
+class DraftDXFWriter(unittest.TestCase):
+    """Test the fast DXF writer."""
+
+    def setUp(self):
+        """Draw the header of the test."""
+        _draw_header()
+
+    def _get_entities(self, writer):
+        """Return the entity types of the ENTITIES section."""
+        data = writer.get_string()
+        data = data.split("ENTITIES\n")[1].split("\n0\nENDSEC")[0]
+        lines = data.split("\n")
+        return [lines[i + 1] for i in range(0, len(lines) - 1, 2)
+                if lines[i] == "0"]
+
+    def test_shape(self):
+        """Write wires and lone edges of a shape."""
+        operation = "dxf_writer.DXFWriter.add_shape"
+        _msg("  Test '{}'".format(operation))
+        import Part
+        wire = Part.makePolygon([Vector(0, 0, 0), Vector(10, 0, 0),
+                                 Vector(10, 10, 0), Vector(0, 0, 0)])
+        circle = Part.makeCircle(5, Vector(20, 0, 0))
+        line = Part.LineSegment(Vector(0, 20, 0), Vector(10, 20, 0))
+        shape = Part.makeCompound([wire, circle, line.toShape()])
+        writer = dxf_writer.DXFWriter()
+        writer.add_layer("Walls", 1, "Dashed")
+        writer.add_shape(shape, "Walls")
+        entities = self._get_entities(writer)
+        self.assertEqual(entities.count("POLYLINE"), 1,
+                         "'{}' failed".format(operation))
+        self.assertEqual(entities.count("VERTEX"), 3,
+                         "'{}' failed".format(operation))
+        self.assertEqual(entities.count("CIRCLE"), 1,
+                         "'{}' failed".format(operation))
+        self.assertEqual(entities.count("LINE"), 1,
+                         "'{}' failed".format(operation))
+        self.assertIn("2\nWalls\n70\n0\n62\n1\n6\nDASHED\n",
+                      writer.get_string(), "'{}' failed".format(operation))
+
+    def test_blocks(self):
+        """Share one block between identical shapes."""
+        operation = "dxf_writer.DXFWriter.add_block"
+        _msg("  Test '{}'".format(operation))
+        import Part
+        box = Part.makeBox(10, 10, 10)
+        shape = Part.makeCompound(box.Faces[4].Wires + box.Faces[5].Wires)
+        writer = dxf_writer.DXFWriter()
+        names = set()
+        for i in range(3):
+            pl = App.Placement(Vector(100 * i, 0, 0),
+                               App.Rotation(Vector(0, 0, 1), 30 * i))
+            names.add(writer.add_block(shape, "BOX", "Boxes", 3, pl))
+        other = Part.makeCompound(Part.makeBox(5, 5, 5).Faces[4].Wires)
+        names.add(writer.add_block(other, "BOX", "Boxes", 3))
+        self.assertEqual(sorted(names), ["BOX", "BOX_"],
+                         "'{}' failed".format(operation))
+        self.assertEqual(self._get_entities(writer), ["INSERT"] * 4,
+                         "'{}' failed".format(operation))
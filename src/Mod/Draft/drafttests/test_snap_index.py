@@ -0,0 +1,115 @@
+"""Unit test for the Draft module, spatial index of edges for snapping.
+"""
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import unittest
+import FreeCAD as App
+from FreeCAD import Vector
+from draftutils import snap_index
+from .auxiliary import _msg
+from .auxiliary import _draw_header
+
+
+class DraftSnapIndex(unittest.TestCase):
+    """Test the spatial index of edges used by the snapper."""
+
+    def setUp(self):
+        """Set up a new document to hold the tests.
+
+        This is executed before every test, so we create a document
+        to hold the objects.
+        """
+        _draw_header()
+        self.doc_name = self.__class__.__name__
+        if App.ActiveDocument:
+            if App.ActiveDocument.Name != self.doc_name:
+                App.newDocument(self.doc_name)
+        else:
+            App.newDocument(self.doc_name)
+        App.setActiveDocument(self.doc_name)
+        self.doc = App.ActiveDocument
+        _msg("  Temporary document '{}'".format(self.doc_name))
+
+    def _make_grid(self, count, offset=0):
+        """Return a compound of count horizontal and vertical lines."""
+        import Part
+        edges = []
+        for i in range(count):
+            line = Part.LineSegment(Vector(offset, i, 0),
+                                    Vector(offset + 0.5, i, 0))
+            edges.append(line.toShape())
+            line = Part.LineSegment(Vector(offset + i, 2, 0),
+                                    Vector(offset + i, 3, 0))
+            edges.append(line.toShape())
+        return Part.makeCompound(edges)
+
+    def test_query(self):
+        """Compare the edges found by the index with all edges."""
+        operation = "snap_index.EdgeIndex.query"
+        _msg("  Test '{}'".format(operation))
+        shape = self._make_grid(200)
+        index = snap_index.EdgeIndex(shape)
+        boxes = [App.BoundBox(-1, -1, -1, 1, 1, 1),
+                 App.BoundBox(10.2, 1.5, -1, 20.5, 2.5, 1),
+                 App.BoundBox(500, 500, 0, 600, 600, 0)]
+        for box in boxes:
+            expected = [i for i, e in enumerate(shape.Edges)
+                        if e.BoundBox.intersect(box)]
+            self.assertEqual(index.query(box), expected,
+                             "'{}' failed".format(operation))
+        box = snap_index.extend_box(App.BoundBox(9.8, 2.2, 5, 10.2, 2.8, 6),
+                                    Vector(0, 0, 1))
+        self.assertEqual(len(index.query(box)), 1,
+                         "'{}' failed".format(operation))
+
+    def test_cache(self):
+        """Reuse the index until the object is recomputed."""
+        operation = "snap_index.get_edge_index"
+        _msg("  Test '{}'".format(operation))
+        obj = self.doc.addObject("Part::Feature", "Grid")
+        obj.Shape = self._make_grid(10)
+        self.doc.recompute()
+        key = (self.doc.Name, obj.Name)
+        index = snap_index.get_edge_index(key, obj.Shape)
+        self.assertIs(snap_index.get_edge_index(key, obj.Shape), index,
+                      "'{}' failed".format(operation))
+        obj.Shape = self._make_grid(10, offset=100)
+        self.doc.recompute()
+        new_index = snap_index.get_edge_index(key, obj.Shape)
+        self.assertIsNot(new_index, index, "'{}' failed".format(operation))
+        box = App.BoundBox(99, 0, -1, 101, 1, 1)
+        self.assertEqual(len(new_index.query(box)), 2,
+                         "'{}' failed".format(operation))
+        # the same geometry with another placement is not the same shape
+        moved = obj.Shape
+        moved.Placement = App.Placement(App.Vector(0, 0, 5), App.Rotation())
+        self.assertIsNot(snap_index.get_edge_index(key, moved), new_index,
+                         "'{}' failed".format(operation))
+
+    def tearDown(self):
+        """Finish the test.
+
+        This is executed after each test, so we close the document.
+        """
+        App.closeDocument(self.doc_name)
@@ -0,0 +1,380 @@
+"""This module provides the placements of the copies of Draft arrays.
+
+The placements of all copies are computed at once with NumPy,
+as arrays of rotation matrices and translation vectors, instead
+of copying and transforming one `Placement` after the other.
+The results are the same as those of the former implementations
+in `Draft._Array` and `Draft.calculatePlacementsOnPath`,
+including the order of the placements.
+"""
+## @package array_placements
+# \ingroup DRAFT
+# \brief This module provides the placements of the copies of Draft arrays
+
+# ***************************************************************************
+# *   (c) 2020 FreeCAD Developers                                           *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+
+import numpy as np
+
+import FreeCAD as App
+
+# Vectors shorter than this can't be normalized, as in Base::Vector3d
+_EPSILON = np.finfo(float).eps
+
+
+def rect_array(pl, xvector, yvector, zvector, xnum, ynum, znum):
+    """Return the placements of an orthogonal array.
+
+    Parameters
+    ----------
+    pl : Base::Placement
+        The placement of the base object.
+
+    xvector, yvector, zvector : Base::Vector3
+        The intervals in the three directions.
+
+    xnum, ynum, znum : int
+        The number of copies in the three directions.
+        As in the former nested loops of `_Array.rectArray`,
+        a number smaller than 1 counts as 1, and the numbers
+        of the following directions are then ignored.
+
+    Returns
+    -------
+    list of Base::Placement
+        The placements, ordered by the X, then Y, then Z index.
+        The first one is `pl`.
+    """
+    counts = [1, 1, 1]
+    for i, num in enumerate((xnum, ynum, znum)):
+        if num < 1:
+            break
+        counts[i] = num
+    index = np.indices(counts)
+    index = index.reshape(3, -1).T
+    vectors = np.array([_get_vector(xvector), _get_vector(yvector),
+                        _get_vector(zvector)])
+    rotation, translation = _get_matrix(pl)
+    translations = translation + index.dot(vectors)
+    return _get_placements(rotation, translations)
+
+
+def circ_array(pl, rdist, tdist, axis, center, cnum, sym):
+    """Return the placements of a circular array.
+
+    The copies are arranged in `cnum - 1` circles around the base
+    object, with a distance of `rdist` between the circles
+    and of about `tdist` between the copies of a circle.
+
+    Parameters
+    ----------
+    pl : Base::Placement
+        The placement of the base object.
+
+    rdist, tdist : float
+        The radial and tangential distances.
+
+    axis, center : Base::Vector3
+        The axis and the center of the rotations.
+
+    cnum : int
+        The number of circles, including the base object.
+
+    sym : int
+        The number of copies of each circle is a multiple of `sym`.
+
+    Returns
+    -------
+    list of Base::Placement
+        The placements, the first one is `pl`.
+    """
+    sym = max(1, sym)
+    lead = (0, 1, 0)
+    if axis.x == 0 and axis.z == 0:
+        lead = (1, 0, 0)
+    direction = _normalize(np.cross(_get_vector(axis), lead))
+    axis = _get_vector(axis)
+    center = _get_vector(center)
+    rotation, translation = _get_matrix(pl)
+    placements = [pl.copy()]
+    for xcount in range(1, cnum):
+        rc = xcount * rdist
+        n = math.floor(2 * rc * math.pi / tdist)
+        n = int(math.floor(n / sym) * sym)
+        if n == 0:
+            continue
+        # npl.translate(trans), then npl.rotate() around the center
+        # expressed in the coordinates of npl
+        trans = direction * rc
+        local = rotation.T.dot(center - trans)
+        spins = _get_rotations(axis, np.arange(n) * (360.0 / n))
+        rotations = np.matmul(rotation, spins)
+        shift = translation + trans + rotation.dot(local)
+        translations = shift - np.matmul(rotations, local)
+        placements.extend(_get_placements(rotations, translations))
+    return placements
+
+
+def polar_array(spl, center, angle, num, axis, axisvector):
+    """Return the placements of a polar array.
+
+    Parameters
+    ----------
+    spl : Base::Placement
+        The placement of the base object.
+
+    center, axis : Base::Vector3
+        The center and the axis of the rotations.
+
+    angle : float
+        The angle covered by the copies, in degrees.
+        If it is 360, the last copy is not on top of the first one.
+
+    num : int
+        The number of copies, including the base object.
+
+    axisvector : Base::Vector3
+        The translation between copies along the axis, or `None`.
+
+    Returns
+    -------
+    list of Base::Placement
+        The placements, the first one is `spl`.
+    """
+    import DraftVecUtils
+
+    placements = [spl.copy()]
+    if angle == 360:
+        fraction = float(angle) / num
+    else:
+        if num == 0:
+            return placements
+        fraction = float(angle) / (num - 1)
+    if num < 2:
+        return placements
+    spin, base = _get_matrix(spl)
+    center = _get_vector(center) - base
+    steps = np.arange(1, num)
+    rotations = _get_rotations(_get_vector(axis), steps * fraction)
+    translations = base + center - np.matmul(rotations, center)
+    if axisvector and not DraftVecUtils.isNull(axisvector):
+        translations += np.outer(steps, _get_vector(axisvector))
+    placements.extend(_get_placements(np.matmul(rotations, spin),
+                                      translations))
+    return placements
+
+
+def path_array(shapeRotation, pathwire, count, xlate, align):
+    """Return the placements of copies distributed along a path.
+
+    It computes the same placements as `Draft.calculatePlacement`
+    for each copy, but evaluates the edges only once per copy
+    and the orientations of all copies at once.
+
+    Parameters
+    ----------
+    shapeRotation : Base::Rotation
+        The rotation of the base object.
+
+    pathwire : Part::TopoShape ('Wire')
+        The path.
+
+    count : int
+        The number of copies.
+
+    xlate : Base::Vector3
+        An additional translation of all copies.
+
+    align : bool
+        If it is `True`, the copies are oriented along the path.
+
+    Returns
+    -------
+    list of Base::Placement
+        The placements, the start and the end of the path first,
+        unless the path is closed.
+    """
+    import Part
+    import DraftGeomUtils
+    import DraftVecUtils
+
+    closedpath = DraftGeomUtils.isReallyClosed(pathwire)
+    normal = DraftGeomUtils.getNormal(pathwire)
+    path = Part.__sortEdges__(pathwire.Edges)
+    lengths = np.array([e.Length for e in path])
+    ends = np.cumsum(lengths)
+
+    # edge index and offset along the edge of each copy
+    edges = [0]
+    offsets = [0.0]
+    if not closedpath:
+        edges.append(len(path) - 1)
+        offsets.append(path[-1].Length)
+    if count >= 3:
+        stop = count if closedpath else count - 1
+        step = float(ends[-1]) / stop
+        travel = step * np.arange(1, stop)
+        # avoids problems with float math travel > ends[-1]
+        iend = np.minimum(np.searchsorted(ends, travel), len(path) - 1)
+        edges.extend(iend.tolist())
+        offsets.extend((lengths[iend] - (ends[iend] - travel)).tolist())
+
+    flipped = {}
+    points = []
+    tangents = []
+    normals = []
+    for i, offset in zip(edges, offsets):
+        edge = path[i]
+        if i not in flipped:
+            start = edge.valueAt(edge.getParameterByLength(0))
+            flipped[i] = not DraftVecUtils.equals(edge.Vertexes[0].Point,
+                                                  start)
+        param = edge.getParameterByLength(edge.Length - offset
+                                          if flipped[i] else offset)
+        if len(points) == 0:
+            points.append(_get_vector(path[0].Vertexes[0].Point))
+        elif len(points) == 1 and not closedpath:
+            points.append(_get_vector(path[-1].Vertexes[-1].Point))
+        else:
+            points.append(_get_vector(edge.valueAt(param)))
+        if not align:
+            continue
+        tangents.append(_get_vector(edge.tangentAt(param)))
+        if normal:
+            continue
+        try:
+            n = edge.normalAt(param)
+            n.normalize()
+            normals.append(_get_vector(n))
+        except App.Base.FreeCADError:
+            normals.append(np.zeros(3))
+
+    translations = np.array(points) + _get_vector(xlate)
+    rotation = _get_rotation_matrix(shapeRotation)
+    if not align:
+        return _get_placements(rotation, translations)
+    if normal:
+        normals = _get_vector(normal)
+    rotations = _get_path_rotations(np.array(tangents), np.array(normals))
+    return _get_placements(np.matmul(rotations, rotation), translations)
+
+
+def _get_path_rotations(tangents, normals):
+    # the rotations which align the copies with the tangents,
+    # see Draft.calculatePlacement
+    count = len(tangents)
+    z = np.broadcast_to([0.0, 0.0, 1.0], (count, 3))
+    x = np.broadcast_to([1.0, 0.0, 0.0], (count, 3))
+    t = tangents / np.linalg.norm(tangents, axis=1)[:, None]
+    b = np.cross(t, normals)
+    length = np.linalg.norm(b, axis=1)
+    nonormal = length < _EPSILON
+    b = b / np.where(nonormal, 1.0, length)[:, None]
+    b[nonormal] = 0.0
+    lnodes = np.cross(z, b)
+    length = np.linalg.norm(lnodes, axis=1)
+    lnodes = lnodes / np.where(length < _EPSILON, 1.0, length)[:, None]
+    gimbal = np.abs(b[:, 2]) == 1.0
+    psi = np.where(gimbal, _angles(x, t, z), _angles(x, lnodes, z))
+    theta = np.where(gimbal, 0.0, _angles(z, b, lnodes))
+    phi = np.where(gimbal, 0.0, _angles(lnodes, t, b))
+    psi[nonormal] = theta[nonormal] = phi[nonormal] = 0.0
+    if nonormal.any():
+        App.Console.PrintWarning("Draft PathArray.orientShape - "
+                                 "Path normal is Null. Cannot align.\n")
+    if gimbal.any():
+        App.Console.PrintWarning("Draft PathArray.orientShape - "
+                                 "Gimbal lock. Infinite lnodes. "
+                                 "Change Path or Base.\n")
+    return np.matmul(np.matmul(_get_rotations(b, phi),
+                               _get_rotations(lnodes, theta)),
+                     _get_rotations(z, psi))
+
+
+def _angles(u, v, normal):
+    # signed angles in degrees between the rows of u and v,
+    # as DraftVecUtils.angle
+    ll = np.linalg.norm(u, axis=1) * np.linalg.norm(v, axis=1)
+    dp = np.einsum("ij,ij->i", u, v) / np.where(ll == 0, 1.0, ll)
+    dp = np.clip(dp, -1.0, 1.0)
+    ang = np.degrees(np.arccos(dp))
+    coeff = np.einsum("ij,ij->i", normal, np.cross(u, v))
+    ang = np.where(coeff >= 0, ang, -ang)
+    return np.where(ll == 0, 0.0, ang)
+
+
+def _get_rotations(axes, angles):
+    # rotation matrices around the axes by the angles in degrees,
+    # as Base::Rotation, a null axis gives the identity
+    angles = np.radians(np.asarray(angles, dtype=float))
+    axes = np.broadcast_to(np.asarray(axes, dtype=float),
+                           angles.shape + (3,))
+    length = np.linalg.norm(axes, axis=-1)
+    k = axes / np.where(length < _EPSILON, 1.0, length)[..., None]
+    k = np.where((length < _EPSILON)[..., None], 0.0, k)
+    c = np.cos(angles)[..., None, None]
+    s = np.sin(angles)[..., None, None]
+    cross = np.zeros(angles.shape + (3, 3))
+    cross[..., 0, 1] = -k[..., 2]
+    cross[..., 0, 2] = k[..., 1]
+    cross[..., 1, 0] = k[..., 2]
+    cross[..., 1, 2] = -k[..., 0]
+    cross[..., 2, 0] = -k[..., 1]
+    cross[..., 2, 1] = k[..., 0]
+    outer = k[..., :, None] * k[..., None, :]
+    rotations = c * np.eye(3) + s * cross + (1 - c) * outer
+    # Base::Rotation normalizes the quaternion of a null axis
+    # to the identity
+    rotations[length < _EPSILON] = np.eye(3)
+    return rotations
+
+
+def _get_placements(rotations, translations):
+    rotations = np.broadcast_to(rotations, (len(translations), 3, 3))
+    matrices = np.zeros((len(translations), 16))
+    matrices[:, [0, 1, 2, 4, 5, 6, 8, 9, 10]] = rotations.reshape(-1, 9)
+    matrices[:, [3, 7, 11]] = translations
+    matrices[:, 15] = 1.0
+    return [App.Placement(App.Matrix(*m)) for m in matrices.tolist()]
+
+
+def _get_matrix(placement):
+    m = placement.toMatrix()
+    rotation = np.array([[m.A11, m.A12, m.A13],
+                         [m.A21, m.A22, m.A23],
+                         [m.A31, m.A32, m.A33]])
+    return rotation, np.array([m.A14, m.A24, m.A34])
+
+
+def _get_rotation_matrix(rotation):
+    return _get_matrix(App.Placement(App.Vector(), rotation))[0]
+
+
+def _get_vector(vector):
+    return np.array([vector.x, vector.y, vector.z], dtype=float)
+
+
+def _normalize(vector):
+    return vector / np.linalg.norm(vector)
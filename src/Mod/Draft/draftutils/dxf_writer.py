@@ -0,0 +1,354 @@
+"""This module provides a fast writer of DXF files from shapes.
+
+The legacy exporter of `importDXF` creates one `dxfLibrary` object
+for every entity, and formats it with many small string operations.
+This writer formats each entity with a single template, keeps the
+entities of each layer together, and writes the whole file at once.
+The contents of blocks are compared, so identical geometry,
+for example copies of the same object, is written in a single block
+which is inserted several times.
+"""
+## @package dxf_writer
+# \ingroup DRAFT
+# \brief This module provides a fast writer of DXF files from shapes
+
+# ***************************************************************************
+# *   (c) 2020 FreeCAD Developers                                           *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+from collections import OrderedDict
+
+import FreeCAD as App
+
+# AutoCAD color index meaning "the color of the layer"
+BYLAYER = 256
+
+_LINE = ("0\nLINE\n8\n%s\n62\n%d\n"
+         "10\n%.12g\n20\n%.12g\n30\n%.12g\n"
+         "11\n%.12g\n21\n%.12g\n31\n%.12g\n")
+_CIRCLE = ("0\nCIRCLE\n8\n%s\n62\n%d\n"
+           "10\n%.12g\n20\n%.12g\n30\n%.12g\n40\n%.12g\n")
+_ARC = ("0\nARC\n8\n%s\n62\n%d\n"
+        "10\n%.12g\n20\n%.12g\n30\n%.12g\n40\n%.12g\n"
+        "50\n%.12g\n51\n%.12g\n")
+_POLYLINE = "0\nPOLYLINE\n8\n%s\n62\n%d\n66\n1\n70\n%d\n"
+_VERTEX = "0\nVERTEX\n8\n%s\n10\n%.12g\n20\n%.12g\n30\n%.12g\n42\n%.12g\n"
+_SEQEND = "0\nSEQEND\n8\n%s\n"
+_TEXT = ("0\nTEXT\n8\n%s\n62\n%d\n"
+         "10\n%.12g\n20\n%.12g\n30\n%.12g\n40\n%.12g\n1\n%s\n7\nSTANDARD\n")
+_INSERT = ("0\nINSERT\n8\n%s\n62\n%d\n2\n%s\n"
+           "10\n%.12g\n20\n%.12g\n30\n%.12g\n50\n%.12g\n")
+_LAYER = "0\nLAYER\n2\n%s\n70\n0\n62\n%d\n6\n%s\n"
+_BLOCK = ("0\nBLOCK\n8\n0\n2\n%s\n70\n0\n"
+          "10\n0.0\n20\n0.0\n30\n0.0\n3\n%s\n")
+_LTYPE = ("0\nLTYPE\n2\n%s\n70\n0\n3\n%s\n72\n65\n73\n%d\n40\n%.12g\n"
+          "%s")
+# name, description and dash lengths of the exported line types
+_LINE_TYPES = (("CONTINUOUS", "Solid line", ()),
+               ("DASHED", "__ __ __", (0.5, -0.25)),
+               ("HIDDEN", "- - - -", (0.25, -0.125)),
+               ("DASHDOT", "__ . __ .", (0.5, -0.25, 0.0, -0.25)))
+
+
+class DXFWriter(object):
+    """Collect the entities of a DXF file and write it.
+
+    The entities are kept in lists of formatted strings, one list
+    per layer, and are only joined when the file is written.
+
+    Parameters
+    ----------
+    nospline : bool, optional
+        It defaults to `False`. If it is `True`, curved edges other
+        than circles are exported as straight segments between their
+        vertices; otherwise they are discretized.
+
+    segment_length : float, optional
+        It defaults to 5. The maximum length of the segments
+        of discretized curves. If it is zero, they are exported
+        as a single segment. As the files are DXF R12,
+        ellipses and splines are always discretized, and wires
+        are always exported as `'POLYLINE'` entities, as R12
+        has no `'LWPOLYLINE'`.
+    """
+
+    def __init__(self, nospline=False, segment_length=5.0):
+        self.nospline = nospline
+        self.segment_length = segment_length
+        self.layers = OrderedDict()
+        self.entities = OrderedDict()
+        self.blocks = OrderedDict()
+        self._block_names = {}
+        self._box = None
+
+    def add_layer(self, name, color=7, line_type="CONTINUOUS"):
+        """Define a layer, with its color index and line type."""
+        self.layers[_get_name(name)] = (color, line_type.upper())
+
+    def add_shape(self, shape, layer="0", color=BYLAYER):
+        """Add the edges of a shape as entities of the given layer.
+
+        Each wire becomes a circle, an arc or a polyline, and each edge
+        which doesn't belong to a wire becomes a line, a circle, an arc
+        or a polyline, as in `importDXF.writeShape`.
+
+        Parameters
+        ----------
+        shape : Part::TopoShape
+
+        layer : str, optional
+            It defaults to `'0'`. The name of the layer.
+
+        color : int, optional
+            It defaults to `BYLAYER`. The AutoCAD color index.
+        """
+        self._get_layer(layer).extend(self._format_shape(shape, layer, color))
+        self._add_box(shape.BoundBox)
+
+    def add_block(self, shape, name, layer="0", color=BYLAYER,
+                  placement=None):
+        """Add a shape as a block, and insert it in the given layer.
+
+        If a block with the same contents exists, it is inserted
+        instead, so copies of the same geometry are written once.
+
+        Parameters
+        ----------
+        shape : Part::TopoShape
+            The contents of the block, in the coordinates of the block.
+
+        name : str
+            The name of the block, if it is a new one.
+
+        layer : str, optional
+            It defaults to `'0'`. The layer of the insert.
+
+        color : int, optional
+            It defaults to `BYLAYER`. The color index of the insert.
+            The entities of the block take the color of the insert.
+
+        placement : Base::Placement, optional
+            It defaults to `None`. The position of the insert.
+            Its rotation must be around the Z axis.
+
+        Returns
+        -------
+        str
+            The name of the inserted block.
+        """
+        data = "".join(self._format_shape(shape, "0", 0))
+        block = self._block_names.get(data)
+        if block is None:
+            block = _get_name(name)
+            while block in self.blocks:
+                block += "_"
+            self.blocks[block] = data
+            self._block_names[data] = block
+        if placement is None:
+            placement = App.Placement()
+        base = placement.Base
+        angle = math.degrees(placement.Rotation.Angle)
+        if placement.Rotation.Axis.z < 0:
+            angle = -angle
+        self._get_layer(layer).append(_INSERT % (_get_name(layer), color,
+                                                 block, base.x, base.y,
+                                                 base.z, angle))
+        self._add_box(shape.BoundBox.transformed(placement.toMatrix()))
+        return block
+
+    def add_text(self, text, point, height=1.0, layer="0", color=BYLAYER):
+        """Add a single line text at the given point."""
+        self._get_layer(layer).append(_TEXT % (_get_name(layer), color,
+                                               point.x, point.y, point.z,
+                                               height,
+                                               text.replace("\n", " ")))
+
+    def get_string(self):
+        """Return the contents of the DXF file."""
+        data = []
+        self.write(data.append)
+        return "".join(data)
+
+    def write(self, write):
+        """Write the DXF file with the given function.
+
+        Parameters
+        ----------
+        write : callable
+            A function which takes a string, for example the `write`
+            method of a file opened in text mode.
+        """
+        box = self._box or (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        write("0\nSECTION\n2\nHEADER\n9\n$ACADVER\n1\nAC1009\n"
+              "9\n$INSBASE\n10\n0.0\n20\n0.0\n30\n0.0\n"
+              "9\n$EXTMIN\n10\n%.12g\n20\n%.12g\n30\n%.12g\n"
+              "9\n$EXTMAX\n10\n%.12g\n20\n%.12g\n30\n%.12g\n"
+              "0\nENDSEC\n" % box)
+        write("0\nSECTION\n2\nTABLES\n")
+        write("0\nTABLE\n2\nLTYPE\n70\n%d\n" % len(_LINE_TYPES))
+        for name, description, dashes in _LINE_TYPES:
+            write(_LTYPE % (name, description, len(dashes),
+                            sum(abs(d) for d in dashes),
+                            "".join("49\n%.12g\n" % d for d in dashes)))
+        write("0\nENDTAB\n")
+        layers = OrderedDict([("0", (7, "CONTINUOUS"))])
+        layers.update(self.layers)
+        for name in self.entities:
+            if name not in layers:
+                layers[name] = (7, "CONTINUOUS")
+        write("0\nTABLE\n2\nLAYER\n70\n%d\n" % len(layers))
+        for name, (color, line_type) in layers.items():
+            write(_LAYER % (name, color, line_type))
+        write("0\nENDTAB\n")
+        write("0\nTABLE\n2\nSTYLE\n70\n1\n0\nSTYLE\n2\nSTANDARD\n70\n0\n"
+              "40\n0.0\n41\n1.0\n50\n0.0\n71\n0\n42\n1.0\n3\ntxt\n4\n\n"
+              "0\nENDTAB\n0\nENDSEC\n")
+        write("0\nSECTION\n2\nBLOCKS\n")
+        for name, data in self.blocks.items():
+            write(_BLOCK % (name, name))
+            write(data)
+            write("0\nENDBLK\n8\n0\n")
+        write("0\nENDSEC\n")
+        write("0\nSECTION\n2\nENTITIES\n")
+        for entities in self.entities.values():
+            write("".join(entities))
+        write("0\nENDSEC\n0\nEOF\n")
+
+    def save(self, filename):
+        """Write the DXF file to the given path."""
+        with open(filename, "w") as f:
+            self.write(f.write)
+
+    def _get_layer(self, layer):
+        layer = _get_name(layer)
+        entities = self.entities.get(layer)
+        if entities is None:
+            entities = self.entities[layer] = []
+        return entities
+
+    def _add_box(self, box):
+        if not box.isValid():
+            return
+        b = (box.XMin, box.YMin, box.ZMin, box.XMax, box.YMax, box.ZMax)
+        if self._box is None:
+            self._box = b
+        else:
+            self._box = (min(self._box[0], b[0]), min(self._box[1], b[1]),
+                         min(self._box[2], b[2]), max(self._box[3], b[3]),
+                         max(self._box[4], b[4]), max(self._box[5], b[5]))
+
+    def _format_shape(self, shape, layer, color):
+        import Part
+        layer = _get_name(layer)
+        data = []
+        done = set()
+        for wire in shape.Wires:
+            edges = Part.__sortEdges__(wire.Edges)
+            for e in edges:
+                done.add(e.hashCode())
+            if len(edges) == 1 and _get_type(edges[0]) == "Circle":
+                data.append(self._format_circle(edges[0], layer, color))
+            else:
+                closed = wire.isClosed()
+                points = []
+                for e in edges:
+                    points.extend(self._get_points(e))
+                if not closed:
+                    v = edges[-1].Vertexes[-1].Point
+                    points.append((v.x, v.y, v.z, 0.0))
+                if len(points) < 2:
+                    continue
+                data.append(self._format_polyline(points, closed,
+                                                  layer, color))
+        for e in shape.Edges:
+            if e.hashCode() in done:
+                continue
+            kind = _get_type(e)
+            if kind == "Circle":
+                data.append(self._format_circle(e, layer, color))
+            elif kind == "Line" or (self.nospline and kind != "Circle"):
+                if len(e.Vertexes) > 1:
+                    p1 = e.Vertexes[0].Point
+                    p2 = e.Vertexes[-1].Point
+                    data.append(_LINE % (layer, color, p1.x, p1.y, p1.z,
+                                         p2.x, p2.y, p2.z))
+            else:
+                points = [(p.x, p.y, p.z, 0.0)
+                          for p in self._discretize(e)]
+                data.append(self._format_polyline(points, False,
+                                                  layer, color))
+        return data
+
+    def _get_points(self, edge):
+        # points of an edge of a polyline, without its last point
+        kind = _get_type(edge)
+        p = edge.Vertexes[0].Point
+        if kind == "Circle":
+            bulge = math.tan((edge.LastParameter - edge.FirstParameter) / 4)
+            if edge.Curve.Axis.z < 0:
+                bulge = -bulge
+            return [(p.x, p.y, p.z, bulge)]
+        elif kind != "Line" and not self.nospline:
+            return [(v.x, v.y, v.z, 0.0) for v in self._discretize(edge)[:-1]]
+        return [(p.x, p.y, p.z, 0.0)]
+
+    def _discretize(self, edge):
+        # evenly spaced points, at most segment_length apart
+        if self.segment_length <= 0 or edge.Length <= self.segment_length:
+            return [edge.valueAt(edge.FirstParameter),
+                    edge.valueAt(edge.LastParameter)]
+        number = int(math.ceil(edge.Length / self.segment_length)) + 1
+        return edge.discretize(Number=number)
+
+    def _format_circle(self, edge, layer, color):
+        c = edge.Curve.Center
+        r = edge.Curve.Radius
+        if len(edge.Vertexes) == 1:
+            return _CIRCLE % (layer, color, c.x, c.y, c.z, r)
+        v1 = edge.Vertexes[0].Point
+        v2 = edge.Vertexes[-1].Point
+        a1 = math.degrees(math.atan2(v1.y - c.y, v1.x - c.x))
+        a2 = math.degrees(math.atan2(v2.y - c.y, v2.x - c.x))
+        if edge.Curve.Axis.z < 0:
+            a1, a2 = a2, a1
+        return _ARC % (layer, color, c.x, c.y, c.z, r, a1, a2)
+
+    def _format_polyline(self, points, closed, layer, color):
+        data = [_POLYLINE % (layer, color, int(closed))]
+        data.extend(_VERTEX % (layer, p[0], p[1], p[2], p[3])
+                    for p in points)
+        data.append(_SEQEND % layer)
+        return "".join(data)
+
+
+def _get_type(edge):
+    try:
+        return type(edge.Curve).__name__
+    except Exception:
+        return "Unknown"
+
+
+def _get_name(name):
+    # DXF names can't contain line breaks
+    name = name.replace("\n", " ").strip()
+    return name or "0"
@@ -0,0 +1,273 @@
+"""This module provides a spatial index of the edges of shapes for snapping.
+
+The snapper looks for intersections with the edges of the last objects
+under the cursor on every mouse move. For shapes with many edges,
+for example imported DXF plans, testing every edge is too slow,
+so the edges are kept in a bounding box tree which returns
+only the edges near the edge under the cursor.
+
+The index of an object is built on first use and kept in a small cache.
+It is removed when the object is recomputed or deleted.
+"""
+## @package snap_index
+# \ingroup DRAFT
+# \brief This module provides a spatial index of edges for snapping
+
+# ***************************************************************************
+# *   (c) 2020 FreeCAD Developers                                           *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from collections import OrderedDict
+
+import FreeCAD as App
+
+# Number of children of a node of the bounding box tree
+NODE_SIZE = 8
+
+# Number of edge indexes kept in the cache
+MAX_CACHED_INDEXES = 8
+
+_INF = float("inf")
+_edge_indexes = OrderedDict()
+
+
+class EdgeIndex(object):
+    """Bounding box tree of the edges of a shape.
+
+    The tree is bulk loaded: the edges are sorted along a space filling
+    curve (Morton order) of the centers of their bounding boxes,
+    and groups of `NODE_SIZE` consecutive edges or nodes
+    form the nodes of the next level.
+
+    Parameters
+    ----------
+    shape : Part::TopoShape
+        The shape whose edges are indexed.
+
+    Attributes
+    ----------
+    edges : list of Part::TopoShape
+        The edges of the shape, in the order of `shape.Edges`.
+        The indices returned by the queries refer to this list.
+
+    shape : Part::TopoShape
+        The indexed shape. A shape with other geometry or placement
+        is not the same shape, see `TopoShape.isSame`.
+    """
+
+    def __init__(self, shape):
+        self.edges = shape.Edges
+        self.shape = shape
+        self._boxes = [_get_box(e.BoundBox) for e in self.edges]
+        self._root = self._build()
+
+    def __len__(self):
+        return len(self.edges)
+
+    def query(self, box):
+        """Return the indices of the edges whose boxes intersect `box`.
+
+        Parameters
+        ----------
+        box : Base::BoundBox or tuple
+            A `BoundBox` or a tuple
+            `(xmin, ymin, zmin, xmax, ymax, zmax)`.
+
+        Returns
+        -------
+        list of int
+            The indices of the edges in `edges`, sorted.
+        """
+        if self._root is None:
+            return []
+        if not isinstance(box, tuple):
+            box = _get_box(box)
+        found = []
+        stack = [self._root]
+        while stack:
+            node_box, children, is_leaf = stack.pop()
+            if not _intersect(node_box, box):
+                continue
+            if is_leaf:
+                found.extend(i for i in children
+                             if _intersect(self._boxes[i], box))
+            else:
+                stack.extend(children)
+        found.sort()
+        return found
+
+    def query_edges(self, box):
+        """Return the edges whose boxes intersect `box`, see `query`."""
+        return [self.edges[i] for i in self.query(box)]
+
+    def _build(self):
+        if not self._boxes:
+            return None
+        order = _get_morton_order(self._boxes)
+        level = []
+        for i in range(0, len(order), NODE_SIZE):
+            children = order[i:i + NODE_SIZE]
+            level.append((_merge([self._boxes[j] for j in children]),
+                          children, True))
+        while len(level) > 1:
+            level = [(_merge([node[0] for node in level[i:i + NODE_SIZE]]),
+                      level[i:i + NODE_SIZE], False)
+                     for i in range(0, len(level), NODE_SIZE)]
+        return level[0]
+
+
+def get_edge_index(key, shape):
+    """Return the cached edge index of a shape, build it if needed.
+
+    Parameters
+    ----------
+    key : tuple
+        The document name and the object name of the shape,
+        optionally followed by a subelement name.
+        The index is removed from the cache if this object is recomputed.
+
+    shape : Part::TopoShape
+        The shape of the object. The cached index is only used
+        if it was built for the same shape.
+
+    Returns
+    -------
+    EdgeIndex
+    """
+    index = _edge_indexes.get(key)
+    if index is not None and index.shape.isSame(shape):
+        # mark as recently used
+        del _edge_indexes[key]
+        _edge_indexes[key] = index
+        return index
+    _EdgeIndexObserver.attach()
+    index = EdgeIndex(shape)
+    _edge_indexes[key] = index
+    while len(_edge_indexes) > MAX_CACHED_INDEXES:
+        _edge_indexes.popitem(last=False)
+    return index
+
+
+def remove_edge_indexes(doc_name, obj_name=None):
+    """Remove the cached edge indexes of an object or a whole document."""
+    for key in list(_edge_indexes):
+        if key[0] == doc_name and (obj_name is None or key[1] == obj_name):
+            del _edge_indexes[key]
+
+
+def clear_edge_indexes():
+    """Remove all cached edge indexes."""
+    _edge_indexes.clear()
+
+
+def extend_box(box, direction):
+    """Return the box unbounded along a direction.
+
+    Edges projected along `direction` can only intersect
+    the projection of `box` if their boxes intersect the returned box.
+    Each coordinate in which `direction` is not zero is unbounded.
+
+    Parameters
+    ----------
+    box : Base::BoundBox or tuple
+
+    direction : Base::Vector3
+
+    Returns
+    -------
+    tuple
+        `(xmin, ymin, zmin, xmax, ymax, zmax)`
+    """
+    if not isinstance(box, tuple):
+        box = _get_box(box)
+    box = list(box)
+    for i, component in enumerate((direction.x, direction.y, direction.z)):
+        if abs(component) > 1e-7:
+            box[i] = -_INF
+            box[i + 3] = _INF
+    return tuple(box)
+
+
+def _get_box(bound_box):
+    return (bound_box.XMin, bound_box.YMin, bound_box.ZMin,
+            bound_box.XMax, bound_box.YMax, bound_box.ZMax)
+
+
+def _merge(boxes):
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            min(b[2] for b in boxes), max(b[3] for b in boxes),
+            max(b[4] for b in boxes), max(b[5] for b in boxes))
+
+
+def _intersect(b1, b2):
+    return (b1[0] <= b2[3] and b2[0] <= b1[3]
+            and b1[1] <= b2[4] and b2[1] <= b1[4]
+            and b1[2] <= b2[5] and b2[2] <= b1[5])
+
+
+def _spread_bits(n):
+    # insert two zero bits between the lowest 10 bits of n
+    n &= 0x3ff
+    n = (n | (n << 16)) & 0x30000ff
+    n = (n | (n << 8)) & 0x300f00f
+    n = (n | (n << 4)) & 0x30c30c3
+    n = (n | (n << 2)) & 0x9249249
+    return n
+
+
+def _get_morton_order(boxes):
+    # indices of the boxes sorted by the Morton code of their centers
+    total = _merge(boxes)
+    scales = []
+    for i in range(3):
+        size = total[i + 3] - total[i]
+        scales.append(1023.0 / size if size > 0 else 0.0)
+    keys = []
+    for b in boxes:
+        x = int(((b[0] + b[3]) * 0.5 - total[0]) * scales[0])
+        y = int(((b[1] + b[4]) * 0.5 - total[1]) * scales[1])
+        z = int(((b[2] + b[5]) * 0.5 - total[2]) * scales[2])
+        keys.append(_spread_bits(x)
+                    | (_spread_bits(y) << 1)
+                    | (_spread_bits(z) << 2))
+    return sorted(range(len(boxes)), key=keys.__getitem__)
+
+
+class _EdgeIndexObserver(object):
+    """Remove the edge indexes of recomputed and deleted objects."""
+
+    _instance = None
+
+    @classmethod
+    def attach(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+            App.addDocumentObserver(cls._instance)
+
+    def slotRecomputedObject(self, obj):
+        remove_edge_indexes(obj.Document.Name, obj.Name)
+
+    def slotDeletedObject(self, obj):
+        remove_edge_indexes(obj.Document.Name, obj.Name)
+
+    def slotDeletedDocument(self, doc):
+        remove_edge_indexes(doc.Name)
@@ -34,6 +34,7 @@ the graphical user interface (GUI).
 # ***************************************************************************
 
 import os
+import sys
 import FreeCAD
 from PySide import QtCore
 import Draft_rc
@@ -1045,3 +1046,34 @@ def utf8_decode(text):
         return text.decode("utf-8")
     except AttributeError:
         return text
+
+
+def get_fork_pool(processes):
+    """Return a pool of worker processes forked from the running process.
+
+    The workers share the modules, documents and preferences
+    of the running process without loading them again.
+    A process running the graphical interface is never forked,
+    as the Qt and Coin state of the child would be unusable.
+
+    Parameters
+    ----------
+    processes : int
+        The number of worker processes.
+
+    Returns
+    -------
+    multiprocessing.Pool
+        It returns `None` if processes can't be forked on this platform,
+        or if the graphical interface is running.
+    """
+    if App.GuiUp:
+        return None
+    import multiprocessing
+    if hasattr(multiprocessing, "get_context"):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return None
+        return multiprocessing.get_context("fork").Pool(processes)
+    if sys.platform == "win32":
+        return None
+    return multiprocessing.Pool(processes)
@@ -49,8 +49,14 @@ texts, colors,layers (from groups)
 # the minimum version of the dxfLibrary needed to run
 TEXTSCALING = 1.35
 CURRENTDXFLIB = 1.40
+# number of entities read at once by the streaming importer
+DXF_STREAM_BATCH_SIZE = 10000
+# entities gathered in the compound of their layer by the streaming importer
+DXF_SHAPE_TYPES = ("line", "lwpolyline", "polyline", "arc", "circle",
+                   "ellipse", "spline", "solid", "3dface", "point", "hatch")
 
 import sys, os, math, re
+import collections
 import six
 import FreeCAD
 import Part, Draft, Mesh
@@ -2104,6 +2110,122 @@ def addToBlock(obj, layer):
         layerBlocks[layer] = [obj]
 
 
+def addLayers(tables):
+    """Create the layers defined in the tables section of a DXF file.
+
+    Each layer is created with `locateLayer`, with its color
+    and a drawing style derived from its line type.
+
+    Parameters
+    ----------
+    tables : drawing.tables
+        The tables section of a drawing read by `dxfReader`.
+    """
+    for table in tables.get_type("table"):
+        for layer in table.get_type("layer"):
+            name = layer.name
+            color = tuple(dxfColorMap.color_map[layer.color])
+            drawstyle = "Solid"
+            lt = rawValue(layer, 6)
+            if "DASHED" in lt.upper():
+                drawstyle = "Dashed"
+            elif "HIDDEN" in lt.upper():
+                drawstyle = "Dotted"
+            if ("DASHDOT" in lt.upper()) or ("CENTER" in lt.upper()):
+                drawstyle = "Dashdot"
+            locateLayer(name, color, drawstyle)
+
+
+def addDimension(dim):
+    """Add a new Draft Dimension object to the document.
+
+    The dimension is added to the layer indicated by its DXF code 8.
+    If the global variable `dxfUseStandardSize` is set, the font size
+    of the Draft toolbar is used, otherwise the text height
+    of its dimension style, found with `getdimheight`.
+
+    Parameters
+    ----------
+    dim : drawing.entities
+        The DXF object of type `'dimension'`.
+
+    To do
+    -----
+    Use local variables, not global variables.
+    """
+    try:
+        layer = rawValue(dim, 8)
+        if rawValue(dim, 15) is not None:
+            # this is a radial or diameter dimension
+            # x1 = float(rawValue(dim,11))
+            # y1 = float(rawValue(dim,21))
+            # z1 = float(rawValue(dim,31))
+            x2 = float(rawValue(dim, 10))
+            y2 = float(rawValue(dim, 20))
+            z2 = float(rawValue(dim, 30))
+            x3 = float(rawValue(dim, 15))
+            y3 = float(rawValue(dim, 25))
+            z3 = float(rawValue(dim, 35))
+            x1 = x2
+            y1 = y2
+            z1 = z2
+        else:
+            x1 = float(rawValue(dim, 10))
+            y1 = float(rawValue(dim, 20))
+            z1 = float(rawValue(dim, 30))
+            x2 = float(rawValue(dim, 13))
+            y2 = float(rawValue(dim, 23))
+            z2 = float(rawValue(dim, 33))
+            x3 = float(rawValue(dim, 14))
+            y3 = float(rawValue(dim, 24))
+            z3 = float(rawValue(dim, 34))
+        d = rawValue(dim, 70)
+        if d:
+            align = int(d)
+        else:
+            align = 0
+        d = rawValue(dim, 50)
+        if d:
+            angle = float(d)
+        else:
+            angle = 0
+    except (ValueError, TypeError):
+        warn(dim)
+    else:
+        lay = locateLayer(layer)
+        pt = vec([x1, y1, z1])
+        p1 = vec([x2, y2, z2])
+        p2 = vec([x3, y3, z3])
+        if align >= 128:
+            align -= 128
+        elif align >= 64:
+            align -= 64
+        elif align >= 32:
+            align -= 32
+        if align == 0:
+            if angle in [0, 180]:
+                p2 = vec([x3, y2, z2])
+            elif angle in [90, 270]:
+                p2 = vec([x2, y3, z2])
+        newob = doc.addObject("App::FeaturePython", "Dimension")
+        lay.addObject(newob)
+        _Dimension(newob)
+        _ViewProviderDimension(newob.ViewObject)
+        newob.Start = p1
+        newob.End = p2
+        newob.Dimline = pt
+        if gui:
+            dim.layer = layer
+            dim.color_index = 256
+            formatObject(newob, dim)
+            if dxfUseStandardSize and draftui:
+                newob.ViewObject.FontSize = draftui.fontsize
+            else:
+                st = rawValue(dim, 3)
+                size = getdimheight(st) or 1
+                newob.ViewObject.FontSize = float(size)*TEXTSCALING
+
+
 def processdxf(document, filename, getShapes=False, reComputeFlag=True):
     """Process the DXF file, creating Part objects in the document.
 
@@ -2181,19 +2303,7 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
     shapes = []
 
     # Create layers
-    for table in drawing.tables.get_type("table"):
-        for layer in table.get_type("layer"):
-            name = layer.name
-            color = tuple(dxfColorMap.color_map[layer.color])
-            drawstyle = "Solid"
-            lt = rawValue(layer, 6)
-            if "DASHED" in lt.upper():
-                drawstyle = "Dashed"
-            elif "HIDDEN" in lt.upper():
-                drawstyle = "Dotted"
-            if ("DASHDOT" in lt.upper()) or ("CENTER" in lt.upper()):
-                drawstyle = "Dashdot"
-            locateLayer(name, color, drawstyle)
+    addLayers(drawing.tables)
 
     # Draw lines
     lines = drawing.entities.get_type("line")
@@ -2489,77 +2599,7 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
         FCC.PrintMessage("drawing " + str(len(dims)) + " dimensions...\n")
         for dim in dims:
             if dxfImportLayouts or (not rawValue(dim, 67)):
-                try:
-                    layer = rawValue(dim, 8)
-                    if rawValue(dim, 15) is not None:
-                        # this is a radial or diameter dimension
-                        # x1 = float(rawValue(dim,11))
-                        # y1 = float(rawValue(dim,21))
-                        # z1 = float(rawValue(dim,31))
-                        x2 = float(rawValue(dim, 10))
-                        y2 = float(rawValue(dim, 20))
-                        z2 = float(rawValue(dim, 30))
-                        x3 = float(rawValue(dim, 15))
-                        y3 = float(rawValue(dim, 25))
-                        z3 = float(rawValue(dim, 35))
-                        x1 = x2
-                        y1 = y2
-                        z1 = z2
-                    else:
-                        x1 = float(rawValue(dim, 10))
-                        y1 = float(rawValue(dim, 20))
-                        z1 = float(rawValue(dim, 30))
-                        x2 = float(rawValue(dim, 13))
-                        y2 = float(rawValue(dim, 23))
-                        z2 = float(rawValue(dim, 33))
-                        x3 = float(rawValue(dim, 14))
-                        y3 = float(rawValue(dim, 24))
-                        z3 = float(rawValue(dim, 34))
-                    d = rawValue(dim, 70)
-                    if d:
-                        align = int(d)
-                    else:
-                        align = 0
-                    d = rawValue(dim, 50)
-                    if d:
-                        angle = float(d)
-                    else:
-                        angle = 0
-                except (ValueError, TypeError):
-                    warn(dim)
-                else:
-                    lay = locateLayer(layer)
-                    pt = vec([x1, y1, z1])
-                    p1 = vec([x2, y2, z2])
-                    p2 = vec([x3, y3, z3])
-                    if align >= 128:
-                        align -= 128
-                    elif align >= 64:
-                        align -= 64
-                    elif align >= 32:
-                        align -= 32
-                    if align == 0:
-                        if angle in [0, 180]:
-                            p2 = vec([x3, y2, z2])
-                        elif angle in [90, 270]:
-                            p2 = vec([x2, y3, z2])
-                    newob = doc.addObject("App::FeaturePython", "Dimension")
-                    lay.addObject(newob)
-                    _Dimension(newob)
-                    _ViewProviderDimension(newob.ViewObject)
-                    newob.Start = p1
-                    newob.End = p2
-                    newob.Dimline = pt
-                    if gui:
-                        dim.layer = layer
-                        dim.color_index = 256
-                        formatObject(newob, dim)
-                        if dxfUseStandardSize and draftui:
-                            newob.ViewObject.FontSize = draftui.fontsize
-                        else:
-                            st = rawValue(dim, 3)
-                            size = getdimheight(st) or 1
-                            newob.ViewObject.FontSize = float(size)*TEXTSCALING
+                addDimension(dim)
     else:
         FCC.PrintMessage("skipping dimensions...\n")
 
@@ -2695,6 +2735,459 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
     del blockshapes
 
 
+def readDXFSections(dxffile, batchSize=DXF_STREAM_BATCH_SIZE):
+    """Split an open DXF file into the raw data of its sections.
+
+    The file is read pair by pair of lines (group code and value),
+    so only one batch of entities is held in memory at a time.
+    The `'ENTITIES'` section is split in batches of at most `batchSize`
+    entities. A batch never ends before a `'VERTEX'`, `'ATTRIB'`
+    or `'SEQEND'` entity, so polylines and inserts with attributes
+    are kept whole.
+
+    Parameters
+    ----------
+    dxffile : file
+        A DXF file opened in binary mode.
+
+    batchSize : int, optional
+        It defaults to `DXF_STREAM_BATCH_SIZE`.
+        The maximum number of entities in a batch.
+
+    Yields
+    ------
+    tuple of (str, bytes)
+        The name of the section, `'TABLES'`, `'BLOCKS'` or `'ENTITIES'`,
+        and the group codes of the section or of a batch of entities,
+        as they appear in the file. Other sections are skipped.
+    """
+    section = None
+    data = []
+    count = 0
+    while True:
+        code = dxffile.readline()
+        if not code:
+            break
+        value = dxffile.readline()
+        if code.strip() == b"0":
+            name = value.strip().upper()
+            if name == b"SECTION":
+                dxffile.readline()
+                section = dxffile.readline().strip().upper().decode("latin1")
+                continue
+            elif name == b"ENDSEC":
+                if data:
+                    yield section, b"".join(data)
+                section = None
+                data = []
+                count = 0
+                continue
+            elif name == b"EOF":
+                break
+            elif (section == "ENTITIES"
+                  and name not in (b"VERTEX", b"ATTRIB", b"SEQEND")):
+                if count >= batchSize:
+                    yield section, b"".join(data)
+                    data = []
+                    count = 0
+                count += 1
+        if section in ("TABLES", "BLOCKS", "ENTITIES"):
+            data.append(code)
+            data.append(value)
+
+
+def readDXFSection(name, data):
+    """Parse the raw data of a DXF section with `dxfReader`.
+
+    The data is written as the only section of a temporary DXF file,
+    which is read with `dxfReader.readDXF`.
+
+    Parameters
+    ----------
+    name : str
+        The name of the section, for example `'ENTITIES'`.
+
+    data : bytes
+        The group codes of the section, as returned by `readDXFSections`.
+
+    Returns
+    -------
+    drawing
+        The drawing read by `dxfReader`, with only the given section.
+    """
+    import tempfile
+    eol = b"\r\n" if data.endswith(b"\r\n") else b"\n"
+    fd, tmpname = tempfile.mkstemp(suffix=".dxf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(eol.join([b"0", b"SECTION", b"2", name.encode("latin1"),
+                              b""]))
+            f.write(data)
+            f.write(eol.join([b"0", b"ENDSEC", b"0", b"EOF", b""]))
+        return dxfReader.readDXF(tmpname)
+    finally:
+        os.remove(tmpname)
+
+
+def drawShape(entity):
+    """Return a Part shape from a geometric DXF entity.
+
+    It is used by `processdxfStream` for the entities of the types
+    in `DXF_SHAPE_TYPES`, which become part of the compound of their layer.
+    Points and hatches are only drawn if the global variables
+    `dxfImportPoints` and `dxfImportHatches` are set.
+
+    Parameters
+    ----------
+    entity : drawing.entities
+        A DXF object of one of the types in `DXF_SHAPE_TYPES`,
+        but not a polyline mesh.
+
+    Returns
+    -------
+    Part::TopoShape
+        It returns `None` if it fails producing a shape.
+    """
+    kind = str(entity)
+    if kind == "line":
+        return drawLine(entity, forceShape=True)
+    elif kind in ("polyline", "lwpolyline"):
+        return drawPolyline(entity, forceShape=True)
+    elif kind == "arc":
+        return drawArc(entity, forceShape=True)
+    elif kind == "circle":
+        return drawCircle(entity, forceShape=True)
+    elif kind == "ellipse":
+        return drawEllipse(entity, forceShape=True)
+    elif kind == "spline":
+        return drawSpline(entity, forceShape=True)
+    elif kind == "solid":
+        return drawSolid(entity)
+    elif kind == "3dface":
+        return drawFace(entity)
+    elif kind == "point" and dxfImportPoints:
+        return Part.Vertex(vec(rawValue(entity, 10)),
+                           vec(rawValue(entity, 20)),
+                           vec(rawValue(entity, 30)))
+    elif kind == "hatch" and dxfImportHatches:
+        points = getMultiplePoints(entity)
+        if len(points) > 1:
+            points[-1] = points[0]
+            return Part.makePolygon(points)
+    return None
+
+
+def isMesh(entity):
+    """Return `True` if the DXF entity is a polyline mesh."""
+    return (str(entity) in ("polyline", "lwpolyline")
+            and hasattr(entity, "flags") and entity.flags in [16, 64])
+
+
+def addMesh(mesh, layer, dxfobj=None):
+    """Add a new `Mesh::Feature` with the given mesh to a layer."""
+    newob = doc.addObject("Mesh::Feature", "Mesh")
+    locateLayer(layer).addObject(newob)
+    newob.Mesh = mesh
+    if gui:
+        formatObject(newob, dxfobj)
+    return newob
+
+
+def splitDXFEntities(data):
+    """Split a batch of entities in geometric entities and the others.
+
+    Parameters
+    ----------
+    data : bytes
+        The group codes of a batch of entities,
+        as returned by `readDXFSections`.
+
+    Returns
+    -------
+    tuple of (bytes, bytes)
+        The group codes of the entities of the types in `DXF_SHAPE_TYPES`,
+        and the group codes of the other entities.
+        The vertices, attributes and end of sequence markers
+        stay with the entity they belong to.
+    """
+    lines = data.splitlines(True)
+    shapes = []
+    others = []
+    target = others
+    for i in range(0, len(lines) - 1, 2):
+        if lines[i].strip() == b"0":
+            name = lines[i + 1].strip().decode("latin1").lower()
+            if name not in ("vertex", "attrib", "seqend"):
+                target = shapes if name in DXF_SHAPE_TYPES else others
+        target.append(lines[i])
+        target.append(lines[i + 1])
+    return b"".join(shapes), b"".join(others)
+
+
+def buildDXFShapes(data):
+    """Draw the geometric entities of a batch, in a worker process.
+
+    This function is run by the worker processes of `processdxfStream`.
+    The geometric entities are drawn with `drawShape`,
+    and the shapes of each layer are returned as a compound
+    serialized in BREP format. The polyline meshes are returned
+    as lists of triangles. The other entities are returned as they are,
+    to be drawn in the main process, as they need the document.
+
+    Parameters
+    ----------
+    data : bytes
+        The group codes of a batch of entities,
+        as returned by `readDXFSections`.
+
+    Returns
+    -------
+    tuple
+        The number of geometric entities, a list of tuples
+        `(layer, brep)`, a list of tuples `(layer, triangles)`,
+        the group codes of the other entities,
+        and the number of entities that couldn't be drawn.
+    """
+    global badobjects
+    badobjects = []
+    data, others = splitDXFEntities(data)
+    count = 0
+    breps = []
+    meshes = []
+    if data:
+        layershapes = {}
+        entities = [e for e in readDXFSection("ENTITIES", data).entities.data
+                    if dxfImportLayouts or (not rawValue(e, 67))]
+        count = len(entities)
+        for ent in entities:
+            lay = rawValue(ent, 8)
+            if isMesh(ent):
+                me = drawMesh(ent)
+                if me:
+                    meshes.append((lay, [[tuple(p) for p in f.Points]
+                                         for f in me.Facets]))
+                continue
+            shape = drawShape(ent)
+            if shape:
+                layershapes.setdefault(lay, []).append(shape)
+        for lay, shapes in layershapes.items():
+            try:
+                compound = Part.makeCompound(shapes)
+                breps.append((lay, compound.exportBrepToString()))
+            except Part.OCCError:
+                badobjects.extend(shapes)
+    return count, breps, meshes, others, len(badobjects)
+
+
+def processdxfStream(document, filename, batchSize=DXF_STREAM_BATCH_SIZE,
+                     processes=None):
+    """Process a large DXF file in batches, creating objects in the document.
+
+    Unlike `processdxf`, the file is never read as a whole.
+    The tables and the blocks are read once, then the entities are read
+    by `readDXFSections` and drawn in batches of `batchSize` entities.
+    The global variable `drawing` holds the current batch, with
+    the tables and blocks of the file.
+
+    To create few document objects, the geometric entities of a layer
+    (see `drawShape`) are gathered in a single compound, added
+    to the document as one `Part::Feature` at the end.
+    Each block is created once, as a hidden `Part::Feature`,
+    and each insert becomes an `App::Link` to it.
+    Texts, dimensions, leaders and meshes are created as in `processdxf`.
+    The preferences to join geometry, group layers in blocks
+    and create Draft objects or sketches are not used.
+
+    With more than one process, the geometric entities of each batch
+    are drawn by `buildDXFShapes` in worker processes,
+    while the main process reads the next batches and adds
+    the results to the document, in the order of the file.
+
+    Parameters
+    ----------
+    document : App::Document
+        A document object opened in which to create the new objects.
+
+    filename : str
+        The path to the DXF file to process.
+
+    batchSize : int, optional
+        It defaults to `DXF_STREAM_BATCH_SIZE`.
+        The number of entities read at once.
+
+    processes : int, optional
+        It defaults to `None`, in which case the global variable
+        `dxfImportProcesses` is used. The number of worker processes.
+        If it is 1, if processes can't be forked on this platform,
+        or if the graphical interface is running,
+        all entities are drawn in the main process.
+
+    To do
+    -----
+    Use local variables, not global variables.
+    """
+    global drawing, layers, doc, blockshapes, blockobjects, badobjects
+    if not dxfReader:
+        getDXFlibs()
+        readPreferences()
+    if processes is None:
+        processes = dxfImportProcesses
+    FCC.PrintMessage("opening " + filename + " in batches of "
+                     + str(batchSize) + " entities...\n")
+    layers = []
+    doc = document
+    blockshapes = {}
+    blockobjects = {}
+    badobjects = []
+    tables = None
+    blocks = None
+    blockrefs = {}
+    layershapes = {}
+    counts = [0, 0]
+
+    def addShape(shape, layer):
+        if shape:
+            if layer in layershapes:
+                layershapes[layer].append(shape)
+            else:
+                layershapes[layer] = [shape]
+
+    def drawEntities(data):
+        global drawing
+        drawing = readDXFSection("ENTITIES", data)
+        if tables is not None:
+            drawing.tables = tables
+        if blocks is not None:
+            drawing.blocks = blocks
+        entities = [e for e in drawing.entities.data
+                    if dxfImportLayouts or (not rawValue(e, 67))]
+        counts[0] += len(entities)
+        for ent in entities:
+            kind = str(ent)
+            if isMesh(ent):
+                me = drawMesh(ent)
+                if me:
+                    addMesh(me, rawValue(ent, 8), ent)
+            elif kind in DXF_SHAPE_TYPES:
+                addShape(drawShape(ent), rawValue(ent, 8))
+            elif kind in ("text", "mtext") and dxfImportTexts:
+                addText(ent)
+            elif kind == "dimension" and dxfImportTexts:
+                addDimension(ent)
+            elif kind == "leader" and dxfImportTexts:
+                newob = Draft.makeWire(getMultiplePoints(ent))
+                locateLayer(rawValue(ent, 8)).addObject(newob)
+                if gui:
+                    newob.ViewObject.EndArrow = True
+                    formatObject(newob, ent)
+            elif kind == "insert":
+                if (not dxfStarBlocks) and ent.block[0] == '*':
+                    continue
+                if dxfImportTexts:
+                    for a in attribs(ent):
+                        addText(a, attrib=True)
+                if ent.block not in blockobjects:
+                    blockobjects[ent.block] = None
+                    if ent.block in blockrefs:
+                        drawBlock(blockrefs[ent.block], createObject=True)
+                if blockobjects[ent.block]:
+                    newob = doc.addObject("App::Link", "Block." + ent.block)
+                    newob.LinkedObject = blockobjects[ent.block]
+                    newob.Placement = FreeCAD.Placement(
+                        vec(ent.loc),
+                        FreeCAD.Rotation(Vector(0, 0, 1), ent.rotation))
+                    sc = ent.scale
+                    newob.ScaleVector = Vector(sc[0], sc[1], sc[2])
+                    addObject(newob, layer=ent.layer)
+
+    def addResult(result):
+        count, breps, meshes, others, bad = result
+        counts[0] += count
+        counts[1] += bad
+        for lay, brep in breps:
+            shape = Part.Shape()
+            shape.importBrepFromString(brep, False)
+            addShape(shape, lay)
+        for lay, facets in meshes:
+            addMesh(Mesh.Mesh(facets), lay)
+        if others:
+            drawEntities(others)
+
+    pool = None
+    pending = collections.deque()
+    if processes > 1:
+        from draftutils.utils import get_fork_pool
+        pool = get_fork_pool(processes)
+        if pool:
+            FCC.PrintMessage("drawing entities in " + str(processes)
+                             + " processes...\n")
+        else:
+            FCC.PrintWarning("dxf: worker processes are not available "
+                             "on this platform or with the graphical "
+                             "interface, using a single process\n")
+    from FreeCAD import Base
+    progressbar = Base.ProgressIndicator()
+    progressbar.start("Importing DXF file...", 100)
+    filesize = max(os.path.getsize(filename), 1)
+    progress = 0
+    try:
+        with pythonopen(filename, "rb") as dxffile:
+            for name, data in readDXFSections(dxffile, batchSize):
+                if name == "TABLES":
+                    tables = readDXFSection(name, data).tables
+                    addLayers(tables)
+                    continue
+                elif name == "BLOCKS":
+                    blocks = readDXFSection(name, data).blocks
+                    for ref in blocks.data:
+                        blockrefs[ref.name] = ref
+                    continue
+                if pool:
+                    pending.append(pool.apply_async(buildDXFShapes, (data,)))
+                    # keep a few batches ahead, but not the whole file
+                    while len(pending) > 2 * processes:
+                        addResult(pending.popleft().get())
+                else:
+                    drawEntities(data)
+                FCC.PrintMessage(str(counts[0]) + " entities read...\n")
+                percent = min(100, 100 * dxffile.tell() // filesize)
+                while progress < percent:
+                    progressbar.next()
+                    progress += 1
+        while pending:
+            addResult(pending.popleft().get())
+    finally:
+        if pool:
+            pool.terminate()
+            pool.join()
+        progressbar.stop()
+    drawing = None
+
+    # Create one object per layer
+    for lay, shapes in layershapes.items():
+        try:
+            shape = Part.makeCompound(shapes)
+        except Part.OCCError:
+            FCC.PrintWarning("dxf: unable to make the geometry of layer "
+                             + str(lay) + "\n")
+        else:
+            addObject(shape, lay or "Shape", lay)
+
+    # Hide block objects, if any
+    for k, o in blockobjects.items():
+        if o and o.ViewObject:
+            o.ViewObject.hide()
+
+    doc.recompute()
+    FCC.PrintMessage("successfully imported " + filename + "\n")
+    if badobjects or counts[1]:
+        print("dxf: ", len(badobjects) + counts[1],
+              " objects were not imported")
+    del doc
+    del blockshapes
+    del blockobjects
+
+
 def warn(dxfobject, num=None):
     """Print a warning that the DXF object couldn't be imported.
 
@@ -2721,7 +3214,8 @@ def open(filename):
     """Open a file and return a new document.
 
     If the global variable `dxfUseLegacyImporter` exists,
-    it will process `filename` with `processdxf`.
+    it will process `filename` with `processdxf`,
+    or with `processdxfStream` if `dxfStreamImport` is also set.
     Otherwise, it will use the `Import` module, `Import.readDXF(filename)`.
 
     Parameters
@@ -2750,7 +3244,10 @@ def open(filename):
                     docname = docname.encode(sys.getfilesystemencoding())
             doc = FreeCAD.newDocument(docname)
             doc.Label = decodeName(docname)
-            processdxf(doc, filename)
+            if dxfStreamImport:
+                processdxfStream(doc, filename)
+            else:
+                processdxf(doc, filename)
             return doc
         else:
             errorDXFLib(gui)
@@ -2804,7 +3301,10 @@ def insert(filename, docname):
                     groupname = groupname.encode(sys.getfilesystemencoding())
             importgroup = doc.addObject("App::DocumentObjectGroup", groupname)
             importgroup.Label = decodeName(groupname)
-            processdxf(doc, filename)
+            if dxfStreamImport:
+                processdxfStream(doc, filename)
+            else:
+                processdxf(doc, filename)
             for l in layers:
                 importgroup.addObject(l)
         else:
@@ -3533,6 +4033,8 @@ def export(objectslist, filename, nospline=False, lwPoly=False):
 
     Otherwise it will try to use the DXF export libraries
     by running `getDXFlibs()`.
+    If the global variable `dxfFastExport` is set and `canExportFast()`
+    accepts the objects, they are written with `exportFast()`.
 
     Iterating over all objects it writes shapes individually
     with `writeShape()`, looking for types `'PanelSheet'`, `'PanelCut'`,
@@ -3630,20 +4132,16 @@ def export(objectslist, filename, nospline=False, lwPoly=False):
             # page: special hack-export! (see below)
             exportPage(exportList[0], filename)
 
+        elif dxfFastExport and canExportFast(exportList):
+            exportFast(exportList, exportLayers, filename, nospline, lwPoly)
+
         else:
             # other cases, treat objects one by one
             dxf = dxfLibrary.Drawing()
 
             for ob in exportLayers:
                 if ob.Label != "0":  # dxflibrary already creates it
-                    ltype = 'continuous'
-                    if ob.ViewObject:
-                        if ob.ViewObject.DrawStyle == "Dashed":
-                            ltype = 'DASHED'
-                        elif ob.ViewObject.DrawStyle == "Dotted":
-                            ltype = 'HIDDEN'
-                        elif ob.ViewObject.DrawStyle == "Dashdot":
-                            ltype = 'DASHDOT'
+                    ltype = getLineType(ob)
                     # print("exporting layer:", getStr(ob.Label),
                     #       getACI(ob), ltype)
                     dxf.layers.append(dxfLibrary.Layer(name=getStr(ob.Label),
@@ -3839,6 +4337,166 @@ def export(objectslist, filename, nospline=False, lwPoly=False):
         errorDXFLib(gui)
 
 
+def getLineType(layer):
+    """Return the DXF line type of a layer from its draw style.
+
+    Parameters
+    ----------
+    layer : App::FeaturePython
+        A `Draft Layer`.
+
+    Returns
+    -------
+    str
+        `'continuous'`, `'DASHED'`, `'HIDDEN'` or `'DASHDOT'`.
+    """
+    ltype = 'continuous'
+    if layer.ViewObject:
+        if layer.ViewObject.DrawStyle == "Dashed":
+            ltype = 'DASHED'
+        elif layer.ViewObject.DrawStyle == "Dotted":
+            ltype = 'HIDDEN'
+        elif layer.ViewObject.DrawStyle == "Dashdot":
+            ltype = 'DASHDOT'
+    return ltype
+
+
+def canExportFast(objectslist):
+    """Return `True` if `exportFast` can export all the given objects.
+
+    Panels, axes and dimensions, as well as the export of meshes
+    set by the `'dxfmesh'` parameter, need the legacy exporter.
+    """
+    p = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+    if p.GetBool("dxfmesh"):
+        return False
+    for ob in objectslist:
+        if Draft.getType(ob) in ["PanelSheet", "PanelCut",
+                                 "Axis", "Dimension"]:
+            return False
+    return True
+
+
+def exportFast(objectslist, exportLayers, filename,
+               nospline=False, lwPoly=False):
+    """Export objects to a DXF file with the fast DXF writer.
+
+    The shapes are projected and split in blocks as in `export`,
+    but are written with `draftutils.dxf_writer.DXFWriter`,
+    which doesn't need the DXF libraries.
+
+    Shapes with several wires or lone edges are written as blocks.
+    If the placement of the object only rotates around the Z axis,
+    the block holds the shape without its placement,
+    which is used by the insert, so that identical shapes,
+    for example the copies of an array, share the same block.
+    Objects whose shapes share the same geometry
+    are also only projected once.
+
+    Parameters
+    ----------
+    objectslist : list of App::DocumentObject
+        The objects to export, groups already expanded,
+        see `canExportFast`.
+
+    exportLayers : list of App::FeaturePython
+        The `Draft Layers` to define in the file.
+
+    filename : str
+        The path of the new DXF file.
+
+    nospline : bool, optional
+        It defaults to `False`.
+        If it is `True`, the BSplines are exported as straight segments.
+
+    lwPoly : bool, optional
+        It defaults to `False`. It is ignored, as the files are DXF R12,
+        which has no `'lwpolyline'`: wires are always exported
+        as `'polyline'`.
+    """
+    from draftutils import dxf_writer
+    p = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+    writer = dxf_writer.DXFWriter(nospline,
+                                  p.GetFloat("maxsegmentlength", 5.0))
+    for ob in exportLayers:
+        if ob.Label != "0":
+            writer.add_layer(getStr(ob.Label), getACI(ob), getLineType(ob))
+    direction = None
+    if gui and p.GetBool("dxfproject"):
+        _view = FreeCADGui.ActiveDocument.ActiveView
+        direction = _view.getViewDirection().multiply(-1)
+    # shapes already projected, with the shapes they were projected from,
+    # by hash code of their geometry without placement
+    projected = {}
+    for ob in objectslist:
+        if ob.isDerivedFrom("Part::Feature"):
+            shape = ob.Shape
+            if shape.isNull():
+                continue
+            tess = None
+            if hasattr(ob, "Tessellation"):
+                if ob.Tessellation:
+                    tess = [ob.Tessellation, ob.SegmentLength]
+            pl = shape.Placement
+            local = (direction is None
+                     and (pl.Rotation.Angle == 0
+                          or abs(abs(pl.Rotation.Axis.z) - 1) < 1e-7))
+            sh = None
+            if local:
+                # Part.Shape shares the geometry, unlike copy()
+                base = Part.Shape(shape)
+                base.Placement = FreeCAD.Placement()
+                partners = projected.setdefault(base.hashCode(), [])
+                for other, s in partners:
+                    if shape.isPartner(other):
+                        sh = s
+                        break
+            else:
+                base = shape
+            if sh is None:
+                if direction:
+                    sh = projectShape(base, direction, tess)
+                elif base.Volume > 0:
+                    sh = projectShape(base, Vector(0, 0, 1), tess)
+                else:
+                    sh = base
+                if local:
+                    partners.append((shape, sh))
+            if sh.isNull():
+                continue
+            if (sh.ShapeType == 'Compound'
+                    and not (len(sh.Wires) == 1
+                             and len(sh.Wires[0].Edges) == len(sh.Edges))):
+                writer.add_block(sh, ob.Name.upper(), getStrGroup(ob),
+                                 getACI(ob), pl if local else None)
+            else:
+                if local:
+                    sh = sh.copy()
+                    sh.Placement = pl
+                writer.add_shape(sh, getStrGroup(ob), getACI(ob))
+
+        elif Draft.getType(ob) == "Annotation":
+            height = 1
+            if gui:
+                height = float(ob.ViewObject.FontSize)
+            for i, text in enumerate(ob.LabelText):
+                point = Vector(ob.Position.x, ob.Position.y - i,
+                               ob.Position.z)
+                writer.add_text(getStr(text), point, height,
+                                getStrGroup(ob), getACI(ob, text=True))
+
+        elif Draft.getType(ob) == "DraftText":
+            height = 1
+            if gui:
+                height = float(ob.ViewObject.FontSize)
+            for i, text in enumerate(ob.Text):
+                base = ob.Placement.Base
+                point = Vector(base.x, base.y - (height * 1.2 * i), base.z)
+                writer.add_text(getStr(text), point, height * 0.8,
+                                getStrGroup(ob), getACI(ob, text=True))
+    writer.save(filename)
+
+
 class dxfcounter:
     """DXF counter class to count the number of entities.
     """
@@ -4151,7 +4809,8 @@ def readPreferences():
     `dxfImportPoints`, `dxfImportHatches`, `dxfUseStandardSize`,
     `dxfGetColors`, `dxfUseDraftVisGroups`, `dxfFillMode`,
     `dxfBrightBackground`, `dxfDefaultColor`, `dxfUseLegacyImporter`,
-    `dxfExportBlocks`, `dxfScaling`, `dxfUseLegacyExporter`
+    `dxfExportBlocks`, `dxfScaling`, `dxfUseLegacyExporter`,
+    `dxfStreamImport`, `dxfImportProcesses`, `dxfFastExport`
 
     The parameter path is ``User parameter:BaseApp/Preferences/Mod/Draft``
 
@@ -4175,7 +4834,8 @@ def readPreferences():
     global dxfGetColors, dxfUseDraftVisGroups
     global dxfFillMode, dxfBrightBackground, dxfDefaultColor
     global dxfUseLegacyImporter, dxfExportBlocks, dxfScaling
-    global dxfUseLegacyExporter
+    global dxfUseLegacyExporter, dxfStreamImport, dxfImportProcesses
+    global dxfFastExport
     dxfCreatePart = p.GetBool("dxfCreatePart", True)
     dxfCreateDraft = p.GetBool("dxfCreateDraft", False)
     dxfCreateSketch = p.GetBool("dxfCreateSketch", False)
@@ -4194,6 +4854,9 @@ def readPreferences():
     dxfFillMode = p.GetBool("fillmode", True)
     dxfUseLegacyImporter = p.GetBool("dxfUseLegacyImporter", False)
     dxfUseLegacyExporter = p.GetBool("dxfUseLegacyExporter", False)
+    dxfFastExport = p.GetBool("dxfFastExport", False)
+    dxfStreamImport = p.GetBool("dxfStreamImport", False)
+    dxfImportProcesses = max(1, p.GetInt("dxfImportProcesses", 1))
     dxfBrightBackground = isBrightBackground()
     dxfDefaultColor = getColor()
     dxfExportBlocks = p.GetBool("dxfExportBlocks", True)
@@ -29,6 +29,7 @@
 # include <SMESH_Gen.hxx>
 # include <SMESH_Group.hxx>
 # include <SMESH_Mesh.hxx>
+# include <SMESH_MeshEditor.hxx>
 # include <SMESHDS_Group.hxx>
 # include <SMDSAbs_ElementType.hxx>
 # include <SMDS_MeshElement.hxx>
@@ -595,6 +596,125 @@ PyObject* FemMeshPy::addVolume(PyObject *args)
     return 0;
 }
 
+namespace {
+std::vector<int> getIntVector(PyObject* seq)
+{
+    std::vector<int> values;
+    Py::Sequence list(seq);
+    values.reserve(list.size());
+    for (Py::Sequence::iterator it = list.begin(); it != list.end(); ++it) {
+        values.push_back(static_cast<int>(static_cast<long>(Py::Long(*it))));
+    }
+    return values;
+}
+}
+
+PyObject* FemMeshPy::addNodes(PyObject *args)
+{
+    PyObject *coords;
+    PyObject *ids = Py_None;
+    if (!PyArg_ParseTuple(args, "O|O", &coords, &ids))
+        return 0;
+
+    try {
+        Py::Sequence coordList(coords);
+        std::vector<double> values;
+        values.reserve(coordList.size());
+        for (Py::Sequence::iterator it = coordList.begin(); it != coordList.end(); ++it) {
+            values.push_back(static_cast<double>(Py::Float(*it)));
+        }
+        if (values.size() % 3 != 0)
+            throw std::runtime_error("The number of coordinates is not a multiple of three");
+        std::size_t count = values.size() / 3;
+
+        std::vector<int> nodeIds;
+        if (ids != Py_None) {
+            nodeIds = getIntVector(ids);
+            if (nodeIds.size() != count)
+                throw std::runtime_error("The number of node ids does not match the number of nodes");
+        }
+
+        SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+        for (std::size_t i = 0; i < count; i++) {
+            const double* xyz = &values[3 * i];
+            SMDS_MeshNode* node;
+            if (nodeIds.empty())
+                node = meshDS->AddNode(xyz[0], xyz[1], xyz[2]);
+            else
+                node = meshDS->AddNodeWithID(xyz[0], xyz[1], xyz[2], nodeIds[i]);
+            if (!node)
+                throw std::runtime_error("Failed to add node");
+        }
+        return Py::new_reference_to(Py::Long(static_cast<long>(count)));
+    }
+    catch (const Py::Exception&) {
+        return 0;
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::BaseExceptionFreeCADError, e.what());
+        return 0;
+    }
+}
+
+PyObject* FemMeshPy::addElements(PyObject *args)
+{
+    char *type;
+    PyObject *nodes;
+    int nodeCount;
+    PyObject *ids = Py_None;
+    if (!PyArg_ParseTuple(args, "sOi|O", &type, &nodes, &nodeCount, &ids))
+        return 0;
+
+    try {
+        SMDSAbs_ElementType elemType;
+        if (strcmp(type, "Edge") == 0)
+            elemType = SMDSAbs_Edge;
+        else if (strcmp(type, "Face") == 0)
+            elemType = SMDSAbs_Face;
+        else if (strcmp(type, "Volume") == 0)
+            elemType = SMDSAbs_Volume;
+        else
+            throw std::runtime_error("Unknown element type, 'Edge', 'Face' or 'Volume' are allowed");
+        if (nodeCount < 2)
+            throw std::runtime_error("The node count of an element must be at least two");
+
+        std::vector<int> nodeIds = getIntVector(nodes);
+        if (nodeIds.size() % nodeCount != 0)
+            throw std::runtime_error("The number of node ids is not a multiple of the node count");
+        std::size_t count = nodeIds.size() / nodeCount;
+
+        std::vector<int> elementIds;
+        if (ids != Py_None) {
+            elementIds = getIntVector(ids);
+            if (elementIds.size() != count)
+                throw std::runtime_error("The number of element ids does not match the number of elements");
+        }
+
+        SMESH_MeshEditor editor(getFemMeshPtr()->getSMesh());
+        SMESHDS_Mesh* meshDS = editor.GetMeshDS();
+        SMESH_MeshEditor::ElemFeatures elemFeat(elemType);
+        std::vector<const SMDS_MeshNode*> elemNodes(nodeCount);
+        for (std::size_t i = 0; i < count; i++) {
+            for (int j = 0; j < nodeCount; j++) {
+                elemNodes[j] = meshDS->FindNode(nodeIds[i * nodeCount + j]);
+                if (!elemNodes[j])
+                    throw std::runtime_error("Failed to get node of the given indices");
+            }
+            elemFeat.SetID(elementIds.empty() ? -1 : elementIds[i]);
+            if (!editor.AddElement(elemNodes, elemFeat))
+                throw std::runtime_error("Failed to add element, node count not supported");
+        }
+        return Py::new_reference_to(Py::Long(static_cast<long>(count)));
+    }
+    catch (const Py::Exception&) {
+        return 0;
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::BaseExceptionFreeCADError, e.what());
+        return 0;
+    }
+}
+
 PyObject* FemMeshPy::copy(PyObject *args)
 {
     if (!PyArg_ParseTuple(args, ""))
@@ -73,6 +73,9 @@ void DlgSettingsFemCcxImp::saveSettings()
     ui->cb_ccx_binary_std->onSave();
     ui->fc_ccx_binary_path->onSave();
     ui->cb_split_inp_writer->onSave();
+    ui->cb_fast_frd_reader->onSave();
+    ui->cb_parallel_constraint_sets->onSave();
+    ui->cb_fast_inp_reader->onSave();
 }
 
 void DlgSettingsFemCcxImp::loadSettings()
@@ -98,6 +101,9 @@ void DlgSettingsFemCcxImp::loadSettings()
     ui->cb_ccx_binary_std->onRestore();
     ui->fc_ccx_binary_path->onRestore();
     ui->cb_split_inp_writer->onRestore();
+    ui->cb_fast_frd_reader->onRestore();
+    ui->cb_parallel_constraint_sets->onRestore();
+    ui->cb_fast_inp_reader->onRestore();
 
     ParameterGrp::handle hGrp = App::GetApplication().GetParameterGroupByPath
         ("User parameter:BaseApp/Preferences/Mod/Fem/Ccx");
@@ -47,31 +47,41 @@ DlgSettingsFemGeneralImp::~DlgSettingsFemGeneralImp()
 void DlgSettingsFemGeneralImp::saveSettings()
 {
     ui->cb_analysis_group_meshing->onSave();
+    ui->cb_mesh_set_cache->onSave();
+    ui->cb_mesh_set_cache_file->onSave();
 
     ui->cb_restore_result_dialog->onSave();
     ui->cb_keep_results_on_rerun->onSave();
     ui->cb_hide_constraint->onSave();
+    ui->cb_binary_result_arrays->onSave();
+    ui->cb_result_file_cache->onSave();
 
     ui->cb_wd_temp->onSave();
     ui->cb_wd_beside->onSave();
     ui->cb_wd_custom->onSave();
     ui->le_wd_custom->onSave();
     ui->cb_overwrite_solver_working_directory->onSave();
+    ui->cb_write_solver_profile->onSave();
 }
 
 void DlgSettingsFemGeneralImp::loadSettings()
 {
     ui->cb_analysis_group_meshing->onRestore();
+    ui->cb_mesh_set_cache->onRestore();
+    ui->cb_mesh_set_cache_file->onRestore();
 
     ui->cb_restore_result_dialog->onRestore();
     ui->cb_keep_results_on_rerun->onRestore();
     ui->cb_hide_constraint->onRestore();
+    ui->cb_binary_result_arrays->onRestore();
+    ui->cb_result_file_cache->onRestore();
 
     ui->cb_wd_temp->onRestore();
     ui->cb_wd_beside->onRestore();
     ui->cb_wd_custom->onRestore();
     ui->le_wd_custom->onRestore();
     ui->cb_overwrite_solver_working_directory->onRestore();
+    ui->cb_write_solver_profile->onRestore();
 }
 
 /**
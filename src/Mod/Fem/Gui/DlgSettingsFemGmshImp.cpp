@@ -48,12 +48,16 @@ void DlgSettingsFemGmshImp::saveSettings()
 {
     ui->cb_gmsh_binary_std->onSave();
     ui->fc_gmsh_binary_path->onSave();
+    ui->cb_gmsh_incremental->onSave();
+    ui->sb_gmsh_threads->onSave();
 }
 
 void DlgSettingsFemGmshImp::loadSettings()
 {
     ui->cb_gmsh_binary_std->onRestore();
     ui->fc_gmsh_binary_path->onRestore();
+    ui->cb_gmsh_incremental->onRestore();
+    ui->sb_gmsh_threads->onRestore();
 }
 
 /**
@@ -595,6 +595,10 @@ def makePostVtkResult(
     """makePostVtkResult(document, base_result [name]):
     creates an FEM post processing result object (vtk based) to hold FEM results"""
     obj = doc.addObject("Fem::FemPostPipeline", name)
+    if hasattr(base_result, "Proxy"):
+        # the node results might be saved in binary format
+        from femresult import resultstorage
+        resultstorage.load_result_arrays(base_result)
     obj.load(base_result)
     return obj
 
@@ -125,6 +125,8 @@ gf()
 ./bin/FreeCADCmd --run-test "femtest.app.test_femimport.TestObjectExistance.test_objects_existance"
 ./bin/FreeCADCmd --run-test "femtest.app.test_ccxtools.TestCcxTools.test_freq_analysis"
 ./bin/FreeCADCmd --run-test "femtest.app.test_ccxtools.TestCcxTools.test_static_analysis"
+./bin/FreeCADCmd --run-test "femtest.app.test_ccxtools.TestCcxTools.test_static_parallel_constraint_sets"
+./bin/FreeCADCmd --run-test "femtest.app.test_ccxtools.TestCcxTools.test_write_bulk_lines"
 ./bin/FreeCADCmd --run-test "femtest.app.test_ccxtools.TestCcxTools.test_static_constraint_contact_shell_shell"
 ./bin/FreeCADCmd --run-test "femtest.app.test_ccxtools.TestCcxTools.test_static_constraint_contact_solid_solid"
 ./bin/FreeCADCmd --run-test "femtest.app.test_ccxtools.TestCcxTools.test_static_material_multiple"
@@ -139,6 +141,16 @@ gf()
 ./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_mesh_seg3_python"
 ./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_unv_save_load"
 ./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_writeAbaqus_precision"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_femnodes_ele_incidence"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_mesh_set_cache"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_femmesh_2_mesh"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_gmsh_mesh_input_hash"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_gmsh_reuse_mesh"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_read_inp_fast"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_read_inp_fast_duplicate_nodes"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_xdmf_heavy_data"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_xdmf_result_heavy_data"
+./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshCommon.test_benchmark_preprocessing"
 ./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_create"
 ./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_inp"
 ./bin/FreeCADCmd --run-test "femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_unv"
@@ -151,12 +163,23 @@ gf()
 ./bin/FreeCADCmd --run-test "femtest.app.test_object.TestObjectType.test_femobjects_derivedfromfem"
 ./bin/FreeCADCmd --run-test "femtest.app.test_object.TestObjectType.test_femobjects_derivedfromstd"
 ./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_read_frd_massflow_networkpressure"
+./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_read_frd_fast"
+./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_result_arrays_binary"
+./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_result_arrays_binary_save"
+./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_result_arrays_binary_unchanged"
+./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_read_dat_cached"
 ./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_stress_von_mises"
+./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_stress_von_mises_array"
 ./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_stress_principal_std"
+./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_min_avg_max"
+./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_stress_principal_std_array"
 ./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_stress_principal_reinforced"
 ./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_rho"
 ./bin/FreeCADCmd --run-test "femtest.app.test_result.TestResult.test_disp_abs"
 ./bin/FreeCADCmd --run-test "femtest.app.test_solverframework.TestSolverFrameWork.test_solver_calculix"
+./bin/FreeCADCmd --run-test "femtest.app.test_solverframework.TestSolverFrameWork.test_solver_sweep_overrides"
+./bin/FreeCADCmd --run-test "femtest.app.test_solverframework.TestSolverFrameWork.test_solver_sweep"
+./bin/FreeCADCmd --run-test "femtest.app.test_solverframework.TestSolverFrameWork.test_solver_profile"
 ./bin/FreeCADCmd --run-test "femtest.app.test_solverframework.TestSolverFrameWork.test_solver_elmer"
 
 
@@ -171,6 +194,12 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.a
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_ccxtools.TestCcxTools.test_static_analysis"))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_ccxtools.TestCcxTools.test_static_parallel_constraint_sets"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_ccxtools.TestCcxTools.test_write_bulk_lines"))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_ccxtools.TestCcxTools.test_static_constraint_contact_shell_shell"))
 
@@ -213,6 +242,36 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.a
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_writeAbaqus_precision"))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_femnodes_ele_incidence"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_mesh_set_cache"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_femmesh_2_mesh"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_gmsh_mesh_input_hash"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_gmsh_reuse_mesh"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_read_inp_fast"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_read_inp_fast_duplicate_nodes"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_xdmf_heavy_data"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_xdmf_result_heavy_data"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshCommon.test_benchmark_preprocessing"))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_create"))
 
@@ -249,12 +308,36 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.a
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_read_frd_massflow_networkpressure"))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_read_frd_fast"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_result_arrays_binary"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_result_arrays_binary_save"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_result_arrays_binary_unchanged"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_read_dat_cached"))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_stress_von_mises"))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_stress_von_mises_array"))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_stress_principal_std"))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_min_avg_max"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_stress_principal_std_array"))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_result.TestResult.test_stress_principal_reinforced"))
 
@@ -267,6 +350,15 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.a
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_solverframework.TestSolverFrameWork.test_solver_calculix"))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_solverframework.TestSolverFrameWork.test_solver_sweep_overrides"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_solverframework.TestSolverFrameWork.test_solver_sweep"))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_solverframework.TestSolverFrameWork.test_solver_profile"))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName("femtest.app.test_solverframework.TestSolverFrameWork.test_solver_elmer"))
 
@@ -124,6 +124,8 @@ class _TaskPanelFemResultShow:
     def __init__(self, obj):
         self.result_obj = obj
         self.mesh_obj = self.result_obj.Mesh
+        # the node results might be saved in binary format, load them
+        resulttools.load_result_arrays(self.result_obj)
         # task panel should be started by use of setEdit of view provider
         # in view provider checks: Mesh, active analysis and
         # if Mesh and result are in active analysis
@@ -77,6 +77,40 @@ def import_dat(
 
 # read a calculix result file and extract the data
 def readResult(
+    dat_input,
+    use_cache=None
+):
+    # if use_cache is None the preference General/UseResultFileCache is used
+    # see feminout.resultfilecache
+    if use_cache is None:
+        from femsolver.settings import get_result_file_cache
+        use_cache = get_result_file_cache()
+    if use_cache:
+        from . import resultfilecache
+        arrays = resultfilecache.load_arrays(dat_input, "CcxEigenvalues")
+        if arrays is not None:
+            return [
+                {"eigenmode": mode, "frequency": mode_frequency}
+                for mode, mode_frequency in zip(
+                    arrays["Eigenmodes"].tolist(),
+                    arrays["Frequencies"].tolist()
+                )
+            ]
+    results = read_eigenvalues(dat_input)
+    if use_cache:
+        import numpy as np
+        resultfilecache.save_arrays(
+            dat_input,
+            "CcxEigenvalues",
+            {
+                "Eigenmodes": np.array([m["eigenmode"] for m in results], dtype=np.int64),
+                "Frequencies": np.array([m["frequency"] for m in results], dtype=float),
+            }
+        )
+    return results
+
+
+def read_eigenvalues(
     dat_input
 ):
     Console.PrintMessage("Read ccx results from dat file: {}\n".format(dat_input))
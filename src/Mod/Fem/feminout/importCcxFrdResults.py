@@ -67,7 +67,8 @@ def insert(
 def importFrd(
     filename,
     analysis=None,
-    result_name_prefix=""
+    result_name_prefix="",
+    fast_reader=None
 ):
     from . import importToolsFem
     import ObjectsFem
@@ -77,12 +78,24 @@ def importFrd(
     else:
         doc = FreeCAD.ActiveDocument
 
-    m = read_frd_result(filename)
+    if fast_reader is None:
+        ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+        fast_reader = ccx_prefs.GetBool("UseFastFrdReader", False)
+    if fast_reader:
+        mesh_arrays, result_sets = read_frd_result_fast(filename)
+        m = importToolsFem.make_dict_from_mesh_arrays(mesh_arrays)
+        del mesh_arrays
+        fill_femresult_mechanical = importToolsFem.fill_femresult_mechanical_arrays
+    else:
+        m = read_frd_result(filename)
+        result_sets = m["Results"]
+        fill_femresult_mechanical = importToolsFem.fill_femresult_mechanical
     result_mesh_object = None
     res_obj = None
 
     if len(m["Nodes"]) > 0:
         mesh = importToolsFem.make_femmesh(m)
+        del m
         result_mesh_object = ObjectsFem.makeMeshResult(
             doc,
             "ResultMesh"
@@ -91,87 +104,87 @@ def importFrd(
         res_mesh_is_compacted = False
         nodenumbers_for_compacted_mesh = []
 
-        number_of_increments = len(m["Results"])
-        Console.PrintLog(
-            "Increments: " + str(number_of_increments) + "\n"
-        )
-        if len(m["Results"]) > 0:
-            for result_set in m["Results"]:
-                if "number" in result_set:
-                    eigenmode_number = result_set["number"]
-                else:
-                    eigenmode_number = 0
-                step_time = result_set["time"]
-                step_time = round(step_time, 2)
-                if eigenmode_number > 0:
-                    results_name = (
-                        "{}Mode{}_Results"
-                        .format(result_name_prefix, eigenmode_number)
-                    )
-                elif number_of_increments > 1:
-                    results_name = (
-                        "{}Time{}_Results"
-                        .format(result_name_prefix, step_time)
-                    )
-                else:
-                    results_name = (
-                        "{}Results"
-                        .format(result_name_prefix)
-                    )
-
-                res_obj = ObjectsFem.makeResultMechanical(doc, results_name)
-                res_obj.Mesh = result_mesh_object
-                res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
-                if analysis:
-                    analysis.addObject(res_obj)
-
-                # complementary result object calculations
-                import femresult.resulttools as restools
-                import femtools.femutils as femutils
-                if not res_obj.MassFlowRate:
-                    # information 1:
-                    # only compact result if not Flow 1D results
-                    # compact result object, workaround for bug 2873
-                    # https://www.freecadweb.org/tracker/view.php?id=2873
-                    # information 2:
-                    # if the result data has multiple result sets there will be multiple result objs
-                    # they all will use one mesh obj
-                    # on the first res obj fill the mesh obj will be compacted, thus
-                    # it does not need to be compacted on further result sets
-                    # but NodeNumbers need to be compacted for every result set (res object fill)
-                    # example frd file: https://forum.freecadweb.org/viewtopic.php?t=32649#p274291
-                    if res_mesh_is_compacted is False:
-                        # first result set, compact FemMesh and NodeNumbers
-                        res_obj = restools.compact_result(res_obj)
-                        res_mesh_is_compacted = True
-                        nodenumbers_for_compacted_mesh = res_obj.NodeNumbers
-                    else:
-                        # all other result sets, do not compact FemMesh, only set NodeNumbers
-                        res_obj.NodeNumbers = nodenumbers_for_compacted_mesh
-
-                # fill DisplacementLengths
-                res_obj = restools.add_disp_apps(res_obj)
-                # fill StressValues
-                res_obj = restools.add_von_mises(res_obj)
-                if res_obj.getParentGroup():
-                    has_reinforced_mat = False
-                    for obj in res_obj.getParentGroup().Group:
-                        if obj.isDerivedFrom("App::MaterialObjectPython") \
-                                and femutils.is_of_type(obj, "Fem::MaterialReinforced"):
-                            has_reinforced_mat = True
-                            restools.add_principal_stress_reinforced(res_obj)
-                            break
-                    if has_reinforced_mat is False:
-                        # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
-                        res_obj = restools.add_principal_stress_std(res_obj)
+        number_of_increments = 0
+        for result_set, has_multiple_increments in _iter_result_sets(result_sets):
+            number_of_increments += 1
+            if "number" in result_set:
+                eigenmode_number = result_set["number"]
+            else:
+                eigenmode_number = 0
+            step_time = result_set["time"]
+            step_time = round(step_time, 2)
+            if eigenmode_number > 0:
+                results_name = (
+                    "{}Mode{}_Results"
+                    .format(result_name_prefix, eigenmode_number)
+                )
+            elif has_multiple_increments:
+                results_name = (
+                    "{}Time{}_Results"
+                    .format(result_name_prefix, step_time)
+                )
+            else:
+                results_name = (
+                    "{}Results"
+                    .format(result_name_prefix)
+                )
+
+            res_obj = ObjectsFem.makeResultMechanical(doc, results_name)
+            res_obj.Mesh = result_mesh_object
+            res_obj = fill_femresult_mechanical(res_obj, result_set)
+            if analysis:
+                analysis.addObject(res_obj)
+
+            # complementary result object calculations
+            import femresult.resulttools as restools
+            import femtools.femutils as femutils
+            if not res_obj.MassFlowRate:
+                # information 1:
+                # only compact result if not Flow 1D results
+                # compact result object, workaround for bug 2873
+                # https://www.freecadweb.org/tracker/view.php?id=2873
+                # information 2:
+                # if the result data has multiple result sets there will be multiple result objs
+                # they all will use one mesh obj
+                # on the first res obj fill the mesh obj will be compacted, thus
+                # it does not need to be compacted on further result sets
+                # but NodeNumbers need to be compacted for every result set (res object fill)
+                # example frd file: https://forum.freecadweb.org/viewtopic.php?t=32649#p274291
+                if res_mesh_is_compacted is False:
+                    # first result set, compact FemMesh and NodeNumbers
+                    res_obj = restools.compact_result(res_obj)
+                    res_mesh_is_compacted = True
+                    nodenumbers_for_compacted_mesh = res_obj.NodeNumbers
                 else:
-                    # if a pure frd file was opened no analysis and thus no parent group
+                    # all other result sets, do not compact FemMesh, only set NodeNumbers
+                    res_obj.NodeNumbers = nodenumbers_for_compacted_mesh
+
+            # fill DisplacementLengths
+            res_obj = restools.add_disp_apps(res_obj)
+            # fill StressValues
+            res_obj = restools.add_von_mises(res_obj)
+            if res_obj.getParentGroup():
+                has_reinforced_mat = False
+                for obj in res_obj.getParentGroup().Group:
+                    if obj.isDerivedFrom("App::MaterialObjectPython") \
+                            and femutils.is_of_type(obj, "Fem::MaterialReinforced"):
+                        has_reinforced_mat = True
+                        restools.add_principal_stress_reinforced(res_obj)
+                        break
+                if has_reinforced_mat is False:
                     # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
                     res_obj = restools.add_principal_stress_std(res_obj)
-                # fill Stats
-                res_obj = restools.fill_femresult_stats(res_obj)
+            else:
+                # if a pure frd file was opened no analysis and thus no parent group
+                # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
+                res_obj = restools.add_principal_stress_std(res_obj)
+            # fill Stats
+            res_obj = restools.fill_femresult_stats(res_obj)
 
-        else:
+        Console.PrintLog(
+            "Increments: " + str(number_of_increments) + "\n"
+        )
+        if number_of_increments == 0:
             error_message = (
                 "Nodes, but no results found in frd file. "
                 "It means there only is a mesh but no results in frd file. "
@@ -213,15 +226,11 @@ def importFrd(
     return res_obj
 
 
-# read a calculix result file and extract the nodes
-# displacement vectors and stress values.
-def read_frd_result(
+def read_inout_nodes(
     frd_input
 ):
-    Console.PrintMessage(
-        "Read ccx results from frd file: {}\n"
-        .format(frd_input)
-    )
+    """ reads the special 1DFlow nodes data file which belongs to the frd file
+    """
     inout_nodes = []
     inout_nodes_file = frd_input.rsplit(".", 1)[0] + "_inout_nodes.txt"
     if os.path.exists(inout_nodes_file):
@@ -235,6 +244,35 @@ def read_frd_result(
             inout_nodes.append(a)
         f.close()
         Console.PrintMessage("{}\n".format(inout_nodes))
+    return inout_nodes
+
+
+def _iter_result_sets(
+    result_sets
+):
+    # yields (result_set, has_multiple_increments)
+    # works for lists and generators, for the latter the look ahead of one
+    # result set is needed to know if there are more than one increments
+    result_sets = iter(result_sets)
+    result_set = next(result_sets, None)
+    next_result_set = next(result_sets, None)
+    has_multiple_increments = next_result_set is not None
+    while result_set is not None:
+        yield result_set, has_multiple_increments
+        result_set = next_result_set
+        next_result_set = next(result_sets, None)
+
+
+# read a calculix result file and extract the nodes
+# displacement vectors and stress values.
+def read_frd_result(
+    frd_input
+):
+    Console.PrintMessage(
+        "Read ccx results from frd file: {}\n"
+        .format(frd_input)
+    )
+    inout_nodes = read_inout_nodes(frd_input)
     frd_file = pyopen(frd_input, "r")
     nodes = {}
     elements_hexa8 = {}
@@ -761,3 +799,357 @@ def read_frd_result(
         "Penta15Elem": elements_penta15,
         "Results": results
     }
+
+
+# ********* fast frd reader, block wise into numpy arrays *********
+# the frd data blocks are parsed in chunks of this number of lines
+FRD_CHUNK_SIZE = 200000
+
+# frd element type: (mesh data key, node order, lines per element)
+# the node order is the index into the frd nodes of an element
+# and fits with the node order used in read_frd_result()
+FRD_ELEMENT_TYPES = {
+    1: ("Hexa8Elem", (5, 6, 7, 4, 1, 2, 3, 0), 1),
+    2: ("Penta6Elem", (4, 5, 3, 1, 2, 0), 1),
+    3: ("Tetra4Elem", (1, 0, 2, 3), 1),
+    4: ("Hexa20Elem", (
+        7, 4, 5, 6, 3, 0, 1, 2, 19, 16, 17, 18, 11, 8, 9, 10, 15, 12, 13, 14
+    ), 2),
+    5: ("Penta15Elem", (4, 5, 3, 1, 2, 0, 13, 14, 12, 7, 8, 6, 10, 11, 9), 2),
+    6: ("Tetra10Elem", (1, 0, 2, 3, 4, 6, 5, 8, 7, 9), 1),
+    7: ("Tria3Elem", (0, 1, 2), 1),
+    8: ("Tria6Elem", (0, 1, 2, 3, 4, 5), 1),
+    9: ("Quad4Elem", (0, 1, 2, 3), 1),
+    10: ("Quad8Elem", (0, 1, 2, 3, 4, 5, 6, 7), 1),
+    11: ("Seg2Elem", (0, 1), 1),
+    12: ("Seg3Elem", (0, 1, 2), 1),
+}
+
+# frd result block name: (result set key, value order, value factor)
+# CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
+# FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+# thus exchange the last two entries for stress and strain
+# mass flow is converted to kg/s from t/s
+FRD_RESULT_BLOCKS = (
+    (b"DISP", "disp", (0, 1, 2), 1.0),
+    (b"STRESS", "stress", (0, 1, 2, 3, 5, 4), 1.0),
+    (b"TOSTRAIN", "strain", (0, 1, 2, 3, 5, 4), 1.0),
+    (b"PE", "peeq", (0,), 1.0),
+    (b"NDTEMP", "temp", (0,), 1.0),
+    (b"MAFLOW", "mflow", (0,), 1000.0),
+    (b"STPRES", "npressure", (0,), 1.0),
+)
+
+
+def read_frd_result_fast(
+    frd_input
+):
+    """ reads a CalculiX frd result file block wise into numpy arrays
+
+    Returns the mesh and a generator of the result sets. The mesh is a dict
+    with the keys of read_frd_result() ("Nodes", "Tetra10Elem", ...) and a
+    tuple (ids, array) as value. The generator yields one result set (time
+    step or eigenmode) at a time, thus only one of them is hold in memory.
+    A result set is a dict with "number", "time" and a tuple
+    (node ids, values array) for every result found ("disp", "stress", ...).
+    """
+    Console.PrintMessage(
+        "Read ccx results from frd file (fast reader): {}\n"
+        .format(frd_input)
+    )
+    inout_nodes = read_inout_nodes(frd_input)
+    frd_blocks = _iter_frd_blocks(pyopen(frd_input, "rb"), inout_nodes)
+
+    mesh_arrays = {}
+    first_result_block = None
+    for block in frd_blocks:
+        if block[0] == "Nodes":
+            mesh_arrays["Nodes"] = block[1:]
+        elif block[0] == "Elements":
+            mesh_arrays.update(block[1])
+        else:
+            first_result_block = block
+            break
+    if "Nodes" not in mesh_arrays:
+        Console.PrintError("FEM: No nodes found in Frd file.\n")
+
+    return mesh_arrays, _iter_frd_result_sets(first_result_block, frd_blocks, inout_nodes)
+
+
+def _iter_frd_result_sets(
+    first_result_block,
+    frd_blocks,
+    inout_nodes
+):
+    # same logic as in read_frd_result(), a result set is finished if the
+    # eigenmode or time step changes after the end of a section or at the
+    # end of the frd data
+    if first_result_block is None:
+        return
+    import itertools
+
+    mode_results = {"number": float("NaN"), "time": float("NaN")}
+    end_of_section_found = False
+    result_section_found = False
+    has_mflow_or_npressure = False
+    for block in itertools.chain((first_result_block, ), frd_blocks):
+        if block[0] in ("Number", "Time", "End"):
+            if end_of_section_found and result_section_found:
+                has_mflow_or_npressure = (
+                    has_mflow_or_npressure
+                    or "mflow" in mode_results
+                    or "npressure" in mode_results
+                )
+                yield mode_results
+                mode_results = {"number": float("NaN"), "time": float("NaN")}
+                end_of_section_found = False
+            if block[0] == "Number":
+                mode_results["number"] = block[1]
+            elif block[0] == "Time":
+                mode_results["time"] = block[1]
+        elif block[0] == "Result":
+            mode_results[block[1]] = block[2:]
+            end_of_section_found = True
+            result_section_found = True
+        elif block[0] == "Section":
+            end_of_section_found = True
+        else:
+            # a mesh block after results, should not happen in frd files
+            result_section_found = False
+
+    if has_mflow_or_npressure and not inout_nodes:
+        Console.PrintError(
+            "We have mflow or npressure, but no inout_nodes file.\n"
+        )
+
+
+def _iter_frd_blocks(
+    frd_file,
+    inout_nodes
+):
+    # yields the frd file content block by block
+    # ("Nodes", ids, coords), ("Elements", {key: (ids, nodes)}),
+    # ("Number", eigenmode), ("Time", time step), ("Result", key, ids, values),
+    # ("Section", ) for a not supported block and ("End", ) at the end of data
+    # the eigenmode and time step are only yielded if they increase
+    eigenmode = 0
+    timestep = 0
+    mode_time_found = False
+    try:
+        for line in frd_file:
+            if line[4:6] == b"2C":
+                ids, coords = _read_frd_block(frd_file, _parse_frd_node_lines)
+                yield ("Nodes", ids, coords)
+            elif line[4:6] == b"3C":
+                element_chunks = _read_frd_block(
+                    frd_file,
+                    _parse_frd_element_lines,
+                    element_wise=True
+                )
+                yield ("Elements", _merge_frd_element_chunks(element_chunks, inout_nodes))
+            elif line[1:3] == b"-4":
+                for name, key, value_order, factor in FRD_RESULT_BLOCKS:
+                    if line[5:5 + len(name)] == name:
+                        break
+                else:
+                    _read_frd_block(frd_file, None)
+                    yield ("Section", )
+                    continue
+                ids, values = _read_frd_block(
+                    frd_file,
+                    lambda lines: _parse_frd_result_lines(lines, value_order)
+                )
+                if factor != 1.0:
+                    values *= factor
+                if inout_nodes and key in ("mflow", "npressure"):
+                    ids, values = _add_frd_inout_nodes_results(ids, values, inout_nodes)
+                yield ("Result", key, ids, values)
+            elif line[5:10] == b"PMODE":
+                eigentemp = int(line[30:36])
+                if eigentemp > eigenmode:
+                    eigenmode = eigentemp
+                    yield ("Number", eigenmode)
+            elif line[4:10] == b"1PSTEP":
+                mode_time_found = True
+            elif mode_time_found and line[2:7] == b"100CL":
+                timetemp = float(line[13:25])
+                if timetemp > timestep:
+                    timestep = timetemp
+                    mode_time_found = False
+                    yield ("Time", timestep)
+            elif line[1:5] == b"9999":
+                yield ("End", )
+                break
+    finally:
+        frd_file.close()
+
+
+def _read_frd_block(
+    frd_file,
+    parse_lines,
+    element_wise=False
+):
+    # reads the lines of a block up to its end line " -3" and parses them
+    # chunk wise with parse_lines, returns the concatenated chunks
+    # element chunks are only split on a new element line
+    # the header lines " -4" and " -5" of a result block are skipped
+    import numpy as np
+    lines = []
+    chunks = []
+    for line in frd_file:
+        code = line[1:3]
+        if code == b"-3":
+            break
+        if parse_lines is None or code not in (b"-1", b"-2"):
+            continue
+        if len(lines) >= FRD_CHUNK_SIZE and (not element_wise or code == b"-1"):
+            chunks.append(parse_lines(lines))
+            lines = []
+        lines.append(line)
+    if parse_lines is None:
+        return None
+    if lines or not chunks:
+        chunks.append(parse_lines(lines))
+    if element_wise:
+        return chunks
+    return tuple(np.concatenate(arrays) for arrays in zip(*chunks))
+
+
+def _parse_fixed_width(
+    lines,
+    columns,
+    dtype,
+    fill_empty=False
+):
+    # parses fixed width columns [(start, end), ...] of all lines at once
+    # returns an array of shape (len(lines), len(columns))
+    # if fill_empty is set, missing or blank fields are returned as 0
+    import numpy as np
+    width = max(end for start, end in columns)
+    chars = np.array(lines, dtype="S{}".format(width)).view(np.uint8)
+    chars = chars.reshape(len(lines), width).copy()
+    # remove line endings, trailing NUL bytes are ignored by numpy
+    chars[(chars == ord("\n")) | (chars == ord("\r"))] = 0
+    result = np.empty((len(lines), len(columns)), dtype=dtype)
+    for i, (start, end) in enumerate(columns):
+        field = np.ascontiguousarray(chars[:, start:end])
+        field = field.view("S{}".format(end - start)).ravel()
+        if fill_empty:
+            field = np.char.strip(field)
+            field[field == b""] = b"0"
+        result[:, i] = field.astype(dtype)
+    return result
+
+
+def _parse_frd_node_lines(
+    lines
+):
+    import numpy as np
+    data = _parse_fixed_width(lines, ((4, 13), (13, 25), (25, 37), (37, 49)), np.float64)
+    return data[:, 0].astype(np.int64), data[:, 1:]
+
+
+def _parse_frd_result_lines(
+    lines,
+    value_order
+):
+    import numpy as np
+    ids = _parse_fixed_width(lines, ((4, 13), ), np.int64)[:, 0]
+    columns = tuple((13 + 12 * i, 25 + 12 * i) for i in range(max(value_order) + 1))
+    values = _parse_fixed_width(lines, columns, np.float64)
+    return ids, values[:, value_order]
+
+
+def _parse_frd_element_lines(
+    lines
+):
+    # returns {frd element type: (ids, frd nodes)} for the lines of a chunk
+    import numpy as np
+    lines = np.array(lines, dtype="S103")
+    is_header = lines.astype("S3") == b" -1"
+    headers = _parse_fixed_width(lines[is_header], ((4, 13), (14, 18)), np.int64)
+    node_lines = _parse_fixed_width(
+        lines[~is_header],
+        tuple((3 + 10 * i, 13 + 10 * i) for i in range(10)),
+        np.int64,
+        fill_empty=True
+    )
+    # index of the first node line of every element
+    first_line = np.cumsum(is_header)[~is_header] - 1
+    first_line = np.searchsorted(first_line, np.arange(len(headers)))
+
+    elements = {}
+    for elem_type in np.unique(headers[:, 1]):
+        if elem_type not in FRD_ELEMENT_TYPES:
+            continue
+        key, node_order, lines_per_element = FRD_ELEMENT_TYPES[elem_type]
+        of_type = headers[:, 1] == elem_type
+        rows = first_line[of_type]
+        nodes = np.hstack([node_lines[rows + i] for i in range(lines_per_element)])
+        elements[elem_type] = (headers[of_type, 0], nodes)
+    return elements
+
+
+def _merge_frd_element_chunks(
+    element_chunks,
+    inout_nodes
+):
+    # concatenates the element chunks and brings the nodes in FreeCAD order
+    import numpy as np
+    elements = {}
+    for elem_type, (key, node_order, lines_per_element) in FRD_ELEMENT_TYPES.items():
+        parts = [chunk[elem_type] for chunk in element_chunks if elem_type in chunk]
+        if not parts:
+            continue
+        ids = np.concatenate([part[0] for part in parts])
+        nodes = np.concatenate([part[1] for part in parts])[:, node_order]
+        if elem_type == 12 and inout_nodes:
+            ids, nodes = _set_frd_inout_nodes_seg3(ids, nodes, inout_nodes)
+        elements[key] = (ids, nodes)
+    return elements
+
+
+def _set_frd_inout_nodes_seg3(
+    ids,
+    nodes,
+    inout_nodes
+):
+    # 1DFlow, same as in read_frd_result(), only a few elements
+    import numpy as np
+    seg3_ids = []
+    seg3_nodes = []
+    for elem, (nd1, nd2, nd3) in zip(ids.tolist(), nodes.tolist()):
+        seg3 = None
+        for inout in inout_nodes:
+            if nd1 == int(inout[1]):
+                # fluid inlet node numbering
+                seg3 = (int(inout[2]), nd3, nd1)
+            elif nd3 == int(inout[1]):
+                # fluid outlet node numbering
+                seg3 = (nd1, int(inout[2]), nd3)
+        if seg3 is not None:
+            seg3_ids.append(elem)
+            seg3_nodes.append(seg3)
+    return (
+        np.array(seg3_ids, dtype=np.int64),
+        np.array(seg3_nodes, dtype=np.int64).reshape(-1, 3)
+    )
+
+
+def _add_frd_inout_nodes_results(
+    ids,
+    values,
+    inout_nodes
+):
+    # 1DFlow, same as in read_frd_result(), only a few nodes
+    import numpy as np
+    node_values = {}
+    for node, value in zip(ids.tolist(), values.tolist()):
+        node_values[node] = value
+        for inout in inout_nodes:
+            if node == int(inout[1]):
+                node_values[int(inout[2])] = value
+    return (
+        np.array(list(node_values.keys()), dtype=np.int64),
+        np.array(list(node_values.values()), dtype=np.float64).reshape(-1, values.shape[1])
+    )
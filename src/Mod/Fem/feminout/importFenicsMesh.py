@@ -36,6 +36,7 @@ from . import importToolsFem
 from . import readFenicsXML
 from . import writeFenicsXML
 from . import writeFenicsXDMF
+from . import readFenicsXDMF
 
 if FreeCAD.GuiUp:
     import FreeCADGui
@@ -138,7 +139,8 @@ if FreeCAD.GuiUp:
 
             writeFenicsXDMF.write_fenics_mesh_xdmf(
                 self.fem_mesh_obj, self.fileString,
-                group_values_dict=group_values_dict)
+                group_values_dict=group_values_dict,
+                encoding=get_xdmf_encoding())
 
             FreeCADGui.Control.closeDialog()
 
@@ -170,6 +172,14 @@ def export(objectslist, fileString, group_values_dict_nogui=None):
             "This exporter can only export one object.\n")
         return
     obj = objectslist[0]
+    if obj.isDerivedFrom("Fem::FemResultObject"):
+        if os.path.splitext(fileString)[1].lower() == ".xdmf":
+            writeFenicsXDMF.write_fenics_result_xdmf(
+                obj, fileString,
+                encoding=get_xdmf_encoding(writeFenicsXDMF.ENCODING_BINARY))
+        else:
+            Console.PrintError("FEM results can only be exported to XDMF.\n")
+        return
     if not obj.isDerivedFrom("Fem::FemMeshObject"):
         Console.PrintError("No FEM mesh object selected.\n")
         return
@@ -197,20 +207,62 @@ def export(objectslist, fileString, group_values_dict_nogui=None):
                                                         for g in mesh_groups])
                     writeFenicsXDMF.write_fenics_mesh_xdmf(
                         obj, fileString,
-                        group_values_dict=group_values_dict_nogui)
+                        group_values_dict=group_values_dict_nogui,
+                        encoding=get_xdmf_encoding())
             else:
-                writeFenicsXDMF.write_fenics_mesh_xdmf(obj, fileString)
+                writeFenicsXDMF.write_fenics_mesh_xdmf(
+                    obj, fileString,
+                    encoding=get_xdmf_encoding())
+
+
+def get_xdmf_encoding(default=writeFenicsXDMF.ENCODING_ASCII):
+    """
+    Encoding of the arrays of exported XDMF files, parameter Fenics/XDMFEncoding.
+    ASCII writes the arrays inline into the XDMF file, HDF5 and Binary write
+    them into a heavy data file beside the XDMF file.
+    """
+    fenics_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Fenics")
+    return fenics_prefs.GetString("XDMFEncoding", default)
 
 
 # ********* module specific methods *********
 def import_fenics_mesh(filename, analysis=None):
     """insert a FreeCAD FEM Mesh object in the ActiveDocument
+    if a xdmf file has node results a mechanical result object is inserted too
     """
-    mesh_data = readFenicsXML.read_fenics_mesh_xml(filename)
-    # xdmf not operational
-
     mesh_name = os.path.basename(os.path.splitext(filename)[0])
-    femmesh = importToolsFem.make_femmesh(mesh_data)
+    results = {}
+    if os.path.splitext(filename)[1].lower() == ".xdmf":
+        mesh_arrays = readFenicsXDMF.read_fenics_mesh_xdmf_arrays(filename)
+        femmesh = importToolsFem.make_femmesh_from_arrays(mesh_arrays)
+        results = readFenicsXDMF.read_fenics_result_xdmf(filename)
+    else:
+        mesh_data = readFenicsXML.read_fenics_mesh_xml(filename)
+        femmesh = importToolsFem.make_femmesh(mesh_data)
     if femmesh:
         mesh_object = FreeCAD.ActiveDocument.addObject("Fem::FemMeshObject", mesh_name)
         mesh_object.FemMesh = femmesh
+        if results:
+            import_fenics_results(results, mesh_object, analysis)
+
+
+def import_fenics_results(results, mesh_object, analysis=None):
+    """insert a FreeCAD FEM mechanical result object with the node results
+    of read_fenics_result_xdmf() in the ActiveDocument
+    """
+    import ObjectsFem
+    res_obj = ObjectsFem.makeResultMechanical(FreeCAD.ActiveDocument, mesh_object.Name + "_results")
+    res_obj.Mesh = mesh_object
+    res_obj.NodeNumbers = results["NodeNumbers"].tolist()
+    for name, values in results.items():
+        if name == "NodeNumbers" or not hasattr(res_obj, name):
+            continue
+        if res_obj.getTypeIdOfProperty(name) == "App::PropertyVectorList":
+            setattr(res_obj, name, [FreeCAD.Vector(*v) for v in values.tolist()])
+        elif res_obj.getTypeIdOfProperty(name) == "App::PropertyFloatList":
+            setattr(res_obj, name, values.tolist())
+        else:
+            Console.PrintWarning("Result {} not imported.\n".format(name))
+    if analysis:
+        analysis.addObject(res_obj)
+    return res_obj
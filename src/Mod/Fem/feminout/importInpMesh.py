@@ -60,12 +60,18 @@ def insert(filename, docname):
 
 
 # ********* module specific methods *********
-def read(filename):
+def read(filename, fast_reader=None):
     """read a FemMesh from a inp mesh file and return the FemMesh
     """
     # no document object is created, just the FemMesh is returned
-    mesh_data = read_inp(filename)
     from . import importToolsFem
+    if fast_reader is None:
+        ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+        fast_reader = ccx_prefs.GetBool("UseFastInpReader", False)
+    if fast_reader:
+        mesh_arrays = read_inp_fast(filename)
+        return importToolsFem.make_femmesh_from_arrays(mesh_arrays)
+    mesh_data = read_inp(filename)
     return importToolsFem.make_femmesh(mesh_data)
 
 
@@ -259,3 +265,177 @@ def read_inp(file_name):
         "Penta6Elem": elements.penta6,
         "Penta15Elem": elements.penta15
     }
+
+
+# ********* fast inp mesh reader *********
+# element types of the inp file: key of the mesh data and number of nodes
+_inp_element_types = {}
+for _elm_types, _key, _number_of_nodes in (
+    (("S3", "CPS3", "CPE3", "CAX3"), "Tria3Elem", 3),
+    (("S6", "CPS6", "CPE6", "CAX6"), "Tria6Elem", 6),
+    (("S4", "S4R", "CPS4", "CPS4R", "CPE4", "CPE4R", "CAX4", "CAX4R"), "Quad4Elem", 4),
+    (("S8", "S8R", "CPS8", "CPS8R", "CPE8", "CPE8R", "CAX8", "CAX8R"), "Quad8Elem", 8),
+    (("C3D4", ), "Tetra4Elem", 4),
+    (("C3D10", ), "Tetra10Elem", 10),
+    (("C3D8", "C3D8R", "C3D8I"), "Hexa8Elem", 8),
+    (("C3D20", "C3D20R", "C3D20RI"), "Hexa20Elem", 20),
+    (("C3D6", ), "Penta6Elem", 6),
+    (("C3D15", ), "Penta15Elem", 15),
+    (("B31", "B31R", "T3D2"), "Seg2Elem", 2),
+    (("B32", "B32R", "T3D3"), "Seg3Elem", 3),
+):
+    for _elm_type in _elm_types:
+        _inp_element_types[_elm_type] = (_key, _number_of_nodes)
+
+# switch from the CalculiX node numbering to the FreeCAD node numbering, see read_inp()
+# numbering do not change: tria3, tria6, quad4, quad8, seg2
+_inp_node_order = {
+    "Tetra4Elem": [1, 0, 2, 3],
+    "Tetra10Elem": [1, 0, 2, 3, 4, 6, 5, 8, 7, 9],
+    "Hexa8Elem": [5, 6, 7, 4, 1, 2, 3, 0],
+    "Hexa20Elem": [5, 6, 7, 4, 1, 2, 3, 0, 13, 14, 15, 12, 9, 10, 11, 8, 17, 18, 19, 16],
+    "Penta6Elem": [4, 5, 3, 1, 2, 0],
+    "Penta15Elem": [4, 5, 3, 1, 2, 0, 10, 11, 9, 7, 8, 6, 13, 14, 12],
+    "Seg3Elem": [0, 2, 1],
+}
+
+
+def read_inp_fast(
+    file_name,
+    chunk_size=100000
+):
+    """ reads the mesh of an inp file block wise into numpy arrays
+
+    Same mesh as read_inp(), but the data lines of the *NODE and *ELEMENT
+    blocks are parsed chunk_size lines at a time into numpy arrays.
+    Returns a dict with the keys of read_inp() ("Nodes", "Tetra10Elem", ...)
+    and a tuple (ids, array) as value, like the mesh of
+    importCcxFrdResults.read_frd_result_fast(). *INCLUDE files are read too.
+    Only the model definition (everything before the first *STEP) is read.
+    """
+    import numpy as np
+
+    blocks = {}  # {key: [rows arrays]}
+    block = None
+    error_seg3 = False
+    for line in _iter_inp_lines(file_name):
+        if line[0] == "*":
+            if line[:2] == "**":
+                continue
+            if block is not None:
+                blocks.setdefault(block.key, []).append(block.get_rows())
+                block = None
+            keyword_line = line.upper().split(",")
+            keyword = keyword_line[0].strip()
+            if keyword == "*NODE":
+                block = _InpDataBlock("Nodes", 4, chunk_size)
+            elif keyword == "*ELEMENT":
+                for line_part in keyword_line[1:]:
+                    if line_part.strip()[:4] == "TYPE":
+                        elm_type = line_part.split("=")[1].strip()
+                        if elm_type in _inp_element_types:
+                            key, number_of_nodes = _inp_element_types[elm_type]
+                            block = _InpDataBlock(key, number_of_nodes + 1, chunk_size)
+                            error_seg3 = error_seg3 or key == "Seg3Elem"
+            elif keyword == "*STEP":
+                break
+        elif block is not None:
+            block.add_line(line)
+    if block is not None:
+        blocks.setdefault(block.key, []).append(block.get_rows())
+    if error_seg3 is True:  # to print "not supported"
+        Console.PrintError("Error: seg3 (3-node beam element type) not supported, yet.\n")
+
+    mesh_arrays = {}
+    for key, rows_list in blocks.items():
+        rows = np.concatenate(rows_list)
+        ids = rows[:, 0].astype(np.int64)
+        if key == "Nodes":
+            values = rows[:, 1:]
+        else:
+            values = rows[:, 1:].astype(np.int64)
+            if key in _inp_node_order:
+                values = values[:, _inp_node_order[key]]
+        mesh_arrays[key] = (ids, values)
+    return mesh_arrays
+
+
+def _iter_inp_lines(
+    file_name
+):
+    # the non empty lines of an inp file and its include files
+    with pyopen(file_name, "r") as f:
+        for line in f:
+            if line.strip() == "":
+                continue
+            if line[:8].upper() == "*INCLUDE":
+                start = 1 + line.index("=")
+                include_path = os.path.normpath(line[start:].strip().strip('"'))
+                if os.path.isfile(include_path) is not True:
+                    include_path = os.path.join(os.path.split(file_name)[0], include_path)
+                for include_line in _iter_inp_lines(include_path):
+                    yield include_line
+                continue
+            yield line
+
+
+class _InpDataBlock(object):
+    """ the data lines of one *NODE or *ELEMENT block
+
+    The values of the lines are parsed chunk wise into one array. A row
+    (node id and coordinates, element id and nodes) may be split on more
+    than one line, thus the values which do not fill a row are kept for
+    the next chunk.
+    """
+
+    def __init__(
+        self,
+        key,
+        row_length,
+        chunk_size
+    ):
+        self.key = key
+        self.row_length = row_length
+        self.chunk_size = chunk_size
+        self.lines = []
+        self.rows = []
+        self.rest = None
+
+    def add_line(
+        self,
+        line
+    ):
+        self.lines.append(line.strip().rstrip(","))
+        if len(self.lines) >= self.chunk_size:
+            self.parse_lines()
+
+    def parse_lines(
+        self
+    ):
+        import numpy as np
+        text = ",".join(self.lines)
+        values = np.fromstring(text, dtype=float, sep=",")
+        if len(values) != text.count(",") + 1:
+            raise ValueError(
+                "Could not read the data lines of the {} block.".format(self.key)
+            )
+        if self.rest is not None:
+            values = np.concatenate((self.rest, values))
+        row_count = len(values) // self.row_length
+        self.rows.append(values[:row_count * self.row_length].reshape(-1, self.row_length))
+        self.rest = values[row_count * self.row_length:]
+        self.lines = []
+
+    def get_rows(
+        self
+    ):
+        import numpy as np
+        if self.lines:
+            self.parse_lines()
+        if self.rest is not None and len(self.rest) > 0:
+            Console.PrintError(
+                "Incomplete last data line in the {} block is ignored.\n".format(self.key)
+            )
+        if not self.rows:
+            return np.empty((0, self.row_length))
+        return np.concatenate(self.rows)
@@ -28,6 +28,8 @@ __url__ = "http://www.freecadweb.org"
 #  \ingroup FEM
 #  \brief FreeCAD FEM import tools
 
+import collections
+
 import FreeCAD
 from FreeCAD import Console
 
@@ -244,6 +246,95 @@ def make_femmesh(
     return mesh
 
 
+def make_femmesh_from_arrays(
+    mesh_arrays
+):
+    """ makes an FreeCAD FEM Mesh object from FEM mesh arrays
+
+    Same as make_femmesh() but for the mesh arrays {key: (ids, array)} as
+    returned by the array based readers (e.g. importInpMesh.read_inp_fast()).
+    All nodes and all elements of one type are added at once.
+    """
+    import Fem
+    mesh = Fem.FemMesh()
+    m = mesh_arrays
+    if ("Nodes" in m) and (len(m["Nodes"][0]) > 0):
+        FreeCAD.Console.PrintLog("Found: nodes\n")
+        element_keys = [
+            key for key in _mesh_array_element_types
+            if key in m and len(m[key][0]) > 0
+        ]
+        if element_keys:
+            FreeCAD.Console.PrintLog("Found: elements\n")
+            node_ids, coordinates = get_unique_nodes(*m["Nodes"])
+            mesh.addNodes(coordinates.ravel().tolist(), node_ids.tolist())
+            for key in element_keys:
+                ids, nodes = m[key]
+                mesh.addElements(
+                    _mesh_array_element_types[key],
+                    nodes.ravel().tolist(),
+                    nodes.shape[1],
+                    ids.tolist()
+                )
+            Console.PrintLog(
+                "imported mesh: {} nodes, {}\n".format(
+                    len(node_ids),
+                    ", ".join(
+                        "{} {}".format(len(m[key][0]), key[:-4].upper())
+                        for key in element_keys
+                    )
+                )
+            )
+        else:
+            Console.PrintError("No Elements found!\n")
+    else:
+        Console.PrintError("No Nodes found!\n")
+    return mesh
+
+
+def get_unique_nodes(
+    node_ids,
+    coordinates
+):
+    """ returns the node ids and coordinates arrays without duplicate node ids
+
+    As in the node dictionary of make_femmesh() the last node of a duplicate
+    node id is used. The duplicates are reported.
+    """
+    import numpy as np
+    # the index of the last node of every node id
+    unique_ids, reversed_index = np.unique(node_ids[::-1], return_index=True)
+    if len(unique_ids) == len(node_ids):
+        return node_ids, coordinates
+    counts = np.bincount(np.searchsorted(unique_ids, node_ids))
+    duplicate_ids = unique_ids[counts > 1].tolist()
+    Console.PrintWarning(
+        "Duplicate node ids found, the last node of each id is used: {}{}\n".format(
+            ", ".join(str(i) for i in duplicate_ids[:10]),
+            ", ..." if len(duplicate_ids) > 10 else ""
+        )
+    )
+    keep = np.sort(len(node_ids) - 1 - reversed_index)
+    return node_ids[keep], coordinates[keep]
+
+
+# the element keys of the mesh data in the order of make_femmesh()
+_mesh_array_element_types = collections.OrderedDict((
+    ("Hexa8Elem", "Volume"),
+    ("Penta6Elem", "Volume"),
+    ("Tetra4Elem", "Volume"),
+    ("Tetra10Elem", "Volume"),
+    ("Penta15Elem", "Volume"),
+    ("Hexa20Elem", "Volume"),
+    ("Tria3Elem", "Face"),
+    ("Tria6Elem", "Face"),
+    ("Quad4Elem", "Face"),
+    ("Quad8Elem", "Face"),
+    ("Seg2Elem", "Edge"),
+    ("Seg3Elem", "Edge"),
+))
+
+
 def make_dict_from_femmesh(
     femmesh
 ):
@@ -334,6 +425,29 @@ def make_dict_from_femmesh(
     return mesh_data
 
 
+def make_dict_from_mesh_arrays(
+    mesh_arrays
+):
+    """
+    Converts mesh arrays {key: (ids, array)} as returned by the array based
+    readers (e.g. importCcxFrdResults.read_frd_result_fast()) into the
+    dictionary structure used by importToolsFem.make_femmesh(mesh_data).
+    """
+    mesh_data = {}
+    for key in (
+        "Nodes",
+        "Seg2Elem", "Seg3Elem",
+        "Tria3Elem", "Tria6Elem", "Quad4Elem", "Quad8Elem",
+        "Tetra4Elem", "Tetra10Elem", "Hexa8Elem", "Hexa20Elem", "Penta6Elem", "Penta15Elem"
+    ):
+        if key in mesh_arrays:
+            ids, values = mesh_arrays[key]
+            mesh_data[key] = dict(zip(ids.tolist(), map(tuple, values.tolist())))
+        else:
+            mesh_data[key] = {}
+    return mesh_data
+
+
 def fill_femresult_mechanical(
     res_obj,
     result_set
@@ -466,3 +580,86 @@ def fill_femresult_mechanical(
             res_obj.Time = step_time
 
     return res_obj
+
+
+def fill_femresult_mechanical_arrays(
+    res_obj,
+    result_set
+):
+    """ fills a FreeCAD FEM mechanical result object with result data arrays
+
+    Same as fill_femresult_mechanical() but for result sets of the array
+    based readers (e.g. importCcxFrdResults.read_frd_result_fast()).
+    The results are tuples (node ids, values array). The FreeCAD.Vector of
+    the displacements are only created here.
+    """
+    if "number" in result_set:
+        eigenmode_number = result_set["number"]
+    else:
+        eigenmode_number = 0
+
+    if "time" in result_set:
+        step_time = result_set["time"]
+        step_time = round(step_time, 2)
+
+    number_of_nodes = None
+    if "disp" in result_set:
+        node_ids, disp = result_set["disp"]
+        number_of_nodes = len(node_ids)
+        res_obj.DisplacementVectors = [FreeCAD.Vector(*v) for v in disp.tolist()]
+        res_obj.NodeNumbers = node_ids.tolist()
+
+        # values_S .. stress_tensor .. (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+        if "stress" in result_set:
+            stress = result_set["stress"][1]
+            res_obj.NodeStressXX = stress[:, 0].tolist()
+            res_obj.NodeStressYY = stress[:, 1].tolist()
+            res_obj.NodeStressZZ = stress[:, 2].tolist()
+            res_obj.NodeStressXY = stress[:, 3].tolist()
+            res_obj.NodeStressXZ = stress[:, 4].tolist()
+            res_obj.NodeStressYZ = stress[:, 5].tolist()
+
+        # values_E .. straintuple .. (Exx, Eyy, Ezz, Exy, Exz, Eyz)
+        if "strain" in result_set:
+            strain = result_set["strain"][1]
+            res_obj.NodeStrainXX = strain[:, 0].tolist()
+            res_obj.NodeStrainYY = strain[:, 1].tolist()
+            res_obj.NodeStrainZZ = strain[:, 2].tolist()
+            res_obj.NodeStrainXY = strain[:, 3].tolist()
+            res_obj.NodeStrainXZ = strain[:, 4].tolist()
+            res_obj.NodeStrainYZ = strain[:, 5].tolist()
+
+        if "peeq" in result_set:
+            peeq = result_set["peeq"][1][:, 0]
+            if len(peeq) > 0:
+                if len(peeq) != number_of_nodes:
+                    Console.PrintError("PEEQ seams to have exptra nodes.\n")
+                res_obj.Peeq = peeq[:number_of_nodes].tolist()
+
+        if eigenmode_number > 0:
+            res_obj.Eigenmode = eigenmode_number
+
+    if "temp" in result_set:
+        temperature = result_set["temp"][1][:, 0]
+        if len(temperature) > 0:
+            if number_of_nodes is not None and len(temperature) != number_of_nodes:
+                Console.PrintError("Temperature seams to have exptra nodes.\n")
+                temperature = temperature[:number_of_nodes]
+            res_obj.Temperature = temperature.tolist()
+            res_obj.Time = step_time
+
+    if "mflow" in result_set:
+        node_ids, mass_flow = result_set["mflow"]
+        if len(mass_flow) > 0:
+            res_obj.MassFlowRate = mass_flow[:, 0].tolist()
+            res_obj.Time = step_time
+            # disp does not exist, res_obj.NodeNumbers needs to be set
+            res_obj.NodeNumbers = node_ids.tolist()
+
+    if "npressure" in result_set:
+        network_pressure = result_set["npressure"][1][:, 0]
+        if len(network_pressure) > 0:
+            res_obj.NetworkPressure = network_pressure.tolist()
+            res_obj.Time = step_time
+
+    return res_obj
@@ -108,7 +108,7 @@ def import_z88_disp(
 
             res_obj = ObjectsFem.makeResultMechanical(FreeCAD.ActiveDocument, results_name)
             res_obj.Mesh = result_mesh_object
-            res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
+            res_obj = importToolsFem.fill_femresult_mechanical_arrays(res_obj, result_set)
             if analysis:
                 analysis_object.addObject(res_obj)
 
@@ -126,17 +126,56 @@ def import_z88_disp(
 
 
 def read_z88_disp(
-    z88_disp_input
+    z88_disp_input,
+    use_cache=None
 ):
     """
-    read a z88 disp file and extract the nodes and elements
+    read a z88 disp file and extract the nodes and displacements as arrays
     z88 Displacement output file is z88o2.txt
     works with Z88OS14
+    if use_cache is None the preference General/UseResultFileCache is used,
+    see feminout.resultfilecache
+    """
+    import numpy as np
+    if use_cache is None:
+        from femsolver.settings import get_result_file_cache
+        use_cache = get_result_file_cache()
+    arrays = None
+    if use_cache:
+        from . import resultfilecache
+        arrays = resultfilecache.load_arrays(z88_disp_input, "Z88Displacements")
+    if arrays is not None:
+        node_numbers = arrays["NodeNumbers"]
+        displacements = arrays["Displacements"]
+    else:
+        node_numbers, displacements = read_z88_disp_values(z88_disp_input)
+        node_numbers = np.array(node_numbers, dtype=np.int64)
+        displacements = np.array(displacements, dtype=float).reshape(-1, 3)
+        if use_cache:
+            resultfilecache.save_arrays(
+                z88_disp_input,
+                "Z88Displacements",
+                {
+                    "NodeNumbers": node_numbers,
+                    "Displacements": displacements,
+                }
+            )
+    Console.PrintLog("Read {} node displacements\n".format(len(node_numbers)))
+
+    # the result set of importToolsFem.fill_femresult_mechanical_arrays()
+    results = [{"disp": (node_numbers, displacements)}]
+    return {"Nodes": node_numbers, "Results": results}
+
+
+def read_z88_disp_values(
+    z88_disp_input
+):
     """
-    nodes = {}
-    mode_disp = {}
-    mode_results = {}
-    results = []
+    read the node numbers and the displacements of a z88 disp file
+    returns a list of node numbers and a list of (dx, dy, dz) tuples
+    """
+    node_numbers = []
+    displacements = []
 
     z88_disp_file = pyopen(z88_disp_input, "r")
 
@@ -153,14 +192,8 @@ def read_z88_disp(
                 mode_disp_z = float(linelist[3])
             else:
                 mode_disp_z = 0.0
-            mode_disp[node_no] = FreeCAD.Vector(mode_disp_x, mode_disp_y, mode_disp_z)
-            nodes[node_no] = node_no
-
-    mode_results["disp"] = mode_disp
-    results.append(mode_results)
-
-    for r in results[0]["disp"]:
-        Console.PrintLog("{} --> {}\n".format(r, results[0]["disp"][r]))
+            node_numbers.append(node_no)
+            displacements.append((mode_disp_x, mode_disp_y, mode_disp_z))
 
     z88_disp_file.close()
-    return {"Nodes": nodes, "Results": results}
+    return node_numbers, displacements
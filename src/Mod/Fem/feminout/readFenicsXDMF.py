@@ -27,24 +27,147 @@ __url__ = "http://www.freecadweb.org"
 #  \ingroup FEM
 #  \brief FreeCAD Fenics Mesh XDMF reader for FEM workbench
 
+import os
+from xml.etree import ElementTree as ET
+
+import numpy as np
 from FreeCAD import Console
 
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+
+# XDMF TopologyType and NodesPerElement --> key of the FreeCAD mesh data
+Fenics_XDMF_to_FreeCAD_dict = {
+    ("polyline", 2): "Seg2Elem",
+    ("edge_3", 3): "Seg3Elem",
+    ("triangle", 3): "Tria3Elem",
+    ("tri_6", 6): "Tria6Elem",
+    ("tetrahedron", 4): "Tetra4Elem",
+    ("tet_10", 10): "Tetra10Elem",
+}
+
+# XDMF NumberType and Precision --> numpy dtype of the binary heavy data
+XDMF_number_types = {
+    ("UInt", "4"): "u4",
+    ("UInt", "8"): "u8",
+    ("Int", "4"): "i4",
+    ("Int", "8"): "i8",
+    ("Float", "4"): "f4",
+    ("Float", "8"): "f8",
+}
+
+
+def read_dataitem(
+    dataitem,
+    xdmf_dir
+):
+    """
+        Returns the array of a DataItem of a XDMF file. The data could be
+        inline XML, a raw binary file or a HDF5 file beside the XDMF file.
+    """
+    shape = tuple(int(d) for d in dataitem.get("Dimensions").split())
+    data_format = dataitem.get("Format", "XML")
+    number_type = dataitem.get("NumberType", "Float")
+    precision = dataitem.get("Precision", "4")
+    if data_format == "XML":
+        if number_type in ("UInt", "Int"):
+            dtype = np.int64
+        else:
+            dtype = float
+        return np.fromstring(dataitem.text or "", dtype=dtype, sep=" ").reshape(shape)
+    elif data_format == "Binary":
+        dtype = np.dtype(XDMF_number_types[(number_type, precision)])
+        if dataitem.get("Endian", "Native") == "Big":
+            dtype = dtype.newbyteorder(">")
+        elif dataitem.get("Endian", "Native") == "Little":
+            dtype = dtype.newbyteorder("<")
+        count = int(np.prod(shape))
+        with open(os.path.join(xdmf_dir, dataitem.text.strip()), "rb") as heavy_file:
+            heavy_file.seek(int(dataitem.get("Seek", "0")))
+            values = np.fromfile(heavy_file, dtype=dtype, count=count)
+        return values.reshape(shape)
+    elif data_format == "HDF":
+        if h5py is None:
+            raise ImportError("Python module h5py is needed to read HDF5 heavy data.")
+        file_name, dataset_name = dataitem.text.strip().split(":", 1)
+        with h5py.File(os.path.join(xdmf_dir, file_name), "r") as heavy_file:
+            return heavy_file[dataset_name][()].reshape(shape)
+    raise ValueError("Unknown DataItem Format: {}".format(data_format))
 
-def read_fenics_mesh_xdmf(xdmffilename):
 
-    Console.PrintMessage("Not operational, yet\n")
-
-    return {
-        "Nodes": {},
-        "Hexa8Elem": {},
-        "Penta6Elem": {},
-        "Tetra4Elem": {},
-        "Tetra10Elem": {},
-        "Penta15Elem": {},
-        "Hexa20Elem": {},
-        "Tria3Elem": {},
-        "Tria6Elem": {},
-        "Quad4Elem": {},
-        "Quad8Elem": {},
-        "Seg2Elem": {}
-    }
+def read_fenics_mesh_xdmf_arrays(xdmffilename):
+    """
+        Returns the mesh arrays {key: (ids, array)} of the base grid of a
+        XDMF file to be evaluated by importToolsFem.make_femmesh_from_arrays.
+        The node and element ids are the indices in the XDMF file plus one.
+    """
+    xdmf_dir = os.path.dirname(xdmffilename)
+    base_grid = ET.parse(xdmffilename).getroot().find("Domain/Grid")
+    mesh_arrays = {}
+    if base_grid is None:
+        Console.PrintWarning("No grid found!\n")
+        return mesh_arrays
+
+    coordinates = read_dataitem(base_grid.find("Geometry/DataItem"), xdmf_dir)
+    if coordinates.shape[1] < 3:
+        # geometry type XY
+        coordinates = np.hstack((
+            coordinates,
+            np.zeros((len(coordinates), 3 - coordinates.shape[1]))
+        ))
+    mesh_arrays["Nodes"] = (np.arange(1, len(coordinates) + 1), coordinates)
+
+    topology = base_grid.find("Topology")
+    topology_key = (
+        topology.get("TopologyType").lower(),
+        int(topology.get("NodesPerElement"))
+    )
+    if topology_key not in Fenics_XDMF_to_FreeCAD_dict:
+        Console.PrintError(
+            "Topology type not supported by XDMF reader: {}\n".format(topology_key)
+        )
+        return mesh_arrays
+    elements = read_dataitem(topology.find("DataItem"), xdmf_dir).astype(np.int64) + 1
+    mesh_arrays[Fenics_XDMF_to_FreeCAD_dict[topology_key]] = (
+        np.arange(1, len(elements) + 1),
+        elements
+    )
+    Console.PrintLog(
+        "Read {} nodes and {} {} from XDMF file\n"
+        .format(len(coordinates), len(elements), topology_key[0])
+    )
+    return mesh_arrays
+
+
+def read_fenics_result_xdmf(xdmffilename):
+    """
+        Returns the node attributes of the base grid of a XDMF file
+        {name: array} and the node numbers {"NodeNumbers": array}. The
+        arrays of Scalar attributes are one dimensional.
+    """
+    xdmf_dir = os.path.dirname(xdmffilename)
+    base_grid = ET.parse(xdmffilename).getroot().find("Domain/Grid")
+    results = {}
+    if base_grid is None:
+        return results
+    for attribute in base_grid.findall("Attribute"):
+        if attribute.get("Center") != "Node":
+            continue
+        values = read_dataitem(attribute.find("DataItem"), xdmf_dir)
+        if attribute.get("AttributeType") == "Scalar":
+            values = values.reshape(-1)
+        results[attribute.get("Name")] = values
+        if "NodeNumbers" not in results:
+            results["NodeNumbers"] = np.arange(1, len(values) + 1)
+    return results
+
+
+def read_fenics_mesh_xdmf(xdmffilename):
+    """
+        Returns element dictionary to be evaluated by make_femmesh later
+    """
+    from .importToolsFem import make_dict_from_mesh_arrays
+    return make_dict_from_mesh_arrays(read_fenics_mesh_xdmf_arrays(xdmffilename))
@@ -33,6 +33,7 @@ import FreeCAD
 from FreeCAD import Console
 from xml.etree import ElementTree as ET
 import itertools
+import numpy as np
 
 
 def read_fenics_mesh_xml(xmlfilename):
@@ -100,6 +101,8 @@ def read_fenics_mesh_xml(xmlfilename):
             Console.PrintWarning("No cells found!\n")
         else:
             Console.PrintLog("Reading %d cells\n" % (int(find_cells.attrib.get("size")),))
+            # generate "v0", "v1", ... from dimension lookup table
+            vertex_keys = ["v" + str(vnum) for vnum in range(cells_parts_dim[cell_type][0])]
             for cell in find_cells:
                 ind = int(cell.get("index"))
 
@@ -108,12 +111,7 @@ def read_fenics_mesh_xml(xmlfilename):
                         "Strange mismatch between cell type {} and cell tag {}\n"
                         .format(cell_type, cell.tag.lower())
                     )
-                num_vertices = cells_parts_dim[cell_type][0]
-
-                vtupel = tuple([
-                    int(cell.get("v" + str(vnum))) + 1 for vnum in range(num_vertices)
-                ])
-                # generate "v0", "v1", ... from dimension lookup table
+                vtupel = tuple([int(cell.get(vkey)) + 1 for vkey in vertex_keys])
                 # increase numbers by one to match FC numbering convention
 
                 cell_dict[ind + 1] = vtupel
@@ -133,27 +131,31 @@ def read_fenics_mesh_xml(xmlfilename):
                 Jacobian errors).
                 Works only with tet4 and tri3 elements at the moment
             """
-            if dim == 3:
-                for (ind, tet) in list(element_dict["tetra4"].items()):
-                    v0 = nodes[tet[0]]
-                    v1 = nodes[tet[1]]
-                    v2 = nodes[tet[2]]
-                    v3 = nodes[tet[3]]
-                    a = v1 - v0
-                    b = v2 - v0
-                    c = v3 - v0
-                    if a.dot(b.cross(c)) > 0:
-                        element_dict["tetra4"][ind] = (tet[1], tet[0], tet[2], tet[3])
-            if dim == 2:
-                nz = FreeCAD.Vector(0., 0., 1.)
-                for (ind, tria) in list(element_dict["tria3"].items()):
-                    v0 = nodes[tria[0]]
-                    v1 = nodes[tria[1]]
-                    v2 = nodes[tria[2]]
-                    a = v1 - v0
-                    b = v2 - v0
-                    if nz.dot(a.cross(b)) < 0:
-                        element_dict["tria3"][ind] = (tria[1], tria[0], tria[2])
+            def get_points(elements):
+                # the coordinates of the element nodes, shape (elements, nodes, 3)
+                node_ids = list(nodes.keys())
+                coords = np.zeros((max(node_ids) + 1, 3))
+                coords[node_ids] = [tuple(nodes[n]) for n in node_ids]
+                return coords[np.array(elements)]
+
+            # the determinants of all elements are computed at once
+            if dim == 3 and element_dict["tetra4"]:
+                (inds, tets) = zip(*element_dict["tetra4"].items())
+                points = get_points(tets)
+                a = points[:, 1] - points[:, 0]
+                b = points[:, 2] - points[:, 0]
+                c = points[:, 3] - points[:, 0]
+                for i in np.nonzero(np.einsum("ij,ij->i", a, np.cross(b, c)) > 0)[0]:
+                    tet = tets[i]
+                    element_dict["tetra4"][inds[i]] = (tet[1], tet[0], tet[2], tet[3])
+            if dim == 2 and element_dict["tria3"]:
+                (inds, trias) = zip(*element_dict["tria3"].items())
+                points = get_points(trias)
+                a = points[:, 1] - points[:, 0]
+                b = points[:, 2] - points[:, 0]
+                for i in np.nonzero(a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0] < 0)[0]:
+                    tria = trias[i]
+                    element_dict["tria3"][inds[i]] = (tria[1], tria[0], tria[2])
 
         element_dict = {}
         element_counter = {}
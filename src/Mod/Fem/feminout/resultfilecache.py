@@ -0,0 +1,132 @@
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Binary cache of solver result files"
+__author__ = "FreeCAD Developers"
+__url__ = "http://www.freecadweb.org"
+
+## \addtogroup FEM
+#  @{
+
+import json
+import os
+
+import FreeCAD
+
+
+# The text result files of the solvers (z88o2.txt, ccx dat file) are parsed
+# every time the results are imported. If the result file cache is activated
+# in the preferences, the parsed values are saved as numpy arrays into a
+# sidecar directory beside the result file on first read. The next import
+# maps the arrays of the sidecar directory into memory instead of parsing
+# the text file again. The sidecar files are only used as long as size and
+# modification time of the result file have not changed.
+
+CACHE_DIR_SUFFIX = ".fccache"
+CACHE_VERSION = 1
+_KEY_FILE_NAME = "key.json"
+
+
+# ************************************************************************************************
+def get_cache_dir(
+    result_file
+):
+    """the sidecar directory of a result file"""
+    return result_file + CACHE_DIR_SUFFIX
+
+
+def get_result_file_key(
+    result_file,
+    kind
+):
+    """the key of a result file, its size and modification time"""
+    stat = os.stat(result_file)
+    return {
+        "Version": CACHE_VERSION,
+        "Kind": kind,
+        "Size": stat.st_size,
+        "MTime": stat.st_mtime,
+    }
+
+
+def load_arrays(
+    result_file,
+    kind
+):
+    """the arrays of the sidecar directory of a result file as memory-mapped arrays
+
+    Returns a dict {name: array} or None if there is no valid sidecar
+    directory for the result file.
+    """
+    import numpy as np
+    cache_dir = get_cache_dir(result_file)
+    key_file = os.path.join(cache_dir, _KEY_FILE_NAME)
+    if not os.path.isfile(key_file):
+        return None
+    try:
+        with open(key_file, "r") as f:
+            key = json.load(f)
+        if key.get("Key") != get_result_file_key(result_file, kind):
+            FreeCAD.Console.PrintLog("Result file cache {} is outdated.\n".format(cache_dir))
+            return None
+        arrays = {}
+        for name in key["Arrays"]:
+            arrays[name] = np.load(os.path.join(cache_dir, name + ".npy"), mmap_mode="r")
+    except (IOError, OSError, ValueError, KeyError) as e:
+        FreeCAD.Console.PrintWarning(
+            "Result file cache {} could not be read: {}\n".format(cache_dir, e)
+        )
+        return None
+    FreeCAD.Console.PrintLog("Result file cache {} is used.\n".format(cache_dir))
+    return arrays
+
+
+def save_arrays(
+    result_file,
+    kind,
+    arrays
+):
+    """save the arrays {name: array} into the sidecar directory of a result file"""
+    import numpy as np
+    cache_dir = get_cache_dir(result_file)
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        key_file = os.path.join(cache_dir, _KEY_FILE_NAME)
+        # the old key is removed first, thus an interrupted save is not used
+        if os.path.isfile(key_file):
+            os.remove(key_file)
+        for name, values in arrays.items():
+            np.save(os.path.join(cache_dir, name + ".npy"), np.asarray(values))
+        with open(key_file, "w") as f:
+            json.dump(
+                {"Key": get_result_file_key(result_file, kind), "Arrays": sorted(arrays)},
+                f
+            )
+    except (IOError, OSError) as e:
+        FreeCAD.Console.PrintWarning(
+            "Result file cache {} could not be written: {}\n".format(cache_dir, e)
+        )
+        return False
+    FreeCAD.Console.PrintLog("Result file cache {} written.\n".format(cache_dir))
+    return True
+
+##  @}
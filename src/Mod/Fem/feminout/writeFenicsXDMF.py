@@ -28,6 +28,9 @@ __url__ = "http://www.freecadweb.org"
 #  \ingroup FEM
 #  \brief FreeCAD Fenics Mesh XDMF writer for FEM workbench
 
+import io
+import os
+
 from FreeCAD import Console
 from .importToolsFem import \
     get_FemMeshObjectDimension,\
@@ -38,9 +41,18 @@ from .importToolsFem import \
 from xml.etree import ElementTree as ET  # parsing xml files and exporting
 import numpy as np
 
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
 
 ENCODING_ASCII = "ASCII"
 ENCODING_HDF5 = "HDF5"
+ENCODING_BINARY = "Binary"
+
+# number of rows of the heavy data arrays which are created and written at once
+CHUNK_SIZE = 100000
 
 FreeCAD_Group_Dimensions = {
     "Vertex": 0,
@@ -69,9 +81,15 @@ def numpy_array_to_str(
     res = ""
     dt = str(npa.dtype)
     if "int" in dt:
-        res = "\n".join([" ".join([("%d" % s) for s in a]) for a in npa.tolist()])
+        fmt = "%d"
     elif "float" in dt:
-        res = "\n".join([" ".join([("%3.6f" % s) for s in a]) for a in npa.tolist()])
+        fmt = "%3.6f"
+    else:
+        return res
+    if len(npa) > 0:
+        string_io = io.StringIO()
+        np.savetxt(string_io, npa, fmt=fmt, delimiter=" ")
+        res = string_io.getvalue()[:-1]
     return res
 
 
@@ -89,13 +107,107 @@ def tuples_to_numpy(
     return np.array([list(t) for t in tpls])[:, :numbers_per_line]
 
 
+class HeavyDataFile(object):
+    """
+        Heavy data file of a XDMF file. The arrays are not written as text
+        into the XDMF file but chunk wise into a HDF5 file (h5py needed) or
+        into a raw binary file. The XDMF file only gets the references.
+    """
+
+    # XDMF NumberType --> (numpy dtype, Precision)
+    number_types = {
+        "UInt": ("<u4", 4),
+        "Int": ("<i4", 4),
+        "Float": ("<f8", 8),
+    }
+
+    def __init__(
+        self,
+        xdmf_file_name,
+        encoding=ENCODING_HDF5
+    ):
+        if encoding == ENCODING_HDF5 and h5py is None:
+            Console.PrintWarning(
+                "Python module h5py not found, heavy data is written in raw binary format.\n"
+            )
+            encoding = ENCODING_BINARY
+        self.encoding = encoding
+        if encoding == ENCODING_HDF5:
+            self.file_name = os.path.splitext(xdmf_file_name)[0] + ".h5"
+            self.heavy_file = h5py.File(self.file_name, "w")
+        else:
+            self.file_name = os.path.splitext(xdmf_file_name)[0] + ".bin"
+            self.heavy_file = open(self.file_name, "wb")
+        # the path in the XDMF file is relative to the XDMF file
+        self.reference = os.path.basename(self.file_name)
+        self.dataset_names = set()
+
+    def write_dataitem(
+        self,
+        parentnode,
+        name,
+        shape,
+        number_type,
+        chunks
+    ):
+        """
+            Writes the chunks of an array with shape into the heavy data file
+            and adds the DataItem referencing it to the parentnode.
+        """
+        dtype, precision = self.number_types[number_type]
+        # every topology and attribute needs its own data set
+        unique_name = name
+        counter = 0
+        while unique_name in self.dataset_names:
+            counter += 1
+            unique_name = "%s_%d" % (name, counter)
+        name = unique_name
+        self.dataset_names.add(name)
+        dataitem = ET.SubElement(
+            parentnode, "DataItem",
+            Dimensions="%d %d" % shape,
+            NumberType=number_type,
+            Precision=str(precision)
+        )
+        if self.encoding == ENCODING_HDF5:
+            dataitem.set("Format", "HDF")
+            dataset = self.heavy_file.create_dataset(name, shape, dtype=dtype)
+            row = 0
+            for chunk in chunks:
+                dataset[row:row + len(chunk)] = chunk
+                row += len(chunk)
+            dataitem.text = self.reference + ":/" + name
+        else:
+            dataitem.set("Format", "Binary")
+            dataitem.set("Endian", "Little")
+            dataitem.set("Seek", str(self.heavy_file.tell()))
+            for chunk in chunks:
+                np.ascontiguousarray(chunk, dtype=dtype).tofile(self.heavy_file)
+            dataitem.text = self.reference
+        return dataitem
+
+    def close(
+        self
+    ):
+        self.heavy_file.close()
+
+
+def chunked(
+    sequence,
+    chunk_size=CHUNK_SIZE
+):
+    for start in range(0, len(sequence), chunk_size):
+        yield sequence[start:start + chunk_size]
+
+
 def write_fenics_mesh_points_xdmf(
     fem_mesh_obj,
     geometrynode,
-    encoding=ENCODING_ASCII
+    encoding=ENCODING_ASCII,
+    heavy_data=None
 ):
     """
-        Writes either into hdf5 file or into open mesh file
+        Writes either into heavy data file (hdf5 or binary) or into open mesh file
     """
 
     numnodes = fem_mesh_obj.FemMesh.NodeCount
@@ -123,8 +235,20 @@ def write_fenics_mesh_points_xdmf(
             recalc_nodes_ind_dict[key] = ind
 
         dataitem.text = numpy_array_to_str(points_to_numpy(nodes, dim=effective_dim))
-    elif encoding == ENCODING_HDF5:
-        pass
+    else:
+        nodes = fem_mesh_obj.FemMesh.Nodes
+        node_keys = list(nodes.keys())
+        recalc_nodes_ind_dict = dict(zip(node_keys, range(len(node_keys))))
+        heavy_data.write_dataitem(
+            geometrynode,
+            "mesh/geometry",
+            (numnodes, effective_dim),
+            "Float",
+            (
+                points_to_numpy([nodes[key] for key in keys], dim=effective_dim)
+                for keys in chunked(node_keys)
+            )
+        )
 
     return recalc_nodes_ind_dict
 
@@ -134,7 +258,8 @@ def write_fenics_mesh_codim_xdmf(
     topologynode,
     nodes_dict,
     codim=0,
-    encoding=ENCODING_ASCII
+    encoding=ENCODING_ASCII,
+    heavy_data=None
 ):
     mesh_dimension = get_FemMeshObjectDimension(fem_mesh_obj)
 
@@ -186,8 +311,21 @@ def write_fenics_mesh_codim_xdmf(
             Format="XML"
         )
         dataitem.text = numpy_array_to_str(tuples_to_numpy(nodeindices, nodes_per_element))
-    elif encoding == ENCODING_HDF5:
-        pass
+    else:
+        get_element_nodes = fem_mesh_obj.FemMesh.getElementNodes
+        heavy_data.write_dataitem(
+            topologynode,
+            "mesh/topology",
+            (num_topo, nodes_per_element),
+            "UInt",
+            (
+                tuples_to_numpy(
+                    [[nodes_dict[ind] for ind in get_element_nodes(e)] for e in elements],
+                    nodes_per_element
+                )
+                for elements in chunked(list(fc_topo))
+            )
+        )
 
     return fc_topo
 
@@ -195,7 +333,8 @@ def write_fenics_mesh_codim_xdmf(
 def write_fenics_mesh_scalar_cellfunctions(
     name, cell_array,
     attributenode,
-    encoding=ENCODING_ASCII
+    encoding=ENCODING_ASCII,
+    heavy_data=None
 ):
     attributenode.set("AttributeType", "Scalar")
     attributenode.set("Center", "Cell")
@@ -210,8 +349,14 @@ def write_fenics_mesh_scalar_cellfunctions(
             Format="XML"
         )
         dataitem.text = numpy_array_to_str(cell_array)
-    elif encoding == ENCODING_HDF5:
-        pass
+    else:
+        heavy_data.write_dataitem(
+            attributenode,
+            "cell_functions/" + name,
+            (num_cells, num_dims),
+            "Int",
+            chunked(cell_array)
+        )
 
 
 """
@@ -261,6 +406,8 @@ def write_fenics_mesh_xdmf(
 ):
     """
         For the export of xdmf.
+        With encoding ENCODING_HDF5 or ENCODING_BINARY the arrays are written
+        into a heavy data file beside the xdmf file, see HeavyDataFile.
     """
 
     FreeCAD_to_Fenics_dict = {
@@ -298,18 +445,24 @@ def write_fenics_mesh_xdmf(
     # TODO: for every marked group write own grid node with topology (ref if cells)
     #       geometry ref, attribute
 
+    heavy_data = None
+    if encoding != ENCODING_ASCII:
+        heavy_data = HeavyDataFile(outputfile, encoding)
+
     # ***********************************
     # write base topo and geometry
     nodes_dict = write_fenics_mesh_points_xdmf(
         fem_mesh_obj,
         base_geometry,
-        encoding=encoding
+        encoding=encoding,
+        heavy_data=heavy_data
     )
     write_fenics_mesh_codim_xdmf(
         fem_mesh_obj, base_topology,
         nodes_dict,
         codim=0,
-        encoding=encoding
+        encoding=encoding,
+        heavy_data=heavy_data
     )
     # ***********************************
 
@@ -340,7 +493,8 @@ def write_fenics_mesh_xdmf(
             fem_mesh_obj,
             mesh_function_topology,
             nodes_dict,
-            codim=mesh_function_codim, encoding=encoding
+            codim=mesh_function_codim, encoding=encoding,
+            heavy_data=heavy_data
         )
 
         mesh_function_geometry = ET.SubElement(mesh_function_grid, "Geometry", Reference="XML")
@@ -366,14 +520,110 @@ def write_fenics_mesh_xdmf(
             mesh_function_name,
             topo_array,
             mesh_function_attribute,
-            encoding=ENCODING_ASCII
+            encoding=encoding,
+            heavy_data=heavy_data
         )
 
     # TODO: improve cell functions support
 
+    if heavy_data is not None:
+        heavy_data.close()
+    write_xdmf_file(root, outputfile)
+
+
+def write_xdmf_file(
+    root,
+    outputfile
+):
     fp = open(outputfile, "wb")
     fp.write(b'''<?xml version="1.0"?>\n<!DOCTYPE Xdmf SYSTEM "Xdmf.dtd" []>\n''')
     fp.write(ET.tostring(root))
     # xml core functionality does not support pretty printing
     # so the output file looks quite ugly
     fp.close()
+
+
+def write_fenics_result_xdmf(
+    res_obj,
+    outputfile,
+    encoding=ENCODING_BINARY
+):
+    """
+        Writes the mesh and the node results of a mechanical result object
+        into a xdmf file. Vector list properties (DisplacementVectors, ...)
+        are written as Vector attributes, float list properties as Scalar
+        attributes. The attribute names are the property names, thus
+        readFenicsXDMF.read_fenics_result_xdmf() returns them again.
+    """
+    from femresult import resultstorage
+
+    fem_mesh_obj = res_obj.Mesh
+    Console.PrintMessage(
+        "Converting " + res_obj.Label + " to fenics XDMF File\n"
+    )
+    root = ET.Element("Xdmf", version="3.0")
+    domain = ET.SubElement(root, "Domain")
+    base_grid = ET.SubElement(domain, "Grid", Name="base_mesh", GridType="Uniform")
+    base_topology = ET.SubElement(base_grid, "Topology")
+    base_geometry = ET.SubElement(base_grid, "Geometry")
+
+    heavy_data = None
+    if encoding != ENCODING_ASCII:
+        heavy_data = HeavyDataFile(outputfile, encoding)
+
+    nodes_dict = write_fenics_mesh_points_xdmf(
+        fem_mesh_obj,
+        base_geometry,
+        encoding=encoding,
+        heavy_data=heavy_data
+    )
+    write_fenics_mesh_codim_xdmf(
+        fem_mesh_obj, base_topology,
+        nodes_dict,
+        codim=0,
+        encoding=encoding,
+        heavy_data=heavy_data
+    )
+
+    # the results are sorted like the nodes of the mesh
+    node_numbers = resultstorage.get_result_array(res_obj, "NodeNumbers")
+    node_indices = np.array([nodes_dict[n] for n in node_numbers.tolist()], dtype=int)
+    num_nodes = len(nodes_dict)
+    for name in resultstorage.get_result_array_names(res_obj):
+        if name == "NodeNumbers":
+            continue
+        values = resultstorage.get_result_array(res_obj, name)
+        if len(values) != len(node_indices):
+            continue
+        if values.ndim == 1:
+            attribute_type = "Scalar"
+            values = values.reshape(-1, 1)
+        else:
+            attribute_type = "Vector"
+        node_values = np.zeros((num_nodes, values.shape[1]))
+        node_values[node_indices] = values
+        attribute = ET.SubElement(
+            base_grid, "Attribute",
+            Name=name,
+            AttributeType=attribute_type,
+            Center="Node"
+        )
+        if heavy_data is None:
+            dataitem = ET.SubElement(
+                attribute, "DataItem",
+                Dimensions="%d %d" % node_values.shape,
+                Format="XML"
+            )
+            dataitem.text = numpy_array_to_str(node_values)
+        else:
+            heavy_data.write_dataitem(
+                attribute,
+                "results/" + name,
+                node_values.shape,
+                "Float",
+                chunked(node_values)
+            )
+
+    if heavy_data is not None:
+        heavy_data.close()
+    write_xdmf_file(root, outputfile)
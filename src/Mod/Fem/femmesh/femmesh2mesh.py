@@ -29,6 +29,8 @@ __url__ = "http://www.freecadweb.org"
 
 import time
 
+import numpy as np
+
 import FreeCAD
 # import Mesh
 
@@ -86,118 +88,95 @@ face_dicts = {
     20: hexaFaces}
 
 
-def femmesh_2_mesh(myFemMesh, myResults=None):
-    shiftBits = 20  # allows a million nodes, needs to be higher for more nodes in a FemMesh
-
-    # This code generates a dict and a faceCode for each face of all elements
-    # All faceCodes are than sorted.
-
+def femmesh_2_mesh(myFemMesh, myResults=None, displacement_factor=1.0):
+    """returns the outer skin of a FemMesh as a list of triangle points
+    which can be used to create a Mesh, see module docstring.
+    If a result object is given, the nodes are moved by the displacements
+    multiplied by the displacement_factor.
+    """
     start_time = time.process_time()
-    faceCodeList = []
-    faceCodeDict = {}
+    points, triangles = femmesh_2_mesh_arrays(myFemMesh, myResults, displacement_factor)
+    output_mesh = [FreeCAD.Vector(*p) for p in points[triangles.ravel()].tolist()]
+    end_time = time.process_time()
+    FreeCAD.Console.PrintMessage(
+        "Mesh by surface search method: {}\n".format(end_time - start_time)
+    )
+    return output_mesh
 
-    if myFemMesh.VolumeCount > 0:
-        for ele in myFemMesh.Volumes:
-            element_nodes = myFemMesh.getElementNodes(ele)
-            # print("element_node: ", element_nodes)
-            faceDef = face_dicts[len(element_nodes)]
-
-            for key in faceDef:
-                nodeList = []
-                codeList = []
-                faceCode = 0
-                shifter = 0
-                for nodeIdx in faceDef[key]:
-                    nodeList.append(element_nodes[nodeIdx])
-                    codeList.append(element_nodes[nodeIdx])
-                codeList.sort()
-                for node in codeList:
-                    faceCode += (node << shifter)
-                    # x << n: x shifted left by n bits = Multiplication
-                    shifter += shiftBits
-                # print("codeList: ", codeList)
-                faceCodeDict[faceCode] = nodeList
-                faceCodeList.append(faceCode)
-    elif myFemMesh.FaceCount > 0:
-        for ele in myFemMesh.Faces:
-            element_nodes = myFemMesh.getElementNodes(ele)
-            # print("element_node: ", element_nodes)
-            faceDef = {1: [0, 1, 2]}
 
-            for key in faceDef:
-                nodeList = []
-                codeList = []
-                faceCode = 0
-                shifter = 0
-                for nodeIdx in faceDef[key]:
-                    nodeList.append(element_nodes[nodeIdx])
-                    codeList.append(element_nodes[nodeIdx])
-                codeList.sort()
-                for node in codeList:
-                    faceCode += (node << shifter)
-                    # x << n: x shifted left by n bits = Multiplication
-                    shifter += shiftBits
-                # print("codeList: ", codeList)
-                faceCodeDict[faceCode] = nodeList
-                faceCodeList.append(faceCode)
-
-    faceCodeList.sort()
-    allFaces = len(faceCodeList)
-    actFaceIdx = 0
-    singleFaces = []
-    # Here we search for faces, which do not have a counterpart.
-    # These are the faces on the surface of the mesh.
-    while actFaceIdx < allFaces:
-        if actFaceIdx < (allFaces - 1):
-            if faceCodeList[actFaceIdx] == faceCodeList[actFaceIdx + 1]:
-                actFaceIdx += 2
-            else:
-                # print("found a single Face: ", faceCodeList[actFaceIdx])
-                singleFaces.append(faceCodeList[actFaceIdx])
-                actFaceIdx += 1
-        else:
-            FreeCAD.Console.PrintMessage("Found a last Face: {}\n".format(faceCodeList[actFaceIdx]))
-            singleFaces.append(faceCodeList[actFaceIdx])
-            actFaceIdx += 1
+def femmesh_2_mesh_arrays(myFemMesh, myResults=None, displacement_factor=1.0):
+    """returns the outer skin of a FemMesh as numpy arrays
+    points ... the node coordinates, displaced if a result object is given
+    triangles ... three indices into points for every triangle
+    """
+    node_ids = np.fromiter(myFemMesh.Nodes.keys(), dtype=np.int64)
+    points = np.array([tuple(v) for v in myFemMesh.Nodes.values()], dtype=float).reshape(-1, 3)
+    node_index = np.full(node_ids.max() + 1 if len(node_ids) else 1, -1, dtype=np.int64)
+    node_index[node_ids] = np.arange(len(node_ids))
 
-    output_mesh = []
     if myResults:
         FreeCAD.Console.PrintMessage("{}\n".format(myResults.Name))
-        for myFace in singleFaces:
-            face_nodes = faceCodeDict[myFace]
-            dispVec0 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[0])]
-            dispVec1 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[1])]
-            dispVec2 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[2])]
-            triangle = [myFemMesh.getNodeById(face_nodes[0]) + dispVec0,
-                        myFemMesh.getNodeById(face_nodes[1]) + dispVec1,
-                        myFemMesh.getNodeById(face_nodes[2]) + dispVec2]
-            output_mesh.extend(triangle)
-            # print("my triangle: ", triangle)
-            if len(face_nodes) == 4:
-                dispVec3 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[3])]
-                triangle = [myFemMesh.getNodeById(face_nodes[2]) + dispVec2,
-                            myFemMesh.getNodeById(face_nodes[3]) + dispVec3,
-                            myFemMesh.getNodeById(face_nodes[0]) + dispVec0]
-                output_mesh.extend(triangle)
-                # print("my 2. triangle: ", triangle)
-
+        from femresult import resultstorage
+        disp_nodes = resultstorage.get_result_array(myResults, "NodeNumbers").astype(np.int64)
+        disp = resultstorage.get_result_array(myResults, "DisplacementVectors").reshape(-1, 3)
+        if len(disp) == len(disp_nodes) and len(disp) > 0:
+            in_mesh = disp_nodes < len(node_index)
+            disp_index = node_index[disp_nodes[in_mesh]]
+            has_node = disp_index >= 0
+            points[disp_index[has_node]] += displacement_factor * disp[in_mesh][has_node]
+
+    faces = get_surface_faces(myFemMesh)
+    # triangulate, quad faces are split into (0, 1, 2) and (2, 3, 0)
+    is_quad = faces[:, 3] >= 0
+    first_row = np.arange(len(faces)) + np.cumsum(is_quad) - is_quad
+    triangles = np.empty((len(faces) + np.count_nonzero(is_quad), 3), dtype=np.int64)
+    triangles[first_row] = faces[:, :3]
+    triangles[first_row[is_quad] + 1] = faces[is_quad][:, [2, 3, 0]]
+    return points, node_index[triangles]
+
+
+def get_surface_faces(myFemMesh):
+    """returns the faces of the outer skin of a FemMesh as array of node ids
+    one row per face, the fourth node of triangle faces is -1
+    The faces of all volume elements are collected and sorted, a face
+    which is found only once is a face on the surface of the mesh.
+    """
+    if myFemMesh.VolumeCount > 0:
+        elements = myFemMesh.Volumes
+    elif myFemMesh.FaceCount > 0:
+        elements = myFemMesh.Faces
     else:
-        for myFace in singleFaces:
-            face_nodes = faceCodeDict[myFace]
-            triangle = [myFemMesh.getNodeById(face_nodes[0]),
-                        myFemMesh.getNodeById(face_nodes[1]),
-                        myFemMesh.getNodeById(face_nodes[2])]
-            output_mesh.extend(triangle)
-            # print("my triangle: ", triangle)
-            if len(face_nodes) == 4:
-                triangle = [myFemMesh.getNodeById(face_nodes[2]),
-                            myFemMesh.getNodeById(face_nodes[3]),
-                            myFemMesh.getNodeById(face_nodes[0])]
-                output_mesh.extend(triangle)
-                # print("my 2. triangle: ", triangle)
-
-    end_time = time.process_time()
-    FreeCAD.Console.PrintMessage(
-        "Mesh by surface search method: {}\n".format(end_time - start_time)
-    )
-    return output_mesh
+        return np.empty((0, 4), dtype=np.int64)
+
+    # connectivity arrays per count of element nodes
+    element_nodes = {}
+    for ele in elements:
+        nodes = myFemMesh.getElementNodes(ele)
+        element_nodes.setdefault(len(nodes), []).append(nodes)
+
+    all_faces = []
+    for node_count, nodes in element_nodes.items():
+        nodes = np.array(nodes, dtype=np.int64)
+        if myFemMesh.VolumeCount > 0:
+            faceDef = face_dicts[node_count]
+        elif node_count in (4, 8):
+            faceDef = {1: [0, 1, 2, 3]}
+        else:
+            faceDef = {1: [0, 1, 2]}
+        for key in sorted(faceDef):
+            faces = np.full((len(nodes), 4), -1, dtype=np.int64)
+            faces[:, :len(faceDef[key])] = nodes[:, faceDef[key]]
+            all_faces.append(faces)
+    all_faces = np.concatenate(all_faces)
+
+    # here we search for faces, which do not have a counterpart
+    # the node ids of a face are sorted to compare the faces
+    face_keys = np.sort(all_faces, axis=1)
+    order = np.lexsort(face_keys.T[::-1])
+    face_keys = face_keys[order]
+    new_key = np.ones(len(face_keys) + 1, dtype=bool)
+    new_key[1:-1] = np.any(face_keys[1:] != face_keys[:-1], axis=1)
+    key_starts = np.flatnonzero(new_key)
+    counts = np.diff(key_starts)
+    single_faces = order[key_starts[:-1][counts == 1]]
+    return all_faces[single_faces]
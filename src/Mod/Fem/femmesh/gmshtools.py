@@ -27,8 +27,12 @@ __url__ = "http://www.freecadweb.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
+import os
+import shutil
 import sys
 import subprocess
+import time
 
 import FreeCAD
 from FreeCAD import Console
@@ -38,6 +42,11 @@ from . import meshtools
 import femtools.femutils as femutils
 
 
+# {mesh input hash: mesh file} of the meshes of the session, see GmshTools.reuse_mesh()
+_previous_meshes = {}
+_max_previous_meshes = 8
+
+
 class GmshTools():
     def __init__(self, gmsh_mesh_obj, analysis=None):
 
@@ -132,6 +141,13 @@ class GmshTools():
         self.bl_setting_list = []  # list of dict, each item map to MeshBoundaryLayer object
         self.bl_boundary_list = []  # to remove duplicated boundary edge or faces
 
+        # incremental meshing and multi threading
+        gmsh_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+        self.incremental = gmsh_prefs.GetBool("IncrementalMeshing", False)
+        self.max_threads = gmsh_prefs.GetInt("MaxThreads", 0)
+        self.mesh_input_hash = ""
+        self.mesh_reused = False
+
         # other initializations
         self.temp_file_geometry = ""
         self.temp_file_mesh = ""
@@ -152,12 +168,30 @@ class GmshTools():
         self.write_geo()
 
     def create_mesh(self):
+        timings = []
+        start_time = time.time()
         self.update_mesh_data()
         self.get_tmp_file_paths()
         self.get_gmsh_command()
         self.write_gmsh_input_files()
-        error = self.run_gmsh_with_geo()
+        timings.append(("write input files", time.time() - start_time))
+        start_time = time.time()
+        if self.incremental and self.reuse_mesh():
+            error = ""
+            timings.append(("reuse mesh", time.time() - start_time))
+        else:
+            # the mesh file is overwritten, thus its hash is not valid anymore
+            self.remove_mesh_input_hash()
+            error = self.run_gmsh_with_geo()
+            timings.append(("run Gmsh", time.time() - start_time))
+        start_time = time.time()
         self.read_and_set_new_mesh()
+        if self.incremental and not self.error and not self.mesh_reused:
+            self.save_mesh_input_hash()
+        timings.append(("read mesh", time.time() - start_time))
+        Console.PrintMessage("  Gmsh meshing timings:\n")
+        for step, seconds in timings:
+            Console.PrintMessage("    {}: {:.3f} s\n".format(step, seconds))
         return error
 
     def start_logs(self):
@@ -756,6 +790,10 @@ class GmshTools():
             "5=Frontal Delaunay, 6=Frontal Hex, 7=MMG3D, 9=R-tree)\n"
         )
         geo.write("Mesh.Algorithm3D = " + self.algorithm3D + ";\n")
+        if self.max_threads > 0 and self.dimension == "3":
+            geo.write("// multi threading for 3D meshing, needs a Gmsh built with OpenMP\n")
+            geo.write("General.NumThreads = " + str(self.max_threads) + ";\n")
+            geo.write("Mesh.MaxNumThreads3D = " + str(self.max_threads) + ";\n")
         geo.write("\n")
 
         geo.write("// meshing\n")
@@ -830,6 +868,64 @@ class GmshTools():
             self.error = True
         return error
 
+    def get_mesh_input_hash(self):
+        # hash of the brep geometry file and of the geo file
+        # the lines with file paths are not used, they change with the working dir
+        input_hash = hashlib.sha1()
+        with open(self.temp_file_geometry, "rb") as brep:
+            input_hash.update(brep.read())
+        with open(self.temp_file_geo, "r") as geo:
+            for line in geo:
+                if not line.startswith(("//", "Merge ", "Save ")):
+                    input_hash.update(line.encode("utf-8"))
+        input_hash.update(self.gmsh_bin.encode("utf-8"))
+        return input_hash.hexdigest()
+
+    def get_mesh_hash_file(self, mesh_file=None):
+        # the hash file is beside the mesh file
+        if mesh_file is None:
+            mesh_file = self.temp_file_mesh
+        return os.path.splitext(mesh_file)[0] + ".hash"
+
+    def is_mesh_of_input_hash(self, mesh_file, input_hash):
+        # a mesh file is overwritten by every run of Gmsh in its working dir
+        # thus it is only used if the hash file beside it has the same hash
+        hash_file = self.get_mesh_hash_file(mesh_file)
+        if not os.path.isfile(mesh_file) or not os.path.isfile(hash_file):
+            return False
+        with open(hash_file, "r") as f:
+            return f.read().strip() == input_hash
+
+    def reuse_mesh(self):
+        # if the geometry and the mesh parameter have not changed since the
+        # last run of Gmsh, the last mesh file is reused and Gmsh is not run
+        self.mesh_input_hash = self.get_mesh_input_hash()
+        mesh_file = _previous_meshes.get(self.mesh_input_hash, self.temp_file_mesh)
+        if not self.is_mesh_of_input_hash(mesh_file, self.mesh_input_hash):
+            _previous_meshes.pop(self.mesh_input_hash, None)
+            return False
+        if mesh_file != self.temp_file_mesh:
+            shutil.copyfile(mesh_file, self.temp_file_mesh)
+        self.mesh_reused = True
+        Console.PrintMessage(
+            "  Geometry and mesh parameter have not changed, "
+            "the last mesh is reused: {}\n".format(mesh_file)
+        )
+        return True
+
+    def save_mesh_input_hash(self):
+        if not self.mesh_input_hash:
+            self.mesh_input_hash = self.get_mesh_input_hash()
+        with open(self.get_mesh_hash_file(), "w") as hash_file:
+            hash_file.write(self.mesh_input_hash + "\n")
+        if len(_previous_meshes) >= _max_previous_meshes:
+            _previous_meshes.clear()
+        _previous_meshes[self.mesh_input_hash] = self.temp_file_mesh
+
+    def remove_mesh_input_hash(self):
+        if os.path.isfile(self.get_mesh_hash_file()):
+            os.remove(self.get_mesh_hash_file())
+
     def read_and_set_new_mesh(self):
         if not self.error:
             fem_mesh = Fem.read(self.temp_file_mesh)
@@ -0,0 +1,216 @@
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Cache for finite element mesh sets of reference shapes"
+__author__ = "FreeCAD Developers"
+__url__ = "http://www.freecadweb.org"
+
+## \addtogroup FEM
+#  @{
+
+import hashlib
+import json
+import os
+from array import array
+from itertools import chain
+
+import FreeCAD
+
+
+# The geometric search of the mesh nodes and elements of a reference shape
+# (getNodesByFace(), getccxVolumesByFace(), ...) is the most expensive part
+# of writing a solver input file. Its result only depends on the mesh and
+# on the geometry of the reference shape, thus it can be reused for the next
+# solver run if only a material value or a load value has changed.
+# The sets are cached content addressed, the mesh by a hash of its nodes and
+# elements and the reference shapes by a hash of their brep.
+# A cache is kept for every mesh in the session, and it could be saved
+# as json file into the solver working directory.
+
+CACHE_FILE_NAME = "mesh_set_cache.json"
+
+# {mesh_hash: MeshSetCache}, only the meshes of the last analysis runs are kept
+_mesh_set_caches = {}
+_max_mesh_set_caches = 4
+
+
+# ************************************************************************************************
+class MeshSetCache(object):
+    """cache for the mesh sets of reference shapes of one finite element mesh
+
+    The cached values are json types (lists, numbers, strings) because they
+    could be saved into a file. The values are stored per kind of the set
+    ("Nodes", "FaceNodeAreas", ...) and per hash of the reference shapes.
+    """
+
+    def __init__(
+        self,
+        mesh_hash,
+        file_name=None
+    ):
+        self.mesh_hash = mesh_hash
+        self.file_name = file_name
+        self.sets = {}
+        self.changed = False
+        self.hits = 0
+        self.misses = 0
+        if file_name:
+            self.load(file_name)
+
+    def get(
+        self,
+        kind,
+        shape_hash
+    ):
+        """the cached value or None"""
+        value = self.sets.get(kind, {}).get(shape_hash)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(
+        self,
+        kind,
+        shape_hash,
+        value
+    ):
+        self.sets.setdefault(kind, {})[shape_hash] = value
+        self.changed = True
+
+    def load(
+        self,
+        file_name
+    ):
+        """load the sets of a cache file, if it was written for this mesh"""
+        self.file_name = file_name
+        if not os.path.isfile(file_name):
+            return
+        try:
+            with open(file_name, "r") as cache_file:
+                data = json.load(cache_file)
+        except (IOError, ValueError) as e:
+            FreeCAD.Console.PrintWarning(
+                "Mesh set cache file {} could not be read: {}\n".format(file_name, e)
+            )
+            return
+        if data.get("MeshHash") != self.mesh_hash:
+            FreeCAD.Console.PrintLog(
+                "Mesh set cache file {} is for another mesh.\n".format(file_name)
+            )
+            return
+        for kind, kind_sets in data.get("Sets", {}).items():
+            self.sets.setdefault(kind, {}).update(kind_sets)
+        FreeCAD.Console.PrintLog("Mesh set cache file {} loaded.\n".format(file_name))
+
+    def save(
+        self
+    ):
+        """save the sets into the cache file, if there is one and if it has changed"""
+        if not self.file_name or not self.changed:
+            return
+        try:
+            with open(self.file_name, "w") as cache_file:
+                json.dump({"MeshHash": self.mesh_hash, "Sets": self.sets}, cache_file)
+            self.changed = False
+        except IOError as e:
+            FreeCAD.Console.PrintWarning(
+                "Mesh set cache file {} could not be written: {}\n".format(self.file_name, e)
+            )
+
+
+# ************************************************************************************************
+def get_mesh_set_cache(
+    femmesh,
+    femnodes_mesh=None,
+    cache_dir=None
+):
+    """the session wide MeshSetCache of a femmesh
+    if cache_dir is given, the cache is loaded from and saved to a file in this directory
+    """
+    mesh_hash = get_mesh_hash(femmesh, femnodes_mesh)
+    mesh_set_cache = _mesh_set_caches.get(mesh_hash)
+    if mesh_set_cache is None:
+        if len(_mesh_set_caches) >= _max_mesh_set_caches:
+            _mesh_set_caches.clear()
+        mesh_set_cache = MeshSetCache(mesh_hash)
+        _mesh_set_caches[mesh_hash] = mesh_set_cache
+    if cache_dir:
+        file_name = os.path.join(cache_dir, CACHE_FILE_NAME)
+        if mesh_set_cache.file_name != file_name:
+            mesh_set_cache.load(file_name)
+            # write the sets of the session into the new file too
+            mesh_set_cache.changed = True
+    return mesh_set_cache
+
+
+def clear_mesh_set_caches():
+    _mesh_set_caches.clear()
+
+
+# ************************************************************************************************
+def get_mesh_hash(
+    femmesh,
+    femnodes_mesh=None
+):
+    """hash of the node coordinates, the element ids and the group data of a femmesh"""
+    if femnodes_mesh is None:
+        femnodes_mesh = femmesh.Nodes
+    mesh_hash = hashlib.sha1()
+    node_ids = sorted(femnodes_mesh)
+    mesh_hash.update(array("q", node_ids).tobytes())
+    mesh_hash.update(
+        array("d", chain.from_iterable(femnodes_mesh[n] for n in node_ids)).tobytes()
+    )
+    for element_ids in (femmesh.Volumes, femmesh.Faces, femmesh.Edges):
+        mesh_hash.update(array("q", element_ids).tobytes())
+        mesh_hash.update(b";")
+    # the mesh sets of constraints are taken from group data if there is some
+    for group in femmesh.Groups:
+        mesh_hash.update(femmesh.getGroupName(group).encode("utf-8"))
+        mesh_hash.update(femmesh.getGroupElementType(group).encode("utf-8"))
+        mesh_hash.update(array("q", femmesh.getGroupElements(group)).tobytes())
+    return mesh_hash.hexdigest()
+
+
+def get_shape_hash(
+    shape
+):
+    """hash of the geometry and placement of a reference shape"""
+    return hashlib.sha1(shape.exportBrepToString().encode("utf-8")).hexdigest()
+
+
+def get_references_hash(
+    references
+):
+    """hash of the geometry of all reference shapes of a list of references
+    [(document object, ("Face1", ...)), ...]
+    """
+    from femmesh.meshtools import get_element
+    references_hash = hashlib.sha1()
+    for ref_obj, ref_elements in references:
+        for ref_element in ref_elements:
+            references_hash.update(get_shape_hash(get_element(ref_obj, ref_element)).encode())
+        references_hash.update(b";")
+    return references_hash.hexdigest()
+
+##  @}
@@ -33,7 +33,8 @@ import FreeCAD
 # ************************************************************************************************
 def get_femnodes_by_femobj_with_references(
     femmesh,
-    femobj
+    femobj,
+    mesh_set_cache=None
 ):
     node_set = []
     if femmesh.GroupCount:
@@ -49,7 +50,11 @@ def get_femnodes_by_femobj_with_references(
             "    Finite element mesh nodes will be retrieved "
             "by searching the appropriate nodes in the finite element mesh.\n"
         )
-        node_set = get_femnodes_by_references(femmesh, femobj["Object"].References)
+        node_set = get_femnodes_by_references(
+            femmesh,
+            femobj["Object"].References,
+            mesh_set_cache
+        )
         # FreeCAD.Console.PrintMessage("node_set_nogroup: {}\n".format(node_set))
 
     # use set for node sets to be sure all nodes are unique
@@ -63,14 +68,15 @@ def get_femelements_by_references(
     femmesh,
     femelement_table,
     references,
-    femnodes_ele_table=None
+    femnodes_ele_table=None,
+    mesh_set_cache=None
 ):
     """get the femelements for a list of references
     """
     references_femelements = []
     for ref in references:
         # femnodes for the current ref
-        ref_femnodes = get_femnodes_by_refshape(femmesh, ref)
+        ref_femnodes = get_femnodes_by_refshape(femmesh, ref, mesh_set_cache)
         if femnodes_ele_table:
             # blind fast binary search, works for volumes only
             # femelements for all references
@@ -92,13 +98,14 @@ def get_femelements_by_references(
 # ************************************************************************************************
 def get_femnodes_by_references(
     femmesh,
-    references
+    references,
+    mesh_set_cache=None
 ):
     """get the femnodes for a list of references
     """
     references_femnodes = []
     for ref in references:
-        references_femnodes += get_femnodes_by_refshape(femmesh, ref)
+        references_femnodes += get_femnodes_by_refshape(femmesh, ref, mesh_set_cache)
 
     # return references_femnodes  # keeps duplicate nodes, keeps node order
 
@@ -108,8 +115,12 @@ def get_femnodes_by_references(
 
 def get_femnodes_by_refshape(
     femmesh,
-    ref
+    ref,
+    mesh_set_cache=None
 ):
+    """get the femnodes for a reference
+    if a MeshSetCache is given, the nodes of each reference shape are searched only once
+    """
     nodes = []
     for refelement in ref[1]:
         # the following method getElement(element) does not return Solid elements
@@ -122,19 +133,31 @@ def get_femnodes_by_refshape(
             "Element name: {3}\n"
             .format(r.ShapeType, ref[0].Name, ref[0].Label, refelement)
         )
+        if mesh_set_cache is not None:
+            from femmesh.meshsetcache import get_shape_hash
+            shape_hash = get_shape_hash(r)
+            ref_nodes = mesh_set_cache.get("Nodes", shape_hash)
+            if ref_nodes is not None:
+                FreeCAD.Console.PrintLog("    Nodes of the reference shape from cache.\n")
+                nodes += ref_nodes
+                continue
+        ref_nodes = []
         if r.ShapeType == "Vertex":
-            nodes += femmesh.getNodesByVertex(r)
+            ref_nodes = femmesh.getNodesByVertex(r)
         elif r.ShapeType == "Edge":
-            nodes += femmesh.getNodesByEdge(r)
+            ref_nodes = femmesh.getNodesByEdge(r)
         elif r.ShapeType == "Face":
-            nodes += femmesh.getNodesByFace(r)
+            ref_nodes = femmesh.getNodesByFace(r)
         elif r.ShapeType == "Solid":
-            nodes += femmesh.getNodesBySolid(r)
+            ref_nodes = femmesh.getNodesBySolid(r)
         else:
             FreeCAD.Console.PrintMessage(
                 "  "
                 "No Vertice, Edge, Face or Solid as reference shapes!\n"
             )
+        if mesh_set_cache is not None:
+            mesh_set_cache.set("Nodes", shape_hash, list(ref_nodes))
+        nodes += ref_nodes
     return nodes
 
 
@@ -235,6 +258,154 @@ def get_femnodes_ele_table(
     return femnodes_ele_table
 
 
+# ************************************************************************************************
+class FemNodesEleIncidence(object):
+    """array based replacement of the femnodes_ele_table dict, see get_femnodes_ele_table()
+
+    The node element incidence is stored in CSR format as numpy arrays:
+    the elements of node n are indices[offsets[n]:offsets[n + 1]],
+    as index into element_ids, and the position of the node in these elements
+    is coded as a set bit in bits[offsets[n]:offsets[n + 1]].
+    Use get_femnodes_ele_incidence() to get a cached instance.
+    """
+
+    def __init__(
+        self,
+        element_ids,
+        element_node_counts,
+        element_nodes
+    ):
+        # element_nodes are the nodes of all elements in one flat array
+        import numpy as np
+        self.element_ids = element_ids
+        self.element_node_counts = element_node_counts
+        element_starts = np.cumsum(element_node_counts) - element_node_counts
+        slot_elements = np.repeat(np.arange(len(element_ids)), element_node_counts)
+        slot_positions = np.arange(len(element_nodes)) - element_starts[slot_elements]
+        max_node = int(element_nodes.max()) if len(element_nodes) else 0
+        self.offsets = np.zeros(max_node + 2, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(np.bincount(element_nodes, minlength=max_node + 1))
+        order = np.argsort(element_nodes, kind="stable")
+        self.indices = slot_elements[order]
+        self.bits = np.left_shift(np.int64(1), slot_positions[order])
+
+    def __len__(self):
+        return len(self.element_ids)
+
+    def get_bit_patterns(
+        self,
+        node_set
+    ):
+        """for each element the bit pattern of its nodes which are in node_set
+        same as the bit_pattern_dict of get_bit_pattern_dict(), but as array
+        """
+        import numpy as np
+        nodes = np.fromiter(node_set, dtype=np.int64, count=len(node_set))
+        nodes = np.unique(nodes[(nodes >= 0) & (nodes < len(self.offsets) - 1)])
+        starts = self.offsets[nodes]
+        lengths = self.offsets[nodes + 1] - starts
+        slots = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        slots += np.arange(len(slots))
+        bit_patterns = np.zeros(len(self.element_ids), dtype=np.int64)
+        np.bitwise_or.at(bit_patterns, self.indices[slots], self.bits[slots])
+        return bit_patterns
+
+    def get_femelements_by_femnodes(
+        self,
+        node_set
+    ):
+        """the elements which have all their nodes in node_set
+        see get_femelements_by_femnodes_bin()
+        """
+        import numpy as np
+        bit_patterns = self.get_bit_patterns(node_set)
+        all_nodes = np.left_shift(np.int64(1), self.element_node_counts) - 1
+        return self.element_ids[bit_patterns == all_nodes].tolist()
+
+    def get_ccxelement_faces(
+        self,
+        node_set
+    ):
+        """the CalculiX element faces [[eleID, ccx face number], ...]
+        which have all their nodes in node_set
+        see get_ccxelement_faces_from_binary_search()
+        """
+        import numpy as np
+        bit_patterns = self.get_bit_patterns(node_set)
+        candidates = np.flatnonzero(bit_patterns)
+        found_elements = []
+        found_mask_positions = []
+        found_faces = []
+        for node_count, mask_dict in CCX_ELEMENT_FACE_MASKS.items():
+            of_count = candidates[self.element_node_counts[candidates] == node_count]
+            for mask_position, (key, face) in enumerate(mask_dict.items()):
+                found = of_count[(bit_patterns[of_count] & key) == key]
+                found_elements.append(found)
+                found_mask_positions.append(np.full(len(found), mask_position))
+                found_faces.append(np.full(len(found), face))
+        if not found_elements:
+            return []
+        found_elements = np.concatenate(found_elements)
+        found_mask_positions = np.concatenate(found_mask_positions)
+        found_faces = np.concatenate(found_faces)
+        # same order as get_ccxelement_faces_from_binary_search()
+        order = np.lexsort((found_mask_positions, found_elements))
+        return [
+            [ele, face] for ele, face in zip(
+                self.element_ids[found_elements[order]].tolist(),
+                found_faces[order].tolist()
+            )
+        ]
+
+
+# cache for get_femnodes_ele_incidence(), {femelement_table hash: FemNodesEleIncidence}
+_femnodes_ele_incidence_cache = {}
+
+
+def get_femnodes_ele_incidence(
+    femelement_table
+):
+    """the FemNodesEleIncidence of a femelement_table
+    It is cached by the content of the femelement_table, thus it is built only once
+    for a FemMesh and a changed FemMesh results in a new one.
+    """
+    import hashlib
+    import itertools
+    import numpy as np
+    element_ids = np.fromiter(femelement_table.keys(), dtype=np.int64, count=len(femelement_table))
+    element_node_counts = np.fromiter(
+        (len(nodes) for nodes in femelement_table.values()),
+        dtype=np.int64,
+        count=len(femelement_table)
+    )
+    element_nodes = np.fromiter(
+        itertools.chain.from_iterable(femelement_table.values()),
+        dtype=np.int64,
+        count=int(element_node_counts.sum())
+    )
+    table_hash = hashlib.sha1()
+    for data in (element_ids, element_node_counts, element_nodes):
+        table_hash.update(data.tobytes())
+    table_hash = table_hash.hexdigest()
+    if table_hash in _femnodes_ele_incidence_cache:
+        FreeCAD.Console.PrintLog("femnodes_ele_incidence from cache\n")
+        return _femnodes_ele_incidence_cache[table_hash]
+    incidence = FemNodesEleIncidence(element_ids, element_node_counts, element_nodes)
+    # only the femmeshes of the last analysis runs are kept
+    if len(_femnodes_ele_incidence_cache) >= 4:
+        _femnodes_ele_incidence_cache.clear()
+    _femnodes_ele_incidence_cache[table_hash] = incidence
+    FreeCAD.Console.PrintLog(
+        "femnodes_ele_incidence built for {} elements\n"
+        .format(len(element_ids))
+    )
+    return incidence
+
+
+def clear_femnodes_ele_incidence_cache():
+    _femnodes_ele_incidence_cache.clear()
+
+
 # ************************************************************************************************
 def get_copy_of_empty_femelement_table(
     femelement_table
@@ -281,59 +452,75 @@ def get_bit_pattern_dict(
 
 
 # ************************************************************************************************
-def get_ccxelement_faces_from_binary_search(
-    bit_pattern_dict
-):
-    """get the CalculiX element face numbers
-    """
-    # the forum topic discussion with ulrich1a and others ... Better mesh last instead of mesh first
-    # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318#p137171
-    # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=60#p141484
-    # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=50#p141108
-    # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=40#p140371
-    tet10_mask = {
-        119: 1,
-        411: 2,
-        717: 3,
-        814: 4}
-    tet4_mask = {
+# CalculiX element face numbers of volume elements coded as bit pattern of the element nodes
+# {number of element nodes: {bit pattern of the face nodes: ccx face number}}
+# see get_ccxelement_faces_from_binary_search() for more information
+CCX_ELEMENT_FACE_MASKS = {
+    # tet4
+    4: {
         7: 1,
         11: 2,
         13: 3,
-        14: 4}
-    hex8_mask = {
+        14: 4},
+    # pent6
+    6: {
+        56: 1,
+        7: 2,
+        54: 3,
+        45: 4,
+        27: 5},
+    # hex8
+    8: {
         240: 1,
         15: 2,
         102: 3,
         204: 4,
         153: 5,
-        51: 6}
-    hex20_mask = {
+        51: 6},
+    # tet10
+    10: {
+        119: 1,
+        411: 2,
+        717: 3,
+        814: 4},
+    # pent15
+    15: {
+        3640: 1,
+        455: 2,
+        25782: 3,
+        22829: 4,
+        12891: 5},
+    # hex20
+    20: {
         61680: 1,
         3855: 2,
         402022: 3,
         804044: 4,
         624793: 5,
-        201011: 6}
-    pent6_mask = {
-        56: 1,
-        7: 2,
-        54: 3,
-        45: 4,
-        27: 5}
-    pent15_mask = {
-        3640: 1,
-        455: 2,
-        25782: 3,
-        22829: 4,
-        12891: 5}
-    vol_dict = {
-        4: tet4_mask,
-        6: pent6_mask,
-        8: hex8_mask,
-        10: tet10_mask,
-        15: pent15_mask,
-        20: hex20_mask}
+        201011: 6}}
+
+# bit pattern of all nodes of a volume element
+# {number of element nodes: bit pattern}
+VOLUME_ELEMENT_MASKS = {
+    4: 15,
+    6: 63,
+    8: 255,
+    10: 1023,
+    15: 32767,
+    20: 1048575}
+
+
+def get_ccxelement_faces_from_binary_search(
+    bit_pattern_dict
+):
+    """get the CalculiX element face numbers
+    """
+    # the forum topic discussion with ulrich1a and others ... Better mesh last instead of mesh first
+    # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318#p137171
+    # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=60#p141484
+    # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=50#p141108
+    # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=40#p140371
+    vol_dict = CCX_ELEMENT_FACE_MASKS
     faces = []
     for ele in bit_pattern_dict:
         mask_dict = vol_dict[bit_pattern_dict[ele][0]]
@@ -345,6 +532,29 @@ def get_ccxelement_faces_from_binary_search(
     return faces
 
 
+# ************************************************************************************************
+def get_ccxelement_faces_by_femnodes(
+    femelement_table,
+    femnodes_ele_table,
+    node_set
+):
+    """get the CalculiX element faces [[eleID, ccx face number], ...]
+    which have all their nodes in node_set
+    femnodes_ele_table could be a FemNodesEleIncidence
+    or a femnodes_ele_table dict of get_femnodes_ele_table()
+    """
+    if isinstance(femnodes_ele_table, FemNodesEleIncidence):
+        faces = femnodes_ele_table.get_ccxelement_faces(node_set)
+        FreeCAD.Console.PrintLog("found Faces: {}\n".format(len(faces)))
+        return faces
+    bit_pattern_dict = get_bit_pattern_dict(
+        femelement_table,
+        femnodes_ele_table,
+        node_set
+    )
+    return get_ccxelement_faces_from_binary_search(bit_pattern_dict)
+
+
 # ************************************************************************************************
 def get_femelements_by_femnodes_bin(
     femelement_table,
@@ -357,13 +567,11 @@ def get_femelements_by_femnodes_bin(
     blind fast binary search, but works for volumes only
     """
     FreeCAD.Console.PrintMessage("binary search: get_femelements_by_femnodes_bin\n")
-    vol_masks = {
-        4: 15,
-        6: 63,
-        8: 255,
-        10: 1023,
-        15: 32767,
-        20: 1048575}
+    if isinstance(femnodes_ele_table, FemNodesEleIncidence):
+        ele_list = femnodes_ele_table.get_femelements_by_femnodes(node_list)
+        FreeCAD.Console.PrintMessage("found Volumes: {}\n".format(len(ele_list)))
+        return ele_list
+    vol_masks = VOLUME_ELEMENT_MASKS
     # Now we are looking for nodes inside of the Volumes = filling the bit_pattern_dict
     FreeCAD.Console.PrintMessage(
         "len femnodes_ele_table: {}\n"
@@ -478,7 +686,8 @@ def get_femelement_sets(
     femmesh,
     femelement_table,
     fem_objects,
-    femnodes_ele_table=None
+    femnodes_ele_table=None,
+    mesh_set_cache=None
 ):
     # fem_objects = FreeCAD FEM document objects
     # get femelements for reference shapes of each obj.References
@@ -499,7 +708,8 @@ def get_femelement_sets(
             ref_shape_femelements = get_femelements_by_references(
                 femmesh, femelement_table,
                 obj.References,
-                femnodes_ele_table
+                femnodes_ele_table,
+                mesh_set_cache
             )
             referenced_femelements += ref_shape_femelements
             count_femelements += len(ref_shape_femelements)
@@ -755,7 +965,8 @@ def get_elset_short_name(
 # ***** Vertex loads *****************************************************************************
 def get_force_obj_vertex_nodeload_table(
     femmesh,
-    frc_obj
+    frc_obj,
+    mesh_set_cache=None
 ):
     # force_obj_node_load_table:
     #     [
@@ -777,7 +988,15 @@ def get_force_obj_vertex_nodeload_table(
                 "Element name: {3}\n"
                 .format(ref_node.ShapeType, o.Name, o.Label, elem)
             )
-            node = femmesh.getNodesByVertex(ref_node)
+            node = None
+            if mesh_set_cache is not None:
+                from femmesh.meshsetcache import get_shape_hash
+                shape_hash = get_shape_hash(ref_node)
+                node = mesh_set_cache.get("Nodes", shape_hash)
+            if node is None:
+                node = femmesh.getNodesByVertex(ref_node)
+                if mesh_set_cache is not None:
+                    mesh_set_cache.set("Nodes", shape_hash, list(node))
             elem_info_string = "node load on shape: " + o.Name + ":" + elem
             if len(node) == 1:
                 force_obj_node_load_table.append(
@@ -799,7 +1018,8 @@ def get_force_obj_edge_nodeload_table(
     femmesh,
     femelement_table,
     femnodes_mesh,
-    frc_obj
+    frc_obj,
+    mesh_set_cache=None
 ):
     # force_obj_node_load_table:
     #     [
@@ -829,14 +1049,26 @@ def get_force_obj_edge_nodeload_table(
         for elem in elem_tup:
             ref_edge = o.Shape.getElement(elem)
 
-            # edge_table:
-            #     { meshedgeID : ( nodeID, ... , nodeID ) }
-            edge_table = get_ref_edgenodes_table(femmesh, femelement_table, ref_edge)
-
-            # node_length_table:
-            #     [ (nodeID, length), ... , (nodeID, length) ]
-            # some nodes will have more than one entry
-            node_length_table = get_ref_edgenodes_lengths(femnodes_mesh, edge_table)
+            node_length_table = None
+            if mesh_set_cache is not None:
+                from femmesh.meshsetcache import get_shape_hash
+                shape_hash = get_shape_hash(ref_edge)
+                node_length_table = mesh_set_cache.get("EdgeNodeLengths", shape_hash)
+            if node_length_table is None:
+                # edge_table:
+                #     { meshedgeID : ( nodeID, ... , nodeID ) }
+                edge_table = get_ref_edgenodes_table(femmesh, femelement_table, ref_edge)
+
+                # node_length_table:
+                #     [ (nodeID, length), ... , (nodeID, length) ]
+                # some nodes will have more than one entry
+                node_length_table = get_ref_edgenodes_lengths(femnodes_mesh, edge_table)
+                if mesh_set_cache is not None:
+                    mesh_set_cache.set(
+                        "EdgeNodeLengths",
+                        shape_hash,
+                        [list(node_length) for node_length in node_length_table]
+                    )
 
             # node_sum_length_table:
             #     { nodeID : Length, ... , nodeID : Length }
@@ -1071,7 +1303,8 @@ def get_force_obj_face_nodeload_table(
     femmesh,
     femelement_table,
     femnodes_mesh,
-    frc_obj
+    frc_obj,
+    mesh_set_cache=None
 ):
     # force_obj_node_load_table:
     #     [
@@ -1101,14 +1334,26 @@ def get_force_obj_face_nodeload_table(
         for elem in elem_tup:
             ref_face = o.Shape.getElement(elem)
 
-            # face_table:
-            #    { meshfaceID : ( nodeID, ... , nodeID ) }
-            face_table = get_ref_facenodes_table(femmesh, femelement_table, ref_face)
-
-            # node_area_table:
-            #    [ (nodeID, Area), ... , (nodeID, Area) ]
-            # some nodes will have more than one entry
-            node_area_table = get_ref_facenodes_areas(femnodes_mesh, face_table)
+            node_area_table = None
+            if mesh_set_cache is not None:
+                from femmesh.meshsetcache import get_shape_hash
+                shape_hash = get_shape_hash(ref_face)
+                node_area_table = mesh_set_cache.get("FaceNodeAreas", shape_hash)
+            if node_area_table is None:
+                # face_table:
+                #    { meshfaceID : ( nodeID, ... , nodeID ) }
+                face_table = get_ref_facenodes_table(femmesh, femelement_table, ref_face)
+
+                # node_area_table:
+                #    [ (nodeID, Area), ... , (nodeID, Area) ]
+                # some nodes will have more than one entry
+                node_area_table = get_ref_facenodes_areas(femnodes_mesh, face_table)
+                if mesh_set_cache is not None:
+                    mesh_set_cache.set(
+                        "FaceNodeAreas",
+                        shape_hash,
+                        [list(node_area) for node_area in node_area_table]
+                    )
 
             # node_sum_area_table:
             #    { nodeID : Area, ... , nodeID : Area }
@@ -1580,21 +1825,34 @@ def get_pressure_obj_faces(
     femmesh,
     femelement_table,
     femnodes_ele_table,
-    femobj
+    femobj,
+    mesh_set_cache=None
 ):
     # see get_ccxelement_faces_from_binary_search for more information
     if is_solid_femmesh(femmesh):
+        if mesh_set_cache is not None:
+            from femmesh.meshsetcache import get_references_hash
+            references_hash = get_references_hash(femobj["Object"].References)
+            pressure_faces = mesh_set_cache.get("PressureFaces", references_hash)
+            if pressure_faces is not None:
+                FreeCAD.Console.PrintLog("    Pressure faces from cache.\n")
+                return pressure_faces
         # get the nodes
         # sorted and duplicates removed
-        prs_face_node_set = get_femnodes_by_femobj_with_references(femmesh, femobj)
+        prs_face_node_set = get_femnodes_by_femobj_with_references(
+            femmesh,
+            femobj,
+            mesh_set_cache
+        )
         # FreeCAD.Console.PrintMessage("prs_face_node_set: {}\n".format(prs_face_node_set))
-        # fill the bit_pattern_dict and search for the faces
-        bit_pattern_dict = get_bit_pattern_dict(
+        # fill the bit pattern and search for the faces
+        pressure_faces = get_ccxelement_faces_by_femnodes(
             femelement_table,
             femnodes_ele_table,
             prs_face_node_set
         )
-        pressure_faces = get_ccxelement_faces_from_binary_search(bit_pattern_dict)
+        if mesh_set_cache is not None:
+            mesh_set_cache.set("PressureFaces", references_hash, pressure_faces)
     elif is_face_femmesh(femmesh):
         pressure_faces = []
         # normally we should call get_femelements_by_references and
@@ -1648,7 +1906,8 @@ def get_contact_obj_faces(
     femmesh,
     femelement_table,
     femnodes_ele_table,
-    femobj
+    femobj,
+    mesh_set_cache=None
 ):
     # see comment on get_pressure_obj_faces_depreciated in the regard of getccxVolumesByFace()
 
@@ -1697,27 +1956,27 @@ def get_contact_obj_faces(
 
     if is_solid_femmesh(femmesh):
         # get the nodes, sorted and duplicates removed
-        slaveface_nds = sorted(list(set(get_femnodes_by_refshape(femmesh, slave_ref))))
-        masterface_nds = sorted(list(set(get_femnodes_by_refshape(femmesh, master_ref))))
+        slaveface_nds = sorted(list(set(
+            get_femnodes_by_refshape(femmesh, slave_ref, mesh_set_cache)
+        )))
+        masterface_nds = sorted(list(set(
+            get_femnodes_by_refshape(femmesh, master_ref, mesh_set_cache)
+        )))
         # FreeCAD.Console.PrintLog("slaveface_nds: {}\n".format(slaveface_nds))
         # FreeCAD.Console.PrintLog("masterface_nds: {}\n".format(slaveface_nds))
 
-        # fill the bit_pattern_dict and search for the faces
-        slave_bit_pattern_dict = get_bit_pattern_dict(
+        # fill the bit pattern and search for the faces ids
+        slave_faces = get_ccxelement_faces_by_femnodes(
             femelement_table,
             femnodes_ele_table,
             slaveface_nds
         )
-        master_bit_pattern_dict = get_bit_pattern_dict(
+        master_faces = get_ccxelement_faces_by_femnodes(
             femelement_table,
             femnodes_ele_table,
             masterface_nds
         )
 
-        # get the faces ids
-        slave_faces = get_ccxelement_faces_from_binary_search(slave_bit_pattern_dict)
-        master_faces = get_ccxelement_faces_from_binary_search(master_bit_pattern_dict)
-
     elif is_face_femmesh(femmesh):
         slave_ref_shape = slave_ref[0].Shape.getElement(slave_ref[1][0])
         master_ref_shape = master_ref[0].Shape.getElement(master_ref[1][0])
@@ -289,6 +289,9 @@ class _FemResultMechanical():
         zero_list = 39 * [0]
         obj.Stats = zero_list
 
+        from femresult import resultstorage
+        resultstorage.attach_observer()
+
     # standard Feature methods
     def execute(self, obj):
         """"this method is executed on object creation and
@@ -299,7 +302,18 @@ class _FemResultMechanical():
         return
 
     def onChanged(self, obj, prop):
-        return
+        # a changed node result outdates the binary result array file
+        if obj.getGroupOfProperty(prop) == "NodeData":
+            from femresult import resultstorage
+            resultstorage.set_result_arrays_changed(obj)
+
+    def onDocumentRestored(self, obj):
+        # the node results might be saved in binary format
+        # they are loaded now, C++ code like the VTK export reads the properties
+        from femresult import resultstorage
+        resultstorage.reset_result_arrays_status(obj)
+        resultstorage.load_result_arrays(obj)
+        resultstorage.attach_observer()
 
     def __getstate__(self):
         return self.Type
@@ -0,0 +1,267 @@
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Binary storage of FEM result arrays"
+__author__ = "FreeCAD Developers"
+__url__ = "http://www.freecadweb.org"
+
+## \addtogroup FEM
+#  @{
+
+import os
+import shutil
+import tempfile
+
+import FreeCAD
+import numpy as np
+
+
+# The node results of a mechanical result object (displacements, stresses,
+# strains, ...) are float list and vector list properties. They are saved as
+# text into the Document.xml of the FCStd file, which is slow and large for
+# big meshes. If the binary result arrays are activated in the preferences
+# the node results are written into one compressed numpy file (npz) on save of
+# the document. The npz file is a file included property of the result object
+# and thus it is saved into the FCStd zip file. While the document is saved
+# the node result properties are transient, thus they are not written into
+# the Document.xml, but their values in memory are kept. On restore of the
+# document they are filled again from the npz file, see load_result_arrays(),
+# because C++ code like the VTK export reads the properties directly. The npz
+# file is only written again if a node result has changed since it was last
+# written or read.
+
+RESULT_ARRAY_PROPERTY = "ResultArrayFile"
+RESULT_ARRAY_FILE_NAME = "ResultArrays.npz"
+_list_property_types = (
+    "App::PropertyFloatList",
+    "App::PropertyVectorList",
+    "App::PropertyIntegerList",
+)
+# (document name, object name) of the result objects whose binary result array
+# file holds the current node results, see set_result_arrays_changed()
+_current_array_files = set()
+
+
+# ************************************************************************************************
+def get_result_array_names(
+    res_obj
+):
+    """the names of the node result list properties of a result object"""
+    names = ["NodeNumbers"]
+    for prop in res_obj.PropertiesList:
+        if res_obj.getGroupOfProperty(prop) == "NodeData" \
+                and res_obj.getTypeIdOfProperty(prop) in _list_property_types:
+            names.append(prop)
+    return names
+
+
+def has_result_array_file(
+    res_obj
+):
+    """True if the result object has a binary result array file"""
+    return bool(getattr(res_obj, RESULT_ARRAY_PROPERTY, ""))
+
+
+def _get_array_file_key(
+    res_obj
+):
+    return (res_obj.Document.Name, res_obj.Name)
+
+
+def set_result_arrays_changed(
+    res_obj
+):
+    """mark the binary result array file of a result object as outdated
+    called on change of a node result property
+    """
+    _current_array_files.discard(_get_array_file_key(res_obj))
+
+
+def result_arrays_loaded(
+    res_obj
+):
+    """True if the node result properties are filled
+    False if they are only in the binary result array file
+    """
+    return not has_result_array_file(res_obj) or len(res_obj.NodeNumbers) > 0
+
+
+def store_result_arrays(
+    res_obj
+):
+    """write the node results of a result object into a binary result array file
+
+    The list properties are set transient, thus they are not saved into the
+    document, their values are kept. Use reset_result_arrays_status() after the
+    document has been saved. Returns True if the node results have been stored.
+    If the node results are not loaded the existing file is kept. If they have
+    not changed since the file was last written or read it is not written again.
+    """
+    if len(res_obj.NodeNumbers) == 0:
+        return False
+    if has_result_array_file(res_obj) \
+            and _get_array_file_key(res_obj) in _current_array_files:
+        with np.load(getattr(res_obj, RESULT_ARRAY_PROPERTY)) as arrays:
+            names = arrays.files
+        for name in names:
+            if hasattr(res_obj, name):
+                res_obj.setPropertyStatus(name, "Transient")
+        FreeCAD.Console.PrintLog(
+            "Node results of {} unchanged, binary file kept.\n".format(res_obj.Name)
+        )
+        return True
+    arrays = {}
+    for name in get_result_array_names(res_obj):
+        values = getattr(res_obj, name)
+        if len(values) == 0:
+            continue
+        if res_obj.getTypeIdOfProperty(name) == "App::PropertyVectorList":
+            arrays[name] = np.array([tuple(v) for v in values], dtype=float)
+        elif res_obj.getTypeIdOfProperty(name) == "App::PropertyIntegerList":
+            arrays[name] = np.array(values, dtype=np.int64)
+        else:
+            arrays[name] = np.array(values, dtype=float)
+    if not hasattr(res_obj, RESULT_ARRAY_PROPERTY):
+        res_obj.addProperty(
+            "App::PropertyFileIncluded",
+            RESULT_ARRAY_PROPERTY,
+            "Base",
+            "Binary file of the node results",
+            1
+        )
+    temp_dir = tempfile.mkdtemp(prefix="fem_result_arrays_")
+    try:
+        array_file = os.path.join(temp_dir, RESULT_ARRAY_FILE_NAME)
+        with open(array_file, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        # the file is copied into the transient directory of the document
+        setattr(res_obj, RESULT_ARRAY_PROPERTY, array_file)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    for name in arrays:
+        res_obj.setPropertyStatus(name, "Transient")
+    _current_array_files.add(_get_array_file_key(res_obj))
+    FreeCAD.Console.PrintLog(
+        "Node results of {} stored in binary format.\n".format(res_obj.Name)
+    )
+    return True
+
+
+def reset_result_arrays_status(
+    res_obj
+):
+    """make the node result properties of a result object persistent again
+
+    The transient status set by store_result_arrays() is saved with the
+    document, thus it is reset after save and after restore of the document.
+    """
+    for name in get_result_array_names(res_obj):
+        if "Transient" in res_obj.getPropertyStatus(name):
+            res_obj.setPropertyStatus(name, "-Transient")
+
+
+def load_result_arrays(
+    res_obj
+):
+    """fill the node result properties from the binary result array file
+
+    Does nothing if the node results are already loaded. Returns True
+    if the node result properties have been filled.
+    """
+    if result_arrays_loaded(res_obj):
+        return False
+    with np.load(getattr(res_obj, RESULT_ARRAY_PROPERTY)) as arrays:
+        for name in arrays.files:
+            if not hasattr(res_obj, name):
+                continue
+            values = arrays[name]
+            if res_obj.getTypeIdOfProperty(name) == "App::PropertyVectorList":
+                setattr(res_obj, name, [FreeCAD.Vector(*v) for v in values.tolist()])
+            else:
+                setattr(res_obj, name, values.tolist())
+    # the properties were set from the file, it is still current
+    _current_array_files.add(_get_array_file_key(res_obj))
+    FreeCAD.Console.PrintLog(
+        "Node results of {} loaded from binary format.\n".format(res_obj.Name)
+    )
+    return True
+
+
+def get_result_array(
+    res_obj,
+    name
+):
+    """a node result of a result object as numpy array
+
+    If the node results are not loaded only this one array is read from
+    the binary result array file, the properties are not filled.
+    """
+    if result_arrays_loaded(res_obj):
+        values = getattr(res_obj, name)
+        if res_obj.getTypeIdOfProperty(name) == "App::PropertyVectorList":
+            return np.array([tuple(v) for v in values], dtype=float).reshape(-1, 3)
+        return np.array(values)
+    with np.load(getattr(res_obj, RESULT_ARRAY_PROPERTY)) as arrays:
+        if name in arrays.files:
+            return arrays[name]
+    return np.array([])
+
+
+# ************************************************************************************************
+class _ResultStorageObserver(object):
+    """store the node results of all result objects on save of a document,
+    if the binary result arrays are activated in the preferences
+    """
+
+    _instance = None
+
+    @classmethod
+    def attach(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+            FreeCAD.addDocumentObserver(cls._instance)
+
+    def __init__(self):
+        # names of the result objects stored per document, see slotFinishSaveDocument
+        self.stored = {}
+
+    def slotStartSaveDocument(self, doc, file_name):
+        from femsolver.settings import get_binary_result_arrays
+        if not get_binary_result_arrays():
+            return
+        for obj in doc.Objects:
+            if obj.isDerivedFrom("Fem::FemResultObjectPython") \
+                    and hasattr(obj, "Proxy") \
+                    and getattr(obj.Proxy, "Type", "") == "Fem::FemResultMechanical":
+                if store_result_arrays(obj):
+                    self.stored.setdefault(doc.Name, []).append(obj.Name)
+
+    def slotFinishSaveDocument(self, doc, file_name):
+        for name in self.stored.pop(doc.Name, []):
+            obj = doc.getObject(name)
+            if obj:
+                reset_result_arrays_status(obj)
+
+
+def attach_observer():
+    _ResultStorageObserver.attach()
+
+##  @}
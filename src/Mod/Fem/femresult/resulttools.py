@@ -93,6 +93,7 @@ def reset_mesh_color(resultobj):
 
 def show_displacement(resultobj, displacement_factor=0.0):
     if FreeCAD.GuiUp:
+        load_result_arrays(resultobj)
         if resultobj.Mesh.ViewObject.Visibility is False:
             resultobj.Mesh.ViewObject.Visibility = True
         resultobj.Mesh.ViewObject.setNodeDisplacementByVectors(
@@ -123,6 +124,7 @@ def show_result(resultobj, result_type="Sabs", limit=None):
         reset_mesh_color(resultobj.Mesh)
         return
     if resultobj:
+        load_result_arrays(resultobj)
         if result_type == "Sabs":
             values = resultobj.StressValues
         elif result_type == "Uabs":
@@ -170,6 +172,18 @@ def show_color_by_scalar_with_cutoff(resultobj, values, limit=None):
         )
 
 
+def load_result_arrays(res_obj):
+    """Fills the node results of a result object if they are saved in binary format
+
+    Parameters
+    ----------
+    res_obj : Fem::FemResultMechanical
+        FreeCAD FEM mechanical result object
+    """
+    from femresult import resultstorage
+    return resultstorage.load_result_arrays(res_obj)
+
+
 def get_stats(res_obj, result_type):
     """Returns minimum, average and maximum value for provided result type
 
@@ -275,51 +289,34 @@ def fill_femresult_stats(res_obj):
 
     if res_obj.DisplacementVectors:
         no_of_values = len(res_obj.DisplacementVectors)
-        x_max, y_max, z_max = map(max, zip(*res_obj.DisplacementVectors))
-        x_min, y_min, z_min = map(min, zip(*res_obj.DisplacementVectors))
-        sum_list = map(sum, zip(*res_obj.DisplacementVectors))
-        x_avg, y_avg, z_avg = [i / no_of_values for i in sum_list]
-        a_min = min(res_obj.DisplacementLengths)
-        a_avg = sum(res_obj.DisplacementLengths) / no_of_values
-        a_max = max(res_obj.DisplacementLengths)
+        disp = np.array(res_obj.DisplacementVectors, dtype=float).reshape(-1, 3)
+        x_min, x_avg, x_max = get_min_avg_max(disp[:, 0], no_of_values)
+        y_min, y_avg, y_max = get_min_avg_max(disp[:, 1], no_of_values)
+        z_min, z_avg, z_max = get_min_avg_max(disp[:, 2], no_of_values)
+        a_min, a_avg, a_max = get_min_avg_max(res_obj.DisplacementLengths, no_of_values)
     if res_obj.StressValues:
-        s_min = min(res_obj.StressValues)
-        s_avg = sum(res_obj.StressValues) / no_of_values
-        s_max = max(res_obj.StressValues)
+        s_min, s_avg, s_max = get_min_avg_max(res_obj.StressValues, no_of_values)
     if res_obj.PrincipalMax:
-        p1_min = min(res_obj.PrincipalMax)
-        p1_avg = sum(res_obj.PrincipalMax) / no_of_values
-        p1_max = max(res_obj.PrincipalMax)
+        p1_min, p1_avg, p1_max = get_min_avg_max(res_obj.PrincipalMax, no_of_values)
     if res_obj.PrincipalMed:
-        p2_min = min(res_obj.PrincipalMed)
-        p2_avg = sum(res_obj.PrincipalMed) / no_of_values
-        p2_max = max(res_obj.PrincipalMed)
+        p2_min, p2_avg, p2_max = get_min_avg_max(res_obj.PrincipalMed, no_of_values)
     if res_obj.PrincipalMin:
-        p3_min = min(res_obj.PrincipalMin)
-        p3_avg = sum(res_obj.PrincipalMin) / no_of_values
-        p3_max = max(res_obj.PrincipalMin)
+        p3_min, p3_avg, p3_max = get_min_avg_max(res_obj.PrincipalMin, no_of_values)
     if res_obj.MaxShear:
-        ms_min = min(res_obj.MaxShear)
-        ms_avg = sum(res_obj.MaxShear) / no_of_values
-        ms_max = max(res_obj.MaxShear)
+        ms_min, ms_avg, ms_max = get_min_avg_max(res_obj.MaxShear, no_of_values)
     if res_obj.Peeq:
-        peeq_min = min(res_obj.Peeq)
-        peeq_avg = sum(res_obj.Peeq) / no_of_values
-        peeq_max = max(res_obj.Peeq)
+        peeq_min, peeq_avg, peeq_max = get_min_avg_max(res_obj.Peeq, no_of_values)
     if res_obj.Temperature:
-        temp_min = min(res_obj.Temperature)
-        temp_avg = sum(res_obj.Temperature) / no_of_values
-        temp_max = max(res_obj.Temperature)
+        temp_min, temp_avg, temp_max = get_min_avg_max(res_obj.Temperature, no_of_values)
     if res_obj.MassFlowRate:
         # DisplacementVectors is empty, no_of_values needs to be set
         no_of_values = len(res_obj.MassFlowRate)
-        mflow_min = min(res_obj.MassFlowRate)
-        mflow_avg = sum(res_obj.MassFlowRate) / no_of_values
-        mflow_max = max(res_obj.MassFlowRate)
+        mflow_min, mflow_avg, mflow_max = get_min_avg_max(res_obj.MassFlowRate, no_of_values)
     if res_obj.NetworkPressure:
-        npress_min = min(res_obj.NetworkPressure)
-        npress_avg = sum(res_obj.NetworkPressure) / no_of_values
-        npress_max = max(res_obj.NetworkPressure)
+        npress_min, npress_avg, npress_max = get_min_avg_max(
+            res_obj.NetworkPressure,
+            no_of_values
+        )
 
     res_obj.Stats = [x_min, x_avg, x_max,
                      y_min, y_avg, y_max,
@@ -364,15 +361,45 @@ def fill_femresult_stats(res_obj):
     return res_obj
 
 
+def get_min_avg_max(values, no_of_values):
+    """Returns minimum, average and maximum of the values
+
+    Parameters
+    ----------
+    values : list of floats or numpy array
+        result values
+    no_of_values : int
+        number of values the sum is divided by to get the average
+
+    NaN values are ignored. If there are no other values 0.0 is returned.
+    """
+
+    values = np.asarray(values, dtype=float)
+    if no_of_values == 0 or np.isnan(values).all():
+        # also true for no values at all
+        return (0.0, 0.0, 0.0)
+    return (
+        float(np.nanmin(values)),
+        float(np.nansum(values)) / no_of_values,
+        float(np.nanmax(values))
+    )
+
+
 def add_disp_apps(res_obj):
-    res_obj.DisplacementLengths = calculate_disp_abs(res_obj.DisplacementVectors)
+    res_obj.DisplacementLengths = calculate_disp_abs_array(
+        res_obj.DisplacementVectors
+    ).tolist()
     FreeCAD.Console.PrintLog("Added DisplacementLengths.\n")
     return res_obj
 
 
-def add_von_mises(res_obj):
-    mstress = []
-    iterator = zip(
+def get_stress_tensors(res_obj):
+    """Returns the six stress component lists of a result object
+
+    (Sxx, Syy, Szz, Sxy, Sxz, Syz) as used by the array based calculate methods
+    """
+
+    return (
         res_obj.NodeStressXX,
         res_obj.NodeStressYY,
         res_obj.NodeStressZZ,
@@ -380,36 +407,22 @@ def add_von_mises(res_obj):
         res_obj.NodeStressXZ,
         res_obj.NodeStressYZ
     )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        mstress.append(calculate_von_mises((Sxx, Syy, Szz, Sxy, Sxz, Syz)))
-    res_obj.StressValues = mstress
+
+
+def add_von_mises(res_obj):
+    res_obj.StressValues = calculate_von_mises_array(get_stress_tensors(res_obj)).tolist()
     FreeCAD.Console.PrintLog("Added StressValues (von Mises).\n")
     return res_obj
 
 
 def add_principal_stress_std(res_obj):
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ
+    prinstress1, prinstress2, prinstress3, shearstress = calculate_principal_stress_std_array(
+        get_stress_tensors(res_obj)
     )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        prin1, prin2, prin3, shear = calculate_principal_stress_std((Sxx, Syy, Szz, Sxy, Sxz, Syz))
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = shearstress.tolist()
     FreeCAD.Console.PrintLog("Added principal stress and max shear values.\n")
     return res_obj
 
@@ -609,6 +622,45 @@ def calculate_von_mises(stress_tensor):
     return np.sqrt(1.5 * np.linalg.norm(normal - pressure)**2 + 3.0 * np.linalg.norm(shear)**2)
 
 
+def calculate_von_mises_array(stress_tensors):
+    # array version of calculate_von_mises for all nodes at once
+    # stress_tensors ... (Sxx, Syy, Szz, Sxy, Sxz, Syz), each a list or array of all nodes
+    stress = np.asarray(stress_tensors, dtype=float).reshape(6, -1)
+    normal = stress[:3]
+    shear = stress[3:]
+    pressure = np.sum(normal, axis=0) / 3.0
+    return np.sqrt(
+        1.5 * np.sum((normal - pressure)**2, axis=0)
+        + 3.0 * np.sum(shear**2, axis=0)
+    )
+
+
+def calculate_principal_stress_std_array(stress_tensors):
+    # array version of calculate_principal_stress_std for all nodes at once
+    # stress_tensors ... (Sxx, Syy, Szz, Sxy, Sxz, Syz), each a list or array of all nodes
+    # returns the arrays (prin1, prin2, prin3, maxshear)
+    stress = np.asarray(stress_tensors, dtype=float).reshape(6, -1)
+    s11, s22, s33, s12, s31, s23 = stress
+    sigma = np.empty((stress.shape[1], 3, 3))
+    sigma[:, 0, 0] = s11
+    sigma[:, 1, 1] = s22
+    sigma[:, 2, 2] = s33
+    sigma[:, 0, 1] = sigma[:, 1, 0] = s12
+    sigma[:, 0, 2] = sigma[:, 2, 0] = s31
+    sigma[:, 1, 2] = sigma[:, 2, 1] = s23
+
+    # NaN inside a stress tensor (Calculix frd result files) returns NaN for this node
+    # see calculate_principal_stress_std
+    has_nan = np.isnan(stress).any(axis=0)
+    sigma[has_nan] = 0.0
+
+    # eigvalsh returns the eigenvalues in ascending order
+    eigvals = np.linalg.eigvalsh(sigma)[:, ::-1]
+    eigvals[has_nan] = float("NaN")
+    maxshear = (eigvals[:, 0] - eigvals[:, 2]) / 2.0
+    return (eigvals[:, 0], eigvals[:, 1], eigvals[:, 2], maxshear)
+
+
 def calculate_principal_stress_std(
     stress_tensor
 ):
@@ -860,4 +912,10 @@ def calculate_disp_abs(displacements):
     # see https://forum.freecadweb.org/viewtopic.php?f=18&t=33106&start=100#p296657
     return [np.linalg.norm(nd) for nd in displacements]
 
+
+def calculate_disp_abs_array(displacements):
+    # array version of calculate_disp_abs for all nodes at once
+    displacements = np.asarray(displacements, dtype=float).reshape(-1, 3)
+    return np.linalg.norm(displacements, axis=1)
+
 ##  @}
@@ -85,6 +85,7 @@ class Prepare(run.Prepare):
             self.directory
         )
         path = w.write_calculix_input_file()
+        self.report.profile.extend(w.profile)
         # report to user if task succeeded
         if path != "":
             self.pushStatus("Write completed!")
@@ -123,9 +124,7 @@ class Results(run.Results):
             # TODO do not run solver
             # do not try to read results in a smarter way than an Exception
             raise Exception("Error on writing CalculiX input file.\n")
-        prefs = FreeCAD.ParamGet(
-            "User parameter:BaseApp/Preferences/Mod/Fem/General")
-        if not prefs.GetBool("KeepResultsOnReRun", False):
+        if not self.getKeepResults():
             self.purge_results()
         self.load_results_ccxfrd()
         self.load_results_ccxdat()
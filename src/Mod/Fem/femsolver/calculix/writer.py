@@ -35,9 +35,51 @@ import six
 
 import FreeCAD
 from femmesh import meshtools
+from femtools import femutils
+from .. import profiling
+from .. import settings
 from .. import writerbase
 
 
+# the keys of the femobj dicts which hold the sets computed by the constraint getters
+CONSTRAINT_SET_KEYS = (
+    "Nodes",
+    "NodesSolid",
+    "NodesFaceEdge",
+    "NodeLoadTable",
+    "PressureFaces",
+    "ContactSlaveFaces",
+    "ContactMasterFaces",
+)
+
+# the writer computing its constraint sets, inherited by the forked worker processes
+_forked_writer = None
+
+
+def _get_constraint_sets(job):
+    # runs in a worker process forked by FemInputWriterCcx.get_constraints_sets()
+    # the document objects stay in the main process, only the sets are sent back
+    getter_name, femobjs_name = job
+    writer = _forked_writer
+    mesh_set_cache = writer.get_mesh_set_cache()
+    known_sets = {}
+    if mesh_set_cache is not None:
+        known_sets = {kind: set(kind_sets) for kind, kind_sets in mesh_set_cache.sets.items()}
+    getattr(writer, getter_name)()
+    femobjs_sets = [
+        {key: value for key, value in femobj.items() if key in CONSTRAINT_SET_KEYS}
+        for femobj in getattr(writer, femobjs_name)
+    ]
+    # the new mesh sets go into the cache of the main process
+    new_sets = {}
+    if mesh_set_cache is not None:
+        for kind, kind_sets in mesh_set_cache.sets.items():
+            for shape_hash, value in kind_sets.items():
+                if shape_hash not in known_sets.get(kind, ()):
+                    new_sets.setdefault(kind, {})[shape_hash] = value
+    return femobjs_sets, writer.constraint_conflict_nodes, new_sets
+
+
 class FemInputWriterCcx(writerbase.FemInputWriter):
     def __init__(
         self,
@@ -95,7 +137,10 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             self.dir_name,
             "{}_inout_nodes.txt".format(self.mesh_object.Name)
         )
+        # True if the constraint sets were computed before writing, see get_constraints_sets()
+        self.constraint_sets_computed = False
 
+    @profiling.profiled
     def write_calculix_input_file(self):
         timestart = time.process_time()
         FreeCAD.Console.PrintMessage("Start writing CalculiX input file\n")
@@ -109,10 +154,14 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         FreeCAD.Console.PrintLog(
             "writerbaseCcx --> self.file_name  -->  " + self.file_name + "\n"
         )
+        if settings.get_parallel_constraint_sets() is True:
+            self.get_constraints_sets()
         if self.solver_obj.SplitInputWriter is True:
             self.write_calculix_splitted_input_file()
         else:
             self.write_calculix_one_input_file()
+        self.save_mesh_set_cache_file()
+        self.add_profile_counts()
         writing_time_string = (
             "Writing time CalculiX input file: {} seconds"
             .format(round((time.process_time() - timestart), 2))
@@ -127,6 +176,88 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             )
             return ""
 
+    @profiling.profiled
+    def get_constraints_sets(self):
+        # the node and face sets of the constraints do not depend on each other
+        # thus they are computed in worker processes before the input file is written,
+        # the write methods write them in the usual order afterwards
+        # the workers are forked from this process, thus they inherit the FemMesh,
+        # the reference shapes and the mesh data computed once before the fork
+        # the FemMesh searches hold the GIL, threads would not run them concurrently
+        jobs = []
+        if self.fixed_objects:
+            jobs.append(("get_constraints_fixed_nodes", "fixed_objects"))
+        if self.displacement_objects:
+            jobs.append(("get_constraints_displacement_nodes", "displacement_objects"))
+        if self.planerotation_objects:
+            jobs.append(("get_constraints_planerotation_nodes", "planerotation_objects"))
+        if self.contact_objects:
+            jobs.append(("get_constraints_contact_faces", "contact_objects"))
+        if self.transform_objects:
+            jobs.append(("get_constraints_transform_nodes", "transform_objects"))
+        if self.analysis_type == "static" or self.analysis_type == "thermomech":
+            if self.force_objects:
+                jobs.append(("get_constraints_force_nodeloads", "force_objects"))
+            if self.pressure_objects:
+                jobs.append(("get_constraints_pressure_faces", "pressure_objects"))
+        if self.analysis_type == "thermomech":
+            if self.temperature_objects:
+                jobs.append(("get_constraints_temperature_nodes", "temperature_objects"))
+            if self.fluidsection_objects:
+                jobs.append(("get_constraints_fluidsection_nodes", "fluidsection_objects"))
+        if len(jobs) < 2:
+            return
+        timestart = time.time()
+
+        # shared mesh data
+        self.femnodes_mesh = self.femmesh.Nodes
+        self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+        if self.contact_objects or self.pressure_objects:
+            self.femnodes_ele_table = meshtools.get_femnodes_ele_incidence(
+                self.femelement_table
+            )
+        if self.femmesh.Volumes \
+                and (len(self.shellthickness_objects) > 0 or len(self.beamsection_objects) > 0):
+            self.femelement_volumes_table = meshtools.get_femelement_volumes_table(
+                self.femmesh
+            )
+        mesh_set_cache = self.get_mesh_set_cache()
+
+        global _forked_writer
+        import multiprocessing
+        processes = min(len(jobs), multiprocessing.cpu_count())
+        _forked_writer = self
+        try:
+            pool = femutils.get_fork_pool(processes)
+            if pool is None:
+                FreeCAD.Console.PrintLog(
+                    "Constraint sets are not computed in parallel, "
+                    "processes can not be forked here.\n"
+                )
+                return
+            try:
+                results = pool.map(_get_constraint_sets, jobs)
+            finally:
+                pool.close()
+                pool.join()
+        finally:
+            _forked_writer = None
+        for (getter_name, femobjs_name), result in zip(jobs, results):
+            femobjs_sets, conflict_nodes, new_sets = result
+            for femobj, femobj_sets in zip(getattr(self, femobjs_name), femobjs_sets):
+                femobj.update(femobj_sets)
+            self.constraint_conflict_nodes.extend(conflict_nodes)
+            if mesh_set_cache is not None:
+                for kind, kind_sets in new_sets.items():
+                    for shape_hash, value in kind_sets.items():
+                        mesh_set_cache.set(kind, shape_hash, value)
+        self.constraint_sets_computed = True
+        FreeCAD.Console.PrintMessage(
+            "Constraint sets computed in {} processes: {} seconds\n"
+            .format(processes, round((time.time() - timestart), 2))
+        )
+
+    @profiling.profiled
     def write_calculix_one_input_file(self):
         self.femmesh.writeABAQUS(self.file_name, 1, False)
 
@@ -219,6 +350,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         self.write_footer(inpfile)
         inpfile.close()
 
+    @profiling.profiled
     def write_calculix_splitted_input_file(self):
         # reopen file with "append" and add the analysis definition
         # first open file with "write" to ensure
@@ -391,6 +523,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         self.write_footer(inpfileMain)
         inpfileMain.close()
 
+    @profiling.profiled
     def write_element_sets_material_and_femelement_type(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Element sets for materials and FEM element type (solid, shell, beam, fluid)\n")
@@ -495,12 +628,13 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             if isinstance(ccx_elset["ccx_elset"], six.string_types):
                 f.write(ccx_elset["ccx_elset"] + "\n")
             else:
-                for elid in ccx_elset["ccx_elset"]:
-                    f.write(str(elid) + ",\n")
+                write_id_lines(f, ccx_elset["ccx_elset"])
 
+    @profiling.profiled
     def write_node_sets_constraints_fixed(self, f):
         # get nodes
-        self.get_constraints_fixed_nodes()
+        if self.constraint_sets_computed is False:
+            self.get_constraints_fixed_nodes()
         # write nodes to file
         f.write("\n***********************************************************\n")
         f.write("** Node sets for fixed constraint\n")
@@ -513,20 +647,19 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                     and (len(self.shellthickness_objects) > 0 or len(self.beamsection_objects) > 0):
                 if len(femobj["NodesSolid"]) > 0:
                     f.write("*NSET,NSET=" + fix_obj.Name + "Solid\n")
-                    for n in femobj["NodesSolid"]:
-                        f.write(str(n) + ",\n")
+                    write_id_lines(f, femobj["NodesSolid"])
                 if len(femobj["NodesFaceEdge"]) > 0:
                     f.write("*NSET,NSET=" + fix_obj.Name + "FaceEdge\n")
-                    for n in femobj["NodesFaceEdge"]:
-                        f.write(str(n) + ",\n")
+                    write_id_lines(f, femobj["NodesFaceEdge"])
             else:
                 f.write("*NSET,NSET=" + fix_obj.Name + "\n")
-                for n in femobj["Nodes"]:
-                    f.write(str(n) + ",\n")
+                write_id_lines(f, femobj["Nodes"])
 
+    @profiling.profiled
     def write_node_sets_constraints_displacement(self, f):
         # get nodes
-        self.get_constraints_displacement_nodes()
+        if self.constraint_sets_computed is False:
+            self.get_constraints_displacement_nodes()
         # write nodes to file
         f.write("\n***********************************************************\n")
         f.write("** Node sets for prescribed displacement constraint\n")
@@ -536,12 +669,13 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             disp_obj = femobj["Object"]
             f.write("** " + disp_obj.Label + "\n")
             f.write("*NSET,NSET=" + disp_obj.Name + "\n")
-            for n in femobj["Nodes"]:
-                f.write(str(n) + ",\n")
+            write_id_lines(f, femobj["Nodes"])
 
+    @profiling.profiled
     def write_node_sets_constraints_planerotation(self, f):
         # get nodes
-        self.get_constraints_planerotation_nodes()
+        if self.constraint_sets_computed is False:
+            self.get_constraints_planerotation_nodes()
         # write nodes to file
         if not self.femnodes_mesh:
             self.femnodes_mesh = self.femmesh.Nodes
@@ -583,12 +717,13 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                 if cnt == 0:
                     MPC = node_planerotation[i]
                     MPC_nodes.append(MPC)
-            for i in range(len(MPC_nodes)):
-                f.write(str(MPC_nodes[i]) + ",\n")
+            write_id_lines(f, MPC_nodes)
 
+    @profiling.profiled
     def write_surfaces_constraints_contact(self, f):
         # get faces
-        self.get_constraints_contact_faces()
+        if self.constraint_sets_computed is False:
+            self.get_constraints_contact_faces()
         # write faces to file
         f.write("\n***********************************************************\n")
         f.write("** Surfaces for contact constraint\n")
@@ -599,16 +734,16 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             f.write("** " + contact_obj.Label + "\n")
             # slave DEP
             f.write("*SURFACE, NAME=DEP{}\n".format(contact_obj.Name))
-            for i in femobj["ContactSlaveFaces"]:
-                f.write("{},S{}\n".format(i[0], i[1]))
+            write_face_lines(f, femobj["ContactSlaveFaces"], "{},S{}\n")
             # master IND
             f.write("*SURFACE, NAME=IND{}\n".format(contact_obj.Name))
-            for i in femobj["ContactMasterFaces"]:
-                f.write("{},S{}\n".format(i[0], i[1]))
+            write_face_lines(f, femobj["ContactMasterFaces"], "{},S{}\n")
 
+    @profiling.profiled
     def write_node_sets_constraints_transform(self, f):
         # get nodes
-        self.get_constraints_transform_nodes()
+        if self.constraint_sets_computed is False:
+            self.get_constraints_transform_nodes()
         # write nodes to file
         f.write("\n***********************************************************\n")
         f.write("** Node sets for transform constraint\n")
@@ -621,12 +756,13 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                 f.write("*NSET,NSET=Rect" + trans_obj.Name + "\n")
             elif trans_obj.TransformType == "Cylindrical":
                 f.write("*NSET,NSET=Cylin" + trans_obj.Name + "\n")
-            for n in femobj["Nodes"]:
-                f.write(str(n) + ",\n")
+            write_id_lines(f, femobj["Nodes"])
 
+    @profiling.profiled
     def write_node_sets_constraints_temperature(self, f):
         # get nodes
-        self.get_constraints_temperature_nodes()
+        if self.constraint_sets_computed is False:
+            self.get_constraints_temperature_nodes()
         # write nodes to file
         f.write("\n***********************************************************\n")
         f.write("** Node sets for temperature constraints\n")
@@ -636,9 +772,9 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             temp_obj = femobj["Object"]
             f.write("** " + temp_obj.Label + "\n")
             f.write("*NSET,NSET=" + temp_obj.Name + "\n")
-            for n in femobj["Nodes"]:
-                f.write(str(n) + ",\n")
+            write_id_lines(f, femobj["Nodes"])
 
+    @profiling.profiled
     def write_materials(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Materials\n")
@@ -731,6 +867,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                                 f.write(nl_mat_obj.YieldPoint3 + "\n")
                     f.write("\n")
 
+    @profiling.profiled
     def write_constraints_initialtemperature(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Initial temperature constraint\n")
@@ -741,6 +878,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             # OvG: Initial temperature
             f.write("{0},{1}\n".format(self.ccx_nall, inittemp_obj.initialTemperature))
 
+    @profiling.profiled
     def write_femelementsets(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Sections\n")
@@ -837,6 +975,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                     section_def = "*SOLID SECTION, " + elsetdef + material + "\n"
                     f.write(section_def)
 
+    @profiling.profiled
     def write_step_begin(self, f):
         f.write("\n***********************************************************\n")
         f.write("** At least one step is needed to run an CalculiX analysis of FreeCAD\n")
@@ -937,6 +1076,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         f.write(analysis_type + "\n")
         f.write(analysis_parameter + "\n")
 
+    @profiling.profiled
     def write_constraints_fixed(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Fixed Constraints\n")
@@ -973,6 +1113,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                     f.write(fix_obj_name + ",6\n")
                 f.write("\n")
 
+    @profiling.profiled
     def write_constraints_displacement(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Displacement constraint applied\n")
@@ -1011,6 +1152,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                     f.write(disp_obj_name + ",6,6," + str(disp_obj.zRotation) + "\n")
         f.write("\n")
 
+    @profiling.profiled
     def write_constraints_contact(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Contact Constraints\n")
@@ -1036,6 +1178,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                 stick = (slope / 10.0)
                 f.write(str(friction) + ", " + str(stick) + " \n")
 
+    @profiling.profiled
     def write_constraints_planerotation(self, f):
         f.write("\n***********************************************************\n")
         f.write("** PlaneRotation Constraints\n")
@@ -1047,6 +1190,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             f.write("*MPC\n")
             f.write("PLANE," + fric_obj_name + "\n")
 
+    @profiling.profiled
     def write_constraints_transform(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Transform Constraints\n")
@@ -1063,6 +1207,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                 coords = meshtools.get_cylindrical_coords(trans_obj)
                 f.write(coords + "\n")
 
+    @profiling.profiled
     def write_constraints_selfweight(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Self weight Constraint\n")
@@ -1087,9 +1232,11 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         # different element sets for different density
         # are written in the material element sets already
 
+    @profiling.profiled
     def write_constraints_force(self, f):
         # check shape type of reference shape and get node loads
-        self.get_constraints_force_nodeloads()
+        if self.constraint_sets_computed is False:
+            self.get_constraints_force_nodeloads()
         # write node loads to file
         f.write("\n***********************************************************\n")
         f.write("** Node loads Constraints\n")
@@ -1101,23 +1248,28 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             direction_vec = femobj["Object"].DirectionVector
             for ref_shape in femobj["NodeLoadTable"]:
                 f.write("** " + ref_shape[0] + "\n")
+                # the lines of a ref_shape are written at once
+                node_load_lines = []
                 for n in sorted(ref_shape[1]):
                     node_load = ref_shape[1][n]
                     if (direction_vec.x != 0.0):
                         v1 = "{:.13E}".format(direction_vec.x * node_load)
-                        f.write(str(n) + ",1," + v1 + "\n")
+                        node_load_lines.append(str(n) + ",1," + v1 + "\n")
                     if (direction_vec.y != 0.0):
                         v2 = "{:.13E}".format(direction_vec.y * node_load)
-                        f.write(str(n) + ",2," + v2 + "\n")
+                        node_load_lines.append(str(n) + ",2," + v2 + "\n")
                     if (direction_vec.z != 0.0):
                         v3 = "{:.13E}".format(direction_vec.z * node_load)
-                        f.write(str(n) + ",3," + v3 + "\n")
+                        node_load_lines.append(str(n) + ",3," + v3 + "\n")
+                f.write("".join(node_load_lines))
                 f.write("\n")
             f.write("\n")
 
+    @profiling.profiled
     def write_constraints_pressure(self, f):
         # get the faces and face numbers
-        self.get_constraints_pressure_faces()
+        if self.constraint_sets_computed is False:
+            self.get_constraints_pressure_faces()
         # write face loads to file
         f.write("\n***********************************************************\n")
         f.write("** Element + CalculiX face + load in [MPa]\n")
@@ -1133,18 +1285,26 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                 # in depretiated method get_pressure_obj_faces_depreciated
                 # the face ids where per ref_shape
                 f.write("** " + ref_shape[0] + "\n")
+                # the lines of a ref_shape are written at once
+                pressure_lines = []
                 for face, fno in ref_shape[1]:
                     if fno > 0:  # solid mesh face
-                        f.write("{},P{},{}\n".format(face, fno, rev * prs_obj.Pressure))
+                        pressure_lines.append(
+                            "{},P{},{}\n".format(face, fno, rev * prs_obj.Pressure)
+                        )
                     # on shell mesh face: fno == 0
                     # normal of element face == face normal
                     elif fno == 0:
-                        f.write("{},P,{}\n".format(face, rev * prs_obj.Pressure))
+                        pressure_lines.append("{},P,{}\n".format(face, rev * prs_obj.Pressure))
                     # on shell mesh face: fno == -1
                     # normal of element face opposite direction face normal
                     elif fno == -1:
-                        f.write("{},P,{}\n".format(face, -1 * rev * prs_obj.Pressure))
+                        pressure_lines.append(
+                            "{},P,{}\n".format(face, -1 * rev * prs_obj.Pressure)
+                        )
+                f.write("".join(pressure_lines))
 
+    @profiling.profiled
     def write_constraints_temperature(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Fixed temperature constraint applied\n")
@@ -1165,6 +1325,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                 ))
                 f.write("\n")
 
+    @profiling.profiled
     def write_constraints_heatflux(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Heatflux constraints\n")
@@ -1204,6 +1365,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                                     heatflux_obj.DFlux * 0.001
                                 ))
 
+    @profiling.profiled
     def write_constraints_fluidsection(self, f):
         f.write("\n***********************************************************\n")
         f.write("** FluidSection constraints\n")
@@ -1218,7 +1380,8 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                 .format(self.fluid_inout_nodes_file)
             )
         # get nodes
-        self.get_constraints_fluidsection_nodes()
+        if self.constraint_sets_computed is False:
+            self.get_constraints_fluidsection_nodes()
         for femobj in self.fluidsection_objects:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             fluidsection_obj = femobj["Object"]
@@ -1283,6 +1446,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
                                         fluidsection_obj.OutletFlowRate * 0.001
                                     ))
 
+    @profiling.profiled
     def write_outputs_types(self, f):
         f.write("\n***********************************************************\n")
         f.write("** Outputs --> frd file\n")
@@ -1331,11 +1495,13 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             # f.write("*EL PRINT , ELSET=" + self.ccx_eall + "\n")
             # f.write("S \n")
 
+    @profiling.profiled
     def write_step_end(self, f):
         f.write("\n***********************************************************\n")
         f.write("** written by {} function\n".format(sys._getframe().f_code.co_name))
         f.write("*END STEP \n")
 
+    @profiling.profiled
     def write_footer(self, f):
         f.write("\n***********************************************************\n")
         f.write("** CalculiX Input file\n")
@@ -1657,6 +1823,31 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             self.ccx_elsets.append(ccx_elset)
 
 
+# bulk writing of the large data blocks (node sets, element sets, surfaces)
+# the lines are joined and written in chunks instead of one f.write() per line
+WRITE_CHUNK_SIZE = 100000
+
+
+def write_id_lines(f, ids):
+    # one id per line followed by a comma, as needed for *NSET and *ELSET
+    # same output as: for i in ids: f.write(str(i) + ",\n")
+    ids = list(ids)
+    for start in range(0, len(ids), WRITE_CHUNK_SIZE):
+        chunk = ids[start:start + WRITE_CHUNK_SIZE]
+        f.write(",\n".join(map(str, chunk)) + ",\n")
+
+
+def write_face_lines(f, faces, line_format):
+    # one line per element face [ele_id, face_number], line_format e.g. "{},S{}\n"
+    # same output as: for i in faces: f.write(line_format.format(i[0], i[1]))
+    # the line format is repeated for the whole chunk and formatted once,
+    # thus it may only have automatically numbered fields
+    for start in range(0, len(faces), WRITE_CHUNK_SIZE):
+        chunk = faces[start:start + WRITE_CHUNK_SIZE]
+        values = [value for face in chunk for value in face[:2]]
+        f.write((line_format * len(chunk)).format(*values))
+
+
 # Helpers
 # ccx elset names:
 # M .. Material
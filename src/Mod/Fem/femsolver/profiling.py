@@ -0,0 +1,148 @@
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+""" Record wall time, memory and item counts of the solver stages.
+
+A :class:`Profile` collects one record per stage of a solver run (check,
+prepare, solve, results) and per method of the input file writers. A record
+is a dictionary::
+
+    {
+        "Stage": "write_materials",
+        "Time": 0.012,
+        "PeakRSS": 312.5,
+        "Counts": {}
+    }
+
+"Time" is the wall time in seconds, "PeakRSS" is the peak resident set size
+of the FreeCAD process in MB after the stage (``None`` if it is not known on
+the platform). Item counts of the whole run (nodes, elements, constraint
+sets) are kept in :attr:`Profile.counts`. The profile of a solver run is part
+of its :class:`femsolver.report.Report` and it can be written as json file,
+see :func:`femsolver.settings.get_write_solver_profile`.
+"""
+
+__title__ = "FreeCAD FEM solver profiling"
+__author__ = "FreeCAD Developers"
+__url__ = "http://www.freecadweb.org"
+
+## \addtogroup FEM
+#  @{
+
+import functools
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+
+PROFILE_FILE_NAME = "solver_profile.json"
+
+
+def get_peak_rss():
+    """ Peak resident set size of the process in MB or ``None``."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # bytes on macOS, kilobytes on Linux
+        return peak / 1048576.0
+    return peak / 1024.0
+
+
+class Profile(object):
+    """ Records of the stages of a solver run, see module docstring."""
+
+    def __init__(self):
+        self.records = []
+        self.counts = {}
+
+    @contextmanager
+    def stage(self, name, **counts):
+        """ Record the wall time of the with block as stage *name*."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add(name, time.time() - start, counts)
+
+    def add(self, name, wall_time, counts=None):
+        self.records.append({
+            "Stage": name,
+            "Time": wall_time,
+            "PeakRSS": get_peak_rss(),
+            "Counts": counts or {},
+        })
+
+    def add_counts(self, **counts):
+        self.counts.update(counts)
+
+    def extend(self, profile):
+        self.records.extend(profile.records)
+        self.counts.update(profile.counts)
+
+    def to_dict(self):
+        return {"Counts": self.counts, "Stages": self.records}
+
+    def get_lines(self):
+        """ Human readable lines, one per stage and one for the counts."""
+        lines = []
+        for record in self.records:
+            line = "{}: {:.3f} s".format(record["Stage"], record["Time"])
+            if record["PeakRSS"] is not None:
+                line += ", peak RSS {:.1f} MB".format(record["PeakRSS"])
+            if record["Counts"]:
+                line += ", " + _format_counts(record["Counts"])
+            lines.append(line)
+        if self.counts:
+            lines.append("Counts: " + _format_counts(self.counts))
+        return lines
+
+    def write_json(self, file_name):
+        with open(file_name, "w") as profile_file:
+            json.dump(self.to_dict(), profile_file, indent=2, sort_keys=True)
+
+
+def profiled(method):
+    """ Decorator for methods of objects with a ``profile`` attribute.
+
+    The wall time of every call of the method is recorded as a stage named
+    after the method. Nothing is recorded if ``profile`` is ``None``.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profile = getattr(self, "profile", None)
+        if profile is None:
+            return method(self, *args, **kwargs)
+        with profile.stage(method.__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _format_counts(counts):
+    return ", ".join("{} {}".format(key, counts[key]) for key in sorted(counts))
+
+##  @}
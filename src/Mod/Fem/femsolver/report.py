@@ -27,6 +27,7 @@ __url__ = "http://www.freecadweb.org"
 #  @{
 
 import FreeCAD as App
+from . import profiling
 
 
 INFO = 10
@@ -58,6 +59,8 @@ def displayLog(report):
         App.Console.PrintWarning("%s\n" % w)
     for e in report.errors:
         App.Console.PrintError("%s\n" % e)
+    for t in report.profile.get_lines():
+        App.Console.PrintLog("%s\n" % t)
 
 
 class Report(object):
@@ -66,11 +69,13 @@ class Report(object):
         self.infos = []
         self.warnings = []
         self.errors = []
+        self.profile = profiling.Profile()
 
     def extend(self, report):
         self.infos.extend(report.infos)
         self.warnings.extend(report.warnings)
         self.errors.extend(report.errors)
+        self.profile.extend(report.profile)
 
     def getLevel(self):
         if self.errors:
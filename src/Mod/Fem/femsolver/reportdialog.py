@@ -32,6 +32,7 @@ from PySide import QtGui
 ERROR_COLOR = "red"
 WARNING_COLOR = "#ffaa00"
 INFO_COLOR = "blue"
+TIMING_COLOR = "gray"
 
 
 class ReportDialog(QtGui.QDialog):
@@ -65,6 +66,9 @@ class ReportDialog(QtGui.QDialog):
         for e in report.errors:
             line = "<b>Error:</b> %s" % e
             text += "%s<br>" % self._getColoredLine(line, ERROR_COLOR)
+        for t in report.profile.get_lines():
+            line = "<b>Timing:</b> %s" % t
+            text += "%s<br>" % self._getColoredLine(line, TIMING_COLOR)
         return text
 
     def _getColoredLine(self, text, color):
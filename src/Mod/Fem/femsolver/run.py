@@ -41,6 +41,7 @@ import tempfile
 
 import FreeCAD as App
 import femtools.femutils as femutils
+from . import profiling
 from . import settings
 from . import signal
 from . import task
@@ -60,6 +61,13 @@ DONE = 4
 _machines = {}
 _dirTypes = {}
 
+_STAGE_NAMES = {
+    CHECK: "check",
+    PREPARE: "prepare",
+    SOLVE: "solve",
+    RESULTS: "results",
+}
+
 
 def run_fem_solver(solver, working_dir=None):
     """ Execute *solver* of the solver framework.
@@ -108,6 +116,7 @@ def run_fem_solver(solver, working_dir=None):
                 fea.write_inp_file()
                 fea.ccx_run()
                 fea.load_results()
+                fea.write_profile_file()
             else:
                 App.Console.PrintError("Houston, we have a problem ...!\n{}\n".format(message))
     else:
@@ -285,6 +294,7 @@ class BaseTask(task.Thread):
         self.solver = None
         self.directory = None
         self.testmode = None
+        self.keepResults = None
 
     @property
     def analysis(self):
@@ -309,6 +319,8 @@ class Machine(BaseTask):
         self._pendingState = None
         self._isReset = False
         self.testmode = testmode
+        # None: the KeepResultsOnReRun preference decides
+        self.keepResults = None
 
     @property
     def state(self):
@@ -324,14 +336,17 @@ class Machine(BaseTask):
             and self._pendingState <= self.target
         ):
             task = self._getTask(self._pendingState)
-            self._runTask(task)
-            self.report.extend(task.report)
+            with self.report.profile.stage(_STAGE_NAMES[self._pendingState]):
+                self._runTask(task)
+                # the records of the task come before the record of its stage
+                self.report.extend(task.report)
             if task.failed:
                 self.fail()
             elif task.aborted:
                 self.abort()
             else:
                 self._pendingState += 1
+        self._writeProfile()
         self._applyPending()
 
     def reset(self, newState=CHECK):
@@ -354,6 +369,7 @@ class Machine(BaseTask):
             t.solver = self.solver
             t.directory = self.directory
             t.testmode = self.testmode
+            t.keepResults = self.keepResults
 
     def _applyPending(self):
         if not self._isReset:
@@ -376,6 +392,16 @@ class Machine(BaseTask):
         self.signalAbort.remove(killer)
         task.signalStatus.remove(statusProxy)
 
+    def _writeProfile(self):
+        if settings.get_write_solver_profile() and os.path.isdir(self.directory):
+            profile_file = os.path.join(self.directory, profiling.PROFILE_FILE_NAME)
+            try:
+                self.report.profile.write_json(profile_file)
+            except IOError as e:
+                App.Console.PrintWarning(
+                    "Solver profile {} could not be written: {}\n".format(profile_file, e)
+                )
+
     def _getTask(self, state):
         if state == CHECK:
             return self.check
@@ -450,7 +476,13 @@ class Prepare(BaseTask):
 
 
 class Results(BaseTask):
-    pass
+
+    def getKeepResults(self):
+        """ True if the results of former runs are kept, see Machine.keepResults."""
+        if self.keepResults is not None:
+            return self.keepResults
+        prefs = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+        return prefs.GetBool("KeepResultsOnReRun", False)
 
 
 class _DocObserver(object):
@@ -144,6 +144,70 @@ def get_dir_setting():
     return DirSetting.TEMPORARY
 
 
+def get_mesh_set_cache_setting():
+    """ Check whether the mesh sets of reference shapes should be cached.
+
+    Returns a tuple of two ``bool``. The first one is the value of
+    :term:`General/UseMeshSetCache`. If it is ``True`` the mesh nodes and
+    elements found for the reference shapes of the constraints are reused by
+    the input writer as long as mesh and reference shapes have not changed.
+    The second one is the value of :term:`General/SaveMeshSetCache`. If it is
+    ``True`` the cache is saved into the solver working directory too.
+    """
+    param_group = FreeCAD.ParamGet(_GENERAL_PARAM)
+    use_cache = param_group.GetBool("UseMeshSetCache", True)
+    save_cache = use_cache and param_group.GetBool("SaveMeshSetCache", False)
+    return use_cache, save_cache
+
+
+def get_binary_result_arrays():
+    """ Check whether node results are saved in binary format.
+
+    Returns the value of :term:`General/BinaryResultArrays`. If it is ``True``
+    the node results of mechanical result objects are saved as compressed
+    binary file into the FCStd file instead of text list properties, see
+    :mod:`femresult.resultstorage`.
+    """
+    param_group = FreeCAD.ParamGet(_GENERAL_PARAM)
+    return param_group.GetBool("BinaryResultArrays", False)
+
+
+def get_result_file_cache():
+    """ Check whether solver result files are cached in binary format.
+
+    Returns the value of :term:`General/UseResultFileCache`. If it is ``True``
+    the values of Z88 and CalculiX dat result files are saved as binary files
+    beside the result file on first read and mapped into memory on later
+    imports, see :mod:`feminout.resultfilecache`.
+    """
+    param_group = FreeCAD.ParamGet(_GENERAL_PARAM)
+    return param_group.GetBool("UseResultFileCache", False)
+
+
+def get_write_solver_profile():
+    """ Check whether the solver profile is written into the working directory.
+
+    Returns the value of :term:`General/WriteSolverProfile`. If it is ``True``
+    the wall time, peak memory and item counts of the stages of a solver run
+    are written as json file into the solver working directory, see
+    :mod:`femsolver.profiling`.
+    """
+    param_group = FreeCAD.ParamGet(_GENERAL_PARAM)
+    return param_group.GetBool("WriteSolverProfile", False)
+
+
+def get_parallel_constraint_sets():
+    """ Check whether the CalculiX input writer computes constraint sets in parallel.
+
+    Returns the value of :term:`Ccx/ParallelConstraintSets`. If it is ``True``
+    the node and face sets of all constraints are computed in worker processes
+    before the input file is written. The input file itself is the same. The
+    worker processes are only used in console mode and not on Windows.
+    """
+    param_group = FreeCAD.ParamGet(_PARAM_PATH + "Ccx")
+    return param_group.GetBool("ParallelConstraintSets", False)
+
+
 class _SolverDlg(object):
     """ Internal query logic for solver specific settings.
 
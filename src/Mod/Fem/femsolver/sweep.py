@@ -0,0 +1,283 @@
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+""" Run a solver for a batch of parameter variants of an analysis.
+
+A parameter sweep runs the :class:`femsolver.run.Machine` of a solver once
+for every variant of the analysis. A variant is a set of property overrides
+of document objects of the analysis (material values, loads, mesh size).
+The input files of the variants are written one after the other into their
+own directory, because this needs the document. The solver processes of the
+variants run concurrently, at most *max_workers* at the same time. At the end
+the results of the variants are loaded into result objects one after the
+other and a summary table is returned. Nothing in here needs the Gui.
+
+A variant is a dictionary::
+
+    {
+        "Name": "E_210000",
+        "Overrides": {
+            "MaterialSolid.Material.YoungsModulus": "210000 MPa",
+            "ConstraintForce.Force": 1000.0,
+            "FEMMeshGmsh.CharacteristicLengthMax": "5 mm",
+        }
+    }
+
+The keys of the overrides are the object name and the property name. For
+dictionary properties like the Material of a material object the key inside
+the dictionary is added. If a property of a Gmsh mesh object is overridden
+the mesh is recomputed with Gmsh for this variant. After the input file of a
+variant is written all overridden values and the mesh are restored.
+"""
+
+__title__ = "FreeCAD FEM solver parameter sweep"
+__author__ = "FreeCAD Developers"
+__url__ = "http://www.freecadweb.org"
+
+## \addtogroup FEM
+#  @{
+
+import os
+
+import FreeCAD
+import femtools.femutils as femutils
+from . import run
+
+
+def run_parameter_sweep(
+    solver,
+    variants,
+    working_dir,
+    max_workers=None,
+    load_results=True
+):
+    """ Run *solver* for every variant of *variants*, return a summary table.
+
+    :param solver:
+        A framework compliant solver document object, see
+        :func:`femsolver.run.run_fem_solver`.
+
+    :param variants:
+        A list of variant dictionaries, see module docstring.
+
+    :param working_dir:
+        Existing directory. Every variant gets a sub directory named
+        after the variant.
+
+    :param max_workers:
+        Maximum number of solver processes running at the same time. If
+        ``None`` the number of CPUs is used.
+
+    :param load_results:
+        If ``True`` the results of every variant are loaded into result
+        objects of the analysis. Their labels are prefixed with the variant
+        name. If ``False`` only the solver runs.
+
+    :returns:
+        A list with one dictionary per variant with the keys "Name",
+        "Directory", "Overrides", "Failed", "Time" and "Results". "Results"
+        is a list of tuples (result object name, Stats property) of the
+        loaded result objects.
+    """
+    if not os.path.isdir(working_dir):
+        raise femutils.DirectoryDoesNotExistError("Invalid path")
+    if max_workers is None:
+        max_workers = _get_cpu_count()
+    analysis = femutils.findAnalysisOfMember(solver)
+    doc = solver.Document
+
+    # write the input files, one variant after the other
+    machines = []
+    sweep_table = []
+    for i, variant in enumerate(variants):
+        name = variant.get("Name", "Variant_{:03d}".format(i + 1))
+        overrides = variant.get("Overrides", {})
+        directory = os.path.join(working_dir, name)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        FreeCAD.Console.PrintMessage(
+            "Parameter sweep: prepare {} in {}\n".format(name, directory)
+        )
+        machine = solver.Proxy.createMachine(solver, directory, testmode=False)
+        # the results of the former variants should not be purged
+        machine.keepResults = True
+        restore = apply_overrides(doc, overrides)
+        try:
+            machine.target = run.PREPARE
+            machine.start()
+            machine.join()
+        finally:
+            restore_overrides(doc, restore)
+        machines.append(machine)
+        sweep_table.append({
+            "Name": name,
+            "Directory": directory,
+            "Overrides": overrides,
+            "Failed": machine.failed,
+            "Time": None,
+            "Results": [],
+        })
+
+    # run the solver processes concurrently
+    def solve(machine):
+        if not machine.failed:
+            machine.target = run.SOLVE
+            machine.start()
+            machine.join()
+        return machine
+    _run_concurrently(solve, machines, max_workers)
+    for machine, row in zip(machines, sweep_table):
+        row["Failed"] = machine.failed
+        row["Time"] = machine.time
+
+    # load the results, one variant after the other
+    if load_results:
+        for machine, row in zip(machines, sweep_table):
+            if machine.failed:
+                continue
+            old_results = femutils.get_member(analysis, "Fem::FemResultObject")
+            machine.target = run.RESULTS
+            machine.start()
+            machine.join()
+            row["Failed"] = machine.failed
+            for res_obj in femutils.get_member(analysis, "Fem::FemResultObject"):
+                if res_obj not in old_results:
+                    res_obj.Label = row["Name"] + "_" + res_obj.Label
+                    row["Results"].append((res_obj.Name, tuple(res_obj.Stats)))
+        doc.recompute()
+
+    for row in sweep_table:
+        FreeCAD.Console.PrintMessage(
+            "Parameter sweep: {} {}\n"
+            .format(row["Name"], "failed" if row["Failed"] else "finished")
+        )
+    return sweep_table
+
+
+def write_sweep_table(
+    sweep_table,
+    file_name
+):
+    """ Write the summary table of :func:`run_parameter_sweep` as csv file.
+
+    One line per result object, the overrides and the Stats of the result
+    object are written as columns.
+    """
+    import csv
+    override_keys = []
+    for row in sweep_table:
+        for key in row["Overrides"]:
+            if key not in override_keys:
+                override_keys.append(key)
+    stats_count = 0
+    for row in sweep_table:
+        for res_name, stats in row["Results"]:
+            stats_count = max(stats_count, len(stats))
+    with open(file_name, "w") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(
+            ["Name", "Failed", "Time"]
+            + override_keys
+            + ["Result"]
+            + ["Stats{}".format(i) for i in range(stats_count)]
+        )
+        for row in sweep_table:
+            row_start = [row["Name"], row["Failed"], row["Time"]]
+            row_start += [row["Overrides"].get(key, "") for key in override_keys]
+            if not row["Results"]:
+                writer.writerow(row_start)
+            for res_name, stats in row["Results"]:
+                writer.writerow(row_start + [res_name] + list(stats))
+
+
+def apply_overrides(
+    doc,
+    overrides
+):
+    """ Set the property overrides of a variant in document *doc*.
+
+    Returns the list of the old values which is needed by
+    :func:`restore_overrides`.
+    """
+    restore = []
+    remesh = []
+    for key, value in overrides.items():
+        obj_name, prop = key.split(".", 1)
+        obj = doc.getObject(obj_name)
+        if obj is None:
+            raise ValueError("Parameter sweep: object {} not found.".format(obj_name))
+        if "." in prop:
+            # a key of a dictionary property, e.g. Material.YoungsModulus
+            prop, dict_key = prop.split(".", 1)
+            old_value = getattr(obj, prop)
+            new_value = dict(old_value)
+            new_value[dict_key] = value
+        else:
+            old_value = getattr(obj, prop)
+            new_value = value
+        restore.append((obj, prop, old_value))
+        setattr(obj, prop, new_value)
+        if femutils.is_of_type(obj, "Fem::FemMeshGmsh") and obj not in remesh:
+            remesh.append(obj)
+    for mesh_obj in remesh:
+        # the FemMesh is restored too
+        restore.append((mesh_obj, "FemMesh", mesh_obj.FemMesh.copy()))
+        from femmesh import gmshtools
+        error = gmshtools.GmshTools(mesh_obj).create_mesh()
+        if error:
+            FreeCAD.Console.PrintError(
+                "Parameter sweep: remeshing {} failed: {}\n".format(mesh_obj.Name, error)
+            )
+    doc.recompute()
+    return restore
+
+
+def restore_overrides(
+    doc,
+    restore
+):
+    """ Restore the old values returned by :func:`apply_overrides`."""
+    for obj, prop, old_value in reversed(restore):
+        setattr(obj, prop, old_value)
+    doc.recompute()
+
+
+def _run_concurrently(
+    function,
+    items,
+    max_workers
+):
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:
+        # Python 2 without the futures backport
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(executor.map(function, items))
+
+
+def _get_cpu_count():
+    try:
+        from multiprocessing import cpu_count
+        return cpu_count()
+    except NotImplementedError:
+        return 1
+
+##  @}
@@ -29,7 +29,10 @@ __url__ = "http://www.freecadweb.org"
 import os
 
 import FreeCAD
+from femmesh import meshsetcache
 from femmesh import meshtools
+from femsolver import profiling
+from femsolver import settings
 from femtools.femutils import type_of_obj
 
 
@@ -122,6 +125,61 @@ class FemInputWriter():
         self.femelement_faces_table = {}
         self.femelement_edges_table = {}
         self.femelement_count_test = True
+        self.mesh_set_cache = None
+        self.use_mesh_set_cache, self.save_mesh_set_cache = settings.get_mesh_set_cache_setting()
+        # wall time and memory of the writer methods, see femsolver.profiling
+        self.profile = profiling.Profile()
+
+    def get_mesh_set_cache(self):
+        # the mesh sets of the reference shapes are cached across the solver runs
+        # None is returned if the cache is not used
+        if self.use_mesh_set_cache and self.mesh_set_cache is None:
+            if not self.femnodes_mesh:
+                self.femnodes_mesh = self.femmesh.Nodes
+            self.mesh_set_cache = meshsetcache.get_mesh_set_cache(
+                self.femmesh,
+                self.femnodes_mesh,
+                self.dir_name if self.save_mesh_set_cache else None
+            )
+        return self.mesh_set_cache
+
+    def save_mesh_set_cache_file(self):
+        if self.mesh_set_cache is not None:
+            FreeCAD.Console.PrintLog(
+                "Mesh set cache: {} hits, {} misses\n"
+                .format(self.mesh_set_cache.hits, self.mesh_set_cache.misses)
+            )
+            self.mesh_set_cache.save()
+
+    def add_profile_counts(self):
+        # item counts of the mesh and of the constraint sets for the profile
+        constraint_sets = 0
+        constraint_set_nodes = 0
+        for femobjs in (
+            self.fixed_objects,
+            self.displacement_objects,
+            self.contact_objects,
+            self.planerotation_objects,
+            self.transform_objects,
+            self.force_objects,
+            self.pressure_objects,
+            self.temperature_objects,
+            self.fluidsection_objects,
+        ):
+            for femobj in femobjs:
+                if any(key in femobj for key in (
+                    "Nodes", "NodeLoadTable", "PressureFaces", "ContactSlaveFaces"
+                )):
+                    constraint_sets += 1
+                constraint_set_nodes += len(femobj.get("Nodes", ()))
+        self.profile.add_counts(
+            Nodes=self.femmesh.NodeCount,
+            Volumes=self.femmesh.VolumeCount,
+            Faces=self.femmesh.FaceCount,
+            Edges=self.femmesh.EdgeCount,
+            ConstraintSets=constraint_sets,
+            ConstraintSetNodes=constraint_set_nodes
+        )
 
     # use set for node sets to be sure all nodes are unique
     # use sorted to be sure the order is the same on different runs
@@ -129,6 +187,7 @@ class FemInputWriter():
     #     - done in return value of meshtools.get_femnodes_by_femobj_with_references
     # might be appropriate for element sets too
 
+    @profiling.profiled
     def get_constraints_fixed_nodes(self):
         # get nodes
         for femobj in self.fixed_objects:
@@ -136,7 +195,8 @@ class FemInputWriter():
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
                 self.femmesh,
-                femobj
+                femobj,
+                self.get_mesh_set_cache()
             )
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
@@ -166,6 +226,7 @@ class FemInputWriter():
                 femobj["NodesSolid"] = set(nds_solid)
                 femobj["NodesFaceEdge"] = set(nds_faceedge)
 
+    @profiling.profiled
     def get_constraints_displacement_nodes(self):
         # get nodes
         for femobj in self.displacement_objects:
@@ -173,12 +234,14 @@ class FemInputWriter():
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
                 self.femmesh,
-                femobj
+                femobj,
+                self.get_mesh_set_cache()
             )
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
 
+    @profiling.profiled
     def get_constraints_planerotation_nodes(self):
         # get nodes
         for femobj in self.planerotation_objects:
@@ -186,9 +249,11 @@ class FemInputWriter():
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
                 self.femmesh,
-                femobj
+                femobj,
+                self.get_mesh_set_cache()
             )
 
+    @profiling.profiled
     def get_constraints_transform_nodes(self):
         # get nodes
         for femobj in self.transform_objects:
@@ -196,9 +261,11 @@ class FemInputWriter():
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
                 self.femmesh,
-                femobj
+                femobj,
+                self.get_mesh_set_cache()
             )
 
+    @profiling.profiled
     def get_constraints_temperature_nodes(self):
         # get nodes
         for femobj in self.temperature_objects:
@@ -206,9 +273,11 @@ class FemInputWriter():
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
                 self.femmesh,
-                femobj
+                femobj,
+                self.get_mesh_set_cache()
             )
 
+    @profiling.profiled
     def get_constraints_fluidsection_nodes(self):
         # get nodes
         for femobj in self.fluidsection_objects:
@@ -216,9 +285,11 @@ class FemInputWriter():
             print_obj_info(femobj["Object"])
             femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
                 self.femmesh,
-                femobj
+                femobj,
+                self.get_mesh_set_cache()
             )
 
+    @profiling.profiled
     def get_constraints_force_nodeloads(self):
         # check shape type of reference shape
         for femobj in self.force_objects:
@@ -267,21 +338,25 @@ class FemInputWriter():
             if femobj["RefShapeType"] == "Vertex":  # point load on vertices
                 femobj["NodeLoadTable"] = meshtools.get_force_obj_vertex_nodeload_table(
                     self.femmesh,
-                    frc_obj
+                    frc_obj,
+                    self.get_mesh_set_cache()
                 )
             elif femobj["RefShapeType"] == "Edge":  # line load on edges
                 femobj["NodeLoadTable"] = meshtools.get_force_obj_edge_nodeload_table(
                     self.femmesh,
                     self.femelement_table,
-                    self.femnodes_mesh, frc_obj
+                    self.femnodes_mesh, frc_obj,
+                    self.get_mesh_set_cache()
                 )
             elif femobj["RefShapeType"] == "Face":  # area load on faces
                 femobj["NodeLoadTable"] = meshtools.get_force_obj_face_nodeload_table(
                     self.femmesh,
                     self.femelement_table,
-                    self.femnodes_mesh, frc_obj
+                    self.femnodes_mesh, frc_obj,
+                    self.get_mesh_set_cache()
                 )
 
+    @profiling.profiled
     def get_constraints_pressure_faces(self):
         # TODO see comments in get_constraints_force_nodeloads()
         # it applies here too. Mhh it applies to all constraints ...
@@ -303,8 +378,7 @@ class FemInputWriter():
         if not self.femelement_table:
             self.femelement_table = meshtools.get_femelement_table(self.femmesh)
         if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh,
+            self.femnodes_ele_table = meshtools.get_femnodes_ele_incidence(
                 self.femelement_table
             )
 
@@ -314,7 +388,8 @@ class FemInputWriter():
             pressure_faces = meshtools.get_pressure_obj_faces(
                 self.femmesh,
                 self.femelement_table,
-                self.femnodes_ele_table, femobj
+                self.femnodes_ele_table, femobj,
+                self.get_mesh_set_cache()
             )
             # the data model is for compatibility reason with depreciated version
             # get_pressure_obj_faces_depreciated returns the face ids in a tuple per ref_shape
@@ -324,14 +399,14 @@ class FemInputWriter():
             femobj["PressureFaces"] = [(some_string, pressure_faces)]
             FreeCAD.Console.PrintLog("{}\n".format(femobj["PressureFaces"]))
 
+    @profiling.profiled
     def get_constraints_contact_faces(self):
         if not self.femnodes_mesh:
             self.femnodes_mesh = self.femmesh.Nodes
         if not self.femelement_table:
             self.femelement_table = meshtools.get_femelement_table(self.femmesh)
         if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh,
+            self.femnodes_ele_table = meshtools.get_femnodes_ele_incidence(
                 self.femelement_table
             )
 
@@ -341,7 +416,8 @@ class FemInputWriter():
             contact_slave_faces, contact_master_faces = meshtools.get_contact_obj_faces(
                 self.femmesh,
                 self.femelement_table,
-                self.femnodes_ele_table, femobj
+                self.femnodes_ele_table, femobj,
+                self.get_mesh_set_cache()
             )
             # [ele_id, ele_face_id], [ele_id, ele_face_id], ...]
             # whereas the ele_face_id might be ccx specific
@@ -350,6 +426,7 @@ class FemInputWriter():
             # FreeCAD.Console.PrintLog("{}\n".format(femobj["ContactSlaveFaces"]))
             # FreeCAD.Console.PrintLog("{}\n".format(femobj["ContactMasterFaces"]))
 
+    @profiling.profiled
     def get_element_geometry2D_elements(self):
         # get element ids and write them into the objects
         FreeCAD.Console.PrintMessage("Shell thicknesses\n")
@@ -360,9 +437,11 @@ class FemInputWriter():
         meshtools.get_femelement_sets(
             self.femmesh,
             self.femelement_faces_table,
-            self.shellthickness_objects
+            self.shellthickness_objects,
+            mesh_set_cache=self.get_mesh_set_cache()
         )
 
+    @profiling.profiled
     def get_element_geometry1D_elements(self):
         # get element ids and write them into the objects
         FreeCAD.Console.PrintMessage("Beam sections\n")
@@ -373,9 +452,11 @@ class FemInputWriter():
         meshtools.get_femelement_sets(
             self.femmesh,
             self.femelement_edges_table,
-            self.beamsection_objects
+            self.beamsection_objects,
+            mesh_set_cache=self.get_mesh_set_cache()
         )
 
+    @profiling.profiled
     def get_element_rotation1D_elements(self):
         # get for each geometry edge direction the element ids and rotation norma
         FreeCAD.Console.PrintMessage("Beam rotations\n")
@@ -390,6 +471,7 @@ class FemInputWriter():
             self.theshape
         )
 
+    @profiling.profiled
     def get_element_fluid1D_elements(self):
         # get element ids and write them into the objects
         FreeCAD.Console.PrintMessage("Fluid sections\n")
@@ -400,9 +482,11 @@ class FemInputWriter():
         meshtools.get_femelement_sets(
             self.femmesh,
             self.femelement_edges_table,
-            self.fluidsection_objects
+            self.fluidsection_objects,
+            mesh_set_cache=self.get_mesh_set_cache()
         )
 
+    @profiling.profiled
     def get_material_elements(self):
         # it only works if either Volumes or Shellthicknesses or Beamsections
         # are in the material objects, it means it does not work
@@ -432,15 +516,15 @@ class FemInputWriter():
                 if not self.femnodes_mesh:
                     self.femnodes_mesh = self.femmesh.Nodes
                 if not self.femnodes_ele_table:
-                    self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                        self.femnodes_mesh,
+                    self.femnodes_ele_table = meshtools.get_femnodes_ele_incidence(
                         self.femelement_table
                     )
                 control = meshtools.get_femelement_sets(
                     self.femmesh,
                     self.femelement_table,
                     self.material_objects,
-                    self.femnodes_ele_table
+                    self.femnodes_ele_table,
+                    self.get_mesh_set_cache()
                 )
                 # we only need to set it, if it is still True
                 if (self.femelement_count_test is True) and (control is False):
@@ -453,7 +537,8 @@ class FemInputWriter():
             meshtools.get_femelement_sets(
                 self.femmesh,
                 self.femelement_faces_table,
-                self.material_objects
+                self.material_objects,
+                mesh_set_cache=self.get_mesh_set_cache()
             )
         if self.beamsection_objects or self.fluidsection_objects:
             if not self.femelement_edges_table:
@@ -463,7 +548,8 @@ class FemInputWriter():
             meshtools.get_femelement_sets(
                 self.femmesh,
                 self.femelement_edges_table,
-                self.material_objects
+                self.material_objects,
+                mesh_set_cache=self.get_mesh_set_cache()
             )
 
 
@@ -79,6 +79,7 @@ class Prepare(run.Prepare):
             self.directory
         )
         path = w.write_z88_input()
+        self.report.profile.extend(w.profile)
         # report to user if task succeeded
         if path is not None:
             self.pushStatus("Write completed!")
@@ -125,9 +126,7 @@ class Solve(run.Solve):
 class Results(run.Results):
 
     def run(self):
-        prefs = FreeCAD.ParamGet(
-            "User parameter:BaseApp/Preferences/Mod/Fem/General")
-        if not prefs.GetBool("KeepResultsOnReRun", False):
+        if not self.getKeepResults():
             self.purge_results()
         self.load_results_z88o2()
 
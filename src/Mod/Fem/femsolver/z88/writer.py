@@ -30,6 +30,7 @@ import FreeCAD
 import time
 import femmesh.meshtools as FemMeshTools
 import feminout.importZ88Mesh as importZ88Mesh
+from .. import profiling
 from .. import writerbase as FemInputWriter
 
 
@@ -91,6 +92,7 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
             "FemInputWriterZ88 --> self.file_name  -->  " + self.file_name + "\n"
         )
 
+    @profiling.profiled
     def write_z88_input(self):
         timestart = time.process_time()
         if not self.femnodes_mesh:
@@ -107,6 +109,8 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
         self.write_z88_integration_properties()
         self.write_z88_memory_parameter()
         self.write_z88_solver_parameter()
+        self.save_mesh_set_cache_file()
+        self.add_profile_counts()
         writing_time_string = (
             "Writing time input file: {} seconds"
             .format(round((time.process_time() - timestart), 2))
@@ -136,6 +140,7 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
         FreeCAD.Console.PrintMessage(self.z88_elparam)
         FreeCAD.Console.PrintMessage("\n")
 
+    @profiling.profiled
     def write_z88_mesh(self):
         mesh_file_path = self.file_name + "i1.txt"
         f = open(mesh_file_path, "w")
@@ -147,6 +152,7 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
         )
         f.close()
 
+    @profiling.profiled
     def write_z88_contraints(self):
         constraints_data = []  # will be a list of tuple for better sorting
 
@@ -189,6 +195,7 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
             f.write(c[1])
         f.close()
 
+    @profiling.profiled
     def write_z88_face_loads(self):
         # not yet supported
         face_load_file_path = self.file_name + "i5.txt"
@@ -197,6 +204,7 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
         f.write("\n")
         f.close()
 
+    @profiling.profiled
     def write_z88_materials(self):
         if len(self.material_objects) == 1:
             material_data_file_name = "51.txt"
@@ -218,6 +226,7 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
         else:
             FreeCAD.Console.PrintError("Multiple Materials for Z88 not yet supported!\n")
 
+    @profiling.profiled
     def write_z88_elements_properties(self):
         element_properties_file_path = self.file_name + "elp.txt"
         elements_data = []
@@ -257,6 +266,7 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
         f.write("\n")
         f.close()
 
+    @profiling.profiled
     def write_z88_integration_properties(self):
         integration_data = []
         integration_data.append("1 {} {} {}".format(
@@ -272,6 +282,7 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
         f.write("\n")
         f.close()
 
+    @profiling.profiled
     def write_z88_solver_parameter(self):
         global z88_man_template
         z88_man_template = z88_man_template.replace(
@@ -285,6 +296,7 @@ class FemInputWriterZ88(FemInputWriter.FemInputWriter):
         f.write(z88_man_template)
         f.close()
 
+    @profiling.profiled
     def write_z88_memory_parameter(self):
         # self.z88_param_maxgs = 6000000
         self.z88_param_maxgs = 50000000  # vierkantrohr
@@ -132,6 +132,66 @@ class TestCcxTools(unittest.TestCase):
             res_obj_name=res_obj_name,
         )
 
+    # ********************************************************************************************
+    def test_static_parallel_constraint_sets(
+        self
+    ):
+        # set up
+        from femexamples.boxanalysis import setup_static as setup
+        setup(self.active_doc, "ccxtools")
+        test_name = "ccxtools static parallel constraint sets"
+        base_name = "cube_static"
+        analysis_dir = testtools.get_unit_test_tmp_dir(
+            self.temp_dir,
+            "FEM_ccx_static_parallel"
+        )
+
+        # the input file has to be the same as the one written sequential
+        ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+        parallel_constraint_sets = ccx_prefs.GetBool("ParallelConstraintSets", False)
+        ccx_prefs.SetBool("ParallelConstraintSets", True)
+        try:
+            self.input_file_writing_test(
+                test_name=test_name,
+                base_name=base_name,
+                analysis_dir=analysis_dir,
+                test_end=True,
+            )
+        finally:
+            ccx_prefs.SetBool("ParallelConstraintSets", parallel_constraint_sets)
+
+    # ********************************************************************************************
+    def test_write_bulk_lines(
+        self
+    ):
+        # the bulk written node sets, element sets and surfaces have to be
+        # byte for byte the same as the ones written line by line
+        # a small chunk size to test empty, full and not full last chunks
+        # the timing over a large number of ids is in femtest.benchmark.bulk_writing
+        import io
+        from femsolver.calculix import writer
+        chunk_size = writer.WRITE_CHUNK_SIZE
+        writer.WRITE_CHUNK_SIZE = 3
+        try:
+            for count in range(8):
+                ids = list(range(1, count + 1))
+                faces = [[ele_id, ele_id % 4 + 1] for ele_id in ids]
+                line_file = io.StringIO()
+                for i in ids:
+                    line_file.write(str(i) + ",\n")
+                for i in faces:
+                    line_file.write("{},S{}\n".format(i[0], i[1]))
+                bulk_file = io.StringIO()
+                writer.write_id_lines(bulk_file, ids)
+                writer.write_face_lines(bulk_file, faces, "{},S{}\n")
+                self.assertEqual(
+                    bulk_file.getvalue(),
+                    line_file.getvalue(),
+                    "Bulk written {} ids and faces are unexpected".format(count)
+                )
+        finally:
+            writer.WRITE_CHUNK_SIZE = chunk_size
+
     # ********************************************************************************************
     def test_static_constraint_contact_shell_shell(
         self
@@ -96,6 +96,7 @@ class TestFemCommon(unittest.TestCase):
         pymodules += testtools.collect_python_modules("femobjects")
         pymodules += testtools.collect_python_modules("femresult")
         pymodules += testtools.collect_python_modules("femtest")
+        pymodules += testtools.collect_python_modules("femtest/benchmark")
         pymodules += testtools.collect_python_modules("femtools")
         pymodules += testtools.collect_python_modules("femsolver")
         # TODO test with join on Windows, the use of os.path.join
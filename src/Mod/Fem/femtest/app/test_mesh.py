@@ -212,6 +212,438 @@ class TestMeshCommon(unittest.TestCase):
             )
         )
 
+    # ********************************************************************************************
+    def test_femnodes_ele_incidence(
+        self
+    ):
+        from femmesh import meshtools
+        # two tetra4 sharing the face 2, 3, 4 and a hexa8
+        femelement_table = {
+            1: (1, 2, 3, 4),
+            2: (5, 2, 3, 4),
+            3: (11, 12, 13, 14, 15, 16, 17, 18),
+        }
+        femnodes_mesh = {n: None for n in (1, 2, 3, 4, 5, 11, 12, 13, 14, 15, 16, 17, 18)}
+        femnodes_ele_table = meshtools.get_femnodes_ele_table(femnodes_mesh, femelement_table)
+        incidence = meshtools.get_femnodes_ele_incidence(femelement_table)
+        self.assertIs(
+            incidence,
+            meshtools.get_femnodes_ele_incidence(femelement_table),
+            "FemNodesEleIncidence was not taken from the cache"
+        )
+        for node_set in (
+            {2, 3, 4},
+            {1, 2, 3, 4, 5},
+            {11, 12, 13, 14, 15, 16},
+            {11, 12, 13, 14, 15, 16, 17, 18},
+        ):
+            bit_pattern_dict = meshtools.get_bit_pattern_dict(
+                femelement_table,
+                femnodes_ele_table,
+                node_set
+            )
+            self.assertEqual(
+                meshtools.get_ccxelement_faces_by_femnodes(
+                    femelement_table,
+                    incidence,
+                    node_set
+                ),
+                meshtools.get_ccxelement_faces_from_binary_search(bit_pattern_dict),
+                "Faces found by FemNodesEleIncidence are unexpected"
+            )
+            self.assertEqual(
+                meshtools.get_femelements_by_femnodes_bin(
+                    femelement_table,
+                    incidence,
+                    list(node_set)
+                ),
+                meshtools.get_femelements_by_femnodes_bin(
+                    femelement_table,
+                    femnodes_ele_table,
+                    list(node_set)
+                ),
+                "Volumes found by FemNodesEleIncidence are unexpected"
+            )
+
+    # ********************************************************************************************
+    def test_mesh_set_cache(
+        self
+    ):
+        from femmesh import meshsetcache
+        tetra4 = Fem.FemMesh()
+        tetra4.addNode(0, 0, 0, 1)
+        tetra4.addNode(1, 0, 0, 2)
+        tetra4.addNode(0, 1, 0, 3)
+        tetra4.addNode(0, 0, 1, 4)
+        tetra4.addVolume([1, 2, 3, 4], 1)
+        moved_tetra4 = Fem.FemMesh()
+        moved_tetra4.addNode(0, 0, 0, 1)
+        moved_tetra4.addNode(2, 0, 0, 2)
+        moved_tetra4.addNode(0, 1, 0, 3)
+        moved_tetra4.addNode(0, 0, 1, 4)
+        moved_tetra4.addVolume([1, 2, 3, 4], 1)
+        mesh_hash = meshsetcache.get_mesh_hash(tetra4)
+        self.assertEqual(
+            mesh_hash,
+            meshsetcache.get_mesh_hash(tetra4.copy()),
+            "Mesh hash of a copy of the mesh is unexpected"
+        )
+        self.assertNotEqual(
+            mesh_hash,
+            meshsetcache.get_mesh_hash(moved_tetra4),
+            "Mesh hash of the mesh with a moved node is unexpected"
+        )
+
+        cache_file = join(testtools.get_fem_test_tmp_dir(), meshsetcache.CACHE_FILE_NAME)
+        mesh_set_cache = meshsetcache.MeshSetCache(mesh_hash)
+        mesh_set_cache.set("Nodes", "shape_hash", [1, 2, 3])
+        mesh_set_cache.file_name = cache_file
+        mesh_set_cache.save()
+        self.assertEqual(
+            meshsetcache.MeshSetCache(mesh_hash, cache_file).get("Nodes", "shape_hash"),
+            [1, 2, 3],
+            "Nodes from the mesh set cache file are unexpected"
+        )
+        self.assertIsNone(
+            meshsetcache.MeshSetCache(
+                meshsetcache.get_mesh_hash(moved_tetra4),
+                cache_file
+            ).get("Nodes", "shape_hash"),
+            "Mesh set cache file was used for another mesh"
+        )
+
+    # ********************************************************************************************
+    def test_femmesh_2_mesh(
+        self
+    ):
+        from femmesh import femmesh2mesh
+        # two tetra4 sharing the face 2, 3, 4
+        two_tetra4 = Fem.FemMesh()
+        two_tetra4.addNode(0, 0, 0, 1)
+        two_tetra4.addNode(1, 0, 0, 2)
+        two_tetra4.addNode(0, 1, 0, 3)
+        two_tetra4.addNode(0, 0, 1, 4)
+        two_tetra4.addNode(1, 1, 1, 5)
+        two_tetra4.addVolume([1, 2, 3, 4], 1)
+        two_tetra4.addVolume([5, 2, 4, 3], 2)
+        points, triangles = femmesh2mesh.femmesh_2_mesh_arrays(two_tetra4)
+        self.assertEqual(
+            len(triangles),
+            6,
+            "Count of surface triangles of two tetra4 is unexpected"
+        )
+        # the points are in the order of the nodes of the mesh
+        node_ids = list(two_tetra4.Nodes.keys())
+        self.assertNotIn(
+            [2, 3, 4],
+            [sorted(node_ids[i] for i in tri) for tri in triangles.tolist()],
+            "The inner face of two tetra4 was found as surface face"
+        )
+
+        # one hexa8, every face is split into two triangles
+        hexa8 = Fem.FemMesh()
+        for i, (x, y, z) in enumerate((
+            (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+            (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+        )):
+            hexa8.addNode(x, y, z, i + 1)
+        hexa8.addVolume([1, 2, 3, 4, 5, 6, 7, 8], 1)
+        out_mesh = femmesh2mesh.femmesh_2_mesh(hexa8)
+        self.assertEqual(
+            len(out_mesh),
+            36,
+            "Count of surface triangle points of one hexa8 is unexpected"
+        )
+
+    # ********************************************************************************************
+    def test_gmsh_mesh_input_hash(
+        self
+    ):
+        # Gmsh is not run, only the input files are written
+        import ObjectsFem
+        from femmesh.gmshtools import GmshTools
+        box = self.active_doc.addObject("Part::Box", "Box")
+        mesh_obj = ObjectsFem.makeMeshGmsh(self.active_doc)
+        mesh_obj.Part = box
+        self.active_doc.recompute()
+
+        def get_input_hash(working_dir):
+            gmsh_tools = GmshTools(mesh_obj)
+            gmsh_tools.update_mesh_data()
+            gmsh_tools.get_tmp_file_paths(working_dir, create=True)
+            gmsh_tools.write_gmsh_input_files()
+            return gmsh_tools.get_mesh_input_hash()
+
+        base_dir = testtools.get_fem_test_tmp_dir()
+        input_hash = get_input_hash(join(base_dir, "gmsh_input_hash_1"))
+        self.assertEqual(
+            input_hash,
+            get_input_hash(join(base_dir, "gmsh_input_hash_2")),
+            "Gmsh input hash in another working directory is unexpected"
+        )
+        mesh_obj.CharacteristicLengthMax = "2 mm"
+        self.assertNotEqual(
+            input_hash,
+            get_input_hash(join(base_dir, "gmsh_input_hash_2")),
+            "Gmsh input hash with another CharacteristicLengthMax is unexpected"
+        )
+
+    # ********************************************************************************************
+    def test_gmsh_reuse_mesh(
+        self
+    ):
+        # Gmsh is not run, the mesh files are written by the test
+        import ObjectsFem
+        from femmesh.gmshtools import GmshTools
+        box = self.active_doc.addObject("Part::Box", "Box")
+        mesh_obj = ObjectsFem.makeMeshGmsh(self.active_doc)
+        mesh_obj.Part = box
+        self.active_doc.recompute()
+        import shutil
+        working_dir = join(testtools.get_fem_test_tmp_dir(), "gmsh_reuse_mesh")
+        shutil.rmtree(working_dir, ignore_errors=True)
+
+        def run(max_length):
+            # like GmshTools.create_mesh(), the mesh file holds the max length
+            mesh_obj.CharacteristicLengthMax = max_length
+            gmsh_tools = GmshTools(mesh_obj)
+            gmsh_tools.update_mesh_data()
+            gmsh_tools.get_tmp_file_paths(working_dir, create=True)
+            gmsh_tools.write_gmsh_input_files()
+            if gmsh_tools.reuse_mesh():
+                with open(gmsh_tools.temp_file_mesh, "r") as f:
+                    return f.read()
+            gmsh_tools.remove_mesh_input_hash()
+            with open(gmsh_tools.temp_file_mesh, "w") as f:
+                f.write(max_length)
+            gmsh_tools.save_mesh_input_hash()
+            return None
+
+        self.assertIsNone(run("1 mm"), "Mesh reused on the first run")
+        self.assertEqual(run("1 mm"), "1 mm", "Mesh not reused on the same input")
+        self.assertIsNone(run("2 mm"), "Mesh reused on another input")
+        # the mesh file of 1 mm has been overwritten by the one of 2 mm
+        self.assertIsNone(run("1 mm"), "Overwritten mesh reused")
+
+    # ********************************************************************************************
+    def test_read_inp_fast(
+        self
+    ):
+        # the fast inp reader should read the same mesh as the standard inp reader
+        from feminout import importInpMesh
+        from feminout import importToolsFem
+        for inp_file_name in ("cube_static.inp", "constraint_contact_shell_shell.inp"):
+            inp_file = join(testtools.get_fem_test_home_dir(), "ccx", inp_file_name)
+            mesh_data = importInpMesh.read_inp(inp_file)
+            mesh_arrays = importInpMesh.read_inp_fast(inp_file, chunk_size=100)
+            mesh_data_fast = importToolsFem.make_dict_from_mesh_arrays(mesh_arrays)
+            for key in mesh_data:
+                self.assertEqual(
+                    {i: list(v) for i, v in mesh_data_fast[key].items()},
+                    {i: list(v) for i, v in mesh_data[key].items()},
+                    "Values of {} read by the fast inp reader are unexpected in {}"
+                    .format(key, inp_file_name)
+                )
+
+            femmesh = importToolsFem.make_femmesh(mesh_data)
+            femmesh_fast = importToolsFem.make_femmesh_from_arrays(mesh_arrays)
+            self.assertEqual(
+                femmesh_fast.Nodes,
+                femmesh.Nodes,
+                "Nodes of the FemMesh made from arrays are unexpected"
+            )
+            elements = femmesh.Volumes + femmesh.Faces
+            elements_fast = femmesh_fast.Volumes + femmesh_fast.Faces
+            self.assertEqual(
+                [femmesh_fast.getElementNodes(e) for e in elements_fast],
+                [femmesh.getElementNodes(e) for e in elements],
+                "Elements of the FemMesh made from arrays are unexpected"
+            )
+
+    # ********************************************************************************************
+    def test_read_inp_fast_duplicate_nodes(
+        self
+    ):
+        # as the standard inp reader the fast one should use the last node of a duplicate id
+        from feminout import importInpMesh
+        from feminout import importToolsFem
+        inp_file = join(testtools.get_fem_test_tmp_dir(), "duplicate_nodes.inp")
+        with open(inp_file, "w") as f:
+            f.write("*NODE, NSET=Nall\n")
+            f.write("1, 0.0, 0.0, 0.0\n")
+            f.write("2, 1.0, 0.0, 0.0\n")
+            f.write("3, 0.0, 1.0, 0.0\n")
+            f.write("4, 0.0, 0.0, 1.0\n")
+            f.write("2, 2.0, 0.0, 0.0\n")
+            f.write("*ELEMENT, TYPE=C3D4, ELSET=Eall\n")
+            f.write("1, 1, 2, 3, 4\n")
+        femmesh = importToolsFem.make_femmesh(importInpMesh.read_inp(inp_file))
+        femmesh_fast = importToolsFem.make_femmesh_from_arrays(
+            importInpMesh.read_inp_fast(inp_file)
+        )
+        self.assertEqual(femmesh_fast.NodeCount, 4, "Count of nodes is unexpected")
+        self.assertEqual(
+            femmesh_fast.Nodes[2],
+            FreeCAD.Vector(2.0, 0.0, 0.0),
+            "Node of the duplicate node id is unexpected"
+        )
+        self.assertEqual(
+            femmesh_fast.Nodes,
+            femmesh.Nodes,
+            "Nodes of the FemMesh made from arrays are unexpected"
+        )
+
+    # ********************************************************************************************
+    def test_xdmf_heavy_data(
+        self
+    ):
+        # the mesh written with heavy data should be read back unchanged
+        from feminout import readFenicsXDMF
+        from feminout import writeFenicsXDMF
+        # two tetra4, an edge is needed to get the element order
+        two_tetra4 = Fem.FemMesh()
+        two_tetra4.addNode(0, 0, 0, 1)
+        two_tetra4.addNode(1, 0, 0, 2)
+        two_tetra4.addNode(0, 1, 0, 3)
+        two_tetra4.addNode(0, 0, 1, 4)
+        two_tetra4.addNode(1, 1, 1, 5)
+        two_tetra4.addEdge([1, 2])
+        two_tetra4.addVolume([1, 2, 3, 4])
+        two_tetra4.addVolume([5, 2, 4, 3])
+        mesh_obj = self.active_doc.addObject("Fem::FemMeshObject", "Mesh")
+        mesh_obj.FemMesh = two_tetra4
+        expected_nodes = [tuple(v) for v in two_tetra4.Nodes.values()]
+        expected_volumes = [list(two_tetra4.getElementNodes(v)) for v in two_tetra4.Volumes]
+
+        for encoding in (writeFenicsXDMF.ENCODING_ASCII, writeFenicsXDMF.ENCODING_BINARY):
+            xdmf_file = join(
+                testtools.get_fem_test_tmp_dir(),
+                "two_tetra4_{}.xdmf".format(encoding)
+            )
+            writeFenicsXDMF.write_fenics_mesh_xdmf(mesh_obj, xdmf_file, encoding=encoding)
+            mesh_arrays = readFenicsXDMF.read_fenics_mesh_xdmf_arrays(xdmf_file)
+            self.assertEqual(
+                [tuple(v) for v in mesh_arrays["Nodes"][1].tolist()],
+                expected_nodes,
+                "Nodes read from {} XDMF file are unexpected".format(encoding)
+            )
+            self.assertEqual(
+                mesh_arrays["Tetra4Elem"][1].tolist(),
+                expected_volumes,
+                "Volumes read from {} XDMF file are unexpected".format(encoding)
+            )
+
+    # ********************************************************************************************
+    def test_xdmf_result_heavy_data(
+        self
+    ):
+        # the results written with heavy data should be read back unchanged
+        import ObjectsFem
+        from feminout import importFenicsMesh
+        from feminout import readFenicsXDMF
+        from feminout import writeFenicsXDMF
+        two_tetra4 = Fem.FemMesh()
+        two_tetra4.addNode(0, 0, 0, 1)
+        two_tetra4.addNode(1, 0, 0, 2)
+        two_tetra4.addNode(0, 1, 0, 3)
+        two_tetra4.addNode(0, 0, 1, 4)
+        two_tetra4.addNode(1, 1, 1, 5)
+        two_tetra4.addVolume([1, 2, 3, 4])
+        two_tetra4.addVolume([5, 2, 4, 3])
+        mesh_obj = self.active_doc.addObject("Fem::FemMeshObject", "Mesh")
+        mesh_obj.FemMesh = two_tetra4
+        res_obj = ObjectsFem.makeResultMechanical(self.active_doc)
+        res_obj.Mesh = mesh_obj
+        # the node numbers are not sorted like the nodes of the mesh
+        res_obj.NodeNumbers = [5, 4, 3, 2, 1]
+        res_obj.DisplacementVectors = [FreeCAD.Vector(i, 2 * i, 3 * i) for i in range(5)]
+        res_obj.vonMises = [10.0, 20.0, 30.0, 40.0, 50.0]
+        expected_disp = dict(zip(res_obj.NodeNumbers, res_obj.DisplacementVectors))
+        expected_mises = dict(zip(res_obj.NodeNumbers, res_obj.vonMises))
+
+        encodings = [writeFenicsXDMF.ENCODING_BINARY]
+        if writeFenicsXDMF.h5py is not None:
+            encodings.append(writeFenicsXDMF.ENCODING_HDF5)
+        else:
+            fcc_print("Python module h5py not found, HDF5 result heavy data is not tested")
+        for encoding in encodings:
+            xdmf_file = join(
+                testtools.get_fem_test_tmp_dir(),
+                "two_tetra4_results_{}.xdmf".format(encoding)
+            )
+            writeFenicsXDMF.write_fenics_result_xdmf(res_obj, xdmf_file, encoding=encoding)
+            with open(xdmf_file, "r") as f:
+                self.assertIn(
+                    'Format="{}"'.format("HDF" if encoding == writeFenicsXDMF.ENCODING_HDF5
+                                         else "Binary"),
+                    f.read(),
+                    "Format of the {} XDMF file is unexpected".format(encoding)
+                )
+            results = readFenicsXDMF.read_fenics_result_xdmf(xdmf_file)
+            self.assertEqual(
+                results["NodeNumbers"].tolist(),
+                [1, 2, 3, 4, 5],
+                "Node numbers read from {} XDMF file are unexpected".format(encoding)
+            )
+            imported_obj = importFenicsMesh.import_fenics_results(results, mesh_obj)
+            self.assertEqual(
+                dict(zip(imported_obj.NodeNumbers, imported_obj.DisplacementVectors)),
+                expected_disp,
+                "Displacements read from {} XDMF file are unexpected".format(encoding)
+            )
+            self.assertEqual(
+                dict(zip(imported_obj.NodeNumbers, imported_obj.vonMises)),
+                expected_mises,
+                "von Mises stresses read from {} XDMF file are unexpected".format(encoding)
+            )
+
+        # every data set needs its own name, even if a numbered name is taken
+        from xml.etree import ElementTree as ET
+        xdmf_file = join(testtools.get_fem_test_tmp_dir(), "dataset_names.xdmf")
+        heavy_data = writeFenicsXDMF.HeavyDataFile(xdmf_file, writeFenicsXDMF.ENCODING_BINARY)
+        for name in ("values", "values_2", "values", "values"):
+            heavy_data.write_dataitem(ET.Element("Attribute"), name, (1, 1), "Float", [[[0.0]]])
+        heavy_data.close()
+        self.assertEqual(
+            heavy_data.dataset_names,
+            set(["values", "values_1", "values_2", "values_3"]),
+            "Data set names are unexpected"
+        )
+
+    # ********************************************************************************************
+    def test_benchmark_preprocessing(
+        self
+    ):
+        # the synthetic box meshes and a benchmark run with small meshes
+        import json
+        from femtest.benchmark import preprocessing
+        expected_counts = {"tetra10": (125, 48), "hexa20": (81, 8)}
+        for element_type, (node_count, volume_count) in expected_counts.items():
+            femmesh = preprocessing.make_box_femmesh(2, element_type)
+            self.assertEqual(
+                (femmesh.NodeCount, femmesh.VolumeCount),
+                (node_count, volume_count),
+                "Node and volume count of the {} box mesh are unexpected".format(element_type)
+            )
+
+        result_file = join(testtools.get_fem_test_tmp_dir(), "benchmark_preprocessing.json")
+        preprocessing.run_preprocessing_benchmark(
+            element_counts=(48,),
+            element_types=("tetra10",),
+            result_file=result_file
+        )
+        with open(result_file) as f:
+            results = json.load(f)
+        case = results["Cases"][0]
+        stages = [record["Stage"] for record in case["Stages"]]
+        for step in preprocessing.STEPS:
+            self.assertIn(step, stages, "Benchmark step {} not recorded".format(step))
+        self.assertEqual(
+            case["Counts"]["Volumes"],
+            48,
+            "Volume count of the benchmark case is unexpected"
+        )
+
     # ********************************************************************************************
     def tearDown(
         self
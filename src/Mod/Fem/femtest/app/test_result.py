@@ -28,6 +28,7 @@ import unittest
 from . import support_utils as testtools
 from .support_utils import fcc_print
 
+from math import isnan
 from os.path import join
 
 
@@ -279,6 +280,228 @@ class TestResult(unittest.TestCase):
             "Values of read npressure result data are unexpected"
         )
 
+    # ********************************************************************************************
+    def test_read_frd_fast(
+        self
+    ):
+        # the fast frd reader should read the same data as the standard frd reader
+        frd_file = join(
+            testtools.get_fem_test_home_dir(),
+            "ccx",
+            "cube_static.frd"
+        )
+        from feminout.importCcxFrdResults import read_frd_result as read_frd
+        from feminout.importCcxFrdResults import read_frd_result_fast as read_frd_fast
+        from feminout.importToolsFem import make_dict_from_mesh_arrays
+        frd_content = read_frd(frd_file)
+        mesh_arrays, result_sets = read_frd_fast(frd_file)
+        result_sets = list(result_sets)
+        mesh_data = make_dict_from_mesh_arrays(mesh_arrays)
+
+        self.assertEqual(
+            {n: FreeCAD.Vector(v) for n, v in mesh_data["Nodes"].items()},
+            frd_content["Nodes"],
+            "Values of node data read by the fast frd reader are unexpected"
+        )
+        self.assertEqual(
+            mesh_data["Tetra10Elem"],
+            frd_content["Tetra10Elem"],
+            "Values of Tetra10 data read by the fast frd reader are unexpected"
+        )
+        self.assertEqual(
+            len(result_sets),
+            len(frd_content["Results"]),
+            "Number of result sets read by the fast frd reader is unexpected"
+        )
+        disp_ids, disp = result_sets[0]["disp"]
+        self.assertEqual(
+            {n: FreeCAD.Vector(*v) for n, v in zip(disp_ids.tolist(), disp.tolist())},
+            frd_content["Results"][0]["disp"],
+            "Values of disp data read by the fast frd reader are unexpected"
+        )
+        stress_ids, stress = result_sets[0]["stress"]
+        self.assertEqual(
+            dict(zip(stress_ids.tolist(), map(tuple, stress.tolist()))),
+            frd_content["Results"][0]["stress"],
+            "Values of stress data read by the fast frd reader are unexpected"
+        )
+
+    # ********************************************************************************************
+    def test_result_arrays_binary(
+        self
+    ):
+        import ObjectsFem
+        from femresult import resultstorage
+        res_obj = ObjectsFem.makeResultMechanical(self.active_doc)
+        node_numbers = [1, 2, 3, 4]
+        disp = [
+            FreeCAD.Vector(0.0, 0.0, 0.0),
+            FreeCAD.Vector(0.5, 0.0, 0.0),
+            FreeCAD.Vector(0.5, 0.25, 0.0),
+            FreeCAD.Vector(0.0, 0.25, -0.125),
+        ]
+        stress = [1.5, -2.25, 3.0, 1.0e6]
+        res_obj.NodeNumbers = node_numbers
+        res_obj.DisplacementVectors = disp
+        res_obj.NodeStressXX = stress
+
+        self.assertTrue(
+            resultstorage.store_result_arrays(res_obj),
+            "Storing the result arrays in binary format failed"
+        )
+        self.assertEqual(
+            (res_obj.NodeNumbers, res_obj.DisplacementVectors),
+            (node_numbers, disp),
+            "Result array properties after binary storage are unexpected"
+        )
+        self.assertEqual(
+            resultstorage.get_result_array(res_obj, "NodeStressXX").tolist(),
+            stress,
+            "Values of a result array read from the binary file are unexpected"
+        )
+
+        # the binary file is saved into the FCStd file
+        save_fc_file = join(testtools.get_fem_test_tmp_dir(), "result_arrays_binary.FCStd")
+        self.active_doc.saveAs(save_fc_file)
+        res_name = res_obj.Name
+        FreeCAD.closeDocument(self.active_doc.Name)
+        doc = FreeCAD.open(save_fc_file)
+        res_obj = doc.getObject(res_name)
+        # the result arrays are loaded on restore, C++ code reads the properties
+        self.assertFalse(
+            resultstorage.load_result_arrays(res_obj),
+            "Result arrays not loaded on restore of the document"
+        )
+        self.assertEqual(
+            (res_obj.NodeNumbers, res_obj.DisplacementVectors, res_obj.NodeStressXX),
+            (node_numbers, disp, stress),
+            "Values of result arrays loaded from binary format are unexpected"
+        )
+        FreeCAD.closeDocument(doc.Name)
+        FreeCAD.newDocument(self.doc_name)
+
+    # ********************************************************************************************
+    def test_result_arrays_binary_save(
+        self
+    ):
+        # the result arrays of the document in memory are kept on save
+        import ObjectsFem
+        res_obj = ObjectsFem.makeResultMechanical(self.active_doc)
+        node_numbers = [1, 2, 3]
+        stress = [1.5, -2.25, 3.0]
+        res_obj.NodeNumbers = node_numbers
+        res_obj.NodeStressXX = stress
+
+        fem_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+        binary_result_arrays = fem_prefs.GetBool("BinaryResultArrays", False)
+        fem_prefs.SetBool("BinaryResultArrays", True)
+        try:
+            save_fc_file = join(
+                testtools.get_fem_test_tmp_dir(),
+                "result_arrays_binary_save.FCStd"
+            )
+            self.active_doc.saveAs(save_fc_file)
+            self.active_doc.save()
+        finally:
+            fem_prefs.SetBool("BinaryResultArrays", binary_result_arrays)
+        self.assertEqual(
+            (res_obj.NodeNumbers, res_obj.NodeStressXX),
+            (node_numbers, stress),
+            "Result array properties after save of the document are unexpected"
+        )
+        self.assertNotIn(
+            "Transient",
+            res_obj.getPropertyStatus("NodeStressXX"),
+            "Result array property is still transient after save of the document"
+        )
+        self.assertTrue(
+            res_obj.ResultArrayFile,
+            "No binary result array file after save of the document"
+        )
+
+    # ********************************************************************************************
+    def test_result_arrays_binary_unchanged(
+        self
+    ):
+        # the binary file is only written again if the node results have changed
+        import os
+        import ObjectsFem
+        from femresult import resultstorage
+        res_obj = ObjectsFem.makeResultMechanical(self.active_doc)
+        res_obj.NodeNumbers = [1, 2, 3]
+        res_obj.NodeStressXX = [1.5, -2.25, 3.0]
+        resultstorage.store_result_arrays(res_obj)
+        resultstorage.reset_result_arrays_status(res_obj)
+        os.utime(res_obj.ResultArrayFile, (0, 0))
+        self.assertTrue(
+            resultstorage.store_result_arrays(res_obj),
+            "Storing unchanged result arrays failed"
+        )
+        self.assertIn(
+            "Transient",
+            res_obj.getPropertyStatus("NodeStressXX"),
+            "Unchanged result array property is not transient on store"
+        )
+        self.assertEqual(
+            os.path.getmtime(res_obj.ResultArrayFile),
+            0,
+            "Binary file of unchanged result arrays was written again"
+        )
+        resultstorage.reset_result_arrays_status(res_obj)
+        res_obj.NodeStressXX = [1.0, 2.0, 3.0]
+        resultstorage.store_result_arrays(res_obj)
+        self.assertEqual(
+            resultstorage.get_result_array(res_obj, "NodeStressXX").tolist(),
+            [1.0, 2.0, 3.0],
+            "Binary file of changed result arrays was not written again"
+        )
+
+    # ********************************************************************************************
+    def test_read_dat_cached(
+        self
+    ):
+        # the second read of a dat file should use the binary result file cache
+        import shutil
+        from feminout import resultfilecache
+        from feminout.importCcxDatResults import readResult
+        dat_file = join(
+            testtools.get_fem_test_tmp_dir(),
+            "cube_frequency_cached.dat"
+        )
+        shutil.copyfile(
+            join(testtools.get_fem_test_home_dir(), "ccx", "cube_frequency.dat"),
+            dat_file
+        )
+        shutil.rmtree(resultfilecache.get_cache_dir(dat_file), ignore_errors=True)
+        eigenvalues = readResult(dat_file, use_cache=False)
+        self.assertIsNone(
+            resultfilecache.load_arrays(dat_file, "CcxEigenvalues"),
+            "Result file cache before the first read is unexpected"
+        )
+        self.assertEqual(
+            readResult(dat_file, use_cache=True),
+            eigenvalues,
+            "Values of the first read of the dat file with cache are unexpected"
+        )
+        arrays = resultfilecache.load_arrays(dat_file, "CcxEigenvalues")
+        self.assertEqual(
+            arrays["Frequencies"].tolist(),
+            [m["frequency"] for m in eigenvalues],
+            "Values of the result file cache are unexpected"
+        )
+        self.assertEqual(
+            readResult(dat_file, use_cache=True),
+            eigenvalues,
+            "Values of the dat file read from the result file cache are unexpected"
+        )
+        # the cache is not used for a changed result file
+        with open(dat_file, "a") as f:
+            f.write("\n")
+        self.assertIsNone(
+            resultfilecache.load_arrays(dat_file, "CcxEigenvalues"),
+            "Result file cache of a changed result file is unexpected"
+        )
+
     # ********************************************************************************************
     def get_stress_values(
         self
@@ -342,6 +565,72 @@ class TestResult(unittest.TestCase):
             "Calculated principal stresses are not the expected values."
         )
 
+    # ********************************************************************************************
+    def test_stress_von_mises_array(
+        self
+    ):
+        # the array version should give the same value for every node
+        expected_mises = [283.2082, 283.2082]
+        from femresult.resulttools import calculate_von_mises_array as vm
+        stress_tensors = [(s, s) for s in self.get_stress_values()]
+        mises = vm(stress_tensors)
+        rounded_mises = [round(m, 4) for m in mises.tolist()]
+        # fcc_print(rounded_mises)
+        self.assertEqual(
+            rounded_mises,
+            expected_mises,
+            "Calculated von Mises stress array are not the expected values."
+        )
+
+    # ********************************************************************************************
+    def test_min_avg_max(
+        self
+    ):
+        # NaN values are ignored, a single one must not make the Stats NaN
+        from femresult.resulttools import get_min_avg_max
+        self.assertEqual(
+            get_min_avg_max([1.0, float("NaN"), -2.0, 5.0], 4),
+            (-2.0, 1.0, 5.0),
+            "Min, avg, max of values with NaN are not the expected values."
+        )
+        self.assertEqual(
+            get_min_avg_max([float("NaN"), float("NaN")], 2),
+            (0.0, 0.0, 0.0),
+            "Min, avg, max of NaN values are not the expected values."
+        )
+        self.assertEqual(
+            get_min_avg_max([], 0),
+            (0.0, 0.0, 0.0),
+            "Min, avg, max of no values are not the expected values."
+        )
+
+    # ********************************************************************************************
+    def test_stress_principal_std_array(
+        self
+    ):
+        # the second node has a NaN value, NaN is expected for all its principal stresses
+        expected_principal = (-178.0076, -194.0749, -468.9075, 145.4499)
+        from femresult.resulttools import calculate_principal_stress_std_array as pr
+        stress_tensors = [(s, s) for s in self.get_stress_values()]
+        stress_tensors[2] = (stress_tensors[2][0], float("NaN"))
+        prin = pr(stress_tensors)
+        rounded_prin = (
+            round(prin[0][0], 4),
+            round(prin[1][0], 4),
+            round(prin[2][0], 4),
+            round(prin[3][0], 4)
+        )
+        # fcc_print(rounded_prin)
+        self.assertEqual(
+            rounded_prin,
+            expected_principal,
+            "Calculated principal stress arrays are not the expected values."
+        )
+        self.assertTrue(
+            all(isnan(p[1]) for p in prin),
+            "Calculated principal stress arrays of a NaN stress tensor are not NaN."
+        )
+
     # ********************************************************************************************
     def test_stress_principal_reinforced(
         self
@@ -25,6 +25,9 @@
 import FreeCAD
 import ObjectsFem
 import femsolver.run
+import femtools.femutils as femutils
+import threading
+import time
 import unittest
 from . import support_utils as testtools
 from .support_utils import fcc_print
@@ -108,6 +111,151 @@ class TestSolverFrameWork(unittest.TestCase):
 
         fcc_print("--------------- End of FEM tests solver framework solver CalculiX --------")
 
+    # ********************************************************************************************
+    def test_solver_sweep_overrides(
+        self
+    ):
+        fcc_print("\n--------------- Start of FEM tests solver framework parameter sweep -------")
+
+        from femexamples import boxanalysis as box
+        from femsolver import sweep
+        box.setup_static(self.active_doc, "calculix")
+        mat_obj = self.active_doc.MechanicalMaterial
+        force_obj = self.active_doc.FemConstraintForce
+
+        restore = sweep.apply_overrides(
+            self.active_doc,
+            {
+                "MechanicalMaterial.Material.YoungsModulus": "210000 MPa",
+                "FemConstraintForce.Force": 20000.0,
+            }
+        )
+        self.assertEqual(
+            mat_obj.Material["YoungsModulus"],
+            "210000 MPa",
+            "Overridden material value is unexpected"
+        )
+        self.assertEqual(
+            mat_obj.Material["PoissonRatio"],
+            "0.30",
+            "Not overridden material value is unexpected"
+        )
+        self.assertEqual(force_obj.Force, 20000.0, "Overridden force is unexpected")
+
+        sweep.restore_overrides(self.active_doc, restore)
+        self.assertEqual(
+            mat_obj.Material["YoungsModulus"],
+            "200000 MPa",
+            "Restored material value is unexpected"
+        )
+        self.assertEqual(force_obj.Force, 40000.0, "Restored force is unexpected")
+
+        fcc_print("--------------- End of FEM tests solver framework parameter sweep ---------")
+
+    # ********************************************************************************************
+    def test_solver_sweep(
+        self
+    ):
+        fcc_print("\n--------------- Start of FEM tests solver framework parameter sweep run ---")
+
+        from femsolver import sweep
+        analysis = ObjectsFem.makeAnalysis(self.active_doc, "Analysis")
+        solver_obj = self.active_doc.addObject("Fem::FemSolverObjectPython", "SweepSolver")
+        solver_obj.Proxy = _SweepSolver()
+        analysis.addObject(solver_obj)
+        sweep_dir = testtools.get_unit_test_tmp_dir(self.temp_dir, "sweep")
+        _SweepSolve.max_running = 0
+
+        prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+        keep_results = prefs.GetBool("KeepResultsOnReRun", False)
+        prefs.SetBool("KeepResultsOnReRun", False)
+        try:
+            sweep_table = sweep.run_parameter_sweep(
+                solver_obj,
+                [{"Name": "First", "Overrides": {"Analysis.Label2": "First"}}, {}, {}],
+                sweep_dir,
+                max_workers=2
+            )
+            self.assertFalse(
+                prefs.GetBool("KeepResultsOnReRun", True),
+                "KeepResultsOnReRun preference was changed by the sweep"
+            )
+        finally:
+            prefs.SetBool("KeepResultsOnReRun", keep_results)
+
+        self.assertEqual(
+            [row["Name"] for row in sweep_table],
+            ["First", "Variant_002", "Variant_003"],
+            "Names of the variants are unexpected"
+        )
+        self.assertEqual(analysis.Label2, "", "Overridden value was not restored")
+        # the solver processes of the variants ran concurrently, at most 2 at the same time
+        self.assertEqual(_SweepSolve.max_running, 2, "Concurrent solver runs are unexpected")
+        # the results of all variants are kept, prefixed with the variant name
+        self.assertEqual(
+            len(femutils.get_member(analysis, "Fem::FemResultObject")),
+            3,
+            "Count of result objects is unexpected"
+        )
+        for row in sweep_table:
+            self.assertFalse(row["Failed"], "Variant {} failed".format(row["Name"]))
+            self.assertEqual(len(row["Results"]), 1, "Results of the variant are unexpected")
+            self.assertTrue(
+                self.active_doc.getObject(row["Results"][0][0]).Label.startswith(
+                    row["Name"] + "_Result"
+                ),
+                "Label of the result object of the variant is unexpected"
+            )
+
+        fcc_print("--------------- End of FEM tests solver framework parameter sweep run -----")
+
+    # ********************************************************************************************
+    def test_solver_profile(
+        self
+    ):
+        fcc_print("\n--------------- Start of FEM tests solver framework profile -------------")
+
+        import json
+        from femexamples import boxanalysis as box
+        from femsolver import profiling
+        box.setup_static(self.active_doc, "calculix")
+        solver_obj = self.active_doc.SolverCalculiX
+        analysis_dir = testtools.get_unit_test_tmp_dir(self.temp_dir, "profile")
+
+        machine_ccx = solver_obj.Proxy.createMachine(
+            solver_obj,
+            analysis_dir
+        )
+        machine_ccx.target = femsolver.run.PREPARE
+        machine_ccx.start()
+        machine_ccx.join()  # wait for the machine to finish.
+
+        profile = machine_ccx.report.profile
+        stages = [record["Stage"] for record in profile.records]
+        for stage in ("check", "prepare", "write_calculix_input_file", "write_materials"):
+            self.assertIn(stage, stages, "Stage {} not found in the profile".format(stage))
+        self.assertLess(
+            stages.index("write_calculix_input_file"),
+            stages.index("prepare"),
+            "Order of the stages in the profile is unexpected"
+        )
+        self.assertEqual(
+            profile.counts["Nodes"],
+            self.active_doc.getObject(self.mesh_name).FemMesh.NodeCount,
+            "Count of nodes in the profile is unexpected"
+        )
+
+        profile_file = join(analysis_dir, profiling.PROFILE_FILE_NAME)
+        profile.write_json(profile_file)
+        with open(profile_file, "r") as f:
+            self.assertEqual(
+                json.load(f)["Stages"][0]["Stage"],
+                stages[0],
+                "Profile json file is unexpected"
+            )
+
+        fcc_print("--------------- End of FEM tests solver framework profile ---------------")
+
     # ********************************************************************************************
     def test_solver_elmer(
         self
@@ -195,3 +343,55 @@ class TestSolverFrameWork(unittest.TestCase):
     ):
         # clearance, is executed after every test
         FreeCAD.closeDocument(self.doc_name)
+
+
+# ************************************************************************************************
+# a solver without a solver binary for the parameter sweep test
+# the solve task only counts the tasks running at the same time
+class _SweepSolver(object):
+
+    def createMachine(self, obj, directory, testmode=False):
+        return femsolver.run.Machine(
+            solver=obj, directory=directory,
+            check=_SweepCheck(),
+            prepare=_SweepPrepare(),
+            solve=_SweepSolve(),
+            results=_SweepResults(),
+            testmode=testmode)
+
+
+class _SweepCheck(femsolver.run.Check):
+
+    def run(self):
+        pass
+
+
+class _SweepPrepare(femsolver.run.Prepare):
+
+    def run(self):
+        pass
+
+
+class _SweepSolve(femsolver.run.Solve):
+
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def run(self):
+        with _SweepSolve.lock:
+            _SweepSolve.running += 1
+            _SweepSolve.max_running = max(_SweepSolve.max_running, _SweepSolve.running)
+        time.sleep(0.5)
+        with _SweepSolve.lock:
+            _SweepSolve.running -= 1
+
+
+class _SweepResults(femsolver.run.Results):
+
+    def run(self):
+        if not self.getKeepResults():
+            for m in femutils.get_member(self.analysis, "Fem::FemResultObject"):
+                self.analysis.Document.removeObject(m.Name)
+        res_obj = ObjectsFem.makeResultMechanical(self.analysis.Document, "Result")
+        self.analysis.addObject(res_obj)
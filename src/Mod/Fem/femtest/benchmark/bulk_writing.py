@@ -0,0 +1,81 @@
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+""" Benchmark of the bulk writing of the CalculiX input file data blocks.
+
+The node sets, element sets and surfaces of the CalculiX input file are
+written with femsolver.calculix.writer.write_id_lines() and write_face_lines().
+The benchmark writes count ids and element faces line by line and with the
+bulk functions into memory and compares the wall times. To run the benchmark
+in FreeCADCmd::
+
+    from femtest.benchmark import bulk_writing
+    bulk_writing.run_bulk_writing_benchmark(count=1234567)
+"""
+
+__title__ = "FEM bulk writing benchmark"
+__author__ = "FreeCAD Developers"
+__url__ = "http://www.freecadweb.org"
+
+## \addtogroup FEM
+#  @{
+
+import io
+import time
+
+import FreeCAD
+
+
+# ************************************************************************************************
+def run_bulk_writing_benchmark(
+    count=1234567
+):
+    """write count ids and faces line by line and in bulk
+
+    Returns a dictionary with the wall times "LineByLine" and "Bulk" in seconds.
+    """
+    from femsolver.calculix.writer import write_face_lines
+    from femsolver.calculix.writer import write_id_lines
+    ids = list(range(1, count + 1))
+    faces = [[ele_id, ele_id % 4 + 1] for ele_id in ids]
+
+    timestart = time.time()
+    line_file = io.StringIO()
+    for i in ids:
+        line_file.write(str(i) + ",\n")
+    for i in faces:
+        line_file.write("{},S{}\n".format(i[0], i[1]))
+    line_time = time.time() - timestart
+
+    timestart = time.time()
+    bulk_file = io.StringIO()
+    write_id_lines(bulk_file, ids)
+    write_face_lines(bulk_file, faces, "{},S{}\n")
+    bulk_time = time.time() - timestart
+
+    if bulk_file.getvalue() != line_file.getvalue():
+        FreeCAD.Console.PrintError("The bulk written ids and faces are unexpected.\n")
+    FreeCAD.Console.PrintMessage(
+        "FEM bulk writing benchmark: {} ids and faces, line by line: {} s, bulk: {} s\n"
+        .format(count, round(line_time, 2), round(bulk_time, 2))
+    )
+    return {"LineByLine": line_time, "Bulk": bulk_time}
+
+##  @}
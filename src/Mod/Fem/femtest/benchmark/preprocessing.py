@@ -0,0 +1,413 @@
+# ***************************************************************************
+# *   Copyright (c) 2020 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+""" Benchmark of the FEM preprocessing with synthetic box meshes.
+
+The box analysis of :mod:`femexamples.boxanalysis` (fixed, force and pressure
+constraint) gets a structured tetra10 or hexa20 mesh of the wanted number of
+elements. For every mesh the wall time and the peak memory of the following
+steps are recorded with a :class:`femsolver.profiling.Profile`:
+
+    - make_box_femmesh
+    - get_femelement_table
+    - get_femnodes_by_refshape (nodes of the fixed face)
+    - get_femnodes_ele_incidence
+    - get_pressure_obj_faces
+    - write_inp_file (CalculiX input file, with the stages of the writer)
+    - read_frd_result and read_frd_result_fast (a synthetic frd result file)
+
+The caches of the session are cleared before every mesh, thus every step is
+measured cold. To run the benchmark in FreeCADCmd::
+
+    from femtest.benchmark import preprocessing
+    preprocessing.run_preprocessing_benchmark(
+        element_counts=(10000, 100000),
+        element_types=("tetra10", "hexa20"),
+        result_file="/tmp/fem_preprocessing_benchmark.json"
+    )
+
+The result json file has the keys "Info" (FreeCAD version, platform, date)
+and "Cases". A case has the keys "ElementType", "ElementCount", "Divisions",
+"Counts" and "Stages", the stages are the records of the profile.
+"""
+
+__title__ = "FEM preprocessing benchmark"
+__author__ = "FreeCAD Developers"
+__url__ = "http://www.freecadweb.org"
+
+## \addtogroup FEM
+#  @{
+
+import collections
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+import FreeCAD
+
+
+ELEMENT_TYPES = ("tetra10", "hexa20")
+ELEMENT_COUNTS = (10000, 100000, 1000000, 5000000)
+STEPS = (
+    "get_femelement_table",
+    "get_femnodes_by_refshape",
+    "get_pressure_obj_faces",
+    "write_inp_file",
+    "read_frd_result",
+    "read_frd_result_fast",
+)
+# the box of femexamples.boxanalysis
+BOX_SIZE = 10.0
+
+# corner nodes of the box cell, (x, y, z) in half cell sizes
+_CELL_CORNERS = (
+    (0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0),
+    (0, 0, 2), (2, 0, 2), (2, 2, 2), (0, 2, 2),
+)
+# hexa20 in FreeCAD (SMESH) node order, the normal of the first face points outward
+# corner nodes of the cell, midside nodes between two corner nodes of the element
+_HEXA20_CORNERS = (0, 3, 2, 1, 4, 7, 6, 5)
+_HEXA20_EDGES = (
+    (0, 1), (1, 2), (2, 3), (3, 0),
+    (4, 5), (5, 6), (6, 7), (7, 4),
+    (0, 4), (1, 5), (2, 6), (3, 7),
+)
+# six tetra10 per cell, all share the cell diagonal, thus the cells fit together
+_TETRA10_CORNERS = (
+    (0, 2, 1, 6), (0, 3, 2, 6), (0, 7, 3, 6),
+    (0, 4, 7, 6), (0, 5, 4, 6), (0, 1, 5, 6),
+)
+_TETRA10_EDGES = ((0, 1), (1, 2), (2, 0), (0, 3), (1, 3), (2, 3))
+# frd element type of the element types
+_FRD_ELEMENT_TYPES = {"tetra10": 6, "hexa20": 4}
+
+
+# ************************************************************************************************
+def get_box_divisions(
+    element_count,
+    element_type
+):
+    """number of cells per box edge to get about element_count elements"""
+    if element_type not in ELEMENT_TYPES:
+        raise ValueError("Unknown element type: {}".format(element_type))
+    cell_count = float(element_count) / len(_get_cell_element_nodes(element_type))
+    return max(1, int(round(cell_count ** (1.0 / 3.0))))
+
+
+def get_box_mesh_arrays(
+    divisions,
+    element_type,
+    size=BOX_SIZE
+):
+    """the nodes and elements of a structured box mesh as numpy arrays
+
+    The box has the edge length size and divisions cells per edge. Every cell
+    is one hexa20 or six tetra10. Returns a tuple (node ids, node coordinates,
+    element ids, element nodes), the element nodes are in FreeCAD node order.
+    """
+    import numpy as np
+    # the grid has a point on every corner and midside node position
+    grid_size = 2 * divisions + 1
+    cells = np.indices((divisions, divisions, divisions)).reshape(3, -1).T * 2
+    offsets = np.array(_get_cell_element_nodes(element_type))
+    element_points = cells[:, None, None, :] + offsets[None, :, :, :]
+    element_points = element_points.reshape(-1, offsets.shape[1], 3)
+    grid_index = (
+        element_points[:, :, 0]
+        + grid_size * (element_points[:, :, 1] + grid_size * element_points[:, :, 2])
+    )
+    # only the grid points used by the elements get a node
+    used_points, element_nodes = np.unique(grid_index, return_inverse=True)
+    element_nodes = element_nodes.reshape(grid_index.shape) + 1
+    node_points = np.stack((
+        used_points % grid_size,
+        (used_points // grid_size) % grid_size,
+        used_points // (grid_size * grid_size)
+    ), axis=1)
+    node_coords = node_points * (float(size) / (2 * divisions))
+    node_ids = np.arange(1, len(used_points) + 1)
+    element_ids = np.arange(1, len(element_nodes) + 1)
+    return node_ids, node_coords, element_ids, element_nodes
+
+
+def make_box_femmesh(
+    divisions,
+    element_type,
+    size=BOX_SIZE
+):
+    """a structured tetra10 or hexa20 box FemMesh, see get_box_mesh_arrays()"""
+    import Fem
+    node_ids, node_coords, element_ids, element_nodes = get_box_mesh_arrays(
+        divisions,
+        element_type,
+        size
+    )
+    femmesh = Fem.FemMesh()
+    femmesh.addNodes(node_coords.ravel().tolist(), node_ids.tolist())
+    femmesh.addElements(
+        "Volume",
+        element_nodes.ravel().tolist(),
+        element_nodes.shape[1],
+        element_ids.tolist()
+    )
+    return femmesh
+
+
+def write_frd_file(
+    frd_file_name,
+    element_type,
+    node_ids,
+    node_coords,
+    element_ids,
+    element_nodes
+):
+    """write a CalculiX frd result file with the mesh and a displacement result
+
+    The displacements are proportional to the node coordinates. The mesh
+    arrays are the ones of get_box_mesh_arrays().
+    """
+    import numpy as np
+    from feminout.importCcxFrdResults import FRD_ELEMENT_TYPES
+    frd_type = _FRD_ELEMENT_TYPES[element_type]
+    key, node_order, lines_per_element = FRD_ELEMENT_TYPES[frd_type]
+    # the reader takes the FreeCAD nodes by node_order out of the frd nodes
+    frd_nodes = np.empty_like(element_nodes)
+    frd_nodes[:, list(node_order)] = element_nodes
+    nodes = np.column_stack((node_ids, node_coords))
+    elements = np.column_stack((
+        element_ids,
+        np.full(len(element_ids), frd_type),
+        np.zeros(len(element_ids), dtype=int),
+        np.ones(len(element_ids), dtype=int),
+        frd_nodes
+    ))
+    element_format = " -1%10d%5d%5d%5d" + ("\n -2" + "%10d" * 10) * lines_per_element
+    value_format = " -1%10d%12.5E%12.5E%12.5E"
+    with open(frd_file_name, "w") as f:
+        f.write("    1C\n")
+        f.write("    2C{:30d}{:>38d}\n".format(len(node_ids), 1))
+        np.savetxt(f, nodes, fmt=value_format)
+        f.write(" -3\n")
+        f.write("    3C{:30d}{:>38d}\n".format(len(element_ids), 1))
+        np.savetxt(f, elements, fmt=element_format)
+        f.write(" -3\n")
+        f.write("    1PSTEP{:>26d}{:>12d}{:>12d}\n".format(1, 1, 1))
+        f.write(
+            "  100CL  101 1.000000000{:12d}{:>22d}{:>5d}{:>12d}\n"
+            .format(len(node_ids), 0, 1, 1)
+        )
+        f.write(" -4  DISP        4    1\n")
+        f.write(" -5  D1          1    2    1    0\n")
+        f.write(" -5  D2          1    2    2    0\n")
+        f.write(" -5  D3          1    2    3    0\n")
+        f.write(" -5  ALL         1    2    0    0    1ALL\n")
+        np.savetxt(f, np.column_stack((node_ids, node_coords * 1e-4)), fmt=value_format)
+        f.write(" -3\n")
+        f.write(" 9999\n")
+
+
+# ************************************************************************************************
+def run_preprocessing_benchmark(
+    element_counts=ELEMENT_COUNTS,
+    element_types=ELEMENT_TYPES,
+    result_file=None,
+    working_dir=None,
+    steps=STEPS
+):
+    """run the benchmark for all combinations of element counts and element types
+
+    The input and frd files are written into sub directories of working_dir.
+    If working_dir is not given a temporary directory is used and removed at
+    the end. If result_file is given the results are written as json file.
+    Returns the results, see the module docstring.
+    """
+    remove_working_dir = working_dir is None
+    if working_dir is None:
+        working_dir = tempfile.mkdtemp(prefix="fem_benchmark_")
+    results = {"Info": get_benchmark_info(), "Cases": []}
+    try:
+        for element_type in element_types:
+            for element_count in element_counts:
+                case_dir = os.path.join(
+                    working_dir,
+                    "{}_{}".format(element_type, element_count)
+                )
+                if not os.path.isdir(case_dir):
+                    os.makedirs(case_dir)
+                case = run_case(element_count, element_type, case_dir, steps)
+                results["Cases"].append(case)
+    finally:
+        if remove_working_dir:
+            shutil.rmtree(working_dir, ignore_errors=True)
+    if result_file:
+        with open(result_file, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        FreeCAD.Console.PrintMessage(
+            "FEM preprocessing benchmark written to {}\n".format(result_file)
+        )
+    return results
+
+
+def run_case(
+    element_count,
+    element_type,
+    case_dir,
+    steps=STEPS
+):
+    """run the benchmark steps for one box mesh, returns the case dictionary"""
+    from femexamples import boxanalysis
+    from femmesh import meshsetcache
+    from femmesh import meshtools
+    from femsolver import profiling
+
+    meshsetcache.clear_mesh_set_caches()
+    meshtools.clear_femnodes_ele_incidence_cache()
+    divisions = get_box_divisions(element_count, element_type)
+    profile = profiling.Profile()
+    FreeCAD.Console.PrintMessage(
+        "FEM preprocessing benchmark: {} box with {} elements, {} cells per edge\n"
+        .format(element_type, element_count, divisions)
+    )
+
+    doc = boxanalysis.setup_static(FreeCAD.newDocument("FemBenchmark"), "ccxtools")
+    try:
+        with profile.stage("make_box_femmesh"):
+            doc.Mesh.FemMesh = make_box_femmesh(divisions, element_type, BOX_SIZE)
+        femmesh = doc.Mesh.FemMesh
+        profile.add_counts(Nodes=femmesh.NodeCount, Volumes=femmesh.VolumeCount)
+
+        femelement_table = None
+        if "get_femelement_table" in steps or "get_pressure_obj_faces" in steps:
+            with profile.stage("get_femelement_table"):
+                femelement_table = meshtools.get_femelement_table(femmesh)
+        if "get_femnodes_by_refshape" in steps:
+            ref = (doc.Box, ("Face1",))
+            with profile.stage("get_femnodes_by_refshape"):
+                nodes = meshtools.get_femnodes_by_refshape(femmesh, ref)
+            profile.add_counts(RefShapeNodes=len(nodes))
+        if "get_pressure_obj_faces" in steps:
+            with profile.stage("get_femnodes_ele_incidence"):
+                femnodes_ele_table = meshtools.get_femnodes_ele_incidence(femelement_table)
+            femobj = {"Object": doc.FemConstraintPressure}
+            with profile.stage("get_pressure_obj_faces"):
+                faces = meshtools.get_pressure_obj_faces(
+                    femmesh,
+                    femelement_table,
+                    femnodes_ele_table,
+                    femobj
+                )
+            profile.add_counts(PressureFaces=len(faces))
+        if "write_inp_file" in steps:
+            meshtools.clear_femnodes_ele_incidence_cache()
+            profile.extend(_write_inp_file(doc, case_dir))
+
+        frd_steps = [s for s in ("read_frd_result", "read_frd_result_fast") if s in steps]
+        if frd_steps:
+            profile.extend(_read_frd_file(divisions, element_type, case_dir, frd_steps))
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+
+    for line in profile.get_lines():
+        FreeCAD.Console.PrintMessage("    {}\n".format(line))
+    case = {
+        "ElementType": element_type,
+        "ElementCount": element_count,
+        "Divisions": divisions,
+    }
+    case.update(profile.to_dict())
+    return case
+
+
+def get_benchmark_info(
+):
+    """FreeCAD version, Python version, platform and date of a benchmark run"""
+    return {
+        "FreeCAD": FreeCAD.Version(),
+        "Python": sys.version,
+        "Platform": platform.platform(),
+        "Processor": platform.processor(),
+        "Date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+# ************************************************************************************************
+def _get_cell_element_nodes(
+    element_type
+):
+    # the nodes of the elements of one cell in half cell sizes
+    if element_type == "hexa20":
+        corner_sets = (_HEXA20_CORNERS,)
+        edges = _HEXA20_EDGES
+    else:
+        corner_sets = _TETRA10_CORNERS
+        edges = _TETRA10_EDGES
+    elements = []
+    for corners in corner_sets:
+        points = [_CELL_CORNERS[c] for c in corners]
+        for n1, n2 in edges:
+            points.append(tuple(
+                (a + b) // 2 for a, b in zip(_CELL_CORNERS[corners[n1]], _CELL_CORNERS[corners[n2]])
+            ))
+        elements.append(points)
+    return elements
+
+
+def _write_inp_file(
+    doc,
+    case_dir
+):
+    # the profile of ccxtools has the stages of the writer and write_inp_file
+    from femtools import ccxtools
+    fea = ccxtools.FemToolsCcx(doc.Analysis, doc.CalculiXccxTools, test_mode=True)
+    fea.update_objects()
+    fea.setup_working_dir(case_dir)
+    error = fea.write_inp_file()
+    if error:
+        FreeCAD.Console.PrintError("Writing the input file failed: {}\n".format(error))
+    return fea.profile
+
+
+def _read_frd_file(
+    divisions,
+    element_type,
+    case_dir,
+    frd_steps
+):
+    # the profile of the frd readers
+    from feminout import importCcxFrdResults
+    from femsolver import profiling
+    profile = profiling.Profile()
+    frd_file_name = os.path.join(case_dir, "Mesh.frd")
+    write_frd_file(frd_file_name, element_type, *get_box_mesh_arrays(divisions, element_type))
+    if "read_frd_result" in frd_steps:
+        with profile.stage("read_frd_result"):
+            importCcxFrdResults.read_frd_result(frd_file_name)
+    if "read_frd_result_fast" in frd_steps:
+        with profile.stage("read_frd_result_fast"):
+            result_sets = importCcxFrdResults.read_frd_result_fast(frd_file_name)[1]
+            # the result sets are read lazily, consume them
+            collections.deque(result_sets, maxlen=0)
+    return profile
+
+##  @}
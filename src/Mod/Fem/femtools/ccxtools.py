@@ -33,6 +33,7 @@ import sys
 import subprocess
 import FreeCAD
 import femtools.femutils as femutils
+from femsolver import profiling
 from PySide import QtCore
 if FreeCAD.GuiUp:
     from PySide import QtGui
@@ -161,6 +162,8 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
                 self.test_mode = False
                 self.ccx_binary_present = False
             self.result_object = None
+            # wall time and memory of the stages, see femsolver.profiling
+            self.profile = profiling.Profile()
         else:
             raise Exception(
                 "FEM: Something went wrong, "
@@ -241,6 +244,7 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
                         "No solver is set!\n"
                     )
 
+    @profiling.profiled
     def update_objects(self):
         ## @var mesh
         #  mesh of the analysis. Used to generate .inp file and to show results
@@ -290,6 +294,7 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
         self.contact_constraints = self._get_several_member("Fem::ConstraintContact")
         self.transform_constraints = self._get_several_member("Fem::ConstraintTransform")
 
+    @profiling.profiled
     def check_prerequisites(self):
         FreeCAD.Console.PrintMessage("Check prerequisites.\n")
         from FreeCAD import Units
@@ -725,6 +730,7 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
         # Update inp file name
         self.set_inp_file_name()
 
+    @profiling.profiled
     def write_inp_file(self):
         import femsolver.calculix.writer as iw
         self.inp_file_name = ""
@@ -753,6 +759,7 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
                 self.working_dir
             )
             self.inp_file_name = inp_writer.write_calculix_input_file()
+            self.profile.extend(inp_writer.profile)
         except:
             FreeCAD.Console.PrintError(
                 "Unexpected error when writing CalculiX input file: {}\n"
@@ -937,6 +944,7 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
         m = re.search(r"(\d+).(\d+)", ccx_stdout)
         return (int(m.group(1)), int(m.group(2)))
 
+    @profiling.profiled
     def ccx_run(self):
         FreeCAD.Console.PrintMessage("Run CalculiX ...\n")
         if self.test_mode:
@@ -1029,12 +1037,30 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
                             "Error",
                             error_message
                         )
+                    self.write_profile_file()
                     return False
                 else:
                     self.load_results()
                     # TODO: output an error message if there where problems reading the results
+        self.write_profile_file()
         return True
 
+    def write_profile_file(self):
+        """Write the profile of the stages into the working directory,
+        if it is activated in the preferences, see femsolver.profiling.
+        """
+        for line in self.profile.get_lines():
+            FreeCAD.Console.PrintLog(line + "\n")
+        from femsolver.settings import get_write_solver_profile
+        if get_write_solver_profile() and os.path.isdir(self.working_dir):
+            profile_file = os.path.join(self.working_dir, profiling.PROFILE_FILE_NAME)
+            try:
+                self.profile.write_json(profile_file)
+            except IOError as e:
+                FreeCAD.Console.PrintWarning(
+                    "Solver profile {} could not be written: {}\n".format(profile_file, e)
+                )
+
     def has_no_material_assigned(self):
         if " *ERROR in calinput: no material was assigned" in self.ccx_stdout:
             without_material_elements = []
@@ -1147,6 +1173,7 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
         else:
             return False
 
+    @profiling.profiled
     def load_results(self):
         FreeCAD.Console.PrintMessage("We will load the ccx frd and dat result file.\n")
         self.results_present = False
@@ -483,3 +483,28 @@ def pydecode(bytestring):
         return bytestring
     else:
         return bytestring.decode("utf-8")
+
+
+# ************************************************************************************************
+# worker processes
+def get_fork_pool(processes):
+    """ Return a pool of *processes* worker processes forked from this one.
+
+    The workers inherit the modules, the documents and the data of this process
+    thus only their results have to be pickled. A process running the GUI is
+    never forked, because the Qt and Coin state of the child is unusable.
+
+    :returns:
+     A ``multiprocessing.Pool`` or ``None`` if processes can not be forked on
+     this platform or if the GUI is up.
+    """
+    if FreeCAD.GuiUp:
+        return None
+    import multiprocessing
+    if hasattr(multiprocessing, "get_context"):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return None
+        return multiprocessing.get_context("fork").Pool(processes)
+    if sys.platform == "win32":
+        return None
+    return multiprocessing.Pool(processes)